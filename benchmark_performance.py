@@ -0,0 +1,1005 @@
+#!/usr/bin/env python3
+"""
+성능 벤치마크 스크립트
+합성 어휘를 사용하여 솔버 핵심 자료구조의 처리 시간을 측정합니다.
+
+사용법:
+    python benchmark_performance.py available [--sizes 30000 1000000]
+    python benchmark_performance.py prefix [--sizes 30000 1000000]
+    python benchmark_performance.py syllable [--sizes 30000 1000000] [--batch 2000]
+    python benchmark_performance.py jamo [--sizes 30000 100000] [--distance 2]
+    python benchmark_performance.py sampler [--sizes 30000 1000000]
+    python benchmark_performance.py scoring [--counts 100 10000 100000]
+    python benchmark_performance.py ann [--sizes 100000 500000] [--dim 100] [--k 10]
+    python benchmark_performance.py estimator [--dims 100 300] [--observations 500]
+    python benchmark_performance.py quantization [--sizes 100000] [--dim 300] [--k 10]
+    python benchmark_performance.py simulate [--size 50000] [--dim 100] [--games 64]
+        [--batch-sizes 1 64] [--max-attempts 100] [--noise 0.2]
+    python benchmark_performance.py parallel [--size 50000] [--dim 100] [--games 256]
+        [--workers 1 2 4] [--batch-size 64] [--max-attempts 100] [--noise 0.2]
+    python benchmark_performance.py imports [--runs 3] [--strict]
+"""
+
+import argparse
+import io
+import math
+import os
+import random
+import re
+import subprocess
+import sys
+import time
+from array import array
+from collections import defaultdict
+from contextlib import redirect_stdout
+from typing import Callable, Dict, List, Tuple
+
+from modules.ann_index import IVFIndex, evaluate_recall
+from modules.batch_simulator import BatchSimulator, summarize_results
+from modules.embeddings import EmbeddingStore
+from modules.learning_engine import LearningEngine
+from modules.models import GameSession, GuessResult
+from modules.parallel_runner import ParallelGameRunner
+from modules.quantization import QuantizedEmbeddingStore, evaluate_quantization
+from modules.sampler import WeightedSampler
+from modules.target_estimator import TargetEstimator
+from modules.vocabulary import AvailableVocabulary, Vocabulary, pack_pair
+from modules.word_index import _bit_parallel_distance, _pattern_masks, decompose_jamo
+
+
+def generate_synthetic_vocabulary(size: int, seed: int = 42,
+                                  syllable_count: int = 400) -> List[str]:
+    """
+    벤치마크용 합성 한국어 어휘를 생성합니다.
+
+    실제 어휘처럼 어근(앞 음절)을 공유하는 단어가 많도록 제한된 음절 집합에서
+    2~4음절 단어를 만듭니다.
+
+    Args:
+        size (int): 생성할 단어 수
+        seed (int): 난수 시드
+        syllable_count (int): 사용할 음절 종류 수
+
+    Returns:
+        List[str]: 정렬된 고유 단어 목록
+    """
+    rng = random.Random(seed)
+    syllables = [chr(0xAC00 + i * 7) for i in range(syllable_count)]
+    words = set()
+
+    while len(words) < size:
+        length = rng.choice((2, 2, 3, 3, 3, 4))
+        words.add(''.join(rng.choice(syllables) for _ in range(length)))
+
+    return sorted(words)
+
+
+def generate_synthetic_embeddings(vocabulary: Vocabulary, dim: int = 100, seed: int = 42,
+                                  words_per_topic: int = 50, noise: float = 1.0) -> EmbeddingStore:
+    """
+    벤치마크용 합성 임베딩을 생성합니다 (주제 중심 + 잡음의 군집 구조).
+
+    Args:
+        vocabulary (Vocabulary): 행 순서의 기준이 되는 어휘
+        dim (int): 임베딩 차원
+        seed (int): 난수 시드
+        words_per_topic (int): 주제당 평균 단어 수
+        noise (float): 주제 중심 대비 잡음 크기
+
+    Returns:
+        EmbeddingStore: 메모리 내 임베딩 저장소
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    size = vocabulary.base_size
+    topics = rng.standard_normal((max(1, size // words_per_topic), dim)).astype(np.float32)
+    vectors = topics[rng.integers(0, len(topics), size)]
+    vectors += noise * rng.standard_normal((size, dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return EmbeddingStore(vectors, np.ones(size, dtype=bool), vocabulary)
+
+
+def _measure(func: Callable[[], None], repeat: int) -> float:
+    """
+    함수를 반복 실행하여 1회당 평균 시간(ms)을 반환합니다.
+
+    Args:
+        func (Callable[[], None]): 측정할 함수
+        repeat (int): 반복 횟수
+
+    Returns:
+        float: 1회당 평균 시간 (ms)
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def benchmark_available_vocabulary(size: int, decisions: int = 50,
+                                   probes: int = 20) -> Dict[str, float]:
+    """
+    사용 가능 어휘 구성 방식별 결정 1회당 지연 시간을 측정합니다.
+
+    한 번의 결정은 "사용 가능 어휘 준비 → 전략의 멤버십 확인(probes회) → 무작위 선택
+    → 추측 기록"으로 구성됩니다.
+
+    Args:
+        size (int): 어휘 크기
+        decisions (int): 측정할 결정 횟수
+        probes (int): 결정당 멤버십 확인 횟수
+
+    Returns:
+        Dict[str, float]: 방식별 결정 1회당 평균 시간 (ms)
+    """
+    vocab = generate_synthetic_vocabulary(size)
+    rng = random.Random(7)
+    probe_words = [rng.choice(vocab) for _ in range(probes)]
+
+    # 기존 방식: 매 시도마다 리스트 재구성 + 리스트 멤버십 확인
+    tried_words = set()
+
+    def list_decision() -> None:
+        available = [w for w in vocab if w not in tried_words]
+        for word in probe_words:
+            _ = word in available
+        tried_words.add(random.choice(available))
+
+    # 개선 방식: 세션이 유지하는 사용 가능 어휘 뷰
+    session = GameSession(Vocabulary(vocab))
+
+    def view_decision() -> None:
+        available = session.available
+        for word in probe_words:
+            _ = word in available
+        word = available.random_word()
+        session.add_guess(GuessResult(word, 0.0, 1000, len(session.guesses) + 1))
+
+    # 리스트 방식은 느리므로 큰 어휘에서는 반복 횟수를 줄임
+    list_decisions = max(1, min(decisions, decisions * 30000 // size))
+
+    return {
+        'list_ms': _measure(list_decision, list_decisions),
+        'view_ms': _measure(view_decision, decisions),
+    }
+
+
+def run_available_benchmark(sizes: List[int]) -> None:
+    """
+    사용 가능 어휘 벤치마크를 실행하고 결과를 출력합니다.
+
+    Args:
+        sizes (List[int]): 측정할 어휘 크기 목록
+    """
+    print("📊 사용 가능 어휘 결정 지연 시간 (결정 1회당)")
+    print("=" * 60)
+    print(f"{'어휘 크기':>12} | {'리스트 재구성':>14} | {'비트셋 뷰':>12} | {'배율':>8}")
+    print("-" * 60)
+
+    for size in sizes:
+        result = benchmark_available_vocabulary(size)
+        speedup = result['list_ms'] / max(result['view_ms'], 1e-9)
+        print(f"{size:>12,} | {result['list_ms']:>11.3f} ms | "
+              f"{result['view_ms']:>9.4f} ms | {speedup:>7.0f}x")
+
+
+def benchmark_prefix_lookup(size: int, queries: int = 50) -> Dict[str, float]:
+    """
+    파생어 탐색("어근으로 시작하고 길이 N 이하인 미시도 단어") 1회당 지연 시간을 측정합니다.
+
+    Args:
+        size (int): 어휘 크기
+        queries (int): 측정할 질의 횟수
+
+    Returns:
+        Dict[str, float]: 방식별 질의 1회당 평균 시간 (ms)과 평균 결과 수
+    """
+    vocab = generate_synthetic_vocabulary(size)
+    vocabulary = Vocabulary(vocab)
+    available = AvailableVocabulary(vocabulary)
+    rng = random.Random(11)
+    query_words = [rng.choice(vocab) for _ in range(queries)]
+
+    build_start = time.perf_counter()
+    prefix_index = vocabulary.prefix_index
+    build_ms = (time.perf_counter() - build_start) * 1000
+
+    def scan_lookup(word: str) -> List[str]:
+        root = word[:-1]
+        return [w for w in available
+                if w.startswith(root) and w != word and len(w) <= len(word) + 2]
+
+    def index_lookup(word: str) -> List[str]:
+        return prefix_index.find(word[:-1], available, max_length=len(word) + 2, exclude=word)
+
+    scan_queries = max(1, min(queries, queries * 30000 // size))
+    scan_iter = iter(query_words * 2)
+    index_iter = iter(query_words * 2)
+    matches = sum(len(index_lookup(word)) for word in query_words) / queries
+
+    return {
+        'scan_ms': _measure(lambda: scan_lookup(next(scan_iter)), scan_queries),
+        'index_ms': _measure(lambda: index_lookup(next(index_iter)), queries),
+        'build_ms': build_ms,
+        'matches': matches,
+    }
+
+
+def run_prefix_benchmark(sizes: List[int]) -> None:
+    """
+    접두사 색인 벤치마크를 실행하고 결과를 출력합니다.
+
+    Args:
+        sizes (List[int]): 측정할 어휘 크기 목록
+    """
+    print("📊 파생어 탐색 지연 시간 (질의 1회당)")
+    print("=" * 72)
+    print(f"{'어휘 크기':>12} | {'전체 스캔':>12} | {'접두사 색인':>12} | "
+          f"{'평균 결과':>8} | {'색인 구축':>10}")
+    print("-" * 72)
+
+    for size in sizes:
+        result = benchmark_prefix_lookup(size)
+        print(f"{size:>12,} | {result['scan_ms']:>9.3f} ms | {result['index_ms']:>9.4f} ms | "
+              f"{result['matches']:>10.1f} | {result['build_ms']:>7.0f} ms")
+
+
+def benchmark_syllable_overlap(size: int, batch: int = 2000,
+                               history: int = 5, rounds: int = 10) -> Dict[str, float]:
+    """
+    후보 묶음의 어근 공유/음절 겹침 계산 1회당 지연 시간을 측정합니다.
+
+    기존 방식은 후보 × 최근 추측마다 공통 접두사와 set 교집합을 계산하고,
+    행렬 방식은 CandidateScorer의 음절 코드 행렬을 배열 연산으로 비교하며,
+    역색인 방식은 공통 음절 수를 음절 포스팅 순회로 계산합니다
+    (솔버는 후보 묶음마다 둘 중 싼 쪽을 고름).
+
+    Args:
+        size (int): 어휘 크기
+        batch (int): 후보 묶음 크기
+        history (int): 비교할 최근 추측 수
+        rounds (int): 측정 반복 횟수
+
+    Returns:
+        Dict[str, float]: 방식별 묶음 1회당 평균 시간 (ms)
+    """
+    vocab = generate_synthetic_vocabulary(size)
+    vocabulary = Vocabulary(vocab)
+    rng = random.Random(13)
+    recent = [rng.choice(vocab) for _ in range(history)]
+    candidates = rng.sample(vocab, batch)
+
+    def nested_overlap() -> None:
+        for word in candidates:
+            for guess_word in recent:
+                common_prefix_len = 0
+                for i in range(min(len(word), len(guess_word))):
+                    if word[i] != guess_word[i]:
+                        break
+                    common_prefix_len += 1
+                _ = len(set(word) & set(guess_word))
+
+    scorer = vocabulary.candidate_scorer
+    candidate_ids = [vocabulary.get_id(word) for word in candidates]
+
+    def vectorized_overlap() -> None:
+        codes, first_occurrence = scorer.gather(scorer.as_ids(candidate_ids))
+        for guess_word in recent:
+            scorer.common_prefix_lengths(guess_word, codes)
+            scorer.shared_syllable_counts(guess_word, codes, first_occurrence)
+
+    def indexed_overlap() -> None:
+        ids = scorer.as_ids(candidate_ids)
+        codes, _ = scorer.gather(ids)
+        for guess_word in recent:
+            scorer.common_prefix_lengths(guess_word, codes)
+            scorer.indexed_syllable_counts(guess_word, ids)
+
+    scorer.syllable_postings(recent[0][0])  # 역색인 구축은 측정에서 제외
+    return {
+        'nested_ms': _measure(nested_overlap, rounds),
+        'scorer_ms': _measure(vectorized_overlap, rounds),
+        'index_ms': _measure(indexed_overlap, rounds),
+    }
+
+
+def run_syllable_benchmark(sizes: List[int], batch: int) -> None:
+    """
+    후보 음절 겹침 벤치마크를 실행하고 결과를 출력합니다.
+
+    Args:
+        sizes (List[int]): 측정할 어휘 크기 목록
+        batch (int): 후보 묶음 크기
+    """
+    print(f"📊 후보 음절 겹침 계산 지연 시간 (후보 {batch}개 × 최근 추측 5개)")
+    print("=" * 75)
+    print(f"{'어휘 크기':>12} | {'중첩 루프':>12} | {'코드 행렬':>12} | {'음절 역색인':>12} | {'배율':>8}")
+    print("-" * 75)
+
+    for size in sizes:
+        result = benchmark_syllable_overlap(size, batch)
+        speedup = result['nested_ms'] / max(min(result['scorer_ms'], result['index_ms']), 1e-9)
+        print(f"{size:>12,} | {result['nested_ms']:>9.3f} ms | {result['scorer_ms']:>9.3f} ms | "
+              f"{result['index_ms']:>9.3f} ms | {speedup:>7.1f}x")
+
+
+def benchmark_jamo_neighbors(size: int, max_distance: int = 2,
+                             queries: int = 30) -> Dict[str, float]:
+    """
+    자모 거리 근접 단어 질의 1회당 지연 시간을 측정합니다.
+
+    Args:
+        size (int): 어휘 크기
+        max_distance (int): 최대 자모 편집 거리
+        queries (int): 측정할 질의 횟수
+
+    Returns:
+        Dict[str, float]: 방식별 질의 1회당 평균 시간 (ms), 트리 구축 시간, 평균 결과 수
+    """
+    vocab = generate_synthetic_vocabulary(size)
+    vocabulary = Vocabulary(vocab)
+    available = AvailableVocabulary(vocabulary)
+    rng = random.Random(17)
+    query_words = [rng.choice(vocab) for _ in range(queries)]
+
+    build_start = time.perf_counter()
+    jamo_tree = vocabulary.jamo_tree
+    build_ms = (time.perf_counter() - build_start) * 1000
+
+    jamo_words = [decompose_jamo(word) for word in vocab]
+
+    def scan_lookup(word: str) -> List[str]:
+        jamo = decompose_jamo(word)
+        masks = _pattern_masks(jamo)
+        return [vocab[word_id] for word_id, other in enumerate(jamo_words)
+                if _bit_parallel_distance(masks, len(jamo), other) <= max_distance]
+
+    scan_queries = max(1, min(queries, queries * 30000 // size))
+    scan_iter = iter(query_words * 2)
+    tree_iter = iter(query_words * 2)
+    matches = sum(len(jamo_tree.find(word, max_distance, available))
+                  for word in query_words) / queries
+
+    return {
+        'scan_ms': _measure(lambda: scan_lookup(next(scan_iter)), scan_queries),
+        'tree_ms': _measure(lambda: jamo_tree.find(next(tree_iter), max_distance, available),
+                            queries),
+        'build_ms': build_ms,
+        'matches': matches,
+    }
+
+
+def run_jamo_benchmark(sizes: List[int], max_distance: int) -> None:
+    """
+    자모 BK-트리 벤치마크를 실행하고 결과를 출력합니다.
+
+    Args:
+        sizes (List[int]): 측정할 어휘 크기 목록
+        max_distance (int): 최대 자모 편집 거리
+    """
+    print(f"📊 자모 거리 {max_distance} 이내 근접 단어 질의 지연 시간 (질의 1회당)")
+    print("=" * 72)
+    print(f"{'어휘 크기':>12} | {'전체 스캔':>12} | {'BK-트리':>12} | "
+          f"{'평균 결과':>8} | {'트리 구축':>10}")
+    print("-" * 72)
+
+    for size in sizes:
+        result = benchmark_jamo_neighbors(size, max_distance)
+        print(f"{size:>12,} | {result['scan_ms']:>9.3f} ms | {result['tree_ms']:>9.3f} ms | "
+              f"{result['matches']:>10.1f} | {result['build_ms']:>7.0f} ms")
+
+
+def benchmark_weighted_sampling(size: int, draws: int = 200) -> Dict[str, float]:
+    """
+    시도한 단어를 제외한 가중치 무작위 선택 1회당 지연 시간을 측정합니다.
+
+    기존 방식은 매번 미시도 단어 목록과 가중치 목록을 만들어 random.choices를 호출하고,
+    개선 방식은 펜윅 트리 샘플러에서 샘플링 후 선택된 단어를 제거합니다.
+
+    Args:
+        size (int): 어휘 크기
+        draws (int): 측정할 선택 횟수
+
+    Returns:
+        Dict[str, float]: 방식별 선택 1회당 평균 시간 (ms)과 샘플러 구축 시간
+    """
+    rng = random.Random(19)
+    weights = [1.0 + rng.random() * 3 for _ in range(size)]
+
+    tried = set()
+
+    def list_draw() -> None:
+        candidates = [word_id for word_id in range(size) if word_id not in tried]
+        candidate_weights = [weights[word_id] for word_id in candidates]
+        tried.add(random.choices(candidates, weights=candidate_weights)[0])
+
+    build_start = time.perf_counter()
+    sampler = WeightedSampler(weights)
+    build_ms = (time.perf_counter() - build_start) * 1000
+
+    def sampler_draw() -> None:
+        sampler.remove(sampler.sample())
+
+    list_draws = max(1, min(draws, draws * 30000 // size // 10))
+
+    return {
+        'list_ms': _measure(list_draw, list_draws),
+        'sampler_ms': _measure(sampler_draw, draws),
+        'build_ms': build_ms,
+    }
+
+
+def run_sampler_benchmark(sizes: List[int]) -> None:
+    """
+    가중치 샘플러 벤치마크를 실행하고 결과를 출력합니다.
+
+    Args:
+        sizes (List[int]): 측정할 어휘 크기 목록
+    """
+    print("📊 가중치 무작위 선택 지연 시간 (선택 + 제거 1회당)")
+    print("=" * 72)
+    print(f"{'어휘 크기':>12} | {'목록 재구성':>12} | {'펜윅 샘플러':>12} | "
+          f"{'배율':>8} | {'샘플러 구축':>10}")
+    print("-" * 72)
+
+    for size in sizes:
+        result = benchmark_weighted_sampling(size)
+        speedup = result['list_ms'] / max(result['sampler_ms'], 1e-9)
+        print(f"{size:>12,} | {result['list_ms']:>9.3f} ms | {result['sampler_ms']:>9.4f} ms | "
+              f"{speedup:>7.0f}x | {result['build_ms']:>7.0f} ms")
+
+
+def generate_synthetic_learned_data(vocabulary: Vocabulary, guess_ids: List[int],
+                                    seed: int = 23) -> Dict:
+    """
+    벤치마크용 합성 학습 데이터(단어 빈도, 추측과의 단어 쌍)를 생성합니다.
+
+    Args:
+        vocabulary (Vocabulary): 단어 ID 인터닝 테이블
+        guess_ids (List[int]): 단어 쌍을 만들 추측 단어 ID들
+        seed (int): 난수 시드
+
+    Returns:
+        Dict: LearningEngine.get_learned_data()와 같은 형식의 학습 데이터
+    """
+    rng = random.Random(seed)
+    size = len(vocabulary)
+
+    word_frequency = {}
+    frequency_prior = array('d', bytes(8 * size))
+    for word_id in rng.sample(range(size), size // 20):
+        count = rng.randint(1, 5)
+        avg_similarity = rng.uniform(0, 40)
+        word_frequency[word_id] = {'count': count, 'avg_similarity': avg_similarity}
+        frequency_prior[word_id] = avg_similarity * math.log(count + 1) * 5
+
+    word_pairs = {}
+    pair_partners = defaultdict(set)
+    for guess_id in guess_ids:
+        for other_id in rng.sample(range(size), size // 50):
+            if other_id != guess_id:
+                word_pairs[pack_pair(guess_id, other_id)] = {
+                    'similarity_diffs': [rng.uniform(0, 30) for _ in range(5)]}
+                pair_partners[guess_id].add(other_id)
+                pair_partners[other_id].add(guess_id)
+
+    return {
+        'word_frequency': word_frequency,
+        'frequency_prior': frequency_prior,
+        'word_pairs': word_pairs,
+        'pair_partners': pair_partners,
+        'vocabulary': vocabulary,
+    }
+
+
+def score_candidates_per_word(candidates: List[str], session: GameSession,
+                              learned_data: Dict) -> List[Tuple[str, float]]:
+    """
+    비교 기준: 후보를 한 단어씩 Python으로 계산하는 경사 탐색 점수
+    (딕셔너리 조회, 쌍 키 생성, 유사도 차이 평균, 접두사 비교, 음절 집합 교집합).
+
+    Args:
+        candidates (List[str]): 후보 단어들
+        session (GameSession): 게임 세션
+        learned_data (Dict): 학습된 데이터
+
+    Returns:
+        List[Tuple[str, float]]: 점수순 (단어, 점수) 목록
+    """
+    word_frequency = learned_data['word_frequency']
+    word_pairs = learned_data['word_pairs']
+    get_id = session.vocabulary.get_id
+    top_guesses = session.get_top_guesses(3)
+    recent_guesses = [g for g in session.guesses[-5:] if len(g.word) > 2]
+    recent_words = [g.word for g in session.guesses[-3:]]
+
+    scored = []
+    for word in candidates:
+        word_id = get_id(word)
+        score = 0.0
+
+        freq_data = word_frequency.get(word_id)
+        if freq_data is not None:
+            score += freq_data['avg_similarity'] * math.log(freq_data['count'] + 1) * 5
+
+        for guess in top_guesses:
+            pair_data = word_pairs.get(pack_pair(guess.word_id, word_id))
+            if pair_data is not None and pair_data['similarity_diffs']:
+                diffs = pair_data['similarity_diffs']
+                score += (1 - sum(diffs) / len(diffs) / 100) * guess.similarity * 3
+
+        if len(word) > 2:
+            for guess in recent_guesses:
+                common = 0
+                for a, b in zip(word, guess.word):
+                    if a != b:
+                        break
+                    common += 1
+                if common >= 2:
+                    score += guess.similarity * common
+
+            overlap = sum(len(set(word) & set(recent)) / max(len(word), len(recent))
+                          for recent in recent_words if len(recent) > 2) / len(recent_words)
+            if 0.2 < overlap < 0.7:
+                score += 1
+
+        scored.append((word, score))
+
+    scored.sort(key=lambda item: item[1], reverse=True)
+    return scored
+
+
+def benchmark_candidate_scoring(count: int, rounds: int = 5) -> Dict[str, float]:
+    """
+    후보 묶음 점수 계산 + 상위 10개 선택 1회당 지연 시간을 측정합니다.
+
+    Args:
+        count (int): 후보 수
+        rounds (int): 측정 반복 횟수
+
+    Returns:
+        Dict[str, float]: 방식별 1회당 평균 시간 (ms)
+    """
+    vocab = generate_synthetic_vocabulary(max(count * 2, 30000))
+    vocabulary = Vocabulary(vocab)
+    rng = random.Random(29)
+
+    session = GameSession(vocabulary)
+    for attempt, word in enumerate(rng.sample(vocab, 8), 1):
+        session.add_guess(GuessResult(word, rng.uniform(5, 40), 1000, attempt))
+    learned_data = generate_synthetic_learned_data(
+        vocabulary, [guess.word_id for guess in session.guesses])
+
+    candidates = rng.sample(vocab, count)
+    candidate_ids = [vocabulary.get_id(word) for word in candidates]
+    scorer = vocabulary.candidate_scorer
+
+    def vectorized() -> None:
+        scores = scorer.score_gradient(candidate_ids, session, learned_data)
+        scorer.top_k(candidate_ids, scores, 10)
+
+    vectorized()  # numpy 내부 초기화 비용 제외
+    return {
+        'loop_ms': _measure(lambda: score_candidates_per_word(candidates, session, learned_data),
+                            rounds),
+        'vector_ms': _measure(vectorized, rounds),
+    }
+
+
+def run_scoring_benchmark(counts: List[int]) -> None:
+    """
+    묶음 후보 점수 계산 벤치마크를 실행하고 결과를 출력합니다.
+
+    Args:
+        counts (List[int]): 측정할 후보 수 목록
+    """
+    print("📊 경사 탐색 후보 점수 계산 + 상위 10개 선택 지연 시간")
+    print("=" * 60)
+    print(f"{'후보 수':>12} | {'단어별 루프':>12} | {'NumPy 묶음':>12} | {'배율':>8}")
+    print("-" * 60)
+
+    for count in counts:
+        result = benchmark_candidate_scoring(count)
+        speedup = result['loop_ms'] / max(result['vector_ms'], 1e-9)
+        print(f"{count:>12,} | {result['loop_ms']:>9.3f} ms | "
+              f"{result['vector_ms']:>9.3f} ms | {speedup:>7.1f}x")
+
+
+def run_ann_benchmark(sizes: List[int], dim: int, k: int) -> None:
+    """
+    IVF 색인 구축 시간과 탐색 군집 수별 재현율/지연 시간을 출력합니다.
+
+    Args:
+        sizes (List[int]): 측정할 어휘 크기 목록
+        dim (int): 합성 임베딩 차원
+        k (int): 재현율을 측정할 상위 단어 수
+    """
+    for size in sizes:
+        vocabulary = Vocabulary(generate_synthetic_vocabulary(size))
+        embeddings = generate_synthetic_embeddings(vocabulary, dim)
+
+        build_start = time.perf_counter()
+        index = IVFIndex.build(embeddings)
+        build_ms = (time.perf_counter() - build_start) * 1000
+
+        query_ids = random.Random(31).sample(range(size), 100)
+        report = evaluate_recall(index, embeddings, query_ids, k)
+
+        print(f"📊 IVF 색인: 어휘 {size:,}개, {dim}차원, 군집 {index.n_lists}개 "
+              f"(구축 {build_ms / 1000:.1f}초)")
+        print("=" * 48)
+        print(f"{'탐색 군집':>10} | {'recall@' + str(k):>9} | {'질의 지연':>11}")
+        print("-" * 48)
+        for row in report:
+            label = "전수 비교" if row['n_probe'] == 0 else str(row['n_probe'])
+            print(f"{label:>10} | {row['recall']:>9.3f} | {row['query_ms']:>8.3f} ms")
+        print()
+
+
+def benchmark_target_estimator(dim: int, observations: int,
+                               size: int = 50000) -> Dict[str, float]:
+    """
+    정답 벡터 추정기의 관측당 랭크-1 갱신 시간과 전체 재적합 시간을 비교합니다.
+
+    Args:
+        dim (int): 합성 임베딩 차원
+        observations (int): 관측(추측) 수
+        size (int): 합성 어휘 크기
+
+    Returns:
+        Dict[str, float]: 갱신 p50/p99/최대(ms), 마지막 관측 시점 재적합(ms), 정답과의 코사인
+    """
+    import numpy as np
+
+    vocabulary = Vocabulary(generate_synthetic_vocabulary(size))
+    embeddings = generate_synthetic_embeddings(vocabulary, dim)
+    rng = random.Random(17)
+    target_id = rng.randrange(size)
+    target = embeddings.vectors[target_id]
+    guess_ids = rng.sample(range(size), observations)
+
+    estimator = TargetEstimator(embeddings)
+    update_ms = []
+    for word_id in guess_ids:
+        similarity = float(embeddings.vectors[word_id] @ target) * 100
+        start = time.perf_counter()
+        estimator.observe(word_id, similarity)
+        update_ms.append((time.perf_counter() - start) * 1000)
+
+    # 비교 기준: 관측마다 정규 방정식을 처음부터 다시 푸는 방식
+    observed = np.asarray(embeddings.vectors[guess_ids], dtype=np.float64)
+    targets = observed @ target
+    refit_ms = _measure(lambda: np.linalg.solve(
+        observed.T @ observed + estimator.regularization * np.eye(dim), observed.T @ targets), 5)
+
+    return {
+        'update_p50_ms': float(np.percentile(update_ms, 50)),
+        'update_p99_ms': float(np.percentile(update_ms, 99)),
+        'update_max_ms': max(update_ms),
+        'refit_ms': refit_ms,
+        'cosine': float(estimator.get_direction() @ target),
+    }
+
+
+def run_estimator_benchmark(dims: List[int], observations: int) -> None:
+    """
+    차원별 정답 벡터 추정기 갱신 시간을 출력합니다.
+
+    Args:
+        dims (List[int]): 측정할 임베딩 차원 목록
+        observations (int): 관측(추측) 수
+    """
+    print(f"📊 정답 벡터 추정기: 관측 {observations}개 (셔먼-모리슨 갱신 vs 전체 재적합)")
+    print("=" * 78)
+    print(f"{'차원':>6} | {'갱신 p50':>10} | {'갱신 p99':>10} | {'갱신 최대':>10} | "
+          f"{'재적합':>10} | {'정답 코사인':>10}")
+    print("-" * 78)
+    for dim in dims:
+        result = benchmark_target_estimator(dim, observations)
+        print(f"{dim:>6} | {result['update_p50_ms']:>7.3f} ms | {result['update_p99_ms']:>7.3f} ms | "
+              f"{result['update_max_ms']:>7.3f} ms | {result['refit_ms']:>7.3f} ms | "
+              f"{result['cosine']:>10.3f}")
+
+
+def run_quantization_benchmark(sizes: List[int], dim: int, k: int) -> None:
+    """
+    저장 형식별(float32/int8/PQ) 메모리, recall@k, 전수 비교 질의 지연 시간을 출력합니다.
+
+    Args:
+        sizes (List[int]): 측정할 어휘 크기 목록
+        dim (int): 합성 임베딩 차원
+        k (int): 재현율을 측정할 상위 단어 수
+    """
+    for size in sizes:
+        vocabulary = Vocabulary(generate_synthetic_vocabulary(size))
+        embeddings = generate_synthetic_embeddings(vocabulary, dim)
+        quantized_stores = [QuantizedEmbeddingStore.from_store(embeddings, quantization)
+                            for quantization in ('int8', 'pq')]
+
+        query_ids = random.Random(31).sample(range(size), 50)
+        report = evaluate_quantization(embeddings, quantized_stores, query_ids, k)
+
+        print(f"📊 저장 형식 비교: 어휘 {size:,}개, {dim}차원 (질의 1회당 전수 비교)")
+        print("=" * 56)
+        print(f"{'형식':>8} | {'메모리':>10} | {'recall@' + str(k):>9} | {'질의 지연':>11}")
+        print("-" * 56)
+        for row in report:
+            print(f"{row['format']:>8} | {row['bytes'] / 2 ** 20:>7.1f} MB | "
+                  f"{row['recall']:>9.3f} | {row['query_ms']:>8.3f} ms")
+        print()
+
+
+def run_simulation_benchmark(size: int, dim: int, games: int, batch_sizes: List[int],
+                             max_attempts: int, noise: float) -> None:
+    """
+    같은 정답 표본을 묶음 크기별로 시뮬레이션하여 초당 게임 수와 시도 횟수를 출력합니다.
+
+    묶음 크기 1은 게임을 하나씩 끝까지 진행하는 단일 게임 반복과 같습니다.
+
+    Args:
+        size (int): 합성 어휘 크기
+        dim (int): 합성 임베딩 차원
+        games (int): 시뮬레이션할 게임 수
+        batch_sizes (List[int]): 비교할 묶음 크기 목록
+        max_attempts (int): 게임당 최대 추측 수
+        noise (float): 게임 모델에 섞을 잡음 크기 (0이면 로컬 모델과 동일)
+    """
+    import numpy as np
+
+    vocabulary = Vocabulary(generate_synthetic_vocabulary(size))
+    vocabulary.build_indexes()
+    embeddings = generate_synthetic_embeddings(vocabulary, dim)
+    vocabulary.embeddings = embeddings
+
+    rng = np.random.default_rng(11)
+    game_vectors = embeddings.vectors + noise * rng.standard_normal(
+        embeddings.vectors.shape).astype(np.float32) / math.sqrt(dim)
+    game_vectors /= np.linalg.norm(game_vectors, axis=1, keepdims=True)
+    target_ids = rng.choice(size, games, replace=False)
+
+    print(f"📊 묶음 시뮬레이션: 어휘 {size:,}개, {dim}차원, 게임 {games}개, 잡음 {noise}")
+    print("=" * 72)
+    print(f"{'묶음 크기':>8} | {'초당 게임':>10} | {'해결':>8} | {'평균 시도':>9} | {'중앙값':>7} | {'p90':>7}")
+    print("-" * 72)
+    for batch_size in batch_sizes:
+        simulator = BatchSimulator(vocabulary, game_vectors=game_vectors)
+        start = time.perf_counter()
+        results = simulator.run(target_ids, max_attempts, batch_size)
+        summary = summarize_results(results, time.perf_counter() - start)
+        print(f"{batch_size:>8} | {summary['games_per_second']:>10.2f} | "
+              f"{summary['solved']:>3}/{summary['games']:<4} | {summary['mean_attempts']:>9.2f} | "
+              f"{summary['median_attempts']:>7.1f} | {summary['p90_attempts']:>7.1f}")
+
+
+def run_parallel_benchmark(size: int, dim: int, games: int, workers_list: List[int],
+                           batch_size: int, max_attempts: int, noise: float) -> None:
+    """
+    같은 정답 표본을 작업 프로세스 수별로 병렬 실행하여 초당 게임 수와 확장 배율을 출력합니다.
+
+    Args:
+        size (int): 합성 어휘 크기
+        dim (int): 합성 임베딩 차원
+        games (int): 시뮬레이션할 게임 수
+        workers_list (List[int]): 비교할 작업 프로세스 수 목록
+        batch_size (int): 작업자 안에서 잠금 단계로 함께 진행할 게임 수
+        max_attempts (int): 게임당 최대 추측 수
+        noise (float): 게임 모델에 섞을 잡음 크기 (0이면 로컬 모델과 동일)
+    """
+    import numpy as np
+
+    vocabulary = Vocabulary(generate_synthetic_vocabulary(size))
+    vocabulary.build_indexes()
+    embeddings = generate_synthetic_embeddings(vocabulary, dim)
+    vocabulary.embeddings = embeddings
+
+    rng = np.random.default_rng(11)
+    game_vectors = embeddings.vectors + noise * rng.standard_normal(
+        embeddings.vectors.shape).astype(np.float32) / math.sqrt(dim)
+    game_vectors /= np.linalg.norm(game_vectors, axis=1, keepdims=True)
+    target_ids = rng.choice(size, games, replace=False)
+
+    print(f"📊 병렬 시뮬레이션: 어휘 {size:,}개, {dim}차원, 게임 {games}개, "
+          f"묶음 {batch_size}, CPU {os.cpu_count()}개")
+    print("=" * 72)
+    print(f"{'작업자':>6} | {'초당 게임':>10} | {'배율':>6} | {'해결':>8} | {'평균 시도':>9} | {'학습 단어 쌍':>11}")
+    print("-" * 72)
+    baseline = None
+    for workers in workers_list:
+        with redirect_stdout(io.StringIO()):
+            learning_engine = LearningEngine('', '', vocabulary=vocabulary)
+        runner = ParallelGameRunner(vocabulary, learning_engine, game_vectors, workers=workers)
+        start = time.perf_counter()
+        results = runner.run(target_ids, max_attempts, batch_size, seed=0)
+        summary = summarize_results(results, time.perf_counter() - start)
+        baseline = baseline or summary['games_per_second']
+        print(f"{workers:>6} | {summary['games_per_second']:>10.2f} | "
+              f"{summary['games_per_second'] / baseline:>5.2f}x | "
+              f"{summary['solved']:>3}/{summary['games']:<4} | {summary['mean_attempts']:>9.2f} | "
+              f"{len(learning_engine.word_pairs):>11,}")
+
+
+# 임포트 시간 예산 대상 진입점과 예산 (ms)
+IMPORT_BUDGETS_MS = {
+    'semantic_solver': 150,
+    'analyze_logs': 100,
+    'view_detailed_log': 100,
+    'monitor_game': 50,
+}
+
+# 진입점 임포트 시점에 로드되면 안 되는 무거운 의존성
+HEAVY_MODULES = ['selenium', 'pandas', 'numpy', 'openpyxl', 'xlrd', 'multiprocessing', 'asyncio']
+
+_IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)')
+
+
+def measure_import_time(module: str) -> Tuple[Dict[str, Tuple[int, int]], List[str]]:
+    """
+    새 인터프리터에서 `-X importtime`으로 모듈 임포트 비용을 측정합니다.
+
+    Args:
+        module (str): 임포트할 모듈 이름
+
+    Returns:
+        Tuple[Dict[str, Tuple[int, int]], List[str]]:
+            (모듈별 (자체 시간 us, 누적 시간 us), 로드된 무거운 의존성 목록)
+    """
+    probe = (f"import {module}, sys; "
+             f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', probe],
+                            capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+
+    timings: Dict[str, Tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            timings[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+
+    loaded_heavy = [name for name in result.stdout.strip().split(',') if name]
+    return timings, loaded_heavy
+
+
+def run_import_benchmark(runs: int, strict: bool) -> bool:
+    """
+    진입점별 임포트 시간을 측정하고 예산과 비교합니다.
+
+    Args:
+        runs (int): 진입점당 측정 횟수 (최솟값 사용)
+        strict (bool): 예산 초과를 실패로 처리할지 여부
+
+    Returns:
+        bool: 모든 진입점이 예산과 무거운 의존성 조건을 지켰는지 여부
+    """
+    print("📊 진입점 임포트 시간 (-X importtime, 새 인터프리터 기준)")
+    print("=" * 72)
+
+    all_passed = True
+    for module, budget_ms in IMPORT_BUDGETS_MS.items():
+        best_timings, loaded_heavy = None, []
+        for _ in range(runs):
+            timings, heavy = measure_import_time(module)
+            if module not in timings:
+                continue
+            if best_timings is None or timings[module][1] < best_timings[module][1]:
+                best_timings, loaded_heavy = timings, heavy
+
+        if best_timings is None:
+            print(f"❌ {module}: 임포트 실패")
+            all_passed = False
+            continue
+
+        total_ms = best_timings[module][1] / 1000
+        within_budget = total_ms <= budget_ms and not loaded_heavy
+        all_passed = all_passed and within_budget
+
+        status = "✅" if within_budget else "⚠️"
+        print(f"{status} {module}: {total_ms:.1f} ms (예산 {budget_ms} ms)")
+        if loaded_heavy:
+            print(f"   무거운 의존성 로드됨: {', '.join(loaded_heavy)}")
+
+        # 자체 시간이 큰 모듈 상위 5개
+        top_modules = sorted(best_timings.items(), key=lambda item: item[1][0], reverse=True)[:5]
+        for name, (self_us, cumulative_us) in top_modules:
+            print(f"   - {name:<32} 자체 {self_us / 1000:>6.1f} ms | 누적 {cumulative_us / 1000:>6.1f} ms")
+
+    if not all_passed and strict:
+        print("❌ 임포트 시간 예산을 초과한 진입점이 있습니다.")
+    return all_passed
+
+
+def main():
+    """메인 함수: 벤치마크를 실행합니다."""
+    parser = argparse.ArgumentParser(description="꼬맨틀 솔버 성능 벤치마크")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    available_parser = subparsers.add_parser('available', help="사용 가능 어휘 결정 지연 시간")
+    available_parser.add_argument('--sizes', type=int, nargs='+', default=[30000, 1000000])
+
+    prefix_parser = subparsers.add_parser('prefix', help="파생어 탐색(접두사 색인) 지연 시간")
+    prefix_parser.add_argument('--sizes', type=int, nargs='+', default=[30000, 1000000])
+
+    syllable_parser = subparsers.add_parser('syllable', help="후보 음절 겹침 계산 지연 시간")
+    syllable_parser.add_argument('--sizes', type=int, nargs='+', default=[30000, 1000000])
+    syllable_parser.add_argument('--batch', type=int, default=2000)
+
+    jamo_parser = subparsers.add_parser('jamo', help="자모 거리 근접 단어(BK-트리) 지연 시간")
+    jamo_parser.add_argument('--sizes', type=int, nargs='+', default=[30000, 100000])
+    jamo_parser.add_argument('--distance', type=int, default=2)
+
+    sampler_parser = subparsers.add_parser('sampler', help="가중치 무작위 선택(펜윅 샘플러) 지연 시간")
+    sampler_parser.add_argument('--sizes', type=int, nargs='+', default=[30000, 1000000])
+
+    scoring_parser = subparsers.add_parser('scoring', help="후보 점수 계산(NumPy 묶음) 지연 시간")
+    scoring_parser.add_argument('--counts', type=int, nargs='+', default=[100, 10000, 100000])
+
+    ann_parser = subparsers.add_parser('ann', help="IVF 근사 최근접 이웃 재현율/지연 시간")
+    ann_parser.add_argument('--sizes', type=int, nargs='+', default=[100000, 500000])
+    ann_parser.add_argument('--dim', type=int, default=100)
+    ann_parser.add_argument('--k', type=int, default=10)
+
+    estimator_parser = subparsers.add_parser('estimator', help="정답 벡터 추정기 갱신 지연 시간")
+    estimator_parser.add_argument('--dims', type=int, nargs='+', default=[100, 300])
+    estimator_parser.add_argument('--observations', type=int, default=500)
+
+    quantization_parser = subparsers.add_parser('quantization',
+                                                help="임베딩 저장 형식별 메모리/재현율/지연 시간")
+    quantization_parser.add_argument('--sizes', type=int, nargs='+', default=[100000])
+    quantization_parser.add_argument('--dim', type=int, default=300)
+    quantization_parser.add_argument('--k', type=int, default=10)
+
+    simulate_parser = subparsers.add_parser('simulate', help="묶음 게임 시뮬레이터 처리량")
+    simulate_parser.add_argument('--size', type=int, default=50000)
+    simulate_parser.add_argument('--dim', type=int, default=100)
+    simulate_parser.add_argument('--games', type=int, default=64)
+    simulate_parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 64])
+    simulate_parser.add_argument('--max-attempts', type=int, default=100)
+    simulate_parser.add_argument('--noise', type=float, default=0.2)
+
+    parallel_parser = subparsers.add_parser('parallel', help="프로세스 병렬 게임 실행기 확장성")
+    parallel_parser.add_argument('--size', type=int, default=50000)
+    parallel_parser.add_argument('--dim', type=int, default=100)
+    parallel_parser.add_argument('--games', type=int, default=256)
+    parallel_parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parallel_parser.add_argument('--batch-size', type=int, default=64)
+    parallel_parser.add_argument('--max-attempts', type=int, default=100)
+    parallel_parser.add_argument('--noise', type=float, default=0.2)
+
+    imports_parser = subparsers.add_parser('imports', help="진입점 임포트 시간과 예산")
+    imports_parser.add_argument('--runs', type=int, default=3)
+    imports_parser.add_argument('--strict', action='store_true',
+                                help="예산 초과 시 종료 코드 1로 종료")
+
+    args = parser.parse_args()
+
+    if args.command == 'available':
+        run_available_benchmark(args.sizes)
+    elif args.command == 'prefix':
+        run_prefix_benchmark(args.sizes)
+    elif args.command == 'syllable':
+        run_syllable_benchmark(args.sizes, args.batch)
+    elif args.command == 'jamo':
+        run_jamo_benchmark(args.sizes, args.distance)
+    elif args.command == 'sampler':
+        run_sampler_benchmark(args.sizes)
+    elif args.command == 'scoring':
+        run_scoring_benchmark(args.counts)
+    elif args.command == 'ann':
+        run_ann_benchmark(args.sizes, args.dim, args.k)
+    elif args.command == 'estimator':
+        run_estimator_benchmark(args.dims, args.observations)
+    elif args.command == 'quantization':
+        run_quantization_benchmark(args.sizes, args.dim, args.k)
+    elif args.command == 'simulate':
+        run_simulation_benchmark(args.size, args.dim, args.games, args.batch_sizes,
+                                 args.max_attempts, args.noise)
+    elif args.command == 'parallel':
+        run_parallel_benchmark(args.size, args.dim, args.games, args.workers, args.batch_size,
+                               args.max_attempts, args.noise)
+    elif args.command == 'imports':
+        if not run_import_benchmark(args.runs, args.strict) and args.strict:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+솔버 종단 간 벤치마크 스크립트
+고정된 시드의 정답 목록으로 오프라인 시뮬레이션 게임을 N회 실행하여
+시도 횟수 분포, 해결률, 게임당 소요 시간과 핵심 단계별 지연 시간 분위수를 측정합니다.
+
+측정하는 단계:
+    - select_next_word: 전략 엔진의 다음 단어 선택 (StrategyEngine.select_next_word_id)
+    - learn_word_relationships: 추측마다의 학습 엔진 관계 학습
+    - save_learning_data / save_word_pairs / save_strategy_logs: 게임 종료 시 저장
+
+사용법:
+    python benchmark_solver.py [--games 50] [--max-attempts 300] [--seed 7]
+        [--size 20000] [--dim 50] [--noise 0.2] [--output solver_benchmark.json]
+    python benchmark_solver.py --vocab-file words.txt --embedding-file cc.ko.300.vec
+        [--game-embedding-file game.vec] [--games 50]
+
+어휘/임베딩 파일을 주지 않으면 합성 어휘와 합성 임베딩(게임 모델은 잡음을 섞은 사본)을
+.cache/benchmark_solver/에 만들어 사용합니다. 학습/단어 쌍/거부 단어/전략 로그 파일은
+작업 디렉토리(기본: 임시 디렉토리)에 따로 만들므로 실제 학습 데이터는 바뀌지 않습니다.
+"""
+
+import argparse
+import contextlib
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from functools import wraps
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from benchmark_performance import generate_synthetic_embeddings, generate_synthetic_vocabulary
+from modules.batch_simulator import SimulationResult, summarize_results
+from modules.simulated_game import SimulatedGame, SimulatedGameConfig
+from modules.strategy_logger import StrategyLogger
+from modules.vocabulary import Vocabulary
+from semantic_solver import SemanticSolver
+
+# 시도 횟수 분포 구간 (상한 포함)
+ATTEMPT_BUCKETS = [10, 25, 50, 100, 200, 300, 500]
+
+
+class LatencyRecorder:
+    """
+    객체의 메서드를 감싸 호출마다 소요 시간을 기록하는 측정기
+
+    인스턴스 속성으로 시간 측정 래퍼를 덮어쓰므로 솔버 코드를 바꾸지 않고
+    실제 게임 루프 안에서의 지연 시간을 잽니다.
+    """
+
+    def __init__(self):
+        """측정기를 초기화합니다."""
+        self.samples: Dict[str, List[float]] = {}
+
+    def wrap(self, target: object, method_name: str, label: Optional[str] = None) -> None:
+        """
+        메서드 호출 시간을 기록하도록 감쌉니다.
+
+        Args:
+            target (object): 메서드를 가진 인스턴스
+            method_name (str): 감쌀 메서드 이름
+            label (Optional[str]): 기록 이름 (None이면 메서드 이름)
+        """
+        method = getattr(target, method_name)
+        samples = self.samples.setdefault(label or method_name, [])
+
+        @wraps(method)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                samples.append(time.perf_counter() - start)
+
+        setattr(target, method_name, timed)
+
+    def summarize(self) -> Dict[str, Dict[str, float]]:
+        """
+        기록 이름별 호출 수와 지연 시간 분위수를 반환합니다.
+
+        Returns:
+            Dict[str, Dict[str, float]]: {이름: calls, mean_ms, p50_ms, p95_ms, p99_ms, max_ms}
+        """
+        summary = {}
+        for label, samples in self.samples.items():
+            values = np.array(samples) * 1000
+            if not len(values):
+                summary[label] = {'calls': 0}
+                continue
+            p50, p95, p99 = np.percentile(values, [50, 95, 99])
+            summary[label] = {
+                'calls': len(values),
+                'mean_ms': float(values.mean()),
+                'p50_ms': float(p50),
+                'p95_ms': float(p95),
+                'p99_ms': float(p99),
+                'max_ms': float(values.max()),
+            }
+        return summary
+
+
+def prepare_synthetic_inputs(size: int, dim: int, noise: float,
+                             directory: str = os.path.join('.cache', 'benchmark_solver')
+                             ) -> Tuple[str, str, str]:
+    """
+    합성 어휘 파일과 로컬/게임 모델 임베딩 파일을 만듭니다 (같은 설정이면 기존 파일 재사용).
+
+    게임 모델은 로컬 모델 벡터에 차원 보정 잡음을 섞은 뒤 다시 정규화한 것으로,
+    실제 사이트 모델과 로컬 임베딩이 다른 상황을 흉내 냅니다.
+
+    Args:
+        size (int): 합성 어휘 크기
+        dim (int): 임베딩 차원
+        noise (float): 게임 모델에 섞을 잡음 크기 (0이면 로컬 모델과 동일)
+        directory (str): 파일을 만들 디렉토리
+
+    Returns:
+        Tuple[str, str, str]: (어휘 파일, 로컬 임베딩 파일, 게임 임베딩 파일) 경로
+    """
+    os.makedirs(directory, exist_ok=True)
+    name = f"synthetic_{size}_{dim}"
+    vocab_file = os.path.join(directory, f"{name}.txt")
+    embedding_file = os.path.join(directory, f"{name}.vec")
+    game_embedding_file = os.path.join(directory, f"{name}_noise{noise:g}.vec")
+    if all(os.path.exists(path) for path in (vocab_file, embedding_file, game_embedding_file)):
+        return vocab_file, embedding_file, game_embedding_file
+
+    words = generate_synthetic_vocabulary(size)
+    vocabulary = Vocabulary(words)
+    vectors = np.asarray(generate_synthetic_embeddings(vocabulary, dim).vectors)
+
+    rng = np.random.default_rng(11)
+    game_vectors = vectors + noise * rng.standard_normal(vectors.shape).astype(np.float32) / math.sqrt(dim)
+    game_vectors /= np.linalg.norm(game_vectors, axis=1, keepdims=True)
+
+    with open(vocab_file, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(words) + '\n')
+    for path, matrix in ((embedding_file, vectors), (game_embedding_file, game_vectors)):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"{len(words)} {dim}\n")
+            for word, row in zip(words, matrix):
+                f.write(word + ' ' + ' '.join(f"{value:.5f}" for value in row) + '\n')
+
+    return vocab_file, embedding_file, game_embedding_file
+
+
+def choose_targets(game: SimulatedGame, games: int, seed: int) -> List[str]:
+    """
+    게임 모델에 벡터가 있는 단어 중 시드로 고정된 정답 목록을 고릅니다.
+
+    Args:
+        game (SimulatedGame): 준비된(setup_driver 완료) 시뮬레이션 게임
+        games (int): 정답 수
+        seed (int): 난수 시드
+
+    Returns:
+        List[str]: 정답 단어 목록
+    """
+    present_ids = np.flatnonzero(game.embeddings.present).tolist()
+    if games > len(present_ids):
+        raise ValueError(f"게임 수({games})가 벡터가 있는 단어 수({len(present_ids)})보다 많습니다.")
+    return [game.vocabulary.get_word(word_id)
+            for word_id in random.Random(seed).sample(present_ids, games)]
+
+
+def attempt_distribution(results: List[SimulationResult], max_attempts: int) -> Dict[str, int]:
+    """
+    해결한 게임의 시도 횟수를 구간별로 셉니다 (해결하지 못한 게임은 'unsolved').
+
+    Args:
+        results (List[SimulationResult]): 게임 결과들
+        max_attempts (int): 게임당 최대 시도 수
+
+    Returns:
+        Dict[str, int]: {'≤10': 개수, ..., 'unsolved': 개수}
+    """
+    buckets = [bucket for bucket in ATTEMPT_BUCKETS if bucket < max_attempts] + [max_attempts]
+    distribution = {f"<={bucket}": 0 for bucket in buckets}
+    distribution['unsolved'] = 0
+    for result in results:
+        if not result.solved:
+            distribution['unsolved'] += 1
+            continue
+        bucket = next(bucket for bucket in buckets if result.attempts <= bucket)
+        distribution[f"<={bucket}"] += 1
+    return distribution
+
+
+def run_solver_benchmark(vocab_file: str, embedding_file: str, game_embedding_file: str,
+                         games: int, max_attempts: int, seed: int, work_dir: str,
+                         quiet: bool = True) -> Dict:
+    """
+    솔버 전체 게임 루프를 시뮬레이션 게임으로 반복 실행하며 결과와 지연 시간을 수집합니다.
+
+    솔버 하나가 모든 게임을 이어서 풀므로 학습 데이터는 게임마다 누적되며,
+    게임 i는 random 시드 seed + i로 시작해 같은 설정이면 같은 결과가 재현됩니다.
+
+    Args:
+        vocab_file (str): 어휘 파일 경로
+        embedding_file (str): 솔버(로컬) 임베딩 파일 경로
+        game_embedding_file (str): 게임 모델 임베딩 파일 경로
+        games (int): 게임 수
+        max_attempts (int): 게임당 최대 시도 수
+        seed (int): 정답 선택과 게임별 난수 시드
+        work_dir (str): 학습/로그 파일을 만들 디렉토리
+        quiet (bool): 솔버 출력 숨김 여부
+
+    Returns:
+        Dict: 설정, 게임별 결과, 시도 분포와 해결률 요약, 단계별 지연 시간 분위수
+    """
+    if games <= 0 or max_attempts <= 0:
+        raise ValueError("게임 수와 최대 시도 수는 0보다 커야 합니다.")
+
+    output = open(os.devnull, 'w') if quiet else sys.stdout
+    with contextlib.redirect_stdout(output):
+        start = time.perf_counter()
+        solver = SemanticSolver(
+            vocab_file=vocab_file,
+            learning_file=os.path.join(work_dir, 'learning.json'),
+            word_pairs_file=os.path.join(work_dir, 'word_pairs.json'),
+            rejected_words_file=os.path.join(work_dir, 'rejected_words.bloom'),
+            embedding_file=embedding_file)
+        solver.strategy_engine.logger = StrategyLogger(os.path.join(work_dir, 'strategy_logs.json'))
+
+        game = SimulatedGame(solver.vocab, SimulatedGameConfig(embedding_file=game_embedding_file))
+        solver.web_automation = game
+        if not game.setup_driver():
+            raise ValueError(f"게임 임베딩을 로드할 수 없습니다: {game_embedding_file}")
+        setup_seconds = time.perf_counter() - start
+
+    targets = choose_targets(game, games, seed)
+
+    recorder = LatencyRecorder()
+    recorder.wrap(solver.strategy_engine, 'select_next_word_id', 'select_next_word')
+    recorder.wrap(solver.learning_engine, 'learn_word_relationships')
+    recorder.wrap(solver.learning_engine, 'save_learning_data')
+    recorder.wrap(solver.learning_engine, 'save_word_pairs')
+    recorder.wrap(solver.strategy_engine.logger, '_save_logs', 'save_strategy_logs')
+
+    results: List[SimulationResult] = []
+    game_records = []
+    wall_times = []
+    for index, target in enumerate(targets):
+        game.config.target_word = target
+        random.seed(seed + index)
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(output):
+            answer = solver.solve_game(max_attempts)
+        wall_times.append(time.perf_counter() - start)
+
+        session = solver.current_session
+        result = SimulationResult(
+            target_id=solver.vocabulary.get_id(target),
+            solved=answer == target,
+            attempts=len(session.guesses),
+            best_similarity=session.get_best_similarity(),
+            rejected=max(len(session.tried_ids) - len(session.guesses), 0))
+        results.append(result)
+        game_records.append({'target': target, 'solved': result.solved, 'attempts': result.attempts,
+                             'best_similarity': result.best_similarity,
+                             'rejected': result.rejected, 'seconds': wall_times[-1]})
+        print(f"  게임 {index + 1}/{games}: {'✅' if result.solved else '❌'} "
+              f"{result.attempts}회, {wall_times[-1]:.2f}초")
+
+    if quiet:
+        output.close()
+
+    solved_attempts = np.array([result.attempts for result in results if result.solved])
+    times = np.array(wall_times)
+    summary = summarize_results(results, float(times.sum()))
+    summary.update({
+        'p95_attempts': float(np.percentile(solved_attempts, 95)) if len(solved_attempts) else 0.0,
+        'p99_attempts': float(np.percentile(solved_attempts, 99)) if len(solved_attempts) else 0.0,
+        'max_attempts_used': int(solved_attempts.max()) if len(solved_attempts) else 0,
+        'attempt_distribution': attempt_distribution(results, max_attempts),
+        'setup_seconds': setup_seconds,
+        'total_seconds': float(times.sum()),
+        'mean_game_seconds': float(times.mean()),
+        'p50_game_seconds': float(np.percentile(times, 50)),
+        'p95_game_seconds': float(np.percentile(times, 95)),
+    })
+
+    return {
+        'created': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'config': {'vocab_file': vocab_file, 'embedding_file': embedding_file,
+                   'game_embedding_file': game_embedding_file, 'games': games,
+                   'max_attempts': max_attempts, 'seed': seed,
+                   'vocabulary_size': len(solver.vocab)},
+        'summary': summary,
+        'latency': recorder.summarize(),
+        'games': game_records,
+    }
+
+
+def print_report(report: Dict) -> None:
+    """
+    벤치마크 결과를 사람이 읽기 쉬운 요약으로 출력합니다.
+
+    Args:
+        report (Dict): run_solver_benchmark()의 결과
+    """
+    config, summary = report['config'], report['summary']
+    print()
+    print(f"📊 솔버 종단 간 벤치마크: 어휘 {config['vocabulary_size']:,}개, "
+          f"게임 {config['games']}개, 최대 {config['max_attempts']}회, 시드 {config['seed']}")
+    print("=" * 72)
+    print(f"🎯 해결률: {summary['solved']}/{summary['games']} ({summary['solve_rate'] * 100:.1f}%)")
+    print(f"📈 시도 횟수(해결한 게임): 평균 {summary['mean_attempts']:.1f} | "
+          f"중앙값 {summary['median_attempts']:.1f} | p90 {summary['p90_attempts']:.1f} | "
+          f"p95 {summary['p95_attempts']:.1f} | p99 {summary['p99_attempts']:.1f}")
+    print("   분포: " + ", ".join(f"{bucket} {count}"
+                                 for bucket, count in summary['attempt_distribution'].items()))
+    print(f"⏱️ 게임당 소요 시간: 평균 {summary['mean_game_seconds']:.2f}초 | "
+          f"p50 {summary['p50_game_seconds']:.2f}초 | p95 {summary['p95_game_seconds']:.2f}초 "
+          f"(준비 {summary['setup_seconds']:.2f}초, 전체 {summary['total_seconds']:.1f}초)")
+    print("-" * 72)
+    print(f"{'단계':<26} | {'호출':>7} | {'p50':>9} | {'p95':>9} | {'p99':>9} | {'최대':>9}")
+    print("-" * 72)
+    for label, stats in report['latency'].items():
+        if not stats['calls']:
+            print(f"{label:<26} | {0:>7} | {'-':>9} | {'-':>9} | {'-':>9} | {'-':>9}")
+            continue
+        print(f"{label:<26} | {stats['calls']:>7} | {stats['p50_ms']:>6.2f} ms | "
+              f"{stats['p95_ms']:>6.2f} ms | {stats['p99_ms']:>6.2f} ms | {stats['max_ms']:>6.2f} ms")
+
+
+def main():
+    """명령행 인자를 처리하여 벤치마크를 실행합니다."""
+    parser = argparse.ArgumentParser(description="꼬맨틀 솔버 종단 간 벤치마크 (오프라인 시뮬레이션 게임)")
+    parser.add_argument('--games', type=int, default=50, help="실행할 게임 수")
+    parser.add_argument('--max-attempts', type=int, default=300, help="게임당 최대 시도 수")
+    parser.add_argument('--seed', type=int, default=7, help="정답 선택과 게임별 난수 시드")
+    parser.add_argument('--vocab-file', help="어휘 파일 (생략 시 합성 어휘)")
+    parser.add_argument('--embedding-file', help="솔버 임베딩 파일 (생략 시 합성 임베딩)")
+    parser.add_argument('--game-embedding-file',
+                        help="게임 모델 임베딩 파일 (생략 시 솔버 임베딩과 동일)")
+    parser.add_argument('--size', type=int, default=20000, help="합성 어휘 크기")
+    parser.add_argument('--dim', type=int, default=50, help="합성 임베딩 차원")
+    parser.add_argument('--noise', type=float, default=0.2, help="합성 게임 모델 잡음 크기")
+    parser.add_argument('--work-dir', help="학습/로그 파일 디렉토리 (생략 시 임시 디렉토리)")
+    parser.add_argument('--output', default='solver_benchmark.json', help="JSON 결과 파일")
+    parser.add_argument('--verbose', action='store_true', help="솔버 출력 표시")
+    args = parser.parse_args()
+
+    if bool(args.vocab_file) != bool(args.embedding_file):
+        parser.error("--vocab-file과 --embedding-file은 함께 지정해야 합니다.")
+
+    if args.vocab_file:
+        vocab_file, embedding_file = args.vocab_file, args.embedding_file
+        game_embedding_file = args.game_embedding_file or embedding_file
+    else:
+        print(f"🧪 합성 입력 준비: 어휘 {args.size:,}개, {args.dim}차원, 게임 모델 잡음 {args.noise}")
+        vocab_file, embedding_file, game_embedding_file = prepare_synthetic_inputs(
+            args.size, args.dim, args.noise)
+
+    with contextlib.ExitStack() as stack:
+        work_dir = args.work_dir or stack.enter_context(
+            tempfile.TemporaryDirectory(prefix='benchmark_solver_'))
+        os.makedirs(work_dir, exist_ok=True)
+        report = run_solver_benchmark(vocab_file, embedding_file, game_embedding_file,
+                                      args.games, args.max_attempts, args.seed, work_dir,
+                                      quiet=not args.verbose)
+
+    print_report(report)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
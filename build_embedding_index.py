@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+임베딩 색인 구축 스크립트
+솔버와 같은 어휘/임베딩 캐시를 사용하여 오프라인 색인을 만들고 캐시 옆에 저장합니다.
+
+사용법:
+    python build_embedding_index.py ivf --embeddings cc.ko.300.vec [--vocab words.xls]
+        [--lists 0] [--iterations 10] [--target-recall 0.95] [--k 10] [--queries 200]
+    python build_embedding_index.py quantize --embeddings cc.ko.300.vec [--vocab words.xls]
+        [--formats int8 pq] [--pq-subspaces 0] [--k 10] [--queries 200] [--drop-float32]
+    python build_embedding_index.py neighbors --embeddings cc.ko.300.vec [--vocab words.xls]
+        [--k 100] [--workers 0] [--block-size 4096] [--queries 200]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from modules.ann_index import IVFIndex, evaluate_recall
+from modules.embeddings import EmbeddingStore
+from modules.neighbor_table import NeighborTable
+from modules.quantization import QuantizedEmbeddingStore, evaluate_quantization
+from semantic_solver import SemanticSolver
+
+
+def load_embeddings(vocab_file: str, embedding_file: str) -> EmbeddingStore:
+    """
+    솔버와 같은 방식으로 어휘를 로드하고 임베딩 저장소를 엽니다 (같은 캐시 키 보장).
+
+    Args:
+        vocab_file (str): 어휘 파일 경로
+        embedding_file (str): 임베딩 파일 경로
+
+    Returns:
+        EmbeddingStore: 임베딩 저장소
+    """
+    solver = SemanticSolver(vocab_file, embedding_file=embedding_file)
+    embeddings = solver.vocabulary.embeddings
+    if embeddings is None:
+        print("❌ 임베딩을 로드하지 못했습니다.")
+        sys.exit(1)
+    return embeddings
+
+
+def build_ivf_index(embeddings: EmbeddingStore, n_lists: int, iterations: int,
+                    target_recall: float, k: int, query_count: int) -> IVFIndex:
+    """
+    IVF 색인을 구축하고 재현율 보고서를 출력한 뒤 캐시 옆에 저장합니다.
+
+    목표 재현율을 만족하는 가장 작은 탐색 군집 수를 색인의 기본값으로 저장합니다.
+
+    Args:
+        embeddings (EmbeddingStore): 임베딩 저장소
+        n_lists (int): 군집 수 (0이면 4 × sqrt(벡터 수))
+        iterations (int): k-평균 반복 횟수
+        target_recall (float): 기본 탐색 군집 수를 고를 목표 recall@k
+        k (int): 재현율을 측정할 상위 단어 수
+        query_count (int): 재현율 측정에 사용할 질의 수
+
+    Returns:
+        IVFIndex: 구축된 색인
+    """
+    print(f"🏗️ IVF 색인 구축 중: 벡터 {embeddings.coverage}개, {embeddings.dim}차원")
+    start = time.perf_counter()
+    index = IVFIndex.build(embeddings, n_lists or None, iterations)
+    print(f"✅ 구축 완료: 군집 {index.n_lists}개 ({time.perf_counter() - start:.1f}초)")
+
+    rng = np.random.default_rng(7)
+    present_ids = np.flatnonzero(embeddings.present)
+    query_ids = rng.choice(present_ids, min(query_count, len(present_ids)), replace=False)
+    report = evaluate_recall(index, embeddings, query_ids, k)
+    print_recall_report(report, k)
+
+    chosen = next((row['n_probe'] for row in report
+                   if row['n_probe'] and row['recall'] >= target_recall), None)
+    index.n_probe = chosen or report[-1]['n_probe'] or index.n_probe
+    print(f"🎯 기본 탐색 군집 수: {index.n_probe} (목표 recall@{k} {target_recall:.2f})")
+
+    index_path = IVFIndex.get_index_path(embeddings)
+    if index.save(index_path):
+        print(f"💾 색인 저장: {index_path}")
+    return index
+
+
+def print_recall_report(report, k: int) -> None:
+    """
+    탐색 군집 수별 재현율/지연 시간 보고서를 출력합니다.
+
+    Args:
+        report (List[Dict]): evaluate_recall() 결과
+        k (int): 재현율을 측정한 상위 단어 수
+    """
+    print(f"📊 재현율 vs 전수 비교 (recall@{k}, 질의 1회당)")
+    print("=" * 48)
+    print(f"{'탐색 군집':>10} | {'재현율':>8} | {'지연 시간':>12}")
+    print("-" * 48)
+    for row in report:
+        label = "전수 비교" if row['n_probe'] == 0 else str(row['n_probe'])
+        print(f"{label:>10} | {row['recall']:>8.3f} | {row['query_ms']:>9.3f} ms")
+
+
+def build_quantized_codes(embeddings: EmbeddingStore, formats, pq_subspaces: int, k: int,
+                          query_count: int, drop_float32: bool = False) -> None:
+    """
+    양자화 코드를 (다시) 만들어 캐시 옆에 저장하고 float32 대비 비교 보고서를 출력합니다.
+
+    Args:
+        embeddings (EmbeddingStore): float32 임베딩 저장소
+        formats (List[str]): 만들 양자화 형식들 ('int8', 'pq')
+        pq_subspaces (int): PQ 부분 공간 수 (0이면 차원 / 4)
+        k (int): 재현율을 측정할 상위 단어 수
+        query_count (int): 측정에 사용할 질의 수
+        drop_float32 (bool): 비교 후 float32 캐시 행렬(.emb.npy)을 지울지 여부
+            (양자화 형식 로드는 코드만 열므로 영향 없음)
+    """
+    quantized_stores = [QuantizedEmbeddingStore.from_store(embeddings, quantization,
+                                                           pq_subspaces or None, rebuild=True)
+                        for quantization in formats]
+
+    rng = np.random.default_rng(7)
+    present_ids = np.flatnonzero(embeddings.present)
+    query_ids = rng.choice(present_ids, min(query_count, len(present_ids)), replace=False)
+    report = evaluate_quantization(embeddings, quantized_stores, query_ids, k)
+
+    print(f"📊 저장 형식 비교: 벡터 {embeddings.coverage}개, {embeddings.dim}차원 "
+          f"(recall@{k}는 float32 전수 비교 기준, 질의 1회당)")
+    print("=" * 56)
+    print(f"{'형식':>8} | {'메모리':>10} | {'재현율':>8} | {'지연 시간':>12}")
+    print("-" * 56)
+    for row in report:
+        print(f"{row['format']:>8} | {row['bytes'] / 2 ** 20:>7.1f} MB | "
+              f"{row['recall']:>8.3f} | {row['query_ms']:>9.3f} ms")
+    print("💡 솔버에서 사용: SemanticSolver(embedding_file=..., embedding_quantization='int8')")
+
+    if drop_float32:
+        vectors_path = f"{embeddings.cache_prefix}.emb.npy"
+        size = os.path.getsize(vectors_path)
+        os.remove(vectors_path)
+        print(f"🗑️ float32 캐시 삭제: {vectors_path} ({size / 2 ** 20:.1f}MB)")
+
+
+def build_neighbor_table(embeddings: EmbeddingStore, k: int, workers: int, block_size: int,
+                         query_count: int) -> NeighborTable:
+    """
+    단어별 상위 k개 근접어 표를 프로세스 풀로 구축하고 전수 비교 대비 일치율/조회 시간을 출력합니다.
+
+    중단된 구축이 남아 있으면 완료된 블록을 건너뛰고 이어서 구축합니다.
+
+    Args:
+        embeddings (EmbeddingStore): float32 임베딩 저장소
+        k (int): 단어당 근접어 수
+        workers (int): 작업 프로세스 수 (0이면 CPU 수)
+        block_size (int): 작업 하나가 맡는 행 수
+        query_count (int): 검증에 사용할 질의 수
+
+    Returns:
+        NeighborTable: 구축된 근접어 표
+    """
+    print(f"🏗️ 근접어 표 구축 중: 단어 {len(embeddings)}개 × {k}개 "
+          f"(작업자 {workers or '자동'}, 블록 {block_size}행)")
+    start = time.perf_counter()
+    table = NeighborTable.build(embeddings, k, workers or None, block_size)
+    size = (table.ids.nbytes + table.scores.nbytes) / 2 ** 20
+    print(f"✅ 구축 완료: {size:.1f}MB ({time.perf_counter() - start:.1f}초)")
+    print(f"💾 저장: {NeighborTable.get_paths(embeddings.cache_prefix)[0]}")
+
+    rng = np.random.default_rng(7)
+    present_ids = np.flatnonzero(embeddings.present)
+    query_ids = [int(word_id) for word_id in
+                 rng.choice(present_ids, min(query_count, len(present_ids)), replace=False)]
+    top = min(10, table.k)
+
+    start = time.perf_counter()
+    truth = [[word_id for word_id, _ in embeddings.top_k(query_id, top, exact=True)]
+             for query_id in query_ids]
+    online_ms = (time.perf_counter() - start) * 1000 / max(len(query_ids), 1)
+
+    start = time.perf_counter()
+    found = [[word_id for word_id, _ in table.neighbors(query_id, top)] for query_id in query_ids]
+    table_ms = (time.perf_counter() - start) * 1000 / max(len(query_ids), 1)
+
+    hits = sum(len(set(expected) & set(result)) for expected, result in zip(truth, found))
+    print(f"📊 전수 비교 대비 recall@{top}: {hits / max(sum(map(len, truth)), 1):.3f}, "
+          f"질의당 {online_ms:.3f}ms → {table_ms:.3f}ms")
+    return table
+
+
+def main():
+    """메인 함수: 색인/양자화 코드/근접어 표를 구축합니다."""
+    parser = argparse.ArgumentParser(description="꼬맨틀 솔버 임베딩 색인 구축")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    ivf_parser = subparsers.add_parser('ivf', help="IVF 근사 최근접 이웃 색인 구축")
+    ivf_parser.add_argument('--embeddings', required=True, help="word2vec/fastText 임베딩 파일")
+    ivf_parser.add_argument('--vocab', default='words.xls', help="어휘 파일")
+    ivf_parser.add_argument('--lists', type=int, default=0, help="군집 수 (0이면 자동)")
+    ivf_parser.add_argument('--iterations', type=int, default=10)
+    ivf_parser.add_argument('--target-recall', type=float, default=0.95)
+    ivf_parser.add_argument('--k', type=int, default=10)
+    ivf_parser.add_argument('--queries', type=int, default=200)
+
+    quantize_parser = subparsers.add_parser('quantize', help="int8/PQ 양자화 코드 생성 및 비교")
+    quantize_parser.add_argument('--embeddings', required=True, help="word2vec/fastText 임베딩 파일")
+    quantize_parser.add_argument('--vocab', default='words.xls', help="어휘 파일")
+    quantize_parser.add_argument('--formats', nargs='+', default=['int8', 'pq'],
+                                 choices=['int8', 'pq'])
+    quantize_parser.add_argument('--pq-subspaces', type=int, default=0,
+                                 help="PQ 부분 공간 수 (0이면 차원 / 4)")
+    quantize_parser.add_argument('--k', type=int, default=10)
+    quantize_parser.add_argument('--queries', type=int, default=200)
+    quantize_parser.add_argument('--drop-float32', action='store_true',
+                                 help="양자화 후 float32 캐시 행렬 삭제 (float32로 다시 로드하면 재변환)")
+
+    neighbors_parser = subparsers.add_parser('neighbors', help="단어별 상위 K개 근접어 표 구축")
+    neighbors_parser.add_argument('--embeddings', required=True, help="word2vec/fastText 임베딩 파일")
+    neighbors_parser.add_argument('--vocab', default='words.xls', help="어휘 파일")
+    neighbors_parser.add_argument('--k', type=int, default=100, help="단어당 근접어 수")
+    neighbors_parser.add_argument('--workers', type=int, default=0, help="작업 프로세스 수 (0이면 CPU 수)")
+    neighbors_parser.add_argument('--block-size', type=int, default=4096, help="작업당 행 수")
+    neighbors_parser.add_argument('--queries', type=int, default=200)
+
+    args = parser.parse_args()
+    embeddings = load_embeddings(args.vocab, args.embeddings)
+
+    if args.command == 'ivf':
+        build_ivf_index(embeddings, args.lists, args.iterations, args.target_recall,
+                        args.k, args.queries)
+    elif args.command == 'quantize':
+        build_quantized_codes(embeddings, args.formats, args.pq_subspaces, args.k, args.queries,
+                              args.drop_float32)
+    elif args.command == 'neighbors':
+        build_neighbor_table(embeddings, args.k, args.workers, args.block_size, args.queries)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+로컬 게임 서버 실행 스크립트
+솔버와 같은 어휘/임베딩 캐시로 semantle-ko를 흉내 내는 로컬 HTTP 서버를 띄웁니다.
+
+사용법:
+    python local_game_server.py --embeddings cc.ko.300.vec [--vocab words.xls]
+        [--target 사과 | --seed 7] [--host 127.0.0.1] [--port 8000] [--day 1]
+        [--latency 0.05] [--jitter 0.02] [--error-rate 0.01] [--error-status 503]
+
+브라우저 백엔드는 WebAutomationConfig(game_url='http://127.0.0.1:8000/')로 접속하고,
+통계는 http://127.0.0.1:8000/stats 에서 확인합니다.
+"""
+
+import argparse
+import threading
+
+from build_embedding_index import load_embeddings
+from modules.game_server import GameServerConfig, LocalGameServer
+from modules.simulated_game import SimulatedGame, SimulatedGameConfig
+
+
+def main():
+    """메인 함수: 로컬 게임 서버를 실행합니다."""
+    parser = argparse.ArgumentParser(description="꼬맨틀 로컬 게임 서버 (semantle-ko 흉내)")
+    parser.add_argument('--embeddings', required=True, help="게임 모델 word2vec/fastText 임베딩 파일")
+    parser.add_argument('--vocab', default='words.xls', help="게임 어휘 파일")
+    parser.add_argument('--target', help="정답 단어 (생략 시 --seed로 무작위 선택)")
+    parser.add_argument('--seed', type=int, help="정답 선택과 지연/오류 주입 난수 시드")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--day', type=int, default=1, help="게임 페이지의 퍼즐 번호")
+    parser.add_argument('--latency', type=float, default=0.0, help="추측 응답 지연 (초)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="지연에 더할 무작위 폭 (초)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="추측 요청 오류 주입 확률")
+    parser.add_argument('--error-status', type=int, default=503, help="주입한 오류의 HTTP 상태 코드")
+    args = parser.parse_args()
+
+    embeddings = load_embeddings(args.vocab, args.embeddings)
+    game = SimulatedGame(embeddings.vocabulary,
+                         SimulatedGameConfig(target_word=args.target, seed=args.seed),
+                         embeddings=embeddings)
+    server = LocalGameServer(game, GameServerConfig(
+        host=args.host, port=args.port, day=args.day, latency=args.latency,
+        latency_jitter=args.jitter, error_rate=args.error_rate, error_status=args.error_status,
+        seed=args.seed))
+
+    server.start()
+    print(f"🌐 로컬 게임 서버 실행 중: {server.url} (정답: {game.target_word}, Ctrl+C로 종료)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        print(f"\n📊 서버 통계: {server.get_stats()}")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
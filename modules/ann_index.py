@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+근사 최근접 이웃 색인 모듈
+임베딩 행렬 위의 IVF(역파일, k-평균 중심) 색인을 NumPy로 구현합니다.
+"""
+
+import os
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .embeddings import EmbeddingStore
+
+
+class IVFIndex:
+    """
+    IVF(Inverted File) 근사 최근접 이웃 색인
+
+    단위 벡터들을 구면 k-평균으로 n_lists개 군집으로 나누고, 질의 시 질의와 가장 가까운
+    n_probe개 군집의 단어들만 정확한 내적으로 비교합니다.
+    n_probe를 늘리면 재현율이 오르고 지연 시간이 늘어납니다.
+
+    색인은 오프라인에서 구축하여 임베딩 캐시 옆(.ivf.npz)에 저장하며,
+    역리스트는 CSR 형식(offsets + ids)으로 보관합니다.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, centroids: np.ndarray, list_offsets: np.ndarray, list_ids: np.ndarray,
+                 n_probe: int = 8):
+        """
+        색인을 초기화합니다.
+
+        Args:
+            centroids (np.ndarray): (n_lists, 차원) 단위 중심 벡터
+            list_offsets (np.ndarray): 군집별 역리스트 시작 위치 (n_lists + 1)
+            list_ids (np.ndarray): 군집 순서로 정렬된 단어 ID들
+            n_probe (int): 기본 탐색 군집 수
+        """
+        if len(list_offsets) != len(centroids) + 1:
+            raise ValueError("역리스트 오프셋 수가 중심 수와 맞지 않습니다.")
+
+        self.centroids = centroids
+        self.list_offsets = list_offsets
+        self.list_ids = list_ids
+        self.n_probe = max(1, min(n_probe, len(centroids)))
+
+    @property
+    def n_lists(self) -> int:
+        """군집(역리스트) 수"""
+        return len(self.centroids)
+
+    @classmethod
+    def build(cls, embeddings: EmbeddingStore, n_lists: Optional[int] = None,
+              iterations: int = 10, sample_size: Optional[int] = None,
+              n_probe: int = 8, seed: int = 42, chunk_size: int = 65536) -> 'IVFIndex':
+        """
+        임베딩 행렬로 IVF 색인을 구축합니다 (오프라인 작업).
+
+        Args:
+            embeddings (EmbeddingStore): 임베딩 저장소
+            n_lists (Optional[int]): 군집 수 (None이면 4 × sqrt(벡터 수))
+            iterations (int): k-평균 반복 횟수
+            sample_size (Optional[int]): k-평균 학습 표본 크기 (None이면 군집당 64개)
+            n_probe (int): 기본 탐색 군집 수
+            seed (int): 난수 시드
+            chunk_size (int): 배정 단계에서 한 번에 처리할 행 수
+
+        Returns:
+            IVFIndex: 구축된 색인
+        """
+        word_ids = np.flatnonzero(embeddings.present)
+        if len(word_ids) == 0:
+            raise ValueError("벡터가 있는 단어가 없어 색인을 만들 수 없습니다.")
+
+        if n_lists is None:
+            n_lists = int(4 * np.sqrt(len(word_ids)))
+        n_lists = max(1, min(n_lists, len(word_ids)))
+        sample_size = min(len(word_ids), sample_size or n_lists * 64)
+
+        rng = np.random.default_rng(seed)
+        sample = np.asarray(embeddings.vectors[np.sort(rng.choice(word_ids, sample_size,
+                                                                   replace=False))])
+        centroids = sample[rng.choice(sample_size, n_lists, replace=False)].copy()
+
+        # 구면 k-평균: 내적 최대 중심에 배정 후 평균을 다시 정규화
+        for _ in range(iterations):
+            assignments = cls._assign(sample, centroids, chunk_size)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            counts = np.bincount(assignments, minlength=n_lists)
+
+            empty = np.flatnonzero(counts == 0)
+            if len(empty):
+                sums[empty] = sample[rng.choice(sample_size, len(empty), replace=False)]
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            centroids = (sums / np.maximum(norms, 1e-12)).astype(np.float32)
+
+        assignments = np.empty(len(word_ids), dtype=np.int64)
+        for start in range(0, len(word_ids), chunk_size):
+            rows = np.asarray(embeddings.vectors[word_ids[start:start + chunk_size]])
+            assignments[start:start + chunk_size] = cls._assign(rows, centroids, chunk_size)
+
+        order = np.argsort(assignments, kind='stable')
+        list_offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignments, minlength=n_lists), out=list_offsets[1:])
+        list_ids = word_ids[order].astype(np.int32)
+
+        return cls(centroids, list_offsets, list_ids, n_probe)
+
+    @staticmethod
+    def _assign(rows: np.ndarray, centroids: np.ndarray, chunk_size: int) -> np.ndarray:
+        """행들을 내적이 가장 큰 중심에 배정합니다."""
+        assignments = np.empty(len(rows), dtype=np.int64)
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            assignments[start:start + chunk_size] = np.argmax(chunk @ centroids.T, axis=1)
+        return assignments
+
+    @staticmethod
+    def get_index_path(embeddings: EmbeddingStore) -> str:
+        """
+        임베딩 캐시 옆에 저장할 색인 파일 경로를 반환합니다.
+
+        Args:
+            embeddings (EmbeddingStore): 임베딩 저장소 (load()로 연 저장소)
+
+        Returns:
+            str: 색인 파일 경로
+        """
+        if not embeddings.cache_prefix:
+            raise ValueError("캐시 파일에서 연 임베딩 저장소만 색인 경로를 가집니다.")
+        return f"{embeddings.cache_prefix}.ivf.npz"
+
+    def save(self, file_path: str) -> bool:
+        """
+        색인을 파일에 저장합니다 (임시 파일에 쓴 뒤 원자적 교체).
+
+        Args:
+            file_path (str): 저장 경로 (.npz)
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        try:
+            temp_path = f"{file_path}.tmp.npz"
+            np.savez(temp_path, version=np.array(self.FORMAT_VERSION), centroids=self.centroids,
+                     list_offsets=self.list_offsets, list_ids=self.list_ids,
+                     n_probe=np.array(self.n_probe))
+            os.replace(temp_path, file_path)
+            return True
+        except OSError as e:
+            print(f"⚠️ ANN 색인 저장 실패: {e}")
+            return False
+
+    @classmethod
+    def load(cls, file_path: str) -> Optional['IVFIndex']:
+        """
+        파일에서 색인을 로드합니다.
+
+        Args:
+            file_path (str): 색인 파일 경로
+
+        Returns:
+            Optional[IVFIndex]: 색인 (파일이 없거나 형식이 다르면 None)
+        """
+        if not os.path.exists(file_path):
+            return None
+
+        try:
+            with np.load(file_path) as data:
+                if int(data['version']) != cls.FORMAT_VERSION:
+                    return None
+                return cls(data['centroids'], data['list_offsets'], data['list_ids'],
+                           int(data['n_probe']))
+        except (OSError, KeyError, ValueError) as e:
+            print(f"⚠️ ANN 색인 로드 실패: {e}")
+            return None
+
+    def search(self, embeddings: EmbeddingStore, queries: np.ndarray, k: int = 10,
+               mask: Optional[np.ndarray] = None, exclude: Sequence[int] = (),
+               n_probe: Optional[int] = None) -> List[List[Tuple[int, float]]]:
+        """
+        질의별 상위 k개 근사 최근접 단어를 찾습니다.
+
+        Args:
+            embeddings (EmbeddingStore): 색인을 구축한 임베딩 저장소
+            queries (np.ndarray): (질의 수, 차원) 단위 질의 벡터
+            k (int): 질의당 반환할 단어 수
+            mask (Optional[np.ndarray]): 단어 ID별 허용 여부 (None이면 전체 허용)
+            exclude (Sequence[int]): 질의별로 제외할 단어 ID (-1이면 없음)
+            n_probe (Optional[int]): 탐색 군집 수 (None이면 색인 기본값)
+
+        Returns:
+            List[List[Tuple[int, float]]]: 질의별 (단어 ID, 유사도) 목록 (유사도 높은 순)
+        """
+        n_probe = max(1, min(n_probe or self.n_probe, self.n_lists))
+        centroid_scores = queries @ self.centroids.T
+        if n_probe < self.n_lists:
+            probes = np.argpartition(-centroid_scores, n_probe - 1, axis=1)[:, :n_probe]
+        else:
+            probes = np.broadcast_to(np.arange(self.n_lists), centroid_scores.shape)
+
+        results = []
+        for row, query in enumerate(queries):
+            ids = np.concatenate([self.list_ids[self.list_offsets[p]:self.list_offsets[p + 1]]
+                                  for p in probes[row]])
+            if mask is not None:
+                ids = ids[mask[ids]]
+            if row < len(exclude) and exclude[row] >= 0:
+                ids = ids[ids != exclude[row]]
+            if len(ids) == 0:
+                results.append([])
+                continue
+
+            scores = embeddings.similarities([query], ids)[0]
+            top = EmbeddingStore._top_from_scores(scores, k)
+            results.append([(int(ids[position]), score) for position, score in top])
+        return results
+
+
+def evaluate_recall(index: IVFIndex, embeddings: EmbeddingStore, query_ids: Sequence[int],
+                    k: int = 10,
+                    n_probes: Sequence[int] = (1, 2, 4, 8, 16, 32, 64, 128)) -> List[Dict]:
+    """
+    탐색 군집 수별 재현율(정확한 전수 비교 대비 recall@k)과 질의 지연 시간을 측정합니다.
+
+    Args:
+        index (IVFIndex): 평가할 색인
+        embeddings (EmbeddingStore): 임베딩 저장소
+        query_ids (Sequence[int]): 질의 단어 ID들
+        k (int): 비교할 상위 단어 수
+        n_probes (Sequence[int]): 평가할 탐색 군집 수 목록
+
+    Returns:
+        List[Dict]: n_probe별 {'n_probe', 'recall', 'query_ms'}와 전수 비교 기준 {'n_probe': 0, ...}
+    """
+    query_ids = [int(word_id) for word_id in query_ids if embeddings.has_vector(int(word_id))]
+    if not query_ids:
+        return []
+    queries = np.asarray(embeddings.vectors[query_ids])
+
+    # 전략은 결정마다 질의 몇 개씩 조회하므로 전수 비교도 질의 단위로 측정
+    start = time.perf_counter()
+    exact = [[word_id for word_id, _ in embeddings.top_k(word_id, k, exact=True)]
+             for word_id in query_ids]
+    exact_ms = (time.perf_counter() - start) * 1000 / len(query_ids)
+
+    report = [{'n_probe': 0, 'recall': 1.0, 'query_ms': exact_ms}]
+    for n_probe in n_probes:
+        if n_probe > index.n_lists:
+            break
+        start = time.perf_counter()
+        approximate = [index.search(embeddings, queries[row:row + 1], k, embeddings.present,
+                                    query_ids[row:row + 1], n_probe)[0]
+                       for row in range(len(query_ids))]
+        query_ms = (time.perf_counter() - start) * 1000 / len(query_ids)
+
+        hits = sum(len(set(truth) & {word_id for word_id, _ in found})
+                   for truth, found in zip(exact, approximate))
+        total = sum(len(truth) for truth in exact)
+        report.append({'n_probe': n_probe, 'recall': hits / max(total, 1), 'query_ms': query_ms})
+    return report
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+묶음 게임 시뮬레이터 모듈
+숨은 정답이 서로 다른 여러 게임을 한 단계씩 함께 진행하며 전략을 대량으로 평가합니다.
+"""
+
+import contextlib
+import os
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .constraints import CandidateConstraints
+from .models import RANKED_LIMIT, GameSession, GuessResult
+from .strategy_engine import StrategyEngine
+from .target_estimator import TargetEstimator
+from .vocabulary import Vocabulary
+
+if TYPE_CHECKING:
+    from .learning_engine import LearningEngine
+
+
+@dataclass
+class SimulationResult:
+    """
+    시뮬레이션한 게임 하나의 결과
+
+    Attributes:
+        target_id (int): 숨은 정답 단어 ID
+        solved (bool): 최대 시도 안에 정답을 맞혔는지 여부
+        attempts (int): 게임이 받아들인 추측 수 (정답 포함)
+        best_similarity (float): 최고 유사도
+        rejected (int): 게임 모델에 없어 거부된 제안 수
+    """
+    target_id: int
+    solved: bool
+    attempts: int
+    best_similarity: float
+    rejected: int = 0
+
+
+class BatchSimulator:
+    """
+    잠금 단계(lockstep) 묶음 게임 시뮬레이터
+
+    게임마다 숨은 정답, GameSession(관측 제약 후보 마스크/정답 추정기 포함)을 따로 두고,
+    매 단계 진행 중인 모든 게임이 한 단어씩 추측합니다.
+    추측들의 유사도는 (게임 수, 차원) 행 두 묶음의 행별 내적 한 번으로 계산하고,
+    순위(상위 1000위)는 게임 시작 시 정답 행들과 전체 어휘의 행렬 곱 한 번으로 만든
+    순위표에서 벡터화된 비교로 찾습니다. 관측 제약도 게임들을 묶어 처리합니다:
+    후보가 많은 게임의 추측 유사도 행과, 모순 관측으로 허용 오차를 넓혀야 하는 게임들의
+    지난 관측 행을 게임마다가 아니라 묶음 행렬 곱으로 계산합니다.
+
+    다음 단어 선택은 게임마다 전략 엔진을 호출합니다. 전략(학습 관계, 파생어, 순위 이웃,
+    탐색 등)이 게임 상태에 따라 달라지고 파이썬 자료구조를 쓰므로 게임들을 하나의
+    행렬 연산으로 묶을 수 없으며, 이 부분이 묶음 크기를 키워도 줄지 않는 비용입니다.
+
+    게임 모델은 기본적으로 어휘의 임베딩이며, game_vectors로 다른 행렬(예: 잡음을 섞은
+    모델)을 주면 로컬 모델과 게임 모델이 어긋나는 상황을 재현할 수 있습니다.
+    """
+
+    # 관측 제약 후보가 어휘의 이 비율 이상인 게임은 유사도 행을 묶음 행렬 곱으로 미리 계산
+    # (그보다 적으면 후보 행만 모아 계산하는 편이 빠름)
+    DENSE_OBSERVATION_FRACTION = 0.1
+
+    def __init__(self, vocabulary: Vocabulary, strategy_engine: Optional[StrategyEngine] = None,
+                 learning_engine: Optional['LearningEngine'] = None,
+                 game_vectors: Optional[np.ndarray] = None, constraint_tolerance: float = 1.0,
+                 use_estimator: bool = True, quiet: bool = True,
+                 learning_recorder: Optional['LearningEngine'] = None):
+        """
+        시뮬레이터를 초기화합니다.
+
+        Args:
+            vocabulary (Vocabulary): 임베딩이 연결된 공유 어휘
+            strategy_engine (Optional[StrategyEngine]): 평가할 전략 엔진 (None이면 로깅 없는 기본 엔진)
+            learning_engine (Optional[LearningEngine]): 학습 데이터/탐색 가중치 제공 (None이면 학습 없음)
+            game_vectors (Optional[np.ndarray]): 게임 모델의 (후보 어휘 크기, 차원) 단위 벡터 행렬
+                (None이면 어휘 임베딩 사용)
+            constraint_tolerance (float): 세션 관측 제약의 허용 오차
+            use_estimator (bool): 세션에 정답 벡터 추정기를 연결할지 여부
+            quiet (bool): 전략들의 진행 출력을 숨길지 여부
+            learning_recorder (Optional[LearningEngine]): 추측마다의 관계 학습과 게임 결과를
+                기록할 학습 엔진 (None이면 기록 안 함, 병렬 실행기는 빈 엔진에 증분만 기록)
+        """
+        embeddings = vocabulary.embeddings
+        if embeddings is None:
+            raise ValueError("시뮬레이터는 임베딩이 연결된 어휘가 필요합니다.")
+        if game_vectors is not None and game_vectors.shape[0] != len(embeddings):
+            raise ValueError("게임 모델 행렬의 행 수가 후보 어휘 크기와 다릅니다.")
+
+        self.vocabulary = vocabulary
+        self.embeddings = embeddings
+        self.strategy_engine = strategy_engine or StrategyEngine(enable_logging=False)
+        self.learning_engine = learning_engine
+        self.game_vectors = game_vectors
+        self.constraint_tolerance = constraint_tolerance
+        self.use_estimator = use_estimator
+        self.quiet = quiet
+        self.learning_recorder = learning_recorder
+
+        if game_vectors is None:
+            self.game_present = np.asarray(embeddings.present, dtype=bool)
+        else:
+            self.game_present = np.linalg.norm(game_vectors, axis=1) > 0
+
+    def run(self, target_ids: Sequence[int], max_attempts: int = 300,
+            batch_size: int = 256) -> List[SimulationResult]:
+        """
+        정답마다 게임 하나씩을 batch_size개씩 묶어 잠금 단계로 진행합니다.
+
+        Args:
+            target_ids (Sequence[int]): 게임별 숨은 정답 단어 ID
+            max_attempts (int): 게임당 최대 추측 수
+            batch_size (int): 함께 진행할 게임 수 (1이면 게임을 하나씩 진행)
+
+        Returns:
+            List[SimulationResult]: target_ids 순서의 게임 결과
+        """
+        if batch_size <= 0 or max_attempts <= 0:
+            raise ValueError("묶음 크기와 최대 시도 횟수는 0보다 커야 합니다.")
+
+        results: List[SimulationResult] = []
+        for start in range(0, len(target_ids), batch_size):
+            results.extend(self._run_batch(
+                np.asarray(target_ids[start:start + batch_size], dtype=np.int64), max_attempts))
+        return results
+
+    def _run_batch(self, targets: np.ndarray, max_attempts: int) -> List[SimulationResult]:
+        """게임 묶음 하나를 모두 끝날 때까지 진행합니다."""
+        if not self.game_present[targets].all():
+            raise ValueError("게임 모델에 벡터가 없는 단어는 정답이 될 수 없습니다.")
+
+        rank_ids = self._rank_table(targets)
+        sessions = [self._new_session() for _ in targets]
+        results = [SimulationResult(int(target_id), False, 0, 0.0) for target_id in targets]
+        learned_data = (self.learning_engine.get_learned_data() if self.learning_engine
+                        else {'vocabulary': self.vocabulary})
+        active = np.arange(len(targets))
+
+        while len(active):
+            guesses = self._select_guesses(sessions, active, learned_data)
+
+            # 제안이 없으면 그 게임은 종료, 게임 모델에 없는 단어는 거부 처리
+            exhausted = guesses < 0
+            known = ~exhausted & (guesses < len(self.game_present))
+            rejected = ~exhausted & ~(known & self.game_present[np.where(known, guesses, 0)])
+            for row in np.flatnonzero(rejected):
+                sessions[active[row]].mark_tried_id(int(guesses[row]))
+                results[active[row]].rejected += 1
+
+            accepted = ~exhausted & ~rejected
+            games, guesses = active[accepted], guesses[accepted]
+            similarities = self._similarities(guesses, targets[games])
+            ranks = self._ranks(rank_ids[games], guesses)
+            rows = self._dense_observation_rows(sessions, games, guesses)
+
+            for position, (game, word_id, similarity, rank) in enumerate(
+                    zip(games, guesses, similarities, ranks)):
+                result = results[game]
+                result.attempts += 1
+                solved = word_id == targets[game]
+                rank_text = ("정답!" if solved else
+                             f"{rank}위" if rank else f"{RANKED_LIMIT}위 이상")
+                guess_result = GuessResult(
+                    self.vocabulary.get_word(int(word_id)),
+                    100.0 if solved else float(similarity), rank_text, result.attempts)
+                sessions[game].add_guess(guess_result, rows.get(position))
+                result.best_similarity = sessions[game].get_best_similarity()
+                result.solved = bool(solved)
+                if self.learning_recorder is not None:
+                    # 세션 추측은 유사도 순이므로 방금 만든 결과를 넘김 (자기 자신과의 쌍은 건너뜀)
+                    self.learning_recorder.learn_word_relationships(
+                        guess_result, sessions[game].guesses)
+            self._widen_constraints([sessions[game].constraints for game in games])
+
+            finished = set(active[exhausted].tolist())
+            still_active = [game for game in active.tolist()
+                            if game not in finished and not results[game].solved
+                            and results[game].attempts < max_attempts]
+            if self.learning_recorder is not None:
+                self._record_finished(sessions, results, set(active.tolist()) - set(still_active))
+            active = np.array(still_active, dtype=np.int64)
+
+        return results
+
+    def _record_finished(self, sessions: List[GameSession], results: List[SimulationResult],
+                         games: set) -> None:
+        """끝난 게임들의 결과를 솔버처럼 학습 기록 엔진에 반영합니다 (저장 없음)."""
+        with contextlib.ExitStack() as stack:
+            if self.quiet:
+                stack.enter_context(contextlib.redirect_stdout(
+                    stack.enter_context(open(os.devnull, 'w'))))
+            for game in sorted(games):
+                result = results[game]
+                self.learning_recorder.record_session(
+                    sessions[game], result.solved,
+                    self.vocabulary.get_word(result.target_id) if result.solved else None)
+
+    def _new_session(self) -> GameSession:
+        """솔버의 start_new_session()과 같은 구성으로 게임 세션을 만듭니다."""
+        session = GameSession(self.vocabulary)
+        if self.learning_engine is not None:
+            session.available.set_weights(
+                self.learning_engine.get_exploration_weights(self.vocabulary.base_size))
+
+        session.constraints = CandidateConstraints(self.embeddings, self.constraint_tolerance)
+        # 모순 관측의 허용 오차 넓히기는 단계마다 _widen_constraints()가 묶어서 수행
+        session.constraints.defer_widening = True
+        if self.use_estimator:
+            session.target_estimator = TargetEstimator(self.embeddings)
+        return session
+
+    def _select_guesses(self, sessions: List[GameSession], active: np.ndarray,
+                        learned_data: Dict) -> np.ndarray:
+        """진행 중인 게임마다 전략 엔진으로 다음 단어 ID를 고릅니다 (없으면 -1)."""
+        guesses = np.full(len(active), -1, dtype=np.int64)
+        with contextlib.ExitStack() as stack:
+            if self.quiet:
+                stack.enter_context(contextlib.redirect_stdout(
+                    stack.enter_context(open(os.devnull, 'w'))))
+            for row, game in enumerate(active):
+                session = sessions[game]
+                word_id = self.strategy_engine.select_next_word_id(
+                    session, session.available, learned_data)
+                if word_id is not None:
+                    guesses[row] = word_id
+        return guesses
+
+    def _dense_observation_rows(self, sessions: List[GameSession], games: np.ndarray,
+                                guesses: np.ndarray, chunk_size: int = 64) -> Dict[int, np.ndarray]:
+        """
+        관측 제약 후보가 아직 많은 게임들의 추측 유사도 행을 질의 묶음 행렬 곱으로
+        한꺼번에 계산합니다 (후보가 줄어든 게임은 제약이 후보 행만 모아 계산).
+
+        Returns:
+            Dict[int, np.ndarray]: 이번 단계 추측 위치 → 로컬 임베딩 유사도 행
+        """
+        threshold = len(self.embeddings) * self.DENSE_OBSERVATION_FRACTION
+        dense = [position for position, game in enumerate(games)
+                 if sessions[game].constraints.count >= threshold]
+        rows: Dict[int, np.ndarray] = {}
+        for start in range(0, len(dense), chunk_size):
+            positions = dense[start:start + chunk_size]
+            scores = self.embeddings.similarities([int(guesses[position]) for position in positions])
+            rows.update(zip(positions, scores))
+        return rows
+
+    def _widen_constraints(self, constraints_list: List[CandidateConstraints],
+                           chunk_size: int = 128) -> None:
+        """
+        이번 단계에서 모순 관측이 나온 게임들의 허용 오차를 함께 넓힙니다.
+
+        넓히려면 게임마다 지난 관측들의 전체 어휘 유사도 행이 필요하므로, 여러 게임의
+        관측 단어를 chunk_size 행 안팎씩 모아 행렬 곱 한 번으로 계산합니다
+        (임베딩 행렬을 게임마다 읽는 대신 묶음마다 한 번 읽음).
+        """
+        pending = []
+        for constraints in constraints_list:
+            if not constraints.pending_widening:
+                continue
+            if (constraints.tolerance >= constraints.max_tolerance or
+                    len(constraints.observations) > chunk_size):
+                # 다시 계산할 행이 없거나 혼자서 묶음을 넘는 게임은 스스로 넓힘
+                constraints.widen()
+            else:
+                pending.append(constraints)
+
+        start = 0
+        while start < len(pending):
+            group, rows = [], 0
+            while (start < len(pending) and
+                   rows + len(pending[start].observations) <= chunk_size):
+                group.append(pending[start])
+                rows += len(pending[start].observations)
+                start += 1
+
+            scores = self.embeddings.similarities(
+                [word_id for constraints in group for word_id, _ in constraints.observations])
+            offset = 0
+            for constraints in group:
+                size = len(constraints.observations)
+                constraints.widen(scores[offset:offset + size])
+                offset += size
+
+    def _game_rows(self, word_ids: np.ndarray) -> np.ndarray:
+        """게임 모델의 단위 벡터 행들을 모읍니다."""
+        if self.game_vectors is None:
+            return np.asarray(self.embeddings.vectors[word_ids], dtype=np.float32)
+        return np.asarray(self.game_vectors[word_ids], dtype=np.float32)
+
+    def _similarities(self, guesses: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        """
+        모든 게임의 이번 추측 유사도를 행별 내적 한 번으로 계산합니다.
+
+        게임은 음수 유사도를 0으로 잘라 보여주므로 0 ~ 100 점수로 반올림해 돌려줍니다.
+        """
+        if not len(guesses):
+            return np.zeros(0)
+        cosines = np.einsum('ij,ij->i', self._game_rows(guesses), self._game_rows(targets))
+        return np.clip(np.round(cosines.astype(np.float64) * 100.0, 2), 0.0, 100.0)
+
+    def _rank_table(self, targets: np.ndarray, chunk_size: int = 64) -> np.ndarray:
+        """
+        게임별 정답의 상위 999개 근접어 순위표를 만듭니다 (정답 자신 제외, 1위부터).
+
+        Returns:
+            np.ndarray: (게임 수, RANKED_LIMIT - 1) 단어 ID (순위 순)
+        """
+        limit = min(RANKED_LIMIT - 1, int(np.count_nonzero(self.game_present)) - 1)
+        table = np.full((len(targets), max(limit, 0)), -1, dtype=np.int64)
+        if limit <= 0:
+            return table
+
+        for start in range(0, len(targets), chunk_size):
+            rows = targets[start:start + chunk_size]
+            if self.game_vectors is None:
+                scores = self.embeddings.similarities([int(row) for row in rows])
+            else:
+                scores = self._game_rows(rows) @ np.asarray(self.game_vectors, dtype=np.float32).T
+            scores[:, ~self.game_present] = -np.inf
+            scores[np.arange(len(rows)), rows] = -np.inf
+
+            top = np.argpartition(-scores, limit - 1, axis=1)[:, :limit]
+            order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1, kind='stable')
+            table[start:start + len(rows)] = np.take_along_axis(top, order, axis=1)
+        return table
+
+    @staticmethod
+    def _ranks(rank_ids: np.ndarray, guesses: np.ndarray) -> np.ndarray:
+        """게임별 순위표에서 추측의 순위를 찾습니다 (순위 밖이면 0)."""
+        if not len(guesses) or not rank_ids.shape[1]:
+            return np.zeros(len(guesses), dtype=np.int64)
+        matches = rank_ids == guesses[:, None]
+        return np.where(matches.any(axis=1), matches.argmax(axis=1) + 1, 0)
+
+
+def summarize_results(results: Sequence[SimulationResult], elapsed: Optional[float] = None) -> Dict:
+    """
+    시뮬레이션 결과를 요약합니다.
+
+    Args:
+        results (Sequence[SimulationResult]): 게임 결과들
+        elapsed (Optional[float]): 전체 소요 시간 (초, 주면 초당 게임 수 포함)
+
+    Returns:
+        Dict: games, solved, solve_rate, mean/median/p90 attempts(해결한 게임 기준), games_per_second
+    """
+    attempts = np.array([result.attempts for result in results if result.solved])
+    summary = {
+        'games': len(results),
+        'solved': int(len(attempts)),
+        'solve_rate': len(attempts) / max(len(results), 1),
+        'mean_attempts': float(attempts.mean()) if len(attempts) else 0.0,
+        'median_attempts': float(np.median(attempts)) if len(attempts) else 0.0,
+        'p90_attempts': float(np.percentile(attempts, 90)) if len(attempts) else 0.0,
+    }
+    if elapsed is not None:
+        summary['games_per_second'] = len(results) / elapsed if elapsed > 0 else 0.0
+    return summary
+
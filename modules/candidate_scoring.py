@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+후보 점수 계산 모듈
+후보 단어 ID 배열 전체의 점수 요소를 NumPy 배열 연산으로 한 번에 계산합니다.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .models import GameSession, GuessResult
+from .vocabulary import Vocabulary, pack_pair
+
+
+class CandidateScorer:
+    """
+    묶음 후보 점수 계산기
+
+    어휘 전체를 (단어 수, 최대 길이) 음절 코드 행렬로 보관하고,
+    후보 ID 배열에 대해 빈도 사전 점수, 상위 추측과의 학습된 관계, 어근(접두사) 공유,
+    다양성 보너스, 임베딩 유사도를 모두 배열 연산으로 계산합니다.
+    이후 인터닝된 단어는 다음 계산 때 행렬에 자동으로 추가됩니다.
+
+    공통 음절 수는 음절 역색인(음절 코드 → 그 음절을 포함한 단어 ID 포스팅)으로도
+    계산할 수 있습니다. 포스팅을 훑는 비용이 후보 행렬 비교보다 작은 큰 후보 묶음에서는
+    역색인을 사용하므로, 비용이 "후보 수 × 단어 길이"가 아니라 실제로 겹치는 단어 수에
+    비례합니다. 역색인은 처음 필요할 때 코드 행렬로부터 배열 연산 한 번으로 구축됩니다.
+    """
+
+    # 후보가 이보다 적으면 역색인을 구축하지 않고 행렬 비교만 사용
+    INDEX_MIN_CANDIDATES = 256
+    # 포스팅 원소 하나를 훑는 비용 (행렬 비교 칸 하나 대비)
+    POSTING_COST = 4
+
+    def __init__(self, vocabulary: Vocabulary):
+        """
+        점수 계산기를 초기화합니다.
+
+        Args:
+            vocabulary (Vocabulary): 단어 ID 인터닝 테이블
+        """
+        self.vocabulary = vocabulary
+        self._codes = np.zeros((0, 1), dtype=np.uint32)
+        self._lengths = np.zeros(0, dtype=np.int32)
+        self._first_occurrence = np.zeros((0, 1), dtype=bool)
+
+        # 음절 역색인 (CSR 형식: 음절 코드별 단어 ID 구간, 처음 필요할 때 구축)
+        self._syllable_keys = np.zeros(0, dtype=np.uint32)
+        self._syllable_offsets = np.zeros(1, dtype=np.int64)
+        self._syllable_postings = np.zeros(0, dtype=np.int32)
+        self._indexed_count = 0
+        self._counts = np.zeros(0, dtype=np.int32)
+
+        self._refresh()
+
+    def _refresh(self) -> None:
+        """어휘에 새로 인터닝된 단어들을 음절 코드 행렬에 추가합니다."""
+        start = len(self._lengths)
+        new_words = self.vocabulary.words[start:]
+        if not new_words:
+            return
+
+        # 고정 폭 유니코드 배열을 uint32 코드 행렬로 재해석 (빈 칸은 0)
+        text = np.array(new_words, dtype=str)
+        width = max(text.dtype.itemsize // 4, 1)
+        codes = np.ascontiguousarray(text).view(np.uint32).reshape(len(new_words), width)
+        lengths = np.fromiter((len(word) for word in new_words), dtype=np.int32,
+                              count=len(new_words))
+
+        # 단어 안에서 처음 등장하는 음절 표시 (공통 음절 수를 집합 기준으로 세기 위함)
+        first_occurrence = codes != 0
+        for column in range(1, width):
+            repeated = (codes[:, :column] == codes[:, column:column + 1]).any(axis=1)
+            first_occurrence[:, column] &= ~repeated
+
+        total_width = max(width, self._codes.shape[1])
+        self._codes = np.concatenate([self._pad(self._codes, total_width),
+                                      self._pad(codes, total_width)])
+        self._first_occurrence = np.concatenate([
+            self._pad(self._first_occurrence, total_width),
+            self._pad(first_occurrence, total_width)])
+        self._lengths = np.concatenate([self._lengths, lengths])
+
+    @staticmethod
+    def _pad(matrix: np.ndarray, width: int) -> np.ndarray:
+        """행렬의 열 수를 width로 맞춥니다 (0/False로 채움)."""
+        if matrix.shape[1] == width:
+            return matrix
+        padded = np.zeros((len(matrix), width), dtype=matrix.dtype)
+        padded[:, :matrix.shape[1]] = matrix
+        return padded
+
+    def _encode(self, word: str) -> np.ndarray:
+        """단어를 행렬 폭에 맞춘 음절 코드 벡터로 변환합니다."""
+        codes = np.zeros(self._codes.shape[1], dtype=np.uint32)
+        limit = min(len(word), len(codes))
+        codes[:limit] = [ord(char) for char in word[:limit]]
+        return codes
+
+    def as_ids(self, candidate_ids: Sequence[int]) -> np.ndarray:
+        """
+        후보 ID들을 정수 배열로 변환하고 음절 코드 행렬을 최신 어휘에 맞춥니다.
+
+        Args:
+            candidate_ids (Sequence[int]): 후보 단어 ID들
+
+        Returns:
+            np.ndarray: int64 후보 ID 배열
+        """
+        self._refresh()
+        return np.asarray(candidate_ids, dtype=np.int64)
+
+    def lengths(self, ids: np.ndarray) -> np.ndarray:
+        """후보들의 음절 길이 배열을 반환합니다."""
+        return self._lengths[ids]
+
+    def gather(self, ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        후보들의 음절 코드 행과 첫 등장 음절 표시 행을 한 번에 모읍니다.
+        여러 기준 단어와 비교할 때 행 수집을 반복하지 않도록 결과를 재사용합니다.
+
+        Args:
+            ids (np.ndarray): 후보 ID 배열
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (음절 코드 행렬, 첫 등장 음절 표시 행렬)
+        """
+        return self._codes[ids], self._first_occurrence[ids]
+
+    def common_prefix_lengths(self, word: str, codes: np.ndarray) -> np.ndarray:
+        """
+        기준 단어와 앞 두 음절 이상을 공유하는 후보들의 공통 접두사 길이를 계산합니다.
+
+        Args:
+            word (str): 기준 단어
+            codes (np.ndarray): gather()로 모은 후보 음절 코드 행렬
+
+        Returns:
+            np.ndarray: 후보별 공통 접두사 길이 (2음절 미만 공유면 0)
+        """
+        lengths = np.zeros(len(codes), dtype=np.int64)
+        if len(word) < 2 or codes.shape[1] < 2:
+            return lengths
+
+        # 앞 두 음절이 같은 후보만 전체 열을 비교
+        encoded = self._encode(word)
+        rows = np.flatnonzero((codes[:, 0] == encoded[0]) & (codes[:, 1] == encoded[1]))
+        if len(rows):
+            limit = min(len(word), codes.shape[1])
+            matches = codes[rows, :limit] == encoded[:limit]
+            lengths[rows] = np.logical_and.accumulate(matches, axis=1).sum(axis=1)
+        return lengths
+
+    def shared_syllable_counts(self, word: str, codes: np.ndarray,
+                               first_occurrence: np.ndarray) -> np.ndarray:
+        """
+        기준 단어와 후보들의 공통 음절 수 len(set(후보) & set(기준))를 계산합니다.
+
+        Args:
+            word (str): 기준 단어
+            codes (np.ndarray): gather()로 모은 후보 음절 코드 행렬
+            first_occurrence (np.ndarray): gather()로 모은 첫 등장 음절 표시 행렬
+
+        Returns:
+            np.ndarray: 후보별 공통 음절 수
+        """
+        hits = np.zeros(codes.shape, dtype=bool)
+        for syllable in set(word):
+            hits |= codes == ord(syllable)
+        hits &= first_occurrence
+        return hits.sum(axis=1)
+
+    def _build_syllable_index(self) -> None:
+        """음절 코드 행렬의 첫 등장 음절들로 음절 역색인을 다시 구축합니다."""
+        rows, columns = np.nonzero(self._first_occurrence)
+        keys = self._codes[rows, columns]
+        # 안정 정렬이므로 포스팅 안의 단어 ID는 오름차순
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        self._syllable_postings = rows[order].astype(np.int32)
+        self._syllable_keys, starts = np.unique(keys, return_index=True)
+        self._syllable_offsets = np.append(starts, len(keys)).astype(np.int64)
+        self._indexed_count = len(self._lengths)
+        self._counts = np.zeros(len(self._lengths), dtype=np.int32)
+
+    def syllable_postings(self, syllable: str) -> np.ndarray:
+        """
+        음절을 포함한 단어 ID들을 음절 역색인에서 찾습니다.
+
+        Args:
+            syllable (str): 음절 하나
+
+        Returns:
+            np.ndarray: 단어 ID 배열 (오름차순, 없으면 빈 배열)
+        """
+        self._refresh()
+        if self._indexed_count != len(self._lengths):
+            self._build_syllable_index()
+
+        code = ord(syllable)
+        position = int(np.searchsorted(self._syllable_keys, code))
+        if position == len(self._syllable_keys) or self._syllable_keys[position] != code:
+            return self._syllable_postings[:0]
+        return self._syllable_postings[self._syllable_offsets[position]:
+                                       self._syllable_offsets[position + 1]]
+
+    def indexed_syllable_counts(self, word: str, ids: np.ndarray) -> np.ndarray:
+        """
+        음절 역색인으로 기준 단어와 후보들의 공통 음절 수를 계산합니다.
+
+        기준 단어의 음절마다 포스팅의 단어들만 단어 ID별 계수 배열에 더한 뒤
+        후보 위치의 값을 모으므로, 비용은 포스팅 길이 합 + 후보 수입니다.
+
+        Args:
+            word (str): 기준 단어
+            ids (np.ndarray): 후보 ID 배열
+
+        Returns:
+            np.ndarray: 후보별 공통 음절 수 (shared_syllable_counts()와 같은 값)
+        """
+        postings = [self.syllable_postings(syllable) for syllable in set(word)]
+        # 포스팅 안의 단어 ID는 서로 다르므로 묶음 덧셈으로 충분
+        for posting in postings:
+            self._counts[posting] += 1
+        counts = self._counts[ids].astype(np.int64)
+        for posting in postings:
+            self._counts[posting] = 0
+        return counts
+
+    def _prefers_index(self, word: str, ids: np.ndarray, width: int) -> bool:
+        """포스팅을 훑는 비용이 후보 행렬 비교보다 작은지 판단합니다."""
+        if len(ids) < self.INDEX_MIN_CANDIDATES:
+            return False
+        matrix_cost = len(ids) * width * len(set(word))
+        posting_cost = sum(len(self.syllable_postings(syllable)) for syllable in set(word))
+        return posting_cost * self.POSTING_COST < matrix_cost
+
+    def overlap_counts(self, word: str, ids: np.ndarray, codes: np.ndarray,
+                       first_occurrence: np.ndarray) -> np.ndarray:
+        """
+        기준 단어와 후보들의 공통 음절 수를 더 싼 방법(역색인 또는 행렬 비교)으로 계산합니다.
+
+        Args:
+            word (str): 기준 단어
+            ids (np.ndarray): 후보 ID 배열
+            codes (np.ndarray): gather()로 모은 후보 음절 코드 행렬
+            first_occurrence (np.ndarray): gather()로 모은 첫 등장 음절 표시 행렬
+
+        Returns:
+            np.ndarray: 후보별 공통 음절 수
+        """
+        if self._prefers_index(word, ids, codes.shape[1]):
+            return self.indexed_syllable_counts(word, ids)
+        return self.shared_syllable_counts(word, codes, first_occurrence)
+
+    def frequency_prior(self, ids: np.ndarray, learned_data: Dict) -> np.ndarray:
+        """
+        학습된 단어 빈도의 사전 점수 (평균 유사도 × log(횟수 + 1) × 5)를 조회합니다.
+
+        학습 엔진이 유지하는 단어 ID별 사전 점수 배열이 있으면 복사 없이 조회하고,
+        없으면 word_frequency로부터 계산합니다.
+
+        Args:
+            ids (np.ndarray): 후보 ID 배열
+            learned_data (Dict): 학습된 데이터
+
+        Returns:
+            np.ndarray: 후보별 사전 점수
+        """
+        prior_buffer = learned_data.get('frequency_prior')
+        if prior_buffer is not None:
+            prior = np.frombuffer(prior_buffer, dtype=np.float64)
+        else:
+            word_frequency = learned_data.get('word_frequency', {})
+            prior = np.zeros(len(self.vocabulary), dtype=np.float64)
+            for word_id, freq_data in word_frequency.items():
+                prior[word_id] = (freq_data.get('avg_similarity', 0) *
+                                  np.log(freq_data.get('count', 0) + 1) * 5)
+
+        scores = np.zeros(len(ids), dtype=np.float64)
+        inside = ids < len(prior)
+        scores[inside] = prior[ids[inside]]
+        return scores
+
+    @staticmethod
+    def pair_average_diffs(guess_id: int, ids: np.ndarray, learned_data: Dict) -> np.ndarray:
+        """
+        기준 추측과 후보들 사이의 학습된 평균 유사도 차이를 조회합니다.
+
+        Args:
+            guess_id (int): 기준 추측 단어 ID
+            ids (np.ndarray): 후보 ID 배열
+            learned_data (Dict): 학습된 데이터 (word_pairs, pair_partners)
+
+        Returns:
+            np.ndarray: 후보별 평균 유사도 차이 (학습된 쌍이 없으면 NaN)
+        """
+        diffs = np.full(len(ids), np.nan)
+        partners = learned_data.get('pair_partners', {}).get(guess_id)
+        if not partners:
+            return diffs
+
+        # 학습된 쌍의 유사도 차이 목록은 길이가 제각각이므로 평균은 겹치는 후보에 대해서만 계산
+        word_pairs = learned_data.get('word_pairs', {})
+        if len(ids) <= len(partners):
+            # 후보가 적으면 상대 집합 멤버십 확인이 배열 변환보다 빠름
+            matched = [(position, word_id) for position, word_id in enumerate(ids.tolist())
+                       if word_id in partners]
+        else:
+            partner_ids = np.fromiter(partners, dtype=np.int64, count=len(partners))
+            positions = np.flatnonzero(np.isin(ids, partner_ids))
+            matched = zip(positions.tolist(), ids[positions].tolist())
+
+        for position, word_id in matched:
+            pair_data = word_pairs.get(pack_pair(guess_id, word_id))
+            similarity_diffs = pair_data.get('similarity_diffs') if pair_data else None
+            if similarity_diffs:
+                diffs[position] = sum(similarity_diffs) / len(similarity_diffs)
+        return diffs
+
+    def embedding_scores(self, guesses: Sequence[GuessResult], ids: np.ndarray,
+                         weight: float = 3.0) -> np.ndarray:
+        """
+        추측들과 후보들의 임베딩 코사인 유사도를 추측 유사도로 가중 합산합니다.
+
+        Args:
+            guesses (Sequence[GuessResult]): 기준 추측들
+            ids (np.ndarray): 후보 ID 배열
+            weight (float): 추측 유사도에 곱할 가중치
+
+        Returns:
+            np.ndarray: 후보별 임베딩 점수 (임베딩이 없으면 0)
+        """
+        embeddings = self.vocabulary.embeddings
+        if embeddings is None or not guesses:
+            return np.zeros(len(ids))
+        cosines = embeddings.similarities([g.word_id for g in guesses], ids)
+        return np.asarray([g.similarity * weight for g in guesses]) @ cosines
+
+    def score_gradient(self, candidate_ids: Sequence[int], session: GameSession,
+                       learned_data: Dict) -> np.ndarray:
+        """
+        의미적 경사 탐색의 후보 점수를 계산합니다.
+
+        점수 요소:
+            1. 빈도 사전 점수
+            2. 상위 3개 추측과의 학습된 관계 (1 - 평균차이/100) × 유사도 × 3
+            3. 최근 5개 추측과의 어근 공유 (공통 접두사 2음절 이상) × 유사도
+            4. 최근 3개 추측과의 음절 겹침이 적당하면(0.2 ~ 0.7) 다양성 보너스 1
+            5. 상위 추측과의 임베딩 유사도 (임베딩이 연결된 경우)
+
+        Args:
+            candidate_ids (Sequence[int]): 후보 단어 ID들
+            session (GameSession): 현재 게임 세션
+            learned_data (Dict): 학습된 데이터
+
+        Returns:
+            np.ndarray: 후보별 점수
+        """
+        ids = self.as_ids(candidate_ids)
+        lengths = self.lengths(ids)
+        long_words = lengths > 2
+        codes, first_occurrence = self.gather(ids)
+        top_guesses = session.get_top_guesses(3)
+
+        scores = self.frequency_prior(ids, learned_data)
+
+        for guess in top_guesses:
+            diffs = self.pair_average_diffs(guess.word_id, ids, learned_data)
+            scores += np.nan_to_num((1 - diffs / 100) * guess.similarity * 3)
+
+        prefix_scores = np.zeros(len(ids))
+        for guess in session.guesses[-5:]:
+            if len(guess.word) > 2:
+                prefix_scores += guess.similarity * self.common_prefix_lengths(guess.word, codes)
+        scores += np.where(long_words, prefix_scores, 0)
+
+        recent_words = [g.word for g in session.guesses[-3:]]
+        if recent_words:
+            overlap = np.zeros(len(ids))
+            for recent in recent_words:
+                if len(recent) > 2:
+                    overlap += (self.overlap_counts(recent, ids, codes, first_occurrence) /
+                                np.maximum(lengths, len(recent)))
+            overlap = np.where(long_words, overlap / len(recent_words), 0)
+            scores += (overlap > 0.2) & (overlap < 0.7)
+
+        scores += self.embedding_scores(top_guesses, ids)
+        return scores
+
+    def score_focused(self, candidate_ids: Sequence[int], best_guess: GuessResult,
+                      session: GameSession, learned_data: Dict) -> np.ndarray:
+        """
+        집중 의미 탐색의 후보 점수를 계산합니다.
+
+        점수 요소:
+            1. 최고 단어와 매우 유사한(평균차이 < 5) 학습된 관계면 10 × (1 - 평균차이/100)
+            2. 최근 유사도 기울기가 양수면 기울기 × 5
+            3. 최고 단어와의 공통 음절 비율 × 최고 유사도 × 3
+
+        Args:
+            candidate_ids (Sequence[int]): 후보 단어 ID들
+            best_guess (GuessResult): 현재 최고 유사도 추측
+            session (GameSession): 현재 게임 세션
+            learned_data (Dict): 학습된 데이터
+
+        Returns:
+            np.ndarray: 후보별 점수
+        """
+        ids = self.as_ids(candidate_ids)
+        lengths = self.lengths(ids)
+
+        diffs = self.pair_average_diffs(best_guess.word_id, ids, learned_data)
+        with np.errstate(invalid='ignore'):
+            close = diffs < 5
+        scores = np.where(close, 10 * (1 - diffs / 100), 0.0)
+
+        recent_guesses = session.guesses[-5:]
+        if len(recent_guesses) >= 2:
+            gradient = ((recent_guesses[-1].similarity - recent_guesses[0].similarity) /
+                        len(recent_guesses))
+            if gradient > 0:
+                scores += gradient * 5
+
+        if len(best_guess.word) > 2:
+            shared = self.overlap_counts(best_guess.word, ids, *self.gather(ids))
+            char_similarity = shared / np.maximum(lengths, len(best_guess.word))
+            scores += np.where(lengths > 2, char_similarity * best_guess.similarity * 3, 0)
+
+        return scores
+
+    @staticmethod
+    def top_k(candidate_ids: Sequence[int], scores: np.ndarray,
+              k: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        점수 상위 k개 후보를 점수 내림차순으로 반환합니다 (동점이면 입력 순서 유지).
+
+        Args:
+            candidate_ids (Sequence[int]): 후보 단어 ID들
+            scores (np.ndarray): 후보별 점수
+            k (Optional[int]): 반환할 후보 수 (None이면 전체)
+
+        Returns:
+            List[Tuple[int, float]]: (단어 ID, 점수) 목록
+        """
+        count = len(scores)
+        if k is None or k >= count:
+            order = np.argsort(-scores, kind='stable')
+        elif k <= 0:
+            return []
+        else:
+            # k번째 점수 이상인 후보만 남긴 뒤 정렬 (경계 동점도 입력 순서대로 처리)
+            threshold = np.partition(scores, count - k)[count - k]
+            selected = np.flatnonzero(scores >= threshold)
+            order = selected[np.argsort(-scores[selected], kind='stable')][:k]
+
+        return [(int(candidate_ids[position]), float(scores[position])) for position in order]
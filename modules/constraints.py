@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+관측 제약 모듈
+추측마다 게임이 알려준 유사도로 정답 후보를 좁히는 제약 엔진을 제공합니다.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .embeddings import EmbeddingStore
+from .vocabulary import AvailableVocabulary
+
+
+class CandidateConstraints:
+    """
+    관측 일관성 기반 정답 후보 집합
+
+    추측 단어 w의 유사도 s가 관측되면, 정답 t는 cos(w, t) × 100 ≈ s를 만족해야 합니다.
+    로컬 임베딩이 게임 모델을 따른다고 보고, 관측마다 살아남은 후보들과 w의 유사도를
+    한 번의 행렬-벡터 곱으로 계산하여 허용 오차 밖의 후보를 제거합니다.
+
+    후보가 줄어들수록 다음 관측의 계산량도 함께 줄어들며,
+    각 후보의 누적 제곱 오차(관측과의 불일치 정도)를 함께 유지합니다.
+    """
+
+    def __init__(self, embeddings: EmbeddingStore, tolerance: float = 1.0, scale: float = 100.0,
+                 max_tolerance: float = 16.0):
+        """
+        제약 엔진을 초기화합니다 (처음에는 벡터가 있는 모든 단어가 후보).
+
+        Args:
+            embeddings (EmbeddingStore): 어휘 ID 순서의 임베딩 저장소
+            tolerance (float): 관측 유사도와 예측 유사도의 허용 오차 (유사도 점수 단위)
+            scale (float): 게임 유사도 점수 배율 (코사인 × scale)
+            max_tolerance (float): 관측이 서로 모순될 때 넓힐 수 있는 최대 허용 오차
+        """
+        if tolerance < 0:
+            raise ValueError("허용 오차는 0 이상이어야 합니다.")
+
+        self.embeddings = embeddings
+        self.tolerance = tolerance
+        self.max_tolerance = max(max_tolerance, tolerance)
+        self.scale = scale
+
+        self.observations: List[Tuple[int, float]] = []
+        self.surviving_counts: List[int] = []
+        self.skipped_observations = 0
+        self.inconsistent_observations = 0
+        # True면 모순 관측의 허용 오차 넓히기를 widen() 호출까지 미룸
+        # (묶음 시뮬레이터가 여러 세션의 관측 행을 한 번에 계산해 넘김)
+        self.defer_widening = False
+        self.pending_widening = False
+        self._reset()
+
+    def _reset(self) -> None:
+        """후보 집합을 벡터가 있는 모든 단어로 되돌립니다."""
+        self.mask = np.array(self.embeddings.present, dtype=bool)
+        self.candidate_ids = np.flatnonzero(self.mask)
+        self.fit_errors = np.zeros(len(self.candidate_ids), dtype=np.float64)
+        self.applied_observations = 0
+
+    @property
+    def count(self) -> int:
+        """현재 살아남은 후보 수"""
+        return len(self.candidate_ids)
+
+    @property
+    def is_active(self) -> bool:
+        """후보를 실제로 좁힌 관측이 하나 이상 있는지 여부"""
+        return self.applied_observations > 0
+
+    def observe(self, word_id: int, similarity: float,
+                scores: Optional[np.ndarray] = None) -> int:
+        """
+        관측 하나로 후보 집합을 좁힙니다.
+
+        모든 후보가 제거되는 관측은 로컬 임베딩과 게임 모델이 어긋났다는 신호이므로,
+        허용 오차를 두 배씩 넓혀 지금까지의 관측을 다시 적용합니다
+        (defer_widening이면 pending_widening만 표시하고 widen() 호출을 기다림).
+
+        Args:
+            word_id (int): 추측한 단어 ID
+            similarity (float): 게임이 알려준 유사도 (0.0 ~ 100.0)
+            scores (Optional[np.ndarray]): 추측 단어와 전체 어휘의 코사인 유사도 행
+                (여러 세션의 관측을 묶어 미리 계산한 경우, None이면 직접 계산)
+
+        Returns:
+            int: 관측 후 살아남은 후보 수
+        """
+        if not self.embeddings.has_vector(word_id):
+            self.skipped_observations += 1
+        else:
+            self.observations.append((word_id, similarity))
+            if not self._apply(word_id, similarity, scores):
+                if self.defer_widening:
+                    self.pending_widening = True
+                else:
+                    self._widen()
+
+        self.surviving_counts.append(self.count)
+        return self.count
+
+    def _apply(self, word_id: int, similarity: float, scores: Optional[np.ndarray] = None) -> bool:
+        """
+        관측 하나를 현재 후보들에 적용합니다.
+
+        Args:
+            word_id (int): 추측한 단어 ID
+            similarity (float): 관측 유사도
+            scores (Optional[np.ndarray]): 미리 계산한 추측 단어의 전체 어휘 유사도 행
+
+        Returns:
+            bool: 적용 여부 (모든 후보가 제거되면 적용하지 않고 False)
+        """
+        if scores is not None:
+            predicted = scores[self.candidate_ids]
+        elif self.count * 2 >= len(self.embeddings):
+            # 후보가 많을 때는 행 수집(복사)보다 전체 행렬-벡터 곱이 빠름
+            predicted = self.embeddings.similarities([word_id])[0][self.candidate_ids]
+        else:
+            predicted = self.embeddings.similarities([word_id], self.candidate_ids)[0]
+        residuals = predicted.astype(np.float64) * self.scale - similarity
+        if similarity <= 0.0:
+            # 음수 유사도는 0으로 잘려 보고되므로 상한만 적용
+            residuals = np.maximum(residuals, 0.0)
+        keep = np.abs(residuals) <= self.tolerance
+        keep &= self.candidate_ids != word_id  # 정답이 아닌 추측 단어 자신
+
+        if not keep.any():
+            return False
+
+        self.mask[self.candidate_ids[~keep]] = False
+        self.candidate_ids = self.candidate_ids[keep]
+        self.fit_errors = self.fit_errors[keep] + residuals[keep] ** 2
+        self.applied_observations += 1
+        return True
+
+    def widen(self, scores: Optional[np.ndarray] = None) -> int:
+        """
+        미뤄 둔 허용 오차 넓히기를 수행합니다 (pending_widening이 아니면 아무것도 하지 않음).
+
+        Args:
+            scores (Optional[np.ndarray]): 관측 순서의 (관측 수, 전체 어휘) 코사인 유사도 행렬
+                (여러 세션의 관측을 묶어 미리 계산한 경우, None이면 직접 계산)
+
+        Returns:
+            int: 넓힌 뒤 살아남은 후보 수
+        """
+        if not self.pending_widening:
+            return self.count
+        if scores is not None and len(scores) != len(self.observations):
+            raise ValueError("유사도 행 수가 관측 수와 다릅니다.")
+
+        self.pending_widening = False
+        self._widen(scores=scores)
+        self.surviving_counts[-1] = self.count
+        return self.count
+
+    def _widen(self, chunk_size: int = 64, scores: Optional[np.ndarray] = None) -> None:
+        """
+        허용 오차를 두 배씩 넓혀 모든 관측이 일관되는 후보 집합을 다시 만듭니다.
+
+        관측들을 묶음 행렬 곱으로 한 번만 훑어 단어별 최대 |잔차|와 제곱 잔차 합을 구하므로,
+        후보가 남는 가장 작은 허용 오차를 단계마다 관측을 다시 적용하지 않고 바로 찾습니다.
+        최대 허용 오차로도 모순되면 같은 훑기에서 관측 순서대로 적용한 결과(모든 후보를
+        제거하는 관측은 건너뜀)를 사용합니다.
+
+        Args:
+            chunk_size (int): 한 번의 행렬 곱으로 계산할 관측 수
+            scores (Optional[np.ndarray]): 미리 계산한 관측 순서의 전체 어휘 유사도 행렬
+        """
+        if self.tolerance >= self.max_tolerance:
+            # 이미 최대 허용 오차: 다시 적용해도 지금 상태에서 마지막 관측만 건너뛴 결과와 같음
+            self.inconsistent_observations += 1
+            return
+
+        present = np.asarray(self.embeddings.present, dtype=bool)
+        worst = np.zeros(len(self.embeddings), dtype=np.float64)
+        squared = np.zeros(len(self.embeddings), dtype=np.float64)
+        greedy = present.copy()
+        greedy_errors = np.zeros(len(self.embeddings), dtype=np.float64)
+        greedy_applied = 0
+
+        for start in range(0, len(self.observations), chunk_size):
+            chunk = self.observations[start:start + chunk_size]
+            rows = (scores[start:start + chunk_size] if scores is not None else
+                    self.embeddings.similarities([word_id for word_id, _ in chunk]))
+            for row, (word_id, similarity) in zip(rows, chunk):
+                residuals = row.astype(np.float64) * self.scale - similarity
+                if similarity <= 0.0:
+                    residuals = np.maximum(residuals, 0.0)
+                deviations = np.abs(residuals)
+                residuals **= 2
+                np.maximum(worst, deviations, out=worst)
+                squared += residuals
+
+                # _apply()와 같은 규칙: 추측 단어는 그 관측이 적용될 때만 제외
+                keep = greedy & (deviations <= self.max_tolerance)
+                keep[word_id] = False
+                if keep.any():
+                    greedy = keep
+                    greedy_errors += residuals
+                    greedy_applied += 1
+
+        worst[~present] = np.inf
+        worst[[word_id for word_id, _ in self.observations]] = np.inf
+        best = float(worst.min())
+        while self.tolerance < self.max_tolerance:
+            self.tolerance = min(self.tolerance * 2, self.max_tolerance)
+            if best <= self.tolerance:
+                self._set_candidates(worst <= self.tolerance, squared, len(self.observations))
+                self.inconsistent_observations = 0
+                return
+
+        # 최대 허용 오차로도 모순되는 관측은 건너뜀
+        self._set_candidates(greedy, greedy_errors, greedy_applied)
+        self.inconsistent_observations = len(self.observations) - greedy_applied
+
+    def _set_candidates(self, mask: np.ndarray, errors: np.ndarray, applied: int) -> None:
+        """후보 마스크와 단어별 누적 제곱 오차(전체 어휘 길이)로 후보 집합을 교체합니다."""
+        self.mask = mask
+        self.candidate_ids = np.flatnonzero(mask)
+        self.fit_errors = errors[self.candidate_ids]
+        self.applied_observations = applied
+
+    def consistent_ids(self, available: Optional[AvailableVocabulary] = None) -> np.ndarray:
+        """
+        살아남은 후보 중 아직 시도할 수 있는 단어 ID들을 반환합니다.
+
+        Args:
+            available (Optional[AvailableVocabulary]): 사용 가능한 어휘 뷰 (None이면 전체)
+
+        Returns:
+            np.ndarray: 단어 ID 배열 (단어 ID 순)
+        """
+        if available is None:
+            return self.candidate_ids
+        return self.candidate_ids[self._available_positions(available)]
+
+    def best_candidates(self, k: int = 10,
+                        available: Optional[AvailableVocabulary] = None) -> List[Tuple[int, float]]:
+        """
+        관측들과 가장 잘 맞는 후보들을 누적 제곱 오차가 작은 순으로 반환합니다.
+
+        Args:
+            k (int): 반환할 후보 수
+            available (Optional[AvailableVocabulary]): 사용 가능한 어휘 뷰 (None이면 전체)
+
+        Returns:
+            List[Tuple[int, float]]: (단어 ID, 평균 제곱 오차) 목록
+        """
+        positions = np.arange(len(self.candidate_ids))
+        if available is not None:
+            positions = positions[self._available_positions(available)]
+        if not len(positions) or k <= 0:
+            return []
+
+        errors = self.fit_errors[positions]
+        if len(positions) > k:
+            top = np.argpartition(errors, k - 1)[:k]
+            positions, errors = positions[top], errors[top]
+        order = np.argsort(errors, kind='stable')
+
+        observations = max(self.applied_observations, 1)
+        return [(int(self.candidate_ids[positions[i]]), float(errors[i]) / observations)
+                for i in order]
+
+    def _available_positions(self, available: AvailableVocabulary) -> np.ndarray:
+        """살아남은 후보 중 사용 가능한 단어의 위치 마스크를 계산합니다."""
+        flags = np.frombuffer(available.flag_view(), dtype=np.uint8)
+        inside = self.candidate_ids < len(flags)
+        positions = np.zeros(len(self.candidate_ids), dtype=bool)
+        positions[inside] = flags[self.candidate_ids[inside]] != 0
+        return positions
@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+"""
+단어 임베딩 모듈
+로컬 word2vec/fastText 파일을 어휘 ID 순서에 맞춘 메모리 매핑 행렬로 제공합니다.
+"""
+
+import hashlib
+import glob
+import os
+from typing import TYPE_CHECKING, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .vocabulary import Vocabulary
+
+if TYPE_CHECKING:
+    from .ann_index import IVFIndex
+    from .neighbor_table import NeighborTable
+    from .vocabulary import AvailableVocabulary
+
+
+# 질의: 단어 ID 또는 임베딩 벡터
+Query = Union[int, np.ndarray]
+
+
+def _vocabulary_digest(vocabulary: Vocabulary) -> bytes:
+    """
+    후보 어휘(ID 0 ~ base_size-1)의 순서까지 반영한 해시를 계산합니다.
+
+    Args:
+        vocabulary (Vocabulary): 단어 ID 인터닝 테이블
+
+    Returns:
+        bytes: SHA-256 해시 (32바이트)
+    """
+    digest = hashlib.sha256()
+    for word in vocabulary.words[:vocabulary.base_size]:
+        digest.update(word.encode('utf-8'))
+        digest.update(b'\n')
+    return digest.digest()
+
+
+class EmbeddingStore:
+    """
+    어휘 ID 정렬 단어 임베딩 저장소
+
+    행 i가 단어 ID i의 단위 벡터인 float32 행렬을 `.npy`로 변환해 두고 메모리 매핑으로 엽니다.
+    처음 한 번만 원본(word2vec/fastText 텍스트 또는 word2vec 바이너리)을 변환하며,
+    이후에는 파일을 매핑하기만 하므로 즉시 로드되고 여러 솔버 프로세스가 같은 페이지를 공유합니다.
+
+    벡터는 정규화되어 저장되므로 코사인 유사도는 내적과 같습니다.
+    원본에 없는 단어의 행은 0 벡터이며 근접어 검색에서 제외됩니다.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, vectors: np.ndarray, present: np.ndarray,
+                 vocabulary: Vocabulary, cache_key: str = ''):
+        """
+        임베딩 저장소를 초기화합니다.
+
+        Args:
+            vectors (np.ndarray): (후보 어휘 크기, 차원) 단위 벡터 행렬 (메모리 매핑 가능)
+            present (np.ndarray): 단어 ID별 벡터 존재 여부 (bool)
+            vocabulary (Vocabulary): 행 순서의 기준이 되는 어휘
+            cache_key (str): 원본 파일과 어휘로 계산한 캐시 키 (파생 색인 파일 이름에 사용)
+        """
+        if vectors.ndim != 2 or len(vectors) != len(present):
+            raise ValueError("임베딩 행렬과 존재 여부 배열의 크기가 맞지 않습니다.")
+        if len(vectors) != vocabulary.base_size:
+            raise ValueError("임베딩 행 수가 후보 어휘 크기와 다릅니다.")
+
+        self.vectors = vectors
+        self.present = present
+        self.vocabulary = vocabulary
+        self.cache_key = cache_key
+        self.coverage = int(np.count_nonzero(present))
+
+        # 캐시 파일 이름 접두사 (load()로 연 경우, 파생 색인 파일 경로에 사용)
+        self.cache_prefix: Optional[str] = None
+        # 근사 최근접 이웃 색인 (연결되면 top_k 검색이 전수 비교 대신 사용)
+        self.ann_index: Optional['IVFIndex'] = None
+        # 미리 계산한 근접어 표 (연결되면 단어 ID 질의의 top_k를 표에서 읽음)
+        self.neighbor_table: Optional['NeighborTable'] = None
+
+    @classmethod
+    def load(cls, source_file: str, vocabulary: Vocabulary,
+             cache_directory: str = '.cache', quantization: str = 'float32') -> 'EmbeddingStore':
+        """
+        변환된 캐시가 있으면 메모리 매핑으로 열고, 없으면 원본을 변환한 뒤 엽니다.
+
+        Args:
+            source_file (str): 원본 임베딩 파일 (.vec/.txt 텍스트 또는 .bin 바이너리)
+            vocabulary (Vocabulary): 행 순서의 기준이 되는 어휘
+            cache_directory (str): 변환된 행렬을 저장할 디렉토리
+            quantization (str): 저장 형식 ('float32', 'int8', 'pq'; 양자화 코드는 캐시 옆에 생성)
+
+        Returns:
+            EmbeddingStore: 임베딩 저장소 (양자화 형식이면 QuantizedEmbeddingStore)
+        """
+        cache_key = cls.compute_key(source_file, vocabulary)
+        vectors_path, present_path = cls.get_cache_paths(source_file, cache_key, cache_directory)
+
+        if quantization != 'float32':
+            # 양자화 코드가 이미 있으면 float32 행렬 없이 코드만 연다
+            from .quantization import QuantizedEmbeddingStore
+            quantized = QuantizedEmbeddingStore.open_cached(
+                vectors_path[:-len('.emb.npy')], quantization, vocabulary, cache_key)
+            if quantized is not None:
+                return quantized
+
+        if not (os.path.exists(vectors_path) and os.path.exists(present_path)):
+            cls.convert(source_file, vocabulary, vectors_path, present_path)
+
+        vectors = np.load(vectors_path, mmap_mode='r')
+        present = np.load(present_path)
+        store = cls(vectors, present, vocabulary, cache_key)
+        store.cache_prefix = vectors_path[:-len('.emb.npy')]
+
+        if quantization != 'float32':
+            from .quantization import QuantizedEmbeddingStore
+            return QuantizedEmbeddingStore.from_store(store, quantization)
+        return store
+
+    @classmethod
+    def compute_key(cls, source_file: str, vocabulary: Vocabulary) -> str:
+        """
+        원본 파일 메타데이터와 후보 어휘로 캐시 키를 계산합니다.
+        수 GB의 원본을 매번 해시하지 않도록 내용 대신 크기와 수정 시각을 사용합니다.
+
+        Args:
+            source_file (str): 원본 임베딩 파일 경로
+            vocabulary (Vocabulary): 행 순서의 기준이 되는 어휘
+
+        Returns:
+            str: 16진수 캐시 키 (16자)
+        """
+        stat = os.stat(source_file)
+        digest = hashlib.sha256()
+        digest.update(f"{cls.FORMAT_VERSION}|{os.path.abspath(source_file)}|"
+                      f"{stat.st_size}|{stat.st_mtime_ns}|".encode('utf-8'))
+        digest.update(_vocabulary_digest(vocabulary))
+        return digest.hexdigest()[:16]
+
+    @staticmethod
+    def get_cache_paths(source_file: str, cache_key: str,
+                        cache_directory: str = '.cache') -> Tuple[str, str]:
+        """
+        변환된 행렬과 존재 여부 배열의 파일 경로를 반환합니다.
+
+        Args:
+            source_file (str): 원본 임베딩 파일 경로
+            cache_key (str): 캐시 키
+            cache_directory (str): 캐시 디렉토리
+
+        Returns:
+            Tuple[str, str]: (행렬 .npy 경로, 존재 여부 .npy 경로)
+        """
+        base = os.path.join(cache_directory, f"{os.path.basename(source_file)}.{cache_key}")
+        return f"{base}.emb.npy", f"{base}.present.npy"
+
+    @classmethod
+    def convert(cls, source_file: str, vocabulary: Vocabulary,
+                vectors_path: str, present_path: str) -> int:
+        """
+        원본 임베딩 파일을 어휘 ID 순서의 정규화된 float32 행렬로 변환합니다.
+        행렬은 디스크에 직접 기록(open_memmap)하므로 전체를 메모리에 올리지 않습니다.
+
+        Args:
+            source_file (str): 원본 임베딩 파일 경로
+            vocabulary (Vocabulary): 행 순서의 기준이 되는 어휘
+            vectors_path (str): 행렬 저장 경로
+            present_path (str): 존재 여부 배열 저장 경로
+
+        Returns:
+            int: 벡터를 찾은 후보 단어 수
+        """
+        print(f"🔄 임베딩 변환 중: {source_file}")
+        rows = vocabulary.base_size
+        vector_iter = _iter_source_vectors(source_file, vocabulary)
+        dim = next(vector_iter)
+
+        os.makedirs(os.path.dirname(vectors_path) or '.', exist_ok=True)
+        temp_path = f"{vectors_path}.tmp.npy"
+        vectors = np.lib.format.open_memmap(temp_path, mode='w+', dtype=np.float32,
+                                            shape=(rows, dim))
+        present = np.zeros(rows, dtype=bool)
+
+        for word_id, vector in vector_iter:
+            if present[word_id]:
+                continue
+            norm = float(np.linalg.norm(vector))
+            if norm > 0:
+                vectors[word_id] = vector / norm
+                present[word_id] = True
+
+        vectors.flush()
+        del vectors
+
+        # 같은 캐시 키의 이전 변환 결과와 파생 색인 정리 후 원자적 교체 (존재 여부 배열 먼저)
+        # (다른 어휘로 같은 원본을 변환한 캐시는 키가 달라 건드리지 않음)
+        prefix = vectors_path[:-len('.emb.npy')]
+        for stale_path in glob.glob(f"{glob.escape(prefix)}.*.np[yz]"):
+            if stale_path != temp_path:
+                os.remove(stale_path)
+        np.save(f"{present_path}.tmp.npy", present)
+        os.replace(f"{present_path}.tmp.npy", present_path)
+        os.replace(temp_path, vectors_path)
+
+        found = int(np.count_nonzero(present))
+        print(f"✅ 임베딩 변환 완료: {found}/{rows}개 단어, {dim}차원 → {vectors_path}")
+        return found
+
+    def load_ann_index(self) -> bool:
+        """
+        오프라인에서 구축해 둔 IVF 색인이 캐시 옆에 있으면 연결합니다.
+
+        Returns:
+            bool: 색인 연결 여부
+        """
+        if not self.cache_prefix:
+            return False
+
+        from .ann_index import IVFIndex
+        self.ann_index = IVFIndex.load(IVFIndex.get_index_path(self))
+        return self.ann_index is not None
+
+    def load_neighbor_table(self) -> bool:
+        """
+        오프라인에서 구축해 둔 근접어 표가 캐시 옆에 있으면 연결합니다.
+
+        Returns:
+            bool: 표 연결 여부
+        """
+        if not self.cache_prefix:
+            return False
+
+        from .neighbor_table import NeighborTable
+        table = NeighborTable.load(self.cache_prefix)
+        self.neighbor_table = table if table is not None and len(table) == len(self) else None
+        return self.neighbor_table is not None
+
+    @property
+    def dim(self) -> int:
+        """임베딩 차원"""
+        return self.vectors.shape[1]
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    def has_vector(self, word_id: int) -> bool:
+        """단어 ID에 임베딩이 있는지 확인합니다."""
+        return 0 <= word_id < len(self.present) and bool(self.present[word_id])
+
+    def get_vector(self, word_id: int) -> Optional[np.ndarray]:
+        """
+        단어의 단위 임베딩 벡터를 반환합니다.
+
+        Args:
+            word_id (int): 단어 ID
+
+        Returns:
+            Optional[np.ndarray]: 임베딩 벡터 (없으면 None)
+        """
+        if not self.has_vector(word_id):
+            return None
+        return np.asarray(self.vectors[word_id], dtype=np.float32)
+
+    def _as_query_matrix(self, queries: Sequence[Query]) -> np.ndarray:
+        """질의들(단어 ID 또는 벡터)을 (질의 수, 차원) 단위 벡터 행렬로 만듭니다."""
+        matrix = np.zeros((len(queries), self.dim), dtype=np.float32)
+        for row, query in enumerate(queries):
+            if isinstance(query, (int, np.integer)):
+                if self.has_vector(int(query)):
+                    matrix[row] = self.vectors[query]
+            else:
+                vector = np.asarray(query, dtype=np.float32)
+                norm = float(np.linalg.norm(vector))
+                if norm > 0:
+                    matrix[row] = vector / norm
+        return matrix
+
+    def similarities(self, queries: Sequence[Query],
+                     candidate_ids: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        질의들과 후보들 사이의 코사인 유사도 행렬을 한 번의 행렬 곱으로 계산합니다.
+
+        Args:
+            queries (Sequence[Query]): 단어 ID 또는 벡터 질의들
+            candidate_ids (Optional[Sequence[int]]): 후보 단어 ID들 (None이면 전체 어휘)
+
+        Returns:
+            np.ndarray: (질의 수, 후보 수) float32 코사인 유사도 (벡터 없는 쪽은 0)
+        """
+        query_matrix = self._as_query_matrix(queries)
+
+        if candidate_ids is None:
+            return query_matrix @ self.vectors.T
+
+        ids = np.asarray(candidate_ids, dtype=np.int64)
+        inside = (ids >= 0) & (ids < len(self.vectors))
+        scores = np.zeros((len(query_matrix), len(ids)), dtype=np.float32)
+        if inside.any():
+            scores[:, inside] = query_matrix @ self.vectors[ids[inside]].T
+        return scores
+
+    def similarity(self, word_id1: int, word_id2: int) -> float:
+        """
+        두 단어의 코사인 유사도를 계산합니다.
+
+        Returns:
+            float: 코사인 유사도 (어느 한쪽에 벡터가 없으면 0)
+        """
+        if not (self.has_vector(word_id1) and self.has_vector(word_id2)):
+            return 0.0
+        return float(np.dot(self.vectors[word_id1], self.vectors[word_id2]))
+
+    def candidate_mask(self, available: Optional['AvailableVocabulary'] = None) -> np.ndarray:
+        """
+        근접어 검색 대상 마스크 (벡터가 있고 사용 가능한 단어)를 만듭니다.
+
+        Args:
+            available (Optional[AvailableVocabulary]): 사용 가능 어휘 뷰 (None이면 전체)
+
+        Returns:
+            np.ndarray: 단어 ID별 bool 마스크
+        """
+        if available is None:
+            return self.present
+
+        flags = np.frombuffer(available.flag_view(), dtype=np.uint8)
+        mask = np.zeros(len(self.present), dtype=bool)
+        limit = min(len(flags), len(mask))
+        mask[:limit] = flags[:limit] != 0
+        return mask & self.present
+
+    def top_k(self, query: Query, k: int = 10,
+              available: Optional['AvailableVocabulary'] = None,
+              exact: bool = False) -> List[Tuple[int, float]]:
+        """
+        질의와 코사인 유사도가 가장 높은 단어 k개를 찾습니다 (질의 단어 자신은 제외).
+
+        Args:
+            query (Query): 단어 ID 또는 벡터
+            k (int): 반환할 단어 수
+            available (Optional[AvailableVocabulary]): 사용 가능 어휘 뷰 (None이면 전체)
+            exact (bool): ANN 색인이 연결되어 있어도 전수 비교할지 여부
+
+        Returns:
+            List[Tuple[int, float]]: (단어 ID, 유사도) 목록 (유사도 높은 순)
+        """
+        return self.top_k_batch([query], k, available, exact)[0]
+
+    def top_k_batch(self, queries: Sequence[Query], k: int = 10,
+                    available: Optional['AvailableVocabulary'] = None,
+                    exact: bool = False) -> List[List[Tuple[int, float]]]:
+        """
+        여러 질의의 상위 k개 근접어를 찾습니다.
+        근접어 표가 연결되어 있으면 단어 ID 질의는 표에서 읽고, 나머지는 ANN 색인이 연결되어
+        있으면 색인의 탐색 군집만, 아니면 한 번의 행렬 곱으로 전체를 비교합니다.
+
+        Args:
+            queries (Sequence[Query]): 단어 ID 또는 벡터 질의들
+            k (int): 질의당 반환할 단어 수
+            available (Optional[AvailableVocabulary]): 사용 가능 어휘 뷰 (None이면 전체)
+            exact (bool): 근접어 표/ANN 색인이 연결되어 있어도 전수 비교할지 여부
+
+        Returns:
+            List[List[Tuple[int, float]]]: 질의별 (단어 ID, 유사도) 목록 (유사도 높은 순)
+        """
+        if not len(queries) or k <= 0:
+            return [[] for _ in queries]
+
+        mask = self.candidate_mask(available)
+        if self.neighbor_table is None or exact or k > self.neighbor_table.k:
+            return self._search(queries, k, mask, exact)
+
+        # 단어 ID 질의는 표에서 읽고, 벡터 질의와 표로 답할 수 없는 질의만 계산
+        results = [self._table_neighbors(query, k, mask) for query in queries]
+        missing = [row for row, found in enumerate(results) if found is None]
+        if missing:
+            computed = self._search([queries[row] for row in missing], k, mask, exact)
+            for row, found in zip(missing, computed):
+                results[row] = found
+        return results
+
+    def _table_neighbors(self, query: Query, k: int,
+                         mask: np.ndarray) -> Optional[List[Tuple[int, float]]]:
+        """근접어 표로 답할 수 있으면 상위 k개를, 아니면 None을 반환합니다."""
+        if not isinstance(query, (int, np.integer)):
+            return None
+        found = self.neighbor_table.neighbors(int(query), k, mask)
+        # 표의 근접어가 대부분 이미 사용되어 k개가 안 되면 표 밖의 단어까지 계산
+        return found if len(found) >= k else None
+
+    def _search(self, queries: Sequence[Query], k: int, mask: np.ndarray,
+                exact: bool) -> List[List[Tuple[int, float]]]:
+        """ANN 색인(연결된 경우) 또는 한 번의 행렬 곱 전수 비교로 근접어를 찾습니다."""
+        if self.ann_index is not None and not exact:
+            exclude = [int(query) if isinstance(query, (int, np.integer)) else -1
+                       for query in queries]
+            return self.ann_index.search(self, self._as_query_matrix(queries), k, mask, exclude)
+
+        scores = self.similarities(queries)
+        scores[:, ~mask] = -np.inf
+        for row, query in enumerate(queries):
+            if isinstance(query, (int, np.integer)) and 0 <= query < scores.shape[1]:
+                scores[row, query] = -np.inf
+
+        return [self._top_from_scores(row_scores, k) for row_scores in scores]
+
+    @staticmethod
+    def _top_from_scores(scores: np.ndarray, k: int) -> List[Tuple[int, float]]:
+        """점수 벡터에서 유한한 점수 상위 k개를 (ID, 점수) 목록으로 뽑습니다."""
+        k = min(k, len(scores))
+        if k == 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(int(word_id), float(scores[word_id]))
+                for word_id in top if np.isfinite(scores[word_id])]
+
+
+def _iter_source_vectors(source_file: str, vocabulary: Vocabulary,
+                         chunk_size: int = 1 << 20) -> Iterator:
+    """
+    원본 임베딩 파일에서 후보 어휘 단어의 벡터를 읽습니다.
+
+    첫 번째 값으로 차원을, 이후 (단어 ID, 벡터)를 내보냅니다.
+    후보 어휘에 없는 단어는 벡터를 파싱하지 않고 건너뜁니다.
+
+    Args:
+        source_file (str): 원본 임베딩 파일 경로 (.bin이면 word2vec 바이너리, 그 외 텍스트)
+        vocabulary (Vocabulary): 행 순서의 기준이 되는 어휘
+        chunk_size (int): 바이너리 파일을 읽는 단위 (바이트)
+
+    Returns:
+        Iterator: 차원(int), 이어서 (단어 ID, np.ndarray) 튜플들
+    """
+    base_size = vocabulary.base_size
+    get_id = vocabulary.get_id
+
+    if source_file.endswith('.bin'):
+        with open(source_file, 'rb') as f:
+            count, dim = (int(value) for value in f.readline().split())
+            yield dim
+
+            # 단어는 공백으로 끝나고 바로 뒤에 벡터 dim * 4바이트가 옴 (덩어리 단위로 읽어 분리)
+            record_size = dim * 4
+            buffer, position = b'', 0
+            for _ in range(count):
+                while True:
+                    space = buffer.find(b' ', position)
+                    if space >= 0 and len(buffer) - space - 1 >= record_size:
+                        break
+                    chunk = f.read(chunk_size)
+                    if not chunk:
+                        return
+                    buffer, position = buffer[position:] + chunk, 0
+
+                word_bytes = buffer[position:space].replace(b'\n', b'')
+                data = buffer[space + 1:space + 1 + record_size]
+                position = space + 1 + record_size
+
+                word_id = get_id(word_bytes.decode('utf-8', errors='ignore'))
+                if word_id is not None and word_id < base_size:
+                    yield word_id, np.frombuffer(data, dtype='<f4')
+        return
+
+    with open(source_file, 'r', encoding='utf-8', errors='ignore') as f:
+        first_line = f.readline().rstrip()
+        header = first_line.split()
+        pending = None
+
+        if len(header) == 2 and header[0].isdigit() and header[1].isdigit():
+            dim = int(header[1])
+        else:
+            # 헤더 없는 텍스트 (GloVe 형식 등): 첫 줄로 차원 판단
+            dim = len(header) - 1
+            pending = first_line
+        yield dim
+
+        lines = f if pending is None else _chain_line(pending, f)
+        for line in lines:
+            word, _, values = line.rstrip().partition(' ')
+            word_id = get_id(word)
+            if word_id is None or word_id >= base_size:
+                continue
+            vector = np.array(values.split(), dtype=np.float32)
+            if len(vector) == dim:
+                yield word_id, vector
+
+
+def _chain_line(first_line: str, lines: Iterator[str]) -> Iterator[str]:
+    """이미 읽은 첫 줄을 앞에 붙여 줄들을 순회합니다."""
+    yield first_line
+    yield from lines
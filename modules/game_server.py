@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+로컬 게임 서버 모듈
+꼬맨틀(semantle-ko) 사이트를 흉내 내는 로컬 HTTP 서버로 네트워크 경로를 인터넷 없이 시험합니다.
+"""
+
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+from .simulated_game import SimulatedGame
+
+
+@dataclass
+class GameServerConfig:
+    """로컬 게임 서버 설정을 저장하는 클래스"""
+    host: str = '127.0.0.1'
+    port: int = 8000               # 0이면 빈 포트 자동 선택
+    day: int = 1                   # 게임 페이지가 추측 요청에 쓰는 퍼즐 번호
+    latency: float = 0.0           # 추측 응답 전 인위적 지연 (초)
+    latency_jitter: float = 0.0    # 지연에 더할 균등 분포 무작위 폭 (초)
+    error_rate: float = 0.0        # 추측 요청을 오류로 응답할 확률 (0 ~ 1)
+    error_status: int = 503        # 주입한 오류의 HTTP 상태 코드
+    seed: Optional[int] = None     # 지연/오류 주입 난수 시드
+    request_queue_size: int = 128  # 연결 대기열 크기 (동시 접속 클라이언트 수에 맞춤)
+
+
+# 최소 게임 페이지 (WebAutomation.selectors의 #guess_input, .input-wrapper button, #guesses_table)
+GAME_PAGE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>꼬맨틀 - 로컬 게임 서버</title>
+</head>
+<body>
+<h1>꼬맨틀 (로컬)</h1>
+<p id="similarity-story"></p>
+<form id="form" autocomplete="off">
+  <div class="input-wrapper">
+    <input id="guess_input" type="text" placeholder="단어를 입력하세요">
+    <button type="submit">추측하기</button>
+  </div>
+</form>
+<div id="error"></div>
+<table id="guesses_table">
+  <thead><tr><th>#</th><th>추측한 단어</th><th>유사도</th><th>유사도 순위</th></tr></thead>
+  <tbody></tbody>
+</table>
+<script>
+var puzzleNumber = __DAY__;
+var guesses = [];
+
+function rankText(rank) {
+  if (rank === 0) return '정답!';
+  if (typeof rank === 'number') return rank + '위';
+  return rank;
+}
+
+function render(latest) {
+  var sorted = guesses.slice().sort(function (a, b) { return b.sim - a.sim; });
+  if (latest) sorted.unshift(latest);
+  var body = document.querySelector('#guesses_table tbody');
+  body.innerHTML = '';
+  sorted.forEach(function (guess, index) {
+    var row = document.createElement('tr');
+    if (latest && index === 0) row.className = 'last-input';
+    [guess.number, guess.word, (guess.sim * 100).toFixed(2), rankText(guess.rank)].forEach(function (text) {
+      var cell = document.createElement('td');
+      cell.textContent = text;
+      row.appendChild(cell);
+    });
+    body.appendChild(row);
+    if (latest && index === 0) {
+      var delimiter = document.createElement('tr');
+      delimiter.className = 'delimiter';
+      delimiter.innerHTML = '<td colspan="4"><hr></td>';
+      body.appendChild(delimiter);
+    }
+  });
+}
+
+document.querySelector('#form').addEventListener('submit', function (event) {
+  event.preventDefault();
+  var input = document.querySelector('#guess_input');
+  var word = input.value.trim();
+  var error = document.querySelector('#error');
+  error.className = '';
+  error.textContent = '';
+  if (!word) return;
+
+  var request = new XMLHttpRequest();
+  request.open('GET', '/guess/' + puzzleNumber + '/' + encodeURIComponent(word), false);
+  request.send();
+  if (request.status !== 200) {
+    error.className = 'error';
+    error.textContent = request.status === 404 ? word + ': 모르는 단어입니다.' : '서버 오류 (' + request.status + ')';
+    return;
+  }
+
+  var data = JSON.parse(request.responseText);
+  input.value = '';
+  var existing = guesses.filter(function (guess) { return guess.word === data.guess; })[0];
+  if (!existing) {
+    existing = {number: guesses.length + 1, word: data.guess, sim: data.sim, rank: data.rank};
+    guesses.push(existing);
+  }
+  render(existing);
+});
+</script>
+</body>
+</html>
+"""
+
+
+class _GameHTTPServer(ThreadingHTTPServer):
+    """요청마다 스레드를 띄우는 HTTP 서버 (게임 서버 참조 보관)"""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], owner: 'LocalGameServer', queue_size: int):
+        self.request_queue_size = queue_size
+        self.owner = owner
+        super().__init__(address, _GameRequestHandler)
+
+
+class _GameRequestHandler(BaseHTTPRequestHandler):
+    """semantle-ko와 같은 경로를 처리하는 요청 처리기 (HTTP/1.1 연결 유지)"""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'KkomantleLocal/1.0'
+    # 헤더와 본문을 따로 쓰므로 Nagle 지연(연결 유지 요청마다 약 40ms)을 끔
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        owner = self.server.owner
+        parts = [unquote(part) for part in urlsplit(self.path).path.split('/') if part]
+
+        if not parts:
+            page = GAME_PAGE.replace('__DAY__', str(owner.config.day))
+            self._send(200, page.encode('utf-8'), 'text/html; charset=utf-8')
+        elif parts[0] == 'guess' and len(parts) == 3 and parts[1].isdigit():
+            status, payload = owner.handle_guess(parts[2])
+            self._send_json(status, payload)
+        elif parts[0] == 'similarity' and len(parts) == 2:
+            self._send_json(200, owner.similarity_story())
+        elif parts == ['stats']:
+            self._send_json(200, owner.get_stats())
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def _send_json(self, status: int, payload: Dict) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self._send(status, body, 'application/json; charset=utf-8')
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        # 부하 시험 중 요청마다 stderr에 기록하지 않음 (통계는 /stats)
+        pass
+
+
+class LocalGameServer:
+    """
+    semantle-ko를 흉내 내는 로컬 HTTP 게임 서버
+
+    - `GET /`: WebAutomation 선택자와 같은 구조의 최소 게임 페이지
+    - `GET /guess/<day>/<word>`: 실제 사이트 프런트엔드가 부르는 추측 JSON
+      `{"guess": 단어, "sim": 코사인 유사도, "rank": 순위 정수(정답 0) 또는 "1000위 이상"}`,
+      모르는 단어는 404 `{"error": "unknown"}`
+    - `GET /similarity/<day>`: 정답의 1위/10위/1000위 유사도 `{"top", "top10", "rest"}`
+    - `GET /stats`: 요청 수, 주입한 오류 수 등 서버 통계
+
+    채점은 SimulatedGame(로컬 임베딩 오라클)이 맡고, 요청마다 스레드로 처리하며
+    HTTP/1.1 연결 유지를 지원하므로 많은 클라이언트가 동시에 접속할 수 있습니다.
+    추측 요청에는 설정한 지연과 확률적 오류를 주입해 웹/HTTP 백엔드를 부하 시험할 수 있습니다.
+    """
+
+    def __init__(self, game: SimulatedGame, config: Optional[GameServerConfig] = None):
+        """
+        게임 서버를 초기화합니다 (포트는 start() 또는 serve_forever()에서 엶).
+
+        Args:
+            game (SimulatedGame): 채점에 쓸 시뮬레이션 게임 (게임을 시작하지 않았으면 여기서 시작)
+            config (Optional[GameServerConfig]): 서버 설정
+        """
+        self.config = config or GameServerConfig()
+        if not 0.0 <= self.config.error_rate <= 1.0:
+            raise ValueError("오류 주입 확률은 0과 1 사이여야 합니다.")
+        if self.config.latency < 0 or self.config.latency_jitter < 0:
+            raise ValueError("인위적 지연은 0 이상이어야 합니다.")
+
+        if game.target_id is None and not (game.setup_driver() and game.navigate_to_game()):
+            raise ValueError("시뮬레이션 게임을 시작할 수 없습니다.")
+
+        self.game = game
+        self.httpd: Optional[_GameHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self.stats = {'guess_requests': 0, 'unknown_words': 0, 'injected_errors': 0, 'solved': 0}
+
+    @property
+    def url(self) -> str:
+        """서버 기본 URL (열린 포트 기준)"""
+        host, port = self.httpd.server_address[:2] if self.httpd else (self.config.host,
+                                                                       self.config.port)
+        return f"http://{host}:{port}/"
+
+    def handle_guess(self, word: str) -> Tuple[int, Dict]:
+        """
+        추측 요청 하나를 처리합니다 (지연/오류 주입 포함).
+
+        Args:
+            word (str): 추측 단어
+
+        Returns:
+            Tuple[int, Dict]: (HTTP 상태 코드, JSON 응답)
+        """
+        with self._lock:
+            self.stats['guess_requests'] += 1
+            delay = self.config.latency + self._random.uniform(0.0, self.config.latency_jitter)
+            inject_error = self._random.random() < self.config.error_rate
+
+        if delay > 0:
+            time.sleep(delay)
+        if inject_error:
+            with self._lock:
+                self.stats['injected_errors'] += 1
+            return self.config.error_status, {'error': 'injected'}
+
+        score = self.game.score_word(word)
+        if score is None:
+            with self._lock:
+                self.stats['unknown_words'] += 1
+            return 404, {'error': 'unknown'}
+
+        cosine, rank = score
+        if rank == 0:
+            with self._lock:
+                self.stats['solved'] += 1
+        return 200, {'guess': word, 'sim': cosine,
+                     'rank': rank if rank is not None else "1000위 이상"}
+
+    def similarity_story(self) -> Dict:
+        """
+        정답의 1위/10위/1000위 근접어 유사도를 반환합니다.
+
+        Returns:
+            Dict: {'top': 1위 유사도, 'top10': 10위 유사도, 'rest': 1000위 유사도}
+        """
+        by_rank = {rank: word_id for word_id, rank in self.game.ranks.items()}
+        target_id = self.game.target_id
+
+        def rank_similarity(rank: int) -> float:
+            word_id = by_rank.get(min(rank, len(by_rank)))
+            return self.game.embeddings.similarity(word_id, target_id) if word_id is not None else 0.0
+
+        return {'top': rank_similarity(1), 'top10': rank_similarity(10),
+                'rest': rank_similarity(len(by_rank))}
+
+    def get_stats(self) -> Dict:
+        """
+        서버 통계를 반환합니다.
+
+        Returns:
+            Dict: guess_requests, unknown_words, injected_errors, solved
+        """
+        with self._lock:
+            return dict(self.stats)
+
+    def _open(self) -> None:
+        """포트를 엽니다."""
+        if self.httpd is None:
+            self.httpd = _GameHTTPServer((self.config.host, self.config.port), self,
+                                         self.config.request_queue_size)
+
+    def start(self) -> str:
+        """
+        백그라운드 스레드에서 서버를 시작합니다.
+
+        Returns:
+            str: 서버 기본 URL
+        """
+        self._open()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+            self._thread.start()
+        return self.url
+
+    def serve_forever(self) -> None:
+        """현재 스레드에서 서버를 실행합니다 (Ctrl+C로 종료)."""
+        self._open()
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """서버를 멈추고 포트를 닫습니다."""
+        if self.httpd is None:
+            return
+        if self._thread is not None:
+            self.httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.httpd.server_close()
+        self.httpd = None
+
+    def __enter__(self) -> 'LocalGameServer':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
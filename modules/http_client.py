@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+HTTP 게임 클라이언트 모듈
+브라우저 없이 꼬맨틀 사이트의 추측 엔드포인트를 직접 호출하는 게임 백엔드입니다.
+"""
+
+import http.client
+import json
+import queue
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+from .models import RANKED_LIMIT, GuessResult, SubmitOutcome
+
+
+# 게임 페이지 스크립트의 퍼즐 번호 (예: "var puzzleNumber = 123;")
+_PUZZLE_NUMBER = re.compile(r'puzzleNumber\s*=\s*(\d+)')
+
+
+@dataclass
+class HTTPGameClientConfig:
+    """HTTP 게임 클라이언트 설정을 저장하는 클래스"""
+    game_url: str = "https://semantle-ko.newsjel.ly/"
+    day: Optional[int] = None   # 퍼즐 번호 (None이면 게임 페이지 스크립트에서 찾음)
+    timeout: float = 10.0       # 요청 시간 제한 (초)
+    retries: int = 2            # 연결 오류/5xx 응답 재시도 횟수
+    retry_delay: float = 0.2    # 재시도 전 대기 시간 (초, 재시도마다 두 배)
+    pool_size: int = 4          # 유지할 연결 유지(keep-alive) 연결 수
+
+
+class HTTPGameClient:
+    """
+    꼬맨틀 추측 엔드포인트 직접 호출 클라이언트
+
+    WebAutomation과 같은 setup_driver/navigate_to_game/submit_word/parse_result/
+    check_game_completion 인터페이스를 제공하므로 SemanticSolver(game_backend=...)로
+    바꿔 끼울 수 있습니다. 추측 하나는 `GET /guess/<day>/<word>` 요청 한 번이며,
+    연결은 HTTP/1.1 연결 유지로 재사용하므로 브라우저 입력/대기/표 탐색 없이
+    왕복 시간 한 번에 결과를 받습니다.
+
+    응답 JSON의 sim(코사인)은 게임 화면처럼 × 100 후 소수 둘째 자리로 반올림하며,
+    음수는 솔버의 유사도 범위에 맞게 0으로 자릅니다. 404만 모르는 단어(UNKNOWN_WORD)로 보고,
+    재시도 후에도 남은 5xx 응답, 연결 오류, 해석할 수 없는 응답은 일시적 실패(FAILED)로 구분합니다.
+    """
+
+    def __init__(self, config: Optional[HTTPGameClientConfig] = None):
+        """
+        HTTP 게임 클라이언트를 초기화합니다.
+
+        Args:
+            config (Optional[HTTPGameClientConfig]): 클라이언트 설정
+        """
+        self.config = config or HTTPGameClientConfig()
+        url = urlsplit(self.config.game_url)
+        if url.scheme not in ('http', 'https') or not url.hostname:
+            raise ValueError(f"지원하지 않는 게임 주소입니다: {self.config.game_url}")
+
+        self._scheme = url.scheme
+        self._host = url.hostname
+        self._port = url.port
+        self._base_path = url.path.rstrip('/')
+
+        self.driver = None
+        self.is_connected = False
+        self.day: Optional[int] = self.config.day
+        self.results: List[GuessResult] = []
+        self._submitted: Dict[str, GuessResult] = {}
+        self._answer: Optional[str] = None
+
+        self._idle: 'queue.LifoQueue[http.client.HTTPConnection]' = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'retries': 0, 'connections': 0, 'seconds': 0.0}
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        """새 연결을 만듭니다 (실제 접속은 첫 요청 시)."""
+        connection_class = (http.client.HTTPSConnection if self._scheme == 'https'
+                            else http.client.HTTPConnection)
+        with self._lock:
+            self.stats['connections'] += 1
+        return connection_class(self._host, self._port, timeout=self.config.timeout)
+
+    def _acquire(self) -> http.client.HTTPConnection:
+        """연결 풀에서 쉬고 있는 연결을 꺼내거나 새로 만듭니다."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._new_connection()
+
+    def _release(self, connection: http.client.HTTPConnection) -> None:
+        """다시 쓸 수 있는 연결을 풀에 돌려놓습니다 (풀이 가득 차면 닫음)."""
+        if self._idle.qsize() < self.config.pool_size:
+            self._idle.put(connection)
+        else:
+            connection.close()
+
+    def _request(self, path: str) -> Tuple[int, bytes]:
+        """
+        GET 요청을 보냅니다 (연결 오류와 5xx 응답은 새 연결로 재시도).
+
+        Args:
+            path (str): 게임 주소 기준 경로 (예: 'guess/1/사과'는 인코딩된 형태로)
+
+        Returns:
+            Tuple[int, bytes]: (HTTP 상태 코드, 응답 본문)
+        """
+        delay = self.config.retry_delay
+        last_error: Optional[Exception] = None
+
+        for attempt in range(self.config.retries + 1):
+            if attempt:
+                with self._lock:
+                    self.stats['retries'] += 1
+                time.sleep(delay)
+                delay *= 2
+
+            connection = self._acquire()
+            start = time.perf_counter()
+            try:
+                connection.request('GET', f"{self._base_path}/{path}",
+                                   headers={'Accept': 'application/json, text/html'})
+                response = connection.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException) as e:
+                # 서버가 닫은 연결 유지 연결 등: 연결을 버리고 재시도
+                connection.close()
+                last_error = e
+                continue
+
+            with self._lock:
+                self.stats['requests'] += 1
+                self.stats['seconds'] += time.perf_counter() - start
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(connection)
+
+            if response.status >= 500 and attempt < self.config.retries:
+                last_error = http.client.HTTPException(f"HTTP {response.status}")
+                continue
+            return response.status, body
+
+        raise ConnectionError(f"게임 서버 요청 실패: {last_error}")
+
+    def setup_driver(self) -> bool:
+        """
+        게임 서버 연결을 준비합니다 (브라우저 설정에 해당, 연결은 첫 요청 시 생성).
+
+        Returns:
+            bool: 준비 성공 여부
+        """
+        print(f"✅ HTTP 게임 클라이언트 준비: {self.config.game_url}")
+        return True
+
+    def navigate_to_game(self) -> bool:
+        """
+        게임 페이지를 받아 퍼즐 번호를 확인합니다 (게임 사이트 접속에 해당).
+
+        Returns:
+            bool: 접속 성공 여부
+        """
+        try:
+            status, body = self._request('')
+        except ConnectionError as e:
+            print(f"❌ 게임 사이트 접속 실패: {e}")
+            return False
+
+        if status != 200:
+            print(f"❌ 게임 사이트 접속 실패: HTTP {status}")
+            return False
+
+        if self.day is None:
+            match = _PUZZLE_NUMBER.search(body.decode('utf-8', errors='replace'))
+            if not match:
+                print("❌ 게임 페이지에서 퍼즐 번호를 찾을 수 없습니다. "
+                      "HTTPGameClientConfig(day=...)로 지정하세요.")
+                return False
+            self.day = int(match.group(1))
+
+        self.results = []
+        self._submitted = {}
+        self._answer = None
+        self.is_connected = True
+        print(f"✅ 게임 사이트 접속 완료 (퍼즐 {self.day})")
+        return True
+
+    def submit_word(self, word: str) -> SubmitOutcome:
+        """
+        추측 엔드포인트에 단어를 제출합니다.
+
+        Args:
+            word (str): 제출할 단어
+
+        Returns:
+            SubmitOutcome: 제출 결과 (404는 UNKNOWN_WORD, 서버/연결 오류나
+                해석할 수 없는 응답은 FAILED)
+        """
+        if not self.is_connected:
+            print("❌ 게임 사이트에 연결되지 않았습니다.")
+            return SubmitOutcome.FAILED
+        if word in self._submitted:
+            return SubmitOutcome.ACCEPTED
+
+        try:
+            status, body = self._request(f"guess/{self.day}/{quote(word, safe='')}")
+        except ConnectionError as e:
+            print(f"❌ 단어 제출 실패 ({word}): {e}")
+            return SubmitOutcome.FAILED
+
+        if status == 404:
+            return SubmitOutcome.UNKNOWN_WORD
+        if status != 200:
+            print(f"⚠️ 서버 오류 ({word}): HTTP {status}")
+            return SubmitOutcome.FAILED
+
+        try:
+            data = json.loads(body.decode('utf-8'))
+            cosine = float(data['sim'])
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"⚠️ 응답 파싱 실패 ({word}): {e}")
+            return SubmitOutcome.FAILED
+
+        rank_value = data.get('rank')
+        if rank_value == 0 or cosine >= 0.99995:
+            similarity, rank = 100.0, "정답!"
+            self._answer = word
+        else:
+            similarity = min(max(round(cosine * 100.0, 2), 0.0), 100.0)
+            rank = (f"{rank_value}위" if isinstance(rank_value, int) and rank_value <= RANKED_LIMIT
+                    else str(rank_value or f"{RANKED_LIMIT}위 이상"))
+
+        result = GuessResult(word, similarity, rank, len(self.results) + 1)
+        self._submitted[word] = result
+        self.results.append(result)
+        return SubmitOutcome.ACCEPTED
+
+    def parse_result(self, word: str, attempt: int) -> Optional[GuessResult]:
+        """
+        제출한 단어의 결과를 반환합니다 (응답 JSON에서 이미 파싱됨).
+
+        Args:
+            word (str): 제출한 단어
+            attempt (int): 시도 번호
+
+        Returns:
+            Optional[GuessResult]: 결과 (제출하지 않은 단어면 None)
+        """
+        submitted = self._submitted.get(word)
+        if submitted is None:
+            return None
+        return GuessResult(submitted.word, submitted.similarity, submitted.rank, attempt)
+
+    def check_game_completion(self) -> Optional[str]:
+        """
+        게임 완료 여부를 확인합니다 (정답 찾기 성공).
+
+        Returns:
+            Optional[str]: 성공시 정답 단어, 실패시 None
+        """
+        return self._answer
+
+    def get_current_results(self) -> List[GuessResult]:
+        """
+        현재까지의 모든 결과를 제출 순서대로 가져옵니다.
+
+        Returns:
+            List[GuessResult]: 현재까지의 모든 추측 결과
+        """
+        return list(self.results)
+
+    def cleanup(self) -> None:
+        """연결 유지 중인 연결들을 닫습니다."""
+        self.is_connected = False
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        print("🔧 HTTP 게임 클라이언트 정리 완료")
+
+    def get_driver_info(self) -> dict:
+        """
+        현재 클라이언트 상태 정보를 반환합니다.
+
+        Returns:
+            dict: 클라이언트 상태 정보 (요청 수, 평균 왕복 시간 포함)
+        """
+        with self._lock:
+            stats = dict(self.stats)
+        return {
+            'connected': self.is_connected,
+            'backend': 'http',
+            'game_url': self.config.game_url,
+            'day': self.day,
+            'guesses': len(self.results),
+            'requests': stats['requests'],
+            'retries': stats['retries'],
+            'connections': stats['connections'],
+            'mean_request_ms': stats['seconds'] * 1000 / stats['requests'] if stats['requests'] else 0.0
+        }
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+정보 이득 선택 모듈
+관측 일관 후보 집합을 기대값으로 가장 많이 줄이는 추측을 표본 정답들로 계산합니다.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .constraints import CandidateConstraints
+from .vocabulary import AvailableVocabulary
+
+
+class InformationGainSelector:
+    """
+    기대 정보 이득 추측 선택기
+
+    관측 일관 후보 중 표본 정답 T개와 추측 후보 G개를 뽑아 (G, T) 유사도 표를 한 번의
+    행렬 곱으로 만듭니다. 추측 g가 정답 t에 대해 보여줄 유사도 S[g, t]와 허용 오차 안에서
+    구별되지 않는 표본 수가 관측 후 남을 후보 수이므로, 그 평균(기대 잔여 후보 비율)이
+    가장 작은 추측을 고릅니다.
+
+    결정당 계산량은 유사도 표 칸 수(budget = G × T)로 제한합니다.
+    """
+
+    def __init__(self, budget: int = 65536, max_targets: int = 256, seed: int = 42):
+        """
+        선택기를 초기화합니다.
+
+        Args:
+            budget (int): 결정당 유사도 표 칸 수 (추측 후보 수 × 표본 정답 수)
+            max_targets (int): 표본 정답 최대 수
+            seed (int): 표본 추출 난수 시드
+        """
+        if budget <= 0 or max_targets <= 0:
+            raise ValueError("계산 예산과 표본 수는 0보다 커야 합니다.")
+
+        self.budget = budget
+        self.max_targets = max_targets
+        self.rng = np.random.default_rng(seed)
+
+    def select(self, constraints: CandidateConstraints, available: AvailableVocabulary,
+               budget: Optional[int] = None) -> Optional[Tuple[int, float]]:
+        """
+        기대 잔여 후보 비율이 가장 작은 추측을 선택합니다.
+
+        Args:
+            constraints (CandidateConstraints): 관측 일관 후보 집합
+            available (AvailableVocabulary): 사용 가능한 어휘 뷰
+            budget (Optional[int]): 이번 결정의 유사도 표 칸 수 (None이면 기본 예산)
+
+        Returns:
+            Optional[Tuple[int, float]]: (단어 ID, 기대 잔여 후보 비율) (추측 후보가 없으면 None)
+        """
+        budget = budget or self.budget
+        targets = constraints.candidate_ids
+        if len(targets) > self.max_targets:
+            targets = np.sort(self.rng.choice(targets, self.max_targets, replace=False))
+
+        guess_ids = self._sample_guesses(constraints, available,
+                                         max(1, budget // max(len(targets), 1)))
+        if not len(guess_ids):
+            return None
+
+        remaining = self.expected_remaining(constraints, guess_ids, targets)
+        best = int(np.argmin(remaining))
+        return int(guess_ids[best]), float(remaining[best])
+
+    def expected_remaining(self, constraints: CandidateConstraints, guess_ids: np.ndarray,
+                           target_ids: np.ndarray) -> np.ndarray:
+        """
+        추측별로 관측 후 남을 표본 정답 비율의 기대값을 계산합니다.
+
+        추측이 표본 정답 자신이면 그 정답에서는 게임이 끝나므로 잔여 0으로 셉니다.
+
+        Args:
+            constraints (CandidateConstraints): 관측 일관 후보 집합 (임베딩/허용 오차/배율)
+            guess_ids (np.ndarray): 추측 후보 ID들
+            target_ids (np.ndarray): 표본 정답 ID들
+
+        Returns:
+            np.ndarray: 추측별 기대 잔여 비율 (0 ~ 1)
+        """
+        scores = constraints.embeddings.similarities(guess_ids, target_ids).astype(np.float64)
+        scores *= constraints.scale
+        rows, targets = scores.shape
+
+        # 행마다 정렬한 뒤 행 번호만큼 띄워 펼치면 searchsorted 한 번으로 구간 개수 계산
+        offsets = (np.arange(rows) * (4 * constraints.scale + 4 * constraints.tolerance + 1))[:, None]
+        ordered = (np.sort(scores, axis=1) + offsets).ravel()
+        shifted = scores + offsets
+        counts = (np.searchsorted(ordered, shifted + constraints.tolerance, side='right') -
+                  np.searchsorted(ordered, shifted - constraints.tolerance, side='left'))
+
+        counts = counts.astype(np.float64)
+        counts[np.asarray(guess_ids)[:, None] == np.asarray(target_ids)[None, :]] = 0.0
+        return counts.mean(axis=1) / targets
+
+    def _sample_guesses(self, constraints: CandidateConstraints, available: AvailableVocabulary,
+                        count: int) -> np.ndarray:
+        """
+        추측 후보를 뽑습니다: 절반은 사용 가능한 일관 후보, 나머지는 임베딩이 있는 무작위 단어.
+
+        Args:
+            constraints (CandidateConstraints): 관측 일관 후보 집합
+            available (AvailableVocabulary): 사용 가능한 어휘 뷰
+            count (int): 추측 후보 수
+
+        Returns:
+            np.ndarray: 중복 없는 추측 후보 ID 배열
+        """
+        consistent = constraints.consistent_ids(available)
+        if len(consistent) > count // 2:
+            consistent = self.rng.choice(consistent, max(count // 2, 1), replace=False)
+
+        explorers: List[int] = []
+        embeddings = constraints.embeddings
+        for _ in range(min(count - len(consistent), len(available)) * 2):
+            if len(explorers) >= count - len(consistent):
+                break
+            word_id = available.random_id()
+            if word_id is not None and embeddings.has_vector(word_id):
+                explorers.append(word_id)
+
+        return np.unique(np.concatenate([np.asarray(consistent, dtype=np.int64),
+                                         np.asarray(explorers, dtype=np.int64)]))
@@ -5,12 +5,17 @@
 """
 
 import json
+import math
 import os
-from typing import Dict, List, Optional, Tuple
+import time
+from array import array
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
+from collections import defaultdict
 
 from .models import (GuessResult, GameSession, WordPairData, 
                    SuccessPattern, WordFrequencyData)
+from .vocabulary import Vocabulary, pack_pair, unpack_pair
 
 
 class LearningEngine:
@@ -19,20 +24,33 @@ class LearningEngine:
     """
     
     def __init__(self, learning_file: str = 'kkomantle_learning.json',
-                 word_pairs_file: str = 'word_pairs.json'):
+                 word_pairs_file: str = 'word_pairs.json',
+                 vocabulary: Optional[Vocabulary] = None):
         """
         학습 엔진을 초기화합니다.
         
         Args:
             learning_file (str): 학습 데이터 파일 경로
             word_pairs_file (str): 단어 쌍 데이터 파일 경로
+            vocabulary (Optional[Vocabulary]): 솔버와 공유하는 어휘 (None이면 새로 생성)
         """
         self.learning_file = learning_file
         self.word_pairs_file = word_pairs_file
+        self.vocabulary = vocabulary if vocabulary is not None else Vocabulary()
         
-        # 학습 데이터 로드
+        # 단어 쌍 상대 인덱스: 단어 ID -> 학습된 쌍을 이루는 단어 ID들
+        self.pair_partners: Dict[int, Set[int]] = defaultdict(set)
+        
+        # 학습 데이터 로드 (메모리에서는 단어 ID 기준으로 보관, 파일은 문자열 형식 유지)
         self.learning_data = self._load_learning_data()
-        self.word_pairs = self._load_word_pairs()
+        self.word_frequency: Dict[int, Dict] = self._intern_word_frequency(
+            self.learning_data.pop('word_frequency', {}))
+        self.word_pairs: Dict[int, Dict] = self._load_word_pairs()
+        
+        # 단어 ID별 빈도 사전 점수 (후보 점수 계산기가 복사 없이 배열로 조회)
+        self.frequency_prior = array('d')
+        for word_id in self.word_frequency:
+            self._update_frequency_prior(word_id)
         
         print(f"🧠 기존 학습 데이터: {len(self.word_pairs)}개 단어 쌍, "
               f"{len(self.learning_data.get('successful_patterns', []))}개 성공 패턴")
@@ -58,28 +76,80 @@ class LearningEngine:
             'games_played': 0,
             'successful_patterns': [],
             'category_effectiveness': {},
-            'word_frequency': {},
             'best_strategies': [],
             'last_updated': datetime.now().isoformat()
         }
     
-    def _load_word_pairs(self) -> Dict[str, Dict]:
+    def _intern_word_frequency(self, word_frequency: Dict[str, Dict]) -> Dict[int, Dict]:
+        """
+        문자열 키의 단어 빈도 데이터를 단어 ID 키로 변환합니다.
+        
+        Args:
+            word_frequency (Dict[str, Dict]): 파일에서 읽은 단어 빈도 데이터
+            
+        Returns:
+            Dict[int, Dict]: 단어 ID 키의 단어 빈도 데이터
+        """
+        intern = self.vocabulary.intern
+        return {intern(word): freq_data for word, freq_data in word_frequency.items()}
+    
+    def _load_word_pairs(self) -> Dict[int, Dict]:
         """
         단어 쌍 유사도 데이터를 로드합니다.
+        파일의 "단어1|단어2" 키는 패킹된 정수 키로 변환됩니다.
         
         Returns:
-            Dict[str, Dict]: 단어 쌍 데이터 딕셔너리
+            Dict[int, Dict]: 단어 쌍 데이터 딕셔너리
         """
+        word_pairs = {}
+        
         if os.path.exists(self.word_pairs_file):
             try:
                 with open(self.word_pairs_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    print(f"✅ 단어 쌍 데이터 로드 완료: {self.word_pairs_file}")
-                    return data
+                
+                intern = self.vocabulary.intern
+                for pair_key, pair_data in data.items():
+                    word1, word2 = pair_key.split('|')
+                    word_id1, word_id2 = intern(word1), intern(word2)
+                    
+                    pair_data['last_updated'] = self._parse_timestamp(
+                        pair_data.get('last_updated'))
+                    word_pairs[pack_pair(word_id1, word_id2)] = pair_data
+                    self.pair_partners[word_id1].add(word_id2)
+                    self.pair_partners[word_id2].add(word_id1)
+                
+                print(f"✅ 단어 쌍 데이터 로드 완료: {self.word_pairs_file}")
             except Exception as e:
                 print(f"⚠️ 단어 쌍 데이터 로드 실패: {e}")
+                self.pair_partners.clear()
+                return {}
+        
+        return word_pairs
+    
+    @staticmethod
+    def _parse_timestamp(value: Optional[str]) -> float:
+        """ISO 형식 시간 문자열을 epoch 초로 변환합니다."""
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except (TypeError, ValueError):
+            return time.time()
+    
+    def get_learned_data(self) -> Dict:
+        """
+        전략 엔진에 전달할 학습 데이터를 반환합니다.
+        모든 키는 공유 어휘의 단어 ID 기준입니다.
         
-        return {}
+        Returns:
+            Dict: word_frequency, frequency_prior, word_pairs, pair_partners, vocabulary를 담은 딕셔너리
+        """
+        return {
+            'word_frequency': self.word_frequency,
+            'frequency_prior': self.frequency_prior,
+            'word_pairs': self.word_pairs,
+            'pair_partners': self.pair_partners,
+            'vocabulary': self.vocabulary
+        }
     
     def save_learning_data(self) -> bool:
         """
@@ -92,8 +162,16 @@ class LearningEngine:
             # 마지막 업데이트 시간 갱신
             self.learning_data['last_updated'] = datetime.now().isoformat()
             
+            # 파일에는 문자열 키로 저장 (기존 형식 호환)
+            get_word = self.vocabulary.get_word
+            serialized = dict(self.learning_data)
+            serialized['word_frequency'] = {
+                get_word(word_id): freq_data
+                for word_id, freq_data in self.word_frequency.items()
+            }
+            
             with open(self.learning_file, 'w', encoding='utf-8') as f:
-                json.dump(self.learning_data, f, ensure_ascii=False, indent=2)
+                json.dump(serialized, f, ensure_ascii=False, indent=2)
             return True
         except Exception as e:
             print(f"⚠️ 학습 데이터 저장 실패: {e}")
@@ -107,8 +185,18 @@ class LearningEngine:
             bool: 저장 성공 여부
         """
         try:
+            # 파일에는 "단어1|단어2" 문자열 키로 저장 (사전식 순서, 기존 형식 호환)
+            get_word = self.vocabulary.get_word
+            serialized = {}
+            for pair_key, pair_data in self.word_pairs.items():
+                word_id1, word_id2 = unpack_pair(pair_key)
+                word1, word2 = get_word(word_id1), get_word(word_id2)
+                serialized[f"{min(word1, word2)}|{max(word1, word2)}"] = dict(
+                    pair_data,
+                    last_updated=datetime.fromtimestamp(pair_data['last_updated']).isoformat())
+            
             with open(self.word_pairs_file, 'w', encoding='utf-8') as f:
-                json.dump(self.word_pairs, f, ensure_ascii=False, indent=2)
+                json.dump(serialized, f, ensure_ascii=False, indent=2)
             return True
         except Exception as e:
             print(f"⚠️ 단어 쌍 데이터 저장 실패: {e}")
@@ -123,72 +211,73 @@ class LearningEngine:
             new_guess (GuessResult): 새로운 추측 결과
             existing_guesses (List[GuessResult]): 기존 추측들
         """
+        new_id = self._get_word_id(new_guess)
+        now = time.time()
+        
         # 기존 추측들과의 관계 학습
         for existing_guess in existing_guesses:
-            if existing_guess.word != new_guess.word:
+            existing_id = self._get_word_id(existing_guess)
+            if existing_id != new_id:
                 similarity_diff = abs(new_guess.similarity - existing_guess.similarity)
                 
-                # 단어 쌍 키 생성 (사전식 순서로 정렬)
-                pair_key = self._create_pair_key(new_guess.word, existing_guess.word)
-                
-                # 단어 쌍 데이터 업데이트
-                self._update_word_pair(pair_key, similarity_diff)
+                # 단어 쌍 데이터 업데이트 (순서와 무관한 패킹 키)
+                self._update_word_pair(new_id, existing_id, similarity_diff, now)
         
         # 단어 빈도 데이터 업데이트
-        self._update_word_frequency(new_guess.word, new_guess.similarity)
+        self._update_word_frequency(new_id, new_guess.similarity)
     
-    def _create_pair_key(self, word1: str, word2: str) -> str:
+    def _get_word_id(self, guess: GuessResult) -> int:
         """
-        단어 쌍의 고유 키를 생성합니다.
-        
-        Args:
-            word1 (str): 첫 번째 단어
-            word2 (str): 두 번째 단어
-            
-        Returns:
-            str: 단어 쌍 키
+        추측 결과의 단어 ID를 반환합니다 (없으면 인터닝).
+        세션에서 부여된 ID는 세션과 학습 엔진이 같은 어휘를 공유할 때만 유효합니다.
         """
-        # 사전식 순서로 정렬하여 일관성 보장
-        return f"{min(word1, word2)}|{max(word1, word2)}"
+        if guess.word_id is None:
+            guess.word_id = self.vocabulary.intern(guess.word)
+        return guess.word_id
     
-    def _update_word_pair(self, pair_key: str, similarity_diff: float) -> None:
+    def _update_word_pair(self, word_id1: int, word_id2: int, 
+                          similarity_diff: float, timestamp: float) -> None:
         """
         단어 쌍의 유사도 차이 데이터를 업데이트합니다.
         
         Args:
-            pair_key (str): 단어 쌍 키
+            word_id1 (int): 첫 번째 단어 ID
+            word_id2 (int): 두 번째 단어 ID
             similarity_diff (float): 유사도 차이
+            timestamp (float): 업데이트 시각 (epoch 초)
         """
-        if pair_key not in self.word_pairs:
-            self.word_pairs[pair_key] = {
+        pair_key = pack_pair(word_id1, word_id2)
+        pair_data = self.word_pairs.get(pair_key)
+        
+        if pair_data is None:
+            pair_data = {
                 'similarity_diffs': [],
                 'co_occurrence_count': 0,
-                'last_updated': datetime.now().isoformat()
+                'last_updated': timestamp
             }
+            self.word_pairs[pair_key] = pair_data
+            self.pair_partners[word_id1].add(word_id2)
+            self.pair_partners[word_id2].add(word_id1)
         
         # 유사도 차이 추가
-        self.word_pairs[pair_key]['similarity_diffs'].append(similarity_diff)
-        self.word_pairs[pair_key]['co_occurrence_count'] += 1
-        self.word_pairs[pair_key]['last_updated'] = datetime.now().isoformat()
+        pair_data['similarity_diffs'].append(similarity_diff)
+        pair_data['co_occurrence_count'] += 1
+        pair_data['last_updated'] = timestamp
         
         # 메모리 절약을 위해 최대 100개 기록만 유지
-        if len(self.word_pairs[pair_key]['similarity_diffs']) > 100:
-            self.word_pairs[pair_key]['similarity_diffs'] = \
-                self.word_pairs[pair_key]['similarity_diffs'][-50:]
+        if len(pair_data['similarity_diffs']) > 100:
+            pair_data['similarity_diffs'] = pair_data['similarity_diffs'][-50:]
     
-    def _update_word_frequency(self, word: str, similarity: float) -> None:
+    def _update_word_frequency(self, word_id: int, similarity: float) -> None:
         """
         단어의 사용 빈도와 성과 데이터를 업데이트합니다.
         
         Args:
-            word (str): 단어
+            word_id (int): 단어 ID
             similarity (float): 유사도 점수
         """
-        if 'word_frequency' not in self.learning_data:
-            self.learning_data['word_frequency'] = {}
-        
-        if word not in self.learning_data['word_frequency']:
-            self.learning_data['word_frequency'][word] = {
+        if word_id not in self.word_frequency:
+            self.word_frequency[word_id] = {
                 'count': 0,
                 'avg_similarity': 0.0,
                 'best_similarity': 0.0,
@@ -197,7 +286,7 @@ class LearningEngine:
             }
         
         # 빈도 데이터 업데이트
-        freq_data = self.learning_data['word_frequency'][word]
+        freq_data = self.word_frequency[word_id]
         freq_data['count'] += 1
         
         # 기존 데이터 호환성 확인
@@ -208,6 +297,20 @@ class LearningEngine:
         freq_data['avg_similarity'] = freq_data['total_similarity'] / freq_data['count']
         freq_data['best_similarity'] = max(freq_data['best_similarity'], similarity)
         freq_data['last_used'] = datetime.now().isoformat()
+        self._update_frequency_prior(word_id)
+    
+    def _update_frequency_prior(self, word_id: int) -> None:
+        """
+        단어의 빈도 사전 점수(평균 유사도 × log(횟수 + 1) × 5)를 갱신합니다.
+        
+        Args:
+            word_id (int): 단어 ID
+        """
+        if word_id >= len(self.frequency_prior):
+            self.frequency_prior.extend([0.0] * (word_id + 1 - len(self.frequency_prior)))
+        freq_data = self.word_frequency[word_id]
+        self.frequency_prior[word_id] = (freq_data.get('avg_similarity', 0) *
+                                         math.log(freq_data.get('count', 0) + 1) * 5)
     
     def get_related_words(self, target_word: str, similarity_threshold: float = 10) -> List[str]:
         """
@@ -222,21 +325,22 @@ class LearningEngine:
         """
         related_words = []
         
-        for pair_key, pair_data in self.word_pairs.items():
-            word1, word2 = pair_key.split('|')
+        target_id = self.vocabulary.get_id(target_word)
+        if target_id is None:
+            return []
+        
+        # 대상 단어가 포함된 쌍만 상대 인덱스로 조회
+        for other_id in self.pair_partners.get(target_id, ()):
+            pair_data = self.word_pairs[pack_pair(target_id, other_id)]
             
-            # 대상 단어가 포함된 쌍 찾기
-            if word1 == target_word or word2 == target_word:
-                other_word = word2 if word1 == target_word else word1
+            # 평균 유사도 차이 계산
+            similarity_diffs = pair_data.get('similarity_diffs', [])
+            if similarity_diffs:
+                avg_diff = sum(similarity_diffs) / len(similarity_diffs)
                 
-                # 평균 유사도 차이 계산
-                similarity_diffs = pair_data.get('similarity_diffs', [])
-                if similarity_diffs:
-                    avg_diff = sum(similarity_diffs) / len(similarity_diffs)
-                    
-                    # 임계값보다 유사도 차이가 작은 경우 관련성 높음
-                    if avg_diff < similarity_threshold:
-                        related_words.append((other_word, avg_diff))
+                # 임계값보다 유사도 차이가 작은 경우 관련성 높음
+                if avg_diff < similarity_threshold:
+                    related_words.append((self.vocabulary.get_word(other_id), avg_diff))
         
         # 유사도 차이 순으로 정렬 (작은 순)
         related_words.sort(key=lambda x: x[1])
@@ -252,16 +356,37 @@ class LearningEngine:
         Returns:
             float: 효과성 점수
         """
-        word_frequency = self.learning_data.get('word_frequency', {})
+        return self._calculate_effectiveness_score_by_id(self.vocabulary.get_id(word))
+    
+    def _calculate_effectiveness_score_by_id(self, word_id: Optional[int]) -> float:
+        """단어 ID로 효과성 점수를 계산합니다."""
+        freq_data = self.word_frequency.get(word_id)
         
-        if word in word_frequency:
-            freq_data = word_frequency[word]
+        if freq_data is not None:
             base_score = freq_data.get('avg_similarity', 0) * freq_data.get('count', 1)
             best_bonus = freq_data.get('best_similarity', 0) * 0.5
             return base_score + best_bonus
         
         return 0.0
     
+    def get_exploration_weights(self, size: int) -> List[float]:
+        """
+        무작위 탐색에 사용할 단어 ID별 가중치를 계산합니다.
+        학습된 효과성이 높은 단어일수록 자주 선택되도록 기본 가중치 1에 보너스를 더합니다.
+        
+        Args:
+            size (int): 가중치를 계산할 단어 ID 범위 (보통 후보 어휘 크기)
+            
+        Returns:
+            List[float]: 단어 ID별 가중치
+        """
+        weights = [1.0] * size
+        for word_id in self.word_frequency:
+            if word_id < size:
+                effectiveness = self._calculate_effectiveness_score_by_id(word_id)
+                weights[word_id] += math.log1p(max(effectiveness, 0.0))
+        return weights
+    
     def record_successful_game(self, session: GameSession, final_answer: str) -> None:
         """
         성공한 게임의 패턴을 기록합니다.
@@ -360,10 +485,10 @@ class LearningEngine:
         
         return sorted(word_counts.keys(), key=lambda w: word_counts[w], reverse=True)
     
-    def save_session_results(self, session: GameSession, success: bool = False, 
-                           final_answer: str = None) -> None:
+    def record_session(self, session: GameSession, success: bool = False,
+                       final_answer: str = None) -> None:
         """
-        세션 결과를 저장하고 학습 데이터를 업데이트합니다.
+        세션 결과를 메모리의 학습 데이터에 반영합니다 (파일 저장 없음).
         
         Args:
             session (GameSession): 게임 세션
@@ -376,6 +501,18 @@ class LearningEngine:
         
         # 전략 효과성 업데이트
         self._update_strategy_effectiveness(session)
+    
+    def save_session_results(self, session: GameSession, success: bool = False, 
+                           final_answer: str = None) -> None:
+        """
+        세션 결과를 저장하고 학습 데이터를 업데이트합니다.
+        
+        Args:
+            session (GameSession): 게임 세션
+            success (bool): 성공 여부
+            final_answer (str): 최종 정답 (성공한 경우)
+        """
+        self.record_session(session, success, final_answer)
         
         # 데이터 저장
         save_success = self.save_learning_data() and self.save_word_pairs()
@@ -409,6 +546,99 @@ class LearningEngine:
             stats['total_attempts'] += len(session.guesses)
             stats['avg_attempts'] = stats['total_attempts'] / stats['usage_count']
     
+    def export_state(self) -> Dict:
+        """
+        학습 상태를 단어 문자열 키로 내보냅니다.
+        
+        어휘 ID와 무관한 형식이므로 다른 프로세스의 엔진에 피클로 전달해 merge_state()로
+        병합할 수 있습니다. 내부 데이터를 복사하지 않으므로 읽기 전용으로 사용해야 합니다.
+        
+        Returns:
+            Dict: learning_data, word_frequency {단어: 빈도 데이터},
+                word_pairs {(단어1, 단어2): 쌍 데이터}
+        """
+        get_word = self.vocabulary.get_word
+        word_pairs = {}
+        for pair_key, pair_data in self.word_pairs.items():
+            word_id1, word_id2 = unpack_pair(pair_key)
+            word_pairs[(get_word(word_id1), get_word(word_id2))] = pair_data
+        
+        return {
+            'learning_data': self.learning_data,
+            'word_frequency': {get_word(word_id): freq_data
+                               for word_id, freq_data in self.word_frequency.items()},
+            'word_pairs': word_pairs
+        }
+    
+    def merge_state(self, state: Dict) -> None:
+        """
+        다른 엔진이 export_state()로 내보낸 학습 상태를 누적 병합합니다.
+        
+        빈 엔진에서 기록한 증분(예: 병렬 작업자의 게임들)을 병합하면 같은 추측들을
+        이 엔진에서 직접 학습한 것과 같은 횟수/합계가 됩니다. 유사도 차이 기록과
+        성공 패턴은 기존과 같은 개수 제한을 따릅니다.
+        
+        Args:
+            state (Dict): export_state()의 결과
+        """
+        intern = self.vocabulary.intern
+        
+        for word, freq_data in state.get('word_frequency', {}).items():
+            word_id = intern(word)
+            current = self.word_frequency.get(word_id)
+            if current is None:
+                self.word_frequency[word_id] = dict(freq_data)
+            else:
+                count = current.get('count', 0) + freq_data.get('count', 0)
+                total = (current.get('total_similarity',
+                                     current.get('avg_similarity', 0.0) * current.get('count', 1)) +
+                         freq_data.get('total_similarity',
+                                       freq_data.get('avg_similarity', 0.0) * freq_data.get('count', 1)))
+                current.update(
+                    count=count,
+                    total_similarity=total,
+                    avg_similarity=total / count if count else 0.0,
+                    best_similarity=max(current.get('best_similarity', 0.0),
+                                        freq_data.get('best_similarity', 0.0)),
+                    last_used=max(current.get('last_used', ''), freq_data.get('last_used', '')))
+            self._update_frequency_prior(word_id)
+        
+        for (word1, word2), pair_data in state.get('word_pairs', {}).items():
+            word_id1, word_id2 = intern(word1), intern(word2)
+            pair_key = pack_pair(word_id1, word_id2)
+            current = self.word_pairs.get(pair_key)
+            if current is None:
+                self.word_pairs[pair_key] = dict(
+                    pair_data, similarity_diffs=list(pair_data.get('similarity_diffs', [])))
+                self.pair_partners[word_id1].add(word_id2)
+                self.pair_partners[word_id2].add(word_id1)
+                continue
+            
+            current['similarity_diffs'].extend(pair_data.get('similarity_diffs', []))
+            if len(current['similarity_diffs']) > 100:
+                current['similarity_diffs'] = current['similarity_diffs'][-50:]
+            current['co_occurrence_count'] += pair_data.get('co_occurrence_count', 0)
+            current['last_updated'] = max(current['last_updated'],
+                                          pair_data.get('last_updated', 0.0))
+        
+        learning_data = state.get('learning_data', {})
+        self.learning_data['games_played'] = (self.learning_data.get('games_played', 0) +
+                                              learning_data.get('games_played', 0))
+        
+        patterns = self.learning_data.setdefault('successful_patterns', [])
+        patterns.extend(learning_data.get('successful_patterns', []))
+        if len(patterns) > 100:
+            self.learning_data['successful_patterns'] = patterns[-50:]
+        
+        effectiveness = self.learning_data.setdefault('strategy_effectiveness', {})
+        for strategy, stats in learning_data.get('strategy_effectiveness', {}).items():
+            current = effectiveness.setdefault(
+                strategy, {'usage_count': 0, 'total_attempts': 0, 'avg_attempts': 0.0})
+            current['usage_count'] += stats.get('usage_count', 0)
+            current['total_attempts'] += stats.get('total_attempts', 0)
+            if current['usage_count']:
+                current['avg_attempts'] = current['total_attempts'] / current['usage_count']
+    
     def get_learning_statistics(self) -> Dict:
         """
         현재 학습 상태의 통계를 반환합니다.
@@ -419,21 +649,21 @@ class LearningEngine:
         stats = {
             'total_games': self.learning_data.get('games_played', 0),
             'total_word_pairs': len(self.word_pairs),
-            'total_unique_words': len(self.learning_data.get('word_frequency', {})),
+            'total_unique_words': len(self.word_frequency),
             'successful_patterns': len(self.learning_data.get('successful_patterns', [])),
             'strategy_effectiveness': self.analyze_strategy_effectiveness(),
             'last_updated': self.learning_data.get('last_updated', 'Unknown')
         }
         
         # 가장 효과적인 단어 상위 5개
-        word_frequency = self.learning_data.get('word_frequency', {})
-        if word_frequency:
-            effective_words = sorted(
-                word_frequency.items(), 
-                key=lambda x: self.calculate_effectiveness_score(x[0]),
+        if self.word_frequency:
+            effective_ids = sorted(
+                self.word_frequency, 
+                key=self._calculate_effectiveness_score_by_id,
                 reverse=True
             )[:5]
-            stats['most_effective_words'] = [word for word, _ in effective_words]
+            stats['most_effective_words'] = [
+                self.vocabulary.get_word(word_id) for word_id in effective_ids]
         else:
             stats['most_effective_words'] = []
         
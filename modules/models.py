@@ -4,9 +4,66 @@
 꼬맨틀 솔버에서 사용하는 핵심 데이터 구조와 클래스를 정의합니다.
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, List, Dict, Optional, Set, Union
 from datetime import datetime
+from enum import Enum
+
+from .vocabulary import AvailableVocabulary, Vocabulary
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .constraints import CandidateConstraints
+    from .target_estimator import TargetEstimator
+
+
+# 게임이 순위를 공개하는 범위 (이 밖의 단어는 '1000위 이상'으로 표시)
+RANKED_LIMIT = 1000
+
+
+def parse_rank(rank_text: Union[str, int, None]) -> Optional[int]:
+    """
+    게임이 표시한 순위 문자열을 정수 순위로 변환합니다.
+    
+    Args:
+        rank_text (Union[str, int, None]): 순위 문자열 (예: '123위', '123', '정답!', '1000위 이상')
+        
+    Returns:
+        Optional[int]: 순위 (정답이면 0, 순위 밖이거나 알 수 없으면 None)
+    """
+    text = str(rank_text).strip() if rank_text is not None else ""
+    if not text:
+        return None
+    if '정답' in text:
+        return 0
+    if '이상' in text or '밖' in text:
+        return None
+    
+    match = re.search(r'\d+', text.replace(',', ''))
+    if not match:
+        return None
+    rank = int(match.group())
+    return rank if rank <= RANKED_LIMIT else None
+
+
+class SubmitOutcome(Enum):
+    """
+    게임 백엔드의 단어 제출 결과
+
+    제출 성공(ACCEPTED)만 참으로 평가되므로 `if backend.submit_word(word):`처럼
+    성공 여부만 보는 호출부는 그대로 동작합니다. 게임이 모르는 단어라고 응답한 경우
+    (UNKNOWN_WORD)만 영구 거부 목록에 기록하고, 네트워크 오류나 시간 초과 같은
+    일시적 실패(FAILED)는 현재 세션에서만 건너뜁니다.
+    """
+    ACCEPTED = 'accepted'
+    UNKNOWN_WORD = 'unknown_word'
+    FAILED = 'failed'
+
+    def __bool__(self) -> bool:
+        return self is SubmitOutcome.ACCEPTED
 
 
 @dataclass
@@ -19,14 +76,18 @@ class GuessResult:
         similarity (float): 유사도 점수 (0.0 ~ 100.0)
         rank (str): 유사도 순위 정보
         attempt (int): 시도 번호
+        word_id (Optional[int]): 세션 어휘에서의 단어 ID (세션에 추가될 때 설정)
+        rank_value (Optional[int]): rank를 파싱한 정수 순위 (정답 0, 순위 밖이면 None)
     """
     word: str
     similarity: float
     rank: str = ""
     attempt: int = 0
+    word_id: Optional[int] = None
+    rank_value: Optional[int] = field(default=None, init=False)
     
     def __post_init__(self):
-        """데이터 검증을 수행합니다."""
+        """데이터 검증을 수행하고 순위를 파싱합니다."""
         if not isinstance(self.word, str) or not self.word.strip():
             raise ValueError("단어는 비어있지 않은 문자열이어야 합니다.")
         
@@ -35,6 +96,8 @@ class GuessResult:
         
         if self.attempt < 0:
             raise ValueError("시도 번호는 0 이상이어야 합니다.")
+        
+        self.rank_value = parse_rank(self.rank)
 
 
 @dataclass
@@ -163,28 +226,112 @@ class GameSession:
     현재 게임 세션의 상태를 관리하는 클래스
     """
     
-    def __init__(self):
-        """게임 세션을 초기화합니다."""
+    def __init__(self, vocabulary: Optional[Vocabulary] = None):
+        """
+        게임 세션을 초기화합니다.
+        
+        Args:
+            vocabulary (Optional[Vocabulary]): 솔버와 학습 엔진이 공유하는 어휘
+                (None이면 세션 전용 어휘를 생성)
+        """
+        self.vocabulary: Vocabulary = vocabulary if vocabulary is not None else Vocabulary()
         self.guesses: List[GuessResult] = []
-        self.tried_words: set = set()
+        self.tried_ids: Set[int] = set()
+        self.available: AvailableVocabulary = AvailableVocabulary(self.vocabulary)
         self.session_start: datetime = datetime.now()
         self.session_relationships: Dict[str, List[tuple]] = {}
         self.current_strategy: Optional[str] = None
         self.strategy_history: List[str] = []
+        # 관측 유사도로 정답 후보를 좁히는 제약 (임베딩이 있을 때 솔버가 연결)
+        self.constraints: Optional['CandidateConstraints'] = None
+        # 관측 유사도로 정답 벡터를 점진 추정하는 추정기 (임베딩이 있을 때 솔버가 연결)
+        self.target_estimator: Optional['TargetEstimator'] = None
+        # 순위권(상위 1000위) 추측들 (순위 오름차순)과 정렬 키
+        self.ranked_guesses: List[GuessResult] = []
+        self._rank_keys: List[int] = []
     
-    def add_guess(self, guess_result: GuessResult) -> None:
+    def add_guess(self, guess_result: GuessResult,
+                  similarity_row: Optional['np.ndarray'] = None) -> None:
         """
         새로운 추측 결과를 추가합니다.
         
         Args:
             guess_result (GuessResult): 추측 결과
+            similarity_row (Optional[np.ndarray]): 추측 단어와 전체 어휘의 로컬 임베딩 유사도 행
+                (묶음 시뮬레이터가 미리 계산한 경우 관측 제약에 전달)
         """
+        guess_result.word_id = self.vocabulary.intern(guess_result.word)
         self.guesses.append(guess_result)
-        self.tried_words.add(guess_result.word)
+        self.tried_ids.add(guess_result.word_id)
+        self.available.discard(guess_result.word_id)
+        
+        if self.constraints is not None:
+            self.constraints.observe(guess_result.word_id, guess_result.similarity,
+                                     similarity_row)
+        if self.target_estimator is not None:
+            self.target_estimator.observe(guess_result.word_id, guess_result.similarity)
+        
+        if guess_result.rank_value is not None:
+            position = bisect_right(self._rank_keys, guess_result.rank_value)
+            self._rank_keys.insert(position, guess_result.rank_value)
+            self.ranked_guesses.insert(position, guess_result)
         
         # 유사도 순으로 정렬 (높은 순)
         self.guesses.sort(key=lambda g: g.similarity, reverse=True)
     
+    def mark_tried_id(self, word_id: int) -> None:
+        """
+        결과 없이 시도한 단어(제출/파싱 실패 등)를 ID로 기록합니다.
+        
+        Args:
+            word_id (int): 단어 ID
+        """
+        self.tried_ids.add(word_id)
+        self.available.discard(word_id)
+    
+    def mark_tried(self, word: str) -> int:
+        """
+        결과 없이 시도한 단어를 기록합니다.
+        
+        Args:
+            word (str): 단어
+            
+        Returns:
+            int: 단어 ID
+        """
+        word_id = self.vocabulary.intern(word)
+        self.mark_tried_id(word_id)
+        return word_id
+    
+    def is_tried_id(self, word_id: int) -> bool:
+        """ID로 이미 시도한 단어인지 확인합니다."""
+        return word_id in self.tried_ids
+    
+    def is_tried(self, word: str) -> bool:
+        """이미 시도한 단어인지 확인합니다."""
+        word_id = self.vocabulary.get_id(word)
+        return word_id is not None and word_id in self.tried_ids
+    
+    @property
+    def tried_words(self) -> Set[str]:
+        """
+        시도한 단어들을 문자열 집합으로 반환합니다 (로깅/표시용 경계 변환).
+        
+        Returns:
+            Set[str]: 시도한 단어들
+        """
+        return {self.vocabulary.get_word(word_id) for word_id in self.tried_ids}
+    
+    @property
+    def surviving_counts(self) -> List[int]:
+        """
+        추측별로 관측과 일관된 정답 후보 수를 반환합니다.
+        
+        Returns:
+            List[int]: 추측 순서대로의 후보 수 (제약이 연결되지 않았으면 빈 목록)
+        """
+        return self.constraints.surviving_counts if self.constraints is not None else []
+    
     def get_best_similarity(self) -> float:
         """
         현재까지의 최고 유사도를 반환합니다.
@@ -196,6 +343,27 @@ class GameSession:
             return 0.0
         return max(g.similarity for g in self.guesses)
     
+    def get_best_rank(self) -> Optional[int]:
+        """
+        현재까지의 최고 순위를 반환합니다.
+        
+        Returns:
+            Optional[int]: 최고 순위 (순위권 추측이 없으면 None)
+        """
+        return self._rank_keys[0] if self._rank_keys else None
+    
+    def get_ranked_guesses(self, count: int = 3) -> List[GuessResult]:
+        """
+        순위가 가장 높은 추측들을 반환합니다.
+        
+        Args:
+            count (int): 반환할 추측 개수
+            
+        Returns:
+            List[GuessResult]: 순위 오름차순 추측들 (순위권 추측만)
+        """
+        return self.ranked_guesses[:count]
+    
     def get_recent_guesses(self, count: int = 3) -> List[GuessResult]:
         """
         최근 추측들을 반환합니다.
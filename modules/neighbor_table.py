@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+근접어 표 모듈
+어휘 단어마다 상위 K개 근접어(ID + float16 유사도)를 오프라인에서 미리 계산해
+메모리 매핑 표로 제공합니다.
+"""
+
+import os
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .embeddings import EmbeddingStore
+
+
+class NeighborTable:
+    """
+    미리 계산한 상위 K개 근접어 표
+
+    행 i가 단어 ID i의 근접어들인 (어휘 크기, K) 표 두 개를 캐시 옆에 보관합니다.
+    - ids: int32 단어 ID (유사도 높은 순, 빈 칸은 -1)
+    - scores: float16 코사인 유사도
+
+    표는 메모리 매핑으로 열리므로 조회는 행 읽기뿐이며 온라인 행렬 곱이 없습니다.
+    구축은 행 블록 단위로 프로세스 풀에 나누어 각 작업자가 표 파일의 자기 행에 직접 쓰고,
+    완료된 행을 진행 파일에 기록하므로 중단된 구축을 (블록 크기를 바꿔도) 이어서 할 수 있습니다.
+    """
+
+    KIND = 'neighbors'
+
+    def __init__(self, ids: np.ndarray, scores: np.ndarray):
+        """
+        근접어 표를 초기화합니다.
+
+        Args:
+            ids (np.ndarray): (어휘 크기, K) int32 근접어 ID
+            scores (np.ndarray): (어휘 크기, K) float16 유사도
+        """
+        if ids.shape != scores.shape or ids.ndim != 2:
+            raise ValueError("근접어 ID 표와 유사도 표의 크기가 맞지 않습니다.")
+
+        self.ids = ids
+        self.scores = scores
+
+    @property
+    def k(self) -> int:
+        """단어당 저장된 근접어 수"""
+        return self.ids.shape[1]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @staticmethod
+    def get_paths(prefix: str, partial: bool = False) -> Tuple[str, str, str]:
+        """
+        표 파일 경로들을 반환합니다.
+
+        Args:
+            prefix (str): 임베딩 캐시 파일 이름 접두사
+            partial (bool): 구축 중인(미완성) 파일 경로 여부
+
+        Returns:
+            Tuple[str, str, str]: (ID 표 경로, 유사도 표 경로, 진행 파일 경로)
+        """
+        suffix = '.partial' if partial else ''
+        base = f"{prefix}.{NeighborTable.KIND}"
+        return (f"{base}.ids{suffix}.npy", f"{base}.scores{suffix}.npy",
+                f"{base}.progress.npy")
+
+    @classmethod
+    def load(cls, prefix: str) -> Optional['NeighborTable']:
+        """
+        완성된 표를 메모리 매핑으로 엽니다.
+
+        Args:
+            prefix (str): 임베딩 캐시 파일 이름 접두사
+
+        Returns:
+            Optional[NeighborTable]: 근접어 표 (파일이 없으면 None)
+        """
+        ids_path, scores_path, _ = cls.get_paths(prefix)
+        if not (os.path.exists(ids_path) and os.path.exists(scores_path)):
+            return None
+
+        try:
+            return cls(np.load(ids_path, mmap_mode='r'), np.load(scores_path, mmap_mode='r'))
+        except (OSError, ValueError) as e:
+            print(f"⚠️ 근접어 표 로드 실패: {e}")
+            return None
+
+    @classmethod
+    def build(cls, embeddings: EmbeddingStore, k: int = 100, workers: Optional[int] = None,
+              block_size: int = 4096) -> 'NeighborTable':
+        """
+        임베딩 캐시로 근접어 표를 구축합니다 (오프라인 작업, 중단 후 재실행하면 이어서 구축).
+
+        Args:
+            embeddings (EmbeddingStore): load()로 연 float32 임베딩 저장소
+            k (int): 단어당 근접어 수
+            workers (Optional[int]): 작업 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스)
+            block_size (int): 작업 하나가 맡는 행 수
+
+        Returns:
+            NeighborTable: 완성된 근접어 표
+        """
+        if not embeddings.cache_prefix:
+            raise ValueError("캐시 파일에서 연 임베딩 저장소만 근접어 표를 구축할 수 있습니다.")
+        if k <= 0 or block_size <= 0:
+            raise ValueError("근접어 수와 블록 크기는 0보다 커야 합니다.")
+
+        prefix = embeddings.cache_prefix
+        rows = len(embeddings)
+        k = min(k, max(rows - 1, 1))
+        ids_path, scores_path, progress_path = cls.get_paths(prefix, partial=True)
+        done = cls._open_partial(ids_path, scores_path, progress_path, rows, k)
+
+        # 행이 하나라도 남은 블록만 다시 계산 (이전 구축과 블록 경계가 달라도 안전)
+        blocks = (rows + block_size - 1) // block_size
+        pending = [block for block in range(blocks)
+                   if not done[block * block_size:(block + 1) * block_size].all()]
+        if len(pending) < blocks:
+            print(f"⏯️ 이어서 구축: {blocks - len(pending)}/{blocks}개 블록 완료됨")
+
+        tasks = [(f"{prefix}.emb.npy", f"{prefix}.present.npy", ids_path, scores_path,
+                  block * block_size, min((block + 1) * block_size, rows), k)
+                 for block in pending]
+        start = time.perf_counter()
+        workers = workers or os.cpu_count() or 1
+
+        if workers == 1 or len(tasks) <= 1:
+            for finished, task in enumerate(tasks, 1):
+                cls._mark_done(done, progress_path, _build_block(task), finished, len(tasks), start)
+        else:
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_build_block, task) for task in tasks]
+                for finished, future in enumerate(as_completed(futures), 1):
+                    cls._mark_done(done, progress_path, future.result(), finished,
+                                   len(tasks), start)
+
+        final_ids_path, final_scores_path, _ = cls.get_paths(prefix)
+        os.replace(scores_path, final_scores_path)
+        os.replace(ids_path, final_ids_path)
+        os.remove(progress_path)
+        return cls.load(prefix)
+
+    @staticmethod
+    def _open_partial(ids_path: str, scores_path: str, progress_path: str, rows: int,
+                      k: int) -> np.ndarray:
+        """
+        구축 중인 표 파일을 이어 쓸 수 있으면 진행 상황을, 아니면 새 파일을 만들고 빈 진행 상황을 반환합니다.
+
+        Returns:
+            np.ndarray: 행별 완료 여부 (bool)
+        """
+        try:
+            done = np.load(progress_path)
+            ids = np.load(ids_path, mmap_mode='r')
+            scores = np.load(scores_path, mmap_mode='r')
+            if (done.dtype == bool and done.shape == (rows,)
+                    and ids.shape == scores.shape == (rows, k)):
+                return done
+        except (OSError, ValueError):
+            pass
+
+        np.lib.format.open_memmap(ids_path, mode='w+', dtype=np.int32, shape=(rows, k)).flush()
+        np.lib.format.open_memmap(scores_path, mode='w+', dtype=np.float16, shape=(rows, k)).flush()
+        done = np.zeros(rows, dtype=bool)
+        np.save(progress_path, done)
+        return done
+
+    @staticmethod
+    def _mark_done(done: np.ndarray, progress_path: str, row_range: Tuple[int, int],
+                   finished: int, total: int, started: float) -> None:
+        """완료된 블록의 행들을 진행 파일에 기록하고 진행률을 출력합니다."""
+        done[row_range[0]:row_range[1]] = True
+        np.save(f"{progress_path}.tmp.npy", done)
+        os.replace(f"{progress_path}.tmp.npy", progress_path)
+
+        if finished == total or finished % max(total // 10, 1) == 0:
+            print(f"  블록 {finished}/{total} ({time.perf_counter() - started:.1f}초)")
+
+    def neighbors(self, word_id: int, k: Optional[int] = None,
+                  mask: Optional[np.ndarray] = None) -> List[Tuple[int, float]]:
+        """
+        단어의 근접어를 표에서 읽습니다.
+
+        Args:
+            word_id (int): 단어 ID
+            k (Optional[int]): 반환할 최대 단어 수 (None이면 표 전체)
+            mask (Optional[np.ndarray]): 단어 ID별 허용 여부 (None이면 전체 허용)
+
+        Returns:
+            List[Tuple[int, float]]: (단어 ID, 유사도) 목록 (유사도 높은 순, 허용된 단어만)
+        """
+        if not 0 <= word_id < len(self.ids):
+            return []
+
+        ids = np.asarray(self.ids[word_id])
+        keep = ids >= 0
+        if mask is not None:
+            keep[keep] = mask[ids[keep]]
+        positions = np.flatnonzero(keep)[:k]
+        scores = self.scores[word_id]
+        return [(int(ids[position]), float(scores[position])) for position in positions]
+
+
+def _build_block(task: Tuple[str, str, str, str, int, int, int]) -> Tuple[int, int]:
+    """
+    행 블록 하나의 근접어를 계산해 표 파일의 해당 행에 직접 씁니다 (프로세스 풀 작업).
+
+    작업자는 임베딩 캐시와 표 파일을 메모리 매핑으로 열어 같은 페이지를 공유하며,
+    블록을 다시 (블록 행 수 × 어휘 크기)가 약 64MB를 넘지 않는 묶음으로 나눠 계산합니다.
+
+    Args:
+        task: (행렬 경로, 존재 여부 경로, ID 표 경로, 유사도 표 경로, 시작 행, 끝 행, K)
+
+    Returns:
+        Tuple[int, int]: 처리한 행 범위 (시작 행, 끝 행)
+    """
+    vectors_path, present_path, ids_path, scores_path, start, stop, k = task
+    vectors = np.load(vectors_path, mmap_mode='r')
+    present = np.load(present_path)
+    table_ids = np.load(ids_path, mmap_mode='r+')
+    table_scores = np.load(scores_path, mmap_mode='r+')
+
+    batch_rows = max(1, (1 << 24) // len(vectors))
+    for batch_start in range(start, stop, batch_rows):
+        batch_stop = min(batch_start + batch_rows, stop)
+        rows = np.arange(batch_start, batch_stop)
+        scores = np.asarray(vectors[batch_start:batch_stop]) @ vectors.T
+        scores[:, ~present] = -np.inf
+        scores[rows - batch_start, rows] = -np.inf
+
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind='stable')
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        # 벡터가 없는 단어의 행과 후보가 K개보다 적어 남은 칸은 비워 둠
+        empty = ~np.isfinite(top_scores) | ~present[rows][:, None]
+        top[empty] = -1
+        top_scores[empty] = 0.0
+        table_ids[batch_start:batch_stop] = top
+        table_scores[batch_start:batch_stop] = top_scores
+
+    table_ids.flush()
+    table_scores.flush()
+    return start, stop
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+병렬 게임 실행기 모듈
+시뮬레이션 게임들을 작업 프로세스들에 나누어 진행하고 작업자별 학습 증분을 병합합니다.
+"""
+
+import contextlib
+import multiprocessing
+import os
+import pickle
+import random
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .batch_simulator import BatchSimulator, SimulationResult
+from .embeddings import EmbeddingStore
+from .learning_engine import LearningEngine
+from .vocabulary import Vocabulary
+
+
+# 작업 프로세스의 읽기 전용 공유 상태 (어휘, 임베딩, 게임 모델, 고정된 학습 스냅샷)
+# fork 방식에서는 부모가 풀을 만들기 직전에 채워 두어 자식이 복사 없이 물려받음
+_worker_state: Optional[Dict] = None
+
+
+class ParallelGameRunner:
+    """
+    프로세스 병렬 묶음 게임 실행기
+
+    정답 목록을 작업 단위로 나누어 작업 프로세스마다 BatchSimulator로 잠금 단계 진행하고,
+    결과를 정답 순서대로 모읍니다. 작업에는 정답 ID 목록만 전달되며 무거운 상태는
+    작업자마다 한 번만 준비됩니다.
+    - fork 방식(리눅스 기본): 부모가 로드한 어휘/임베딩/학습 스냅샷을 자식이 그대로 물려받음
+      (임베딩과 게임 모델은 메모리 매핑 파일이라 모든 프로세스가 같은 페이지를 공유)
+    - spawn 방식: 부모가 작업 디렉토리에 내보낸 .npy 파일을 메모리 매핑으로 열고,
+      어휘 목록, 자모 BK-트리, 학습 스냅샷 파일을 작업자 시작 시 한 번 읽음
+
+    작업자들은 실행 시작 시점의 학습 데이터를 고정된 스냅샷으로 읽기만 하고,
+    자기 게임들의 관계 학습과 게임 결과는 빈 학습 엔진에 증분으로 기록해 돌려줍니다.
+    실행이 끝나면 증분들을 부모의 학습 엔진에 병합합니다 (저장은 호출자가 결정).
+    """
+
+    def __init__(self, vocabulary: Vocabulary, learning_engine: Optional[LearningEngine] = None,
+                 game_vectors: Optional[np.ndarray] = None, workers: Optional[int] = None,
+                 constraint_tolerance: float = 1.0, use_estimator: bool = True,
+                 start_method: Optional[str] = None, work_directory: Optional[str] = None):
+        """
+        병렬 실행기를 초기화합니다.
+
+        Args:
+            vocabulary (Vocabulary): 임베딩이 연결된 공유 어휘
+            learning_engine (Optional[LearningEngine]): 스냅샷을 제공하고 증분을 병합받을 학습 엔진
+                (None이면 학습 없이 실행)
+            game_vectors (Optional[np.ndarray]): 게임 모델의 (후보 어휘 크기, 차원) 단위 벡터 행렬
+                (None이면 어휘 임베딩 사용)
+            workers (Optional[int]): 작업 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스)
+            constraint_tolerance (float): 세션 관측 제약의 허용 오차
+            use_estimator (bool): 세션에 정답 벡터 추정기를 연결할지 여부
+            start_method (Optional[str]): 프로세스 시작 방식 ('fork', 'spawn', 'forkserver';
+                None이면 fork를 쓸 수 있으면 fork)
+            work_directory (Optional[str]): spawn 방식에서 공유 파일을 내보낼 디렉토리
+                (None이면 실행마다 임시 디렉토리)
+        """
+        if vocabulary.embeddings is None:
+            raise ValueError("병렬 실행기는 임베딩이 연결된 어휘가 필요합니다.")
+        if game_vectors is not None and game_vectors.shape[0] != len(vocabulary.embeddings):
+            raise ValueError("게임 모델 행렬의 행 수가 후보 어휘 크기와 다릅니다.")
+
+        if start_method is None:
+            start_method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn'
+
+        self.vocabulary = vocabulary
+        self.learning_engine = learning_engine
+        self.game_vectors = game_vectors
+        self.workers = workers or os.cpu_count() or 1
+        self.constraint_tolerance = constraint_tolerance
+        self.use_estimator = use_estimator
+        self.start_method = start_method
+        self.work_directory = work_directory
+
+    def run(self, target_ids: Sequence[int], max_attempts: int = 300, batch_size: int = 64,
+            tasks_per_worker: int = 2, seed: Optional[int] = None) -> List[SimulationResult]:
+        """
+        게임들을 작업 프로세스들에 나누어 진행하고 학습 증분을 병합합니다.
+
+        Args:
+            target_ids (Sequence[int]): 게임별 숨은 정답 단어 ID
+            max_attempts (int): 게임당 최대 추측 수
+            batch_size (int): 작업자 안에서 잠금 단계로 함께 진행할 게임 수
+            tasks_per_worker (int): 작업자당 작업 수 (부하 균형용, 클수록 잘게 나눔)
+            seed (Optional[int]): 작업별 random 시드의 기준값 (None이면 시드 고정 안 함)
+
+        Returns:
+            List[SimulationResult]: target_ids 순서의 게임 결과
+        """
+        if max_attempts <= 0 or batch_size <= 0 or tasks_per_worker <= 0:
+            raise ValueError("최대 시도 횟수, 묶음 크기, 작업자당 작업 수는 0보다 커야 합니다.")
+
+        target_ids = [int(target_id) for target_id in target_ids]
+        task_count = max(1, min(len(target_ids), self.workers * tasks_per_worker))
+        bounds = np.linspace(0, len(target_ids), task_count + 1).astype(int)
+        tasks = [(index, target_ids[start:stop], max_attempts, batch_size,
+                  None if seed is None else seed + index)
+                 for index, (start, stop) in enumerate(zip(bounds[:-1], bounds[1:])) if stop > start]
+
+        global _worker_state
+        state = self._shared_state()
+        outputs: Dict[int, Tuple[List[SimulationResult], Optional[Dict]]] = {}
+
+        if self.workers == 1 or len(tasks) <= 1:
+            _worker_state = state
+            try:
+                for task in tasks:
+                    index, results, delta = _run_task(task)
+                    outputs[index] = (results, delta)
+            finally:
+                _worker_state = None
+        else:
+            with contextlib.ExitStack() as stack:
+                spec = None
+                if self.start_method == 'fork':
+                    # 자식이 fork 시점의 상태를 물려받으므로 풀 생성 전에 채워 둠
+                    _worker_state = state
+                    stack.callback(_clear_worker_state)
+                else:
+                    directory = self.work_directory or stack.enter_context(
+                        tempfile.TemporaryDirectory(prefix='parallel_runner_'))
+                    spec = self._export_state(directory)
+
+                pool = stack.enter_context(ProcessPoolExecutor(
+                    max_workers=min(self.workers, len(tasks)),
+                    mp_context=multiprocessing.get_context(self.start_method),
+                    initializer=_init_worker, initargs=(spec,)))
+                futures = [pool.submit(_run_task, task) for task in tasks]
+                for future in as_completed(futures):
+                    index, results, delta = future.result()
+                    outputs[index] = (results, delta)
+
+        merged: List[SimulationResult] = []
+        for index in sorted(outputs):
+            results, delta = outputs[index]
+            merged.extend(results)
+            if delta is not None:
+                self.learning_engine.merge_state(delta)
+        return merged
+
+    def _shared_state(self) -> Dict:
+        """현재 프로세스의 객체들로 작업자 상태를 구성합니다."""
+        return {
+            'vocabulary': self.vocabulary,
+            'game_vectors': self.game_vectors,
+            'learning_engine': self.learning_engine,
+            'constraint_tolerance': self.constraint_tolerance,
+            'use_estimator': self.use_estimator,
+        }
+
+    def _export_state(self, directory: str) -> Dict:
+        """
+        spawn 방식 작업자가 열 공유 파일들을 내보냅니다.
+
+        임베딩은 load()로 연 캐시 파일을 그대로 쓰고(메모리 내 저장소면 .npy로 저장),
+        게임 모델도 .npy로 저장해 작업자들이 메모리 매핑으로 같은 페이지를 공유합니다.
+        어휘 목록, 자모 BK-트리, 학습 스냅샷은 작업자 시작 시 한 번 읽는 파일로 씁니다.
+
+        Args:
+            directory (str): 파일을 쓸 디렉토리
+
+        Returns:
+            Dict: 작업자 초기화에 필요한 파일 경로와 설정
+        """
+        os.makedirs(directory, exist_ok=True)
+        embeddings = self.vocabulary.embeddings
+
+        quantization = getattr(embeddings, 'quantization', 'float32')
+        if embeddings.cache_prefix:
+            vectors_path = f"{embeddings.cache_prefix}.emb.npy"
+            present_path = f"{embeddings.cache_prefix}.present.npy"
+        elif quantization != 'float32':
+            raise ValueError("캐시 파일 없이 만든 양자화 임베딩은 spawn 방식 작업자와 공유할 수 없습니다.")
+        else:
+            vectors_path = os.path.join(directory, 'embeddings.npy')
+            present_path = os.path.join(directory, 'present.npy')
+            np.save(vectors_path, np.asarray(embeddings.vectors, dtype=np.float32))
+            np.save(present_path, np.asarray(embeddings.present, dtype=bool))
+
+        game_vectors_path = None
+        if self.game_vectors is not None:
+            game_vectors_path = os.path.join(directory, 'game_vectors.npy')
+            np.save(game_vectors_path, np.asarray(self.game_vectors, dtype=np.float32))
+
+        words_path = os.path.join(directory, 'words.txt')
+        with open(words_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(self.vocabulary.words))
+
+        # 자모 BK-트리는 구축이 비싸므로 작업자가 다시 만들지 않고 로드
+        jamo_tree_path = os.path.join(directory, 'jamo.bktree')
+        if not self.vocabulary.jamo_tree.save(jamo_tree_path):
+            jamo_tree_path = None
+
+        snapshot_path = None
+        if self.learning_engine is not None:
+            snapshot_path = os.path.join(directory, 'learning_snapshot.pkl')
+            with open(snapshot_path, 'wb') as f:
+                pickle.dump(self.learning_engine.export_state(), f, pickle.HIGHEST_PROTOCOL)
+
+        return {
+            'words_path': words_path,
+            'base_size': self.vocabulary.base_size,
+            'jamo_tree_path': jamo_tree_path,
+            'vectors_path': vectors_path,
+            'present_path': present_path,
+            'cache_prefix': embeddings.cache_prefix,
+            'quantization': quantization,
+            'game_vectors_path': game_vectors_path,
+            'snapshot_path': snapshot_path,
+            'constraint_tolerance': self.constraint_tolerance,
+            'use_estimator': self.use_estimator,
+        }
+
+
+def _clear_worker_state() -> None:
+    """부모 프로세스의 작업자 상태 참조를 해제합니다."""
+    global _worker_state
+    _worker_state = None
+
+
+def _init_worker(spec: Optional[Dict]) -> None:
+    """
+    작업 프로세스 시작 시 공유 상태를 준비합니다 (fork로 물려받았으면 아무것도 안 함).
+
+    Args:
+        spec (Optional[Dict]): ParallelGameRunner._export_state()의 결과 (fork 방식이면 None)
+    """
+    global _worker_state
+    if _worker_state is not None or spec is None:
+        return
+
+    with open(spec['words_path'], 'r', encoding='utf-8') as f:
+        words = f.read().split('\n')
+    # 후보 어휘 뒤에 인터닝된 단어까지 같은 ID로 맞춰 저장된 BK-트리를 그대로 사용
+    vocabulary = Vocabulary(words[:spec['base_size']])
+    for word in words[spec['base_size']:]:
+        vocabulary.intern(word)
+    vocabulary.build_indexes(jamo_tree_path=spec['jamo_tree_path'])
+
+    embeddings = None
+    if spec['quantization'] != 'float32':
+        # 양자화 코드가 캐시에 있으면 float32 행렬을 열지 않음
+        from .quantization import QuantizedEmbeddingStore
+        embeddings = QuantizedEmbeddingStore.open_cached(
+            spec['cache_prefix'], spec['quantization'], vocabulary)
+    if embeddings is None:
+        embeddings = EmbeddingStore(np.load(spec['vectors_path'], mmap_mode='r'),
+                                    np.load(spec['present_path']), vocabulary)
+        embeddings.cache_prefix = spec['cache_prefix']
+        if spec['quantization'] != 'float32':
+            embeddings = QuantizedEmbeddingStore.from_store(embeddings, spec['quantization'])
+    if embeddings.cache_prefix:
+        embeddings.load_ann_index()
+        embeddings.load_neighbor_table()
+    vocabulary.embeddings = embeddings
+
+    learning_engine = None
+    if spec['snapshot_path']:
+        with open(spec['snapshot_path'], 'rb') as f:
+            snapshot = pickle.load(f)
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            learning_engine = LearningEngine('', '', vocabulary=vocabulary)
+        learning_engine.merge_state(snapshot)
+
+    _worker_state = {
+        'vocabulary': vocabulary,
+        'game_vectors': (np.load(spec['game_vectors_path'], mmap_mode='r')
+                         if spec['game_vectors_path'] else None),
+        'learning_engine': learning_engine,
+        'constraint_tolerance': spec['constraint_tolerance'],
+        'use_estimator': spec['use_estimator'],
+    }
+
+
+def _run_task(task: Tuple[int, List[int], int, int, Optional[int]]
+              ) -> Tuple[int, List[SimulationResult], Optional[Dict]]:
+    """
+    작업 하나(정답 묶음)를 시뮬레이션하고 결과와 학습 증분을 반환합니다 (프로세스 풀 작업).
+
+    Args:
+        task: (작업 번호, 정답 ID 목록, 최대 시도 수, 묶음 크기, random 시드)
+
+    Returns:
+        Tuple[int, List[SimulationResult], Optional[Dict]]:
+            (작업 번호, 게임 결과, export_state() 형식의 학습 증분 또는 None)
+    """
+    index, target_ids, max_attempts, batch_size, seed = task
+    state = _worker_state
+    if seed is not None:
+        random.seed(seed)
+
+    recorder = None
+    if state['learning_engine'] is not None:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            recorder = LearningEngine('', '', vocabulary=state['vocabulary'])
+
+    simulator = BatchSimulator(state['vocabulary'], learning_engine=state['learning_engine'],
+                               game_vectors=state['game_vectors'],
+                               constraint_tolerance=state['constraint_tolerance'],
+                               use_estimator=state['use_estimator'],
+                               learning_recorder=recorder)
+    results = simulator.run(target_ids, max_attempts, batch_size)
+    return index, results, recorder.export_state() if recorder is not None else None
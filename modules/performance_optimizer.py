@@ -4,10 +4,8 @@
 병렬 처리, 캐싱, 배치 학습 등을 통한 성능 향상 기능을 제공합니다.
 """
 
-import asyncio
-import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Callable, Any, Optional, Tuple
 from functools import lru_cache, wraps
 import pickle
@@ -192,8 +190,25 @@ class ParallelProcessor:
         """
         import os
         self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
-        self.thread_pool = ThreadPoolExecutor(max_workers=self.max_workers)
-        self.process_pool = ProcessPoolExecutor(max_workers=min(4, self.max_workers))
+        
+        # 풀은 처음 사용할 때 생성 (프로세스 풀은 생성 비용이 큼)
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool = None
+    
+    @property
+    def thread_pool(self) -> ThreadPoolExecutor:
+        """스레드 풀 (처음 사용할 때 생성)"""
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._thread_pool
+    
+    @property
+    def process_pool(self):
+        """프로세스 풀 (처음 사용할 때 multiprocessing을 로드하여 생성)"""
+        if self._process_pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self._process_pool = ProcessPoolExecutor(max_workers=min(4, self.max_workers))
+        return self._process_pool
     
     def evaluate_candidates_parallel(self, candidates: List[str], 
                                    evaluation_func: Callable[[str], float],
@@ -267,8 +282,12 @@ class ParallelProcessor:
     
     def cleanup(self) -> None:
         """리소스를 정리합니다."""
-        self.thread_pool.shutdown(wait=True)
-        self.process_pool.shutdown(wait=True)
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=True)
+            self._thread_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=True)
+            self._process_pool = None
 
 
 class BatchLearning:
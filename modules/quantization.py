@@ -0,0 +1,532 @@
+#!/usr/bin/env python3
+"""
+임베딩 양자화 모듈
+int8 스칼라 양자화와 곱 양자화(PQ)로 임베딩 행렬의 메모리를 줄이고,
+질의는 float32로 둔 채 코드와 직접 비교(비대칭 거리 계산, ADC)합니다.
+"""
+
+import os
+import time
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .embeddings import EmbeddingStore
+from .vocabulary import Vocabulary
+
+
+# 행 인덱스: 단어 ID, 슬라이스 또는 ID 배열
+RowIndex = Union[int, slice, np.ndarray, Sequence[int]]
+
+
+class ScalarQuantizedCodes:
+    """
+    int8 스칼라 양자화 코드
+
+    행마다 최대 절댓값을 127에 맞추는 배율(float32)과 int8 코드를 저장합니다 (차원당 1바이트).
+    질의와의 내적은 코드 묶음을 float32로 올려 계산한 뒤 행 배율을 곱합니다.
+    """
+
+    KIND = 'int8'
+
+    def __init__(self, codes: np.ndarray, scales: np.ndarray, chunk_size: int = 16384):
+        """
+        코드를 초기화합니다.
+
+        Args:
+            codes (np.ndarray): (행 수, 차원) int8 코드 (메모리 매핑 가능)
+            scales (np.ndarray): 행별 float32 배율
+            chunk_size (int): 유사도 계산 시 한 번에 float32로 올릴 행 수
+        """
+        if len(codes) != len(scales):
+            raise ValueError("int8 코드와 배율의 행 수가 다릅니다.")
+        self.codes = codes
+        self.scales = scales
+        self.chunk_size = chunk_size
+
+    @property
+    def shape(self):
+        return self.codes.shape
+
+    @property
+    def nbytes(self) -> int:
+        """코드와 배율의 총 바이트 수"""
+        return int(self.codes.nbytes + self.scales.nbytes)
+
+    @classmethod
+    def encode(cls, vectors: np.ndarray, chunk_size: int = 65536) -> 'ScalarQuantizedCodes':
+        """
+        float32 행렬을 int8 코드로 양자화합니다.
+
+        Args:
+            vectors (np.ndarray): (행 수, 차원) float32 행렬 (메모리 매핑 가능)
+            chunk_size (int): 한 번에 처리할 행 수
+
+        Returns:
+            ScalarQuantizedCodes: 양자화 코드
+        """
+        codes = np.empty(vectors.shape, dtype=np.int8)
+        scales = np.zeros(len(vectors), dtype=np.float32)
+        for start in range(0, len(vectors), chunk_size):
+            rows = np.asarray(vectors[start:start + chunk_size], dtype=np.float32)
+            peak = np.abs(rows).max(axis=1) if rows.shape[1] else np.zeros(len(rows))
+            scale = np.where(peak > 0, peak / 127.0, 1.0).astype(np.float32)
+            codes[start:start + len(rows)] = np.clip(np.rint(rows / scale[:, None]), -127, 127)
+            scales[start:start + len(rows)] = np.where(peak > 0, scale, 0.0)
+        return cls(codes, scales)
+
+    def decode(self, index: RowIndex) -> np.ndarray:
+        """
+        코드 행들을 float32 벡터로 복원합니다.
+
+        Args:
+            index (RowIndex): 행 인덱스
+
+        Returns:
+            np.ndarray: 복원된 벡터 (인덱스 모양 + 차원)
+        """
+        return self.codes[index].astype(np.float32) * np.asarray(self.scales[index])[..., None]
+
+    def scores(self, query_matrix: np.ndarray, ids: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        float32 질의들과 코드 행들의 내적을 계산합니다 (ADC).
+
+        Args:
+            query_matrix (np.ndarray): (질의 수, 차원) float32 질의
+            ids (Optional[np.ndarray]): 비교할 행 ID들 (None이면 전체 행)
+
+        Returns:
+            np.ndarray: (질의 수, 행 수) float32 내적
+        """
+        count = len(self.codes) if ids is None else len(ids)
+        result = np.empty((len(query_matrix), count), dtype=np.float32)
+        for start in range(0, count, self.chunk_size):
+            rows = slice(start, start + self.chunk_size) if ids is None \
+                else ids[start:start + self.chunk_size]
+            block = query_matrix @ self.codes[rows].astype(np.float32).T
+            result[:, start:start + self.chunk_size] = block * self.scales[rows]
+        return result
+
+    def save(self, prefix: str) -> None:
+        """코드를 {prefix}.int8.codes.npy / .scales.npy에 저장합니다 (원자적 교체)."""
+        _save_arrays(prefix, {'codes': self.codes, 'scales': self.scales}, self.KIND)
+
+    @classmethod
+    def load(cls, prefix: str) -> Optional['ScalarQuantizedCodes']:
+        """저장된 코드를 메모리 매핑으로 엽니다 (없으면 None)."""
+        arrays = _load_arrays(prefix, ('codes', 'scales'), cls.KIND)
+        return cls(arrays['codes'], arrays['scales']) if arrays else None
+
+
+class ProductQuantizedCodes:
+    """
+    곱 양자화(PQ) 코드
+
+    벡터를 M개 부분 공간으로 나누고 부분 공간마다 256개 중심(코드북)을 k-평균으로 학습하여,
+    각 벡터를 부분 공간별 중심 번호(uint8) M개로 저장합니다 (벡터당 M바이트).
+    질의마다 부분 공간별 질의-중심 내적표(M × 256)를 한 번 만들고, 코드로 표를 찾아 더합니다.
+    """
+
+    KIND = 'pq'
+
+    def __init__(self, codebooks: np.ndarray, codes: np.ndarray, dim: int,
+                 chunk_size: int = 16384):
+        """
+        코드를 초기화합니다.
+
+        Args:
+            codebooks (np.ndarray): (M, 중심 수, 부분 차원) float32 코드북
+            codes (np.ndarray): (행 수, M) uint8 코드 (메모리 매핑 가능)
+            dim (int): 원래 벡터 차원 (M × 부분 차원보다 작으면 나머지는 0 채움)
+            chunk_size (int): 유사도 계산 시 한 번에 처리할 행 수
+        """
+        if codes.ndim != 2 or codes.shape[1] != len(codebooks):
+            raise ValueError("PQ 코드의 부분 공간 수가 코드북과 다릅니다.")
+        self.codebooks = codebooks
+        self.codes = codes
+        self.dim = dim
+        self.chunk_size = chunk_size
+
+    @property
+    def shape(self):
+        return (len(self.codes), self.dim)
+
+    @property
+    def subspaces(self) -> int:
+        """부분 공간 수 M"""
+        return len(self.codebooks)
+
+    @property
+    def nbytes(self) -> int:
+        """코드와 코드북의 총 바이트 수"""
+        return int(self.codes.nbytes + self.codebooks.nbytes)
+
+    @classmethod
+    def encode(cls, vectors: np.ndarray, present: np.ndarray, subspaces: Optional[int] = None,
+               iterations: int = 10, sample_size: int = 16384, seed: int = 42,
+               chunk_size: int = 65536) -> 'ProductQuantizedCodes':
+        """
+        float32 행렬로 코드북을 학습하고 전체 행을 PQ 코드로 양자화합니다.
+
+        Args:
+            vectors (np.ndarray): (행 수, 차원) float32 행렬 (메모리 매핑 가능)
+            present (np.ndarray): 행별 벡터 존재 여부 (코드북 학습 표본 선택에 사용)
+            subspaces (Optional[int]): 부분 공간 수 M (None이면 차원 / 4)
+            iterations (int): 부분 공간별 k-평균 반복 횟수
+            sample_size (int): 코드북 학습 표본 크기
+            seed (int): 난수 시드
+            chunk_size (int): 인코딩 시 한 번에 처리할 행 수
+
+        Returns:
+            ProductQuantizedCodes: 양자화 코드
+        """
+        dim = vectors.shape[1]
+        subspaces = max(1, min(subspaces or dim // 4, dim))
+        sub_dim = -(-dim // subspaces)
+
+        word_ids = np.flatnonzero(present)
+        if len(word_ids) == 0:
+            raise ValueError("벡터가 있는 단어가 없어 코드북을 학습할 수 없습니다.")
+
+        rng = np.random.default_rng(seed)
+        sample_ids = np.sort(rng.choice(word_ids, min(sample_size, len(word_ids)), replace=False))
+        sample = cls._split(np.asarray(vectors[sample_ids], dtype=np.float32), subspaces, sub_dim)
+        centroids = min(256, len(sample_ids))
+
+        codebooks = np.zeros((subspaces, centroids, sub_dim), dtype=np.float32)
+        for m in range(subspaces):
+            codebooks[m] = _kmeans(sample[:, m], centroids, iterations, rng)
+
+        codes = np.zeros((len(vectors), subspaces), dtype=np.uint8)
+        for start in range(0, len(vectors), chunk_size):
+            rows = cls._split(np.asarray(vectors[start:start + chunk_size], dtype=np.float32),
+                              subspaces, sub_dim)
+            for m in range(subspaces):
+                codes[start:start + len(rows), m] = _nearest_centroids(rows[:, m], codebooks[m])
+        return cls(codebooks, codes, dim)
+
+    @staticmethod
+    def _split(rows: np.ndarray, subspaces: int, sub_dim: int) -> np.ndarray:
+        """(행 수, 차원) 행렬을 0 채움 후 (행 수, M, 부분 차원)으로 나눕니다."""
+        padded = np.zeros((len(rows), subspaces * sub_dim), dtype=np.float32)
+        padded[:, :rows.shape[1]] = rows
+        return padded.reshape(len(rows), subspaces, sub_dim)
+
+    def decode(self, index: RowIndex) -> np.ndarray:
+        """
+        코드 행들을 코드북 중심으로 복원합니다.
+
+        Args:
+            index (RowIndex): 행 인덱스
+
+        Returns:
+            np.ndarray: 복원된 벡터 (인덱스 모양 + 차원)
+        """
+        codes = np.asarray(self.codes[index])
+        parts = self.codebooks[np.arange(self.subspaces), codes]
+        return parts.reshape(codes.shape[:-1] + (-1,))[..., :self.dim]
+
+    def lookup_tables(self, query_matrix: np.ndarray) -> np.ndarray:
+        """
+        질의별 부분 공간-중심 내적표를 만듭니다.
+
+        Args:
+            query_matrix (np.ndarray): (질의 수, 차원) float32 질의
+
+        Returns:
+            np.ndarray: (질의 수, M, 중심 수) 내적표
+        """
+        sub_dim = self.codebooks.shape[2]
+        split = self._split(query_matrix, self.subspaces, sub_dim)
+        return np.einsum('qmd,mkd->qmk', split, self.codebooks)
+
+    def scores(self, query_matrix: np.ndarray, ids: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        float32 질의들과 코드 행들의 근사 내적을 내적표 조회로 계산합니다 (ADC).
+
+        Args:
+            query_matrix (np.ndarray): (질의 수, 차원) float32 질의
+            ids (Optional[np.ndarray]): 비교할 행 ID들 (None이면 전체 행)
+
+        Returns:
+            np.ndarray: (질의 수, 행 수) float32 근사 내적
+        """
+        # 내적표를 (질의 수, M × 중심 수)로 펼치고 코드에 부분 공간 오프셋을 더해 한 번에 조회
+        tables = self.lookup_tables(query_matrix).reshape(len(query_matrix), -1)
+        offsets = np.arange(self.subspaces, dtype=np.intp) * self.codebooks.shape[1]
+        count = len(self.codes) if ids is None else len(ids)
+        result = np.empty((len(query_matrix), count), dtype=np.float32)
+        for start in range(0, count, self.chunk_size):
+            rows = slice(start, start + self.chunk_size) if ids is None \
+                else ids[start:start + self.chunk_size]
+            positions = np.asarray(self.codes[rows]).astype(np.intp)
+            positions += offsets
+            for row, table in enumerate(tables):
+                result[row, start:start + len(positions)] = np.take(table, positions).sum(axis=1)
+        return result
+
+    def save(self, prefix: str) -> None:
+        """코드를 {prefix}.pq.codes.npy / .codebooks.npy / .dim.npy에 저장합니다 (원자적 교체)."""
+        _save_arrays(prefix, {'codes': self.codes, 'codebooks': self.codebooks,
+                              'dim': np.array([self.dim], dtype=np.int64)}, self.KIND)
+
+    @classmethod
+    def load(cls, prefix: str, dim: Optional[int] = None) -> Optional['ProductQuantizedCodes']:
+        """
+        저장된 코드를 메모리 매핑으로 엽니다 (없으면 None).
+
+        Args:
+            prefix (str): 임베딩 캐시 파일 이름 접두사
+            dim (Optional[int]): 원래 벡터 차원 (None이면 코드와 함께 저장된 차원 사용)
+        """
+        names = ('codes', 'codebooks') if dim is not None else ('codes', 'codebooks', 'dim')
+        arrays = _load_arrays(prefix, names, cls.KIND)
+        if not arrays:
+            return None
+        dim = dim if dim is not None else int(arrays['dim'][0])
+        return cls(np.asarray(arrays['codebooks']), arrays['codes'], dim)
+
+
+QuantizedCodes = Union[ScalarQuantizedCodes, ProductQuantizedCodes]
+
+# 지원하는 저장 형식 (float32는 양자화하지 않은 원래 행렬)
+QUANTIZATION_FORMATS = ('float32', ScalarQuantizedCodes.KIND, ProductQuantizedCodes.KIND)
+
+
+class QuantizedRows:
+    """
+    양자화 코드를 float32 행렬처럼 행 인덱싱하는 읽기 전용 뷰
+
+    `embeddings.vectors[ids]`로 행을 읽는 기존 코드(ANN 색인 구축, 벡터 조회 등)가
+    양자화 저장소에서도 그대로 동작하도록 요청된 행만 복원합니다.
+    """
+
+    ndim = 2
+    dtype = np.dtype(np.float32)
+
+    def __init__(self, codes: QuantizedCodes):
+        self.codes = codes
+
+    @property
+    def shape(self):
+        return self.codes.shape
+
+    def __len__(self) -> int:
+        return self.codes.shape[0]
+
+    def __getitem__(self, index: RowIndex) -> np.ndarray:
+        return self.codes.decode(index)
+
+
+class QuantizedEmbeddingStore(EmbeddingStore):
+    """
+    양자화된 임베딩 저장소
+
+    EmbeddingStore와 같은 인터페이스를 제공하되, 유사도 계산은 float32 질의와
+    양자화 코드를 직접 비교(ADC)하고 행 조회는 필요한 행만 복원합니다.
+    """
+
+    def __init__(self, codes: QuantizedCodes, present: np.ndarray,
+                 vocabulary: Vocabulary, cache_key: str = ''):
+        """
+        양자화 저장소를 초기화합니다.
+
+        Args:
+            codes (QuantizedCodes): int8 또는 PQ 코드
+            present (np.ndarray): 단어 ID별 벡터 존재 여부 (bool)
+            vocabulary (Vocabulary): 행 순서의 기준이 되는 어휘
+            cache_key (str): 원본 파일과 어휘로 계산한 캐시 키
+        """
+        super().__init__(QuantizedRows(codes), present, vocabulary, cache_key)
+        self.codes = codes
+
+    @property
+    def quantization(self) -> str:
+        """저장 형식 이름 ('int8' 또는 'pq')"""
+        return self.codes.KIND
+
+    @classmethod
+    def open_cached(cls, prefix: str, quantization: str, vocabulary: Vocabulary,
+                    cache_key: str = '') -> Optional['QuantizedEmbeddingStore']:
+        """
+        캐시 옆에 저장된 양자화 코드와 존재 여부 배열만으로 양자화 저장소를 엽니다.
+
+        float32 행렬(.emb.npy)은 열지 않으므로, 코드를 만든 뒤에는 float32 캐시를
+        지워도 양자화 형식으로 계속 로드할 수 있습니다.
+
+        Args:
+            prefix (str): 임베딩 캐시 파일 이름 접두사
+            quantization (str): 'int8' 또는 'pq'
+            vocabulary (Vocabulary): 행 순서의 기준이 되는 어휘
+            cache_key (str): 원본 파일과 어휘로 계산한 캐시 키
+
+        Returns:
+            Optional[QuantizedEmbeddingStore]: 양자화 저장소 (코드가 없거나 크기가 맞지 않으면 None)
+        """
+        if quantization not in QUANTIZATION_FORMATS[1:]:
+            raise ValueError(f"지원하지 않는 양자화 형식입니다: {quantization}")
+
+        present_path = f"{prefix}.present.npy"
+        if not os.path.exists(present_path):
+            return None
+        codes = (ScalarQuantizedCodes.load(prefix) if quantization == 'int8'
+                 else ProductQuantizedCodes.load(prefix))
+        present = np.load(present_path)
+        if codes is None or len(codes.codes) != len(present) or len(present) != vocabulary.base_size:
+            return None
+
+        quantized = cls(codes, present, vocabulary, cache_key)
+        quantized.cache_prefix = prefix
+        return quantized
+
+    @classmethod
+    def from_store(cls, store: EmbeddingStore, quantization: str,
+                   pq_subspaces: Optional[int] = None, rebuild: bool = False) -> 'QuantizedEmbeddingStore':
+        """
+        float32 저장소의 캐시 옆에 양자화 코드를 만들거나 열어 양자화 저장소를 만듭니다.
+
+        Args:
+            store (EmbeddingStore): float32 임베딩 저장소 (load()로 연 저장소면 코드를 캐시)
+            quantization (str): 'int8' 또는 'pq'
+            pq_subspaces (Optional[int]): PQ 부분 공간 수 (None이면 차원 / 4)
+            rebuild (bool): 캐시된 코드가 있어도 다시 양자화할지 여부
+
+        Returns:
+            QuantizedEmbeddingStore: 양자화 저장소
+        """
+        if quantization not in QUANTIZATION_FORMATS[1:]:
+            raise ValueError(f"지원하지 않는 양자화 형식입니다: {quantization}")
+
+        prefix = store.cache_prefix
+        codes = None
+        if prefix and not rebuild:
+            codes = (ScalarQuantizedCodes.load(prefix) if quantization == 'int8'
+                     else ProductQuantizedCodes.load(prefix, store.dim))
+            if codes is not None and len(codes.codes) != len(store):
+                codes = None
+
+        if codes is None:
+            start = time.perf_counter()
+            codes = (ScalarQuantizedCodes.encode(store.vectors) if quantization == 'int8'
+                     else ProductQuantizedCodes.encode(store.vectors, store.present, pq_subspaces))
+            print(f"🗜️ 임베딩 양자화 ({quantization}): {codes.nbytes / 2 ** 20:.1f}MB "
+                  f"({time.perf_counter() - start:.1f}초)")
+            if prefix:
+                codes.save(prefix)
+                codes = (ScalarQuantizedCodes.load(prefix) if quantization == 'int8'
+                         else ProductQuantizedCodes.load(prefix, store.dim))
+
+        quantized = cls(codes, store.present, store.vocabulary, store.cache_key)
+        quantized.cache_prefix = prefix
+        return quantized
+
+    def similarities(self, queries, candidate_ids: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        질의들과 후보들 사이의 근사 코사인 유사도 행렬을 양자화 코드로 계산합니다.
+
+        Args:
+            queries (Sequence[Query]): 단어 ID 또는 벡터 질의들
+            candidate_ids (Optional[Sequence[int]]): 후보 단어 ID들 (None이면 전체 어휘)
+
+        Returns:
+            np.ndarray: (질의 수, 후보 수) float32 근사 코사인 유사도 (벡터 없는 쪽은 0)
+        """
+        query_matrix = self._as_query_matrix(queries)
+
+        if candidate_ids is None:
+            return self.codes.scores(query_matrix)
+
+        ids = np.asarray(candidate_ids, dtype=np.int64)
+        inside = (ids >= 0) & (ids < len(self))
+        scores = np.zeros((len(query_matrix), len(ids)), dtype=np.float32)
+        if inside.any():
+            scores[:, inside] = self.codes.scores(query_matrix, ids[inside])
+        return scores
+
+
+def _kmeans(points: np.ndarray, centroids: int, iterations: int,
+            rng: np.random.Generator) -> np.ndarray:
+    """
+    유클리드 k-평균으로 중심들을 학습합니다 (빈 군집은 무작위 점으로 다시 채움).
+
+    Args:
+        points (np.ndarray): (점 수, 차원) 학습 표본
+        centroids (int): 중심 수
+        iterations (int): 반복 횟수
+        rng (np.random.Generator): 난수 생성기
+
+    Returns:
+        np.ndarray: (중심 수, 차원) float32 중심
+    """
+    centers = points[rng.choice(len(points), centroids, replace=False)].copy()
+    for _ in range(iterations):
+        assignments = _nearest_centroids(points, centers)
+        counts = np.bincount(assignments, minlength=centroids)
+        sums = np.stack([np.bincount(assignments, weights=points[:, column], minlength=centroids)
+                         for column in range(points.shape[1])], axis=1)
+        empty = counts == 0
+        centers = sums / np.maximum(counts, 1)[:, None]
+        if empty.any():
+            centers[empty] = points[rng.choice(len(points), int(empty.sum()))]
+    return centers.astype(np.float32)
+
+
+def _nearest_centroids(points: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    """점마다 유클리드 거리가 가장 가까운 중심 번호를 찾습니다."""
+    distances = (centers ** 2).sum(axis=1)[None, :] - 2 * points @ centers.T
+    return np.argmin(distances, axis=1)
+
+
+def _save_arrays(prefix: str, arrays: Dict[str, np.ndarray], kind: str) -> None:
+    """{prefix}.{kind}.{이름}.npy들을 임시 파일에 쓴 뒤 원자적으로 교체합니다."""
+    for name, array in arrays.items():
+        path = f"{prefix}.{kind}.{name}.npy"
+        np.save(f"{path}.tmp.npy", np.asarray(array))
+        os.replace(f"{path}.tmp.npy", path)
+
+
+def _load_arrays(prefix: str, names: Sequence[str], kind: str) -> Optional[Dict[str, np.ndarray]]:
+    """{prefix}.{kind}.{이름}.npy들을 메모리 매핑으로 엽니다 (하나라도 없으면 None)."""
+    paths = {name: f"{prefix}.{kind}.{name}.npy" for name in names}
+    if not all(os.path.exists(path) for path in paths.values()):
+        return None
+    return {name: np.load(path, mmap_mode='r') for name, path in paths.items()}
+
+
+def evaluate_quantization(store: EmbeddingStore, quantized_stores: Sequence[EmbeddingStore],
+                          query_ids: Sequence[int], k: int = 10) -> List[Dict]:
+    """
+    저장 형식별 메모리, recall@k(float32 전수 비교 기준), 질의 지연 시간을 측정합니다.
+
+    Args:
+        store (EmbeddingStore): 기준 float32 임베딩 저장소
+        quantized_stores (Sequence[EmbeddingStore]): 비교할 양자화 저장소들
+        query_ids (Sequence[int]): 질의 단어 ID들
+        k (int): 비교할 상위 단어 수
+
+    Returns:
+        List[Dict]: 형식별 {'format', 'bytes', 'recall', 'query_ms'} (float32가 첫 행)
+    """
+    query_ids = [int(word_id) for word_id in query_ids if store.has_vector(int(word_id))]
+    if not query_ids:
+        return []
+    queries = [store.get_vector(word_id) for word_id in query_ids]
+
+    def run(candidate: EmbeddingStore):
+        start = time.perf_counter()
+        found = [[word_id for word_id, _ in candidate.top_k(query, k + 1, exact=True)
+                  if word_id != query_id][:k]
+                 for query_id, query in zip(query_ids, queries)]
+        return found, (time.perf_counter() - start) * 1000 / len(query_ids)
+
+    truth, float_ms = run(store)
+    report = [{'format': 'float32', 'bytes': len(store) * store.dim * 4,
+               'recall': 1.0, 'query_ms': float_ms}]
+    for candidate in quantized_stores:
+        found, query_ms = run(candidate)
+        hits = sum(len(set(expected) & set(result)) for expected, result in zip(truth, found))
+        report.append({'format': getattr(candidate, 'quantization', 'float32'),
+                       'bytes': candidate.codes.nbytes if hasattr(candidate, 'codes') else 0,
+                       'recall': hits / max(sum(len(expected) for expected in truth), 1),
+                       'query_ms': query_ms})
+    return report
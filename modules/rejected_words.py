@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+거부 단어 필터 모듈
+서버가 받아들이지 않은 단어를 게임 간에 기억하는 영구 네거티브 캐시를 제공합니다.
+"""
+
+import hashlib
+import math
+import os
+import struct
+from typing import Dict, Iterable, List, Set
+
+from .vocabulary import Vocabulary
+
+
+class RejectedWordFilter:
+    """
+    서버 거부 단어 필터 (블룸 필터 + 정확한 오버플로 목록)
+
+    설계 용량까지는 블룸 필터에 비트로만 기록하여 파일을 작게 유지하고,
+    용량을 넘는 단어는 정확한 오버플로 목록에 저장하여 오탐률이 목표치를 넘지 않게 합니다.
+    블룸 필터 특성상 거부되지 않은 단어가 드물게(오탐률만큼) 거부된 것으로 판정될 수 있습니다.
+
+    파일 구조 (리틀 엔디언):
+        magic(4) | version(u16) | hash_count(u16) | bit_count(u32) | capacity(u32)
+        | bloom_count(u32) | overflow_size(u32) | 비트 배열 | UTF-8 오버플로 단어 ('\\n' 구분)
+    """
+
+    MAGIC = b'KBLM'
+    FORMAT_VERSION = 1
+    _HEADER = struct.Struct('<4sHHIIII')
+
+    def __init__(self, file_path: str = 'rejected_words.bloom', capacity: int = 10000,
+                 false_positive_rate: float = 0.001):
+        """
+        거부 단어 필터를 초기화하고 파일이 있으면 로드합니다.
+
+        Args:
+            file_path (str): 필터 파일 경로
+            capacity (int): 블룸 필터 설계 용량 (단어 수)
+            false_positive_rate (float): 설계 용량에서의 목표 오탐률
+        """
+        if capacity <= 0:
+            raise ValueError("capacity는 1 이상이어야 합니다.")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate는 0과 1 사이여야 합니다.")
+
+        self.file_path = file_path
+        self.capacity = capacity
+        self.target_false_positive_rate = false_positive_rate
+
+        # 최적 비트 수 m = -n ln p / (ln 2)^2, 해시 수 k = (m / n) ln 2
+        self.bit_count = max(8, math.ceil(-capacity * math.log(false_positive_rate) /
+                                          (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2)))
+        self.bits = bytearray((self.bit_count + 7) // 8)
+        self.bloom_count = 0
+        self.overflow: Set[str] = set()
+
+        self.load()
+
+    def _bit_positions(self, word: str) -> Iterable[int]:
+        """
+        단어의 비트 위치들을 이중 해싱으로 계산합니다 (실행 간 안정적인 해시 사용).
+
+        Args:
+            word (str): 단어
+
+        Returns:
+            Iterable[int]: 비트 위치들
+        """
+        digest = hashlib.blake2b(word.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return ((first + i * second) % self.bit_count for i in range(self.hash_count))
+
+    def add(self, word: str) -> bool:
+        """
+        거부된 단어를 기록합니다.
+
+        Args:
+            word (str): 서버가 거부한 단어
+
+        Returns:
+            bool: 새로 기록되었는지 여부 (이미 거부 목록에 있으면 False)
+        """
+        if word in self:
+            return False
+
+        if self.bloom_count < self.capacity:
+            for position in self._bit_positions(word):
+                self.bits[position >> 3] |= 1 << (position & 7)
+            self.bloom_count += 1
+        else:
+            self.overflow.add(word)
+        return True
+
+    def __contains__(self, word: str) -> bool:
+        if word in self.overflow:
+            return True
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7))
+                   for position in self._bit_positions(word))
+
+    def __len__(self) -> int:
+        return self.bloom_count + len(self.overflow)
+
+    def find_rejected_ids(self, vocabulary: Vocabulary) -> List[int]:
+        """
+        후보 어휘 중 거부 목록에 있는 단어 ID들을 찾습니다 (어휘 로드 시 한 번 호출).
+
+        Args:
+            vocabulary (Vocabulary): 단어 ID 인터닝 테이블
+
+        Returns:
+            List[int]: 거부된 후보 단어 ID 목록
+        """
+        if not len(self):
+            return []
+        words = vocabulary.words
+        return [word_id for word_id in range(vocabulary.base_size) if words[word_id] in self]
+
+    def get_false_positive_rate(self) -> float:
+        """
+        현재 기록된 단어 수 기준 블룸 필터의 예상 오탐률을 계산합니다.
+
+        Returns:
+            float: 예상 오탐률 (1 - e^(-kn/m))^k
+        """
+        if self.bloom_count == 0:
+            return 0.0
+        return (1 - math.exp(-self.hash_count * self.bloom_count / self.bit_count)) ** self.hash_count
+
+    def get_stats(self) -> Dict:
+        """
+        필터 통계를 반환합니다.
+
+        Returns:
+            Dict: 전체/블룸/오버플로 단어 수, 용량, 비트/해시 수, 예상 오탐률, 파일 크기
+        """
+        return {
+            'entries': len(self),
+            'bloom_entries': self.bloom_count,
+            'overflow_entries': len(self.overflow),
+            'capacity': self.capacity,
+            'bit_count': self.bit_count,
+            'hash_count': self.hash_count,
+            'false_positive_rate': self.get_false_positive_rate(),
+            'target_false_positive_rate': self.target_false_positive_rate,
+            'size_bytes': (self._HEADER.size + len(self.bits) +
+                           len('\n'.join(self.overflow).encode('utf-8')))
+        }
+
+    def load(self) -> bool:
+        """
+        파일에서 필터를 로드합니다 (파일이 없거나 손상되었으면 빈 필터 유지).
+
+        Returns:
+            bool: 로드 성공 여부
+        """
+        if not os.path.exists(self.file_path):
+            return False
+
+        try:
+            with open(self.file_path, 'rb') as f:
+                data = f.read()
+
+            magic, version, hash_count, bit_count, capacity, bloom_count, overflow_size = \
+                self._HEADER.unpack_from(data, 0)
+            bits_size = (bit_count + 7) // 8
+
+            if (magic != self.MAGIC or version != self.FORMAT_VERSION or
+                len(data) != self._HEADER.size + bits_size + overflow_size):
+                print(f"⚠️ 거부 단어 필터 형식이 올바르지 않습니다: {self.file_path}")
+                return False
+
+            # 파일에 저장된 설계 값이 우선 (비트 위치가 이 값들에 의존)
+            self.hash_count = hash_count
+            self.bit_count = bit_count
+            self.capacity = capacity
+            self.bloom_count = bloom_count
+            self.bits = bytearray(data[self._HEADER.size:self._HEADER.size + bits_size])
+
+            overflow_blob = data[self._HEADER.size + bits_size:]
+            self.overflow = set(overflow_blob.decode('utf-8').split('\n')) if overflow_blob else set()
+            return True
+        except (OSError, ValueError, struct.error) as e:
+            print(f"⚠️ 거부 단어 필터 로드 실패: {e}")
+            return False
+
+    def save(self) -> bool:
+        """
+        필터를 파일에 저장합니다.
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        try:
+            overflow_blob = '\n'.join(sorted(self.overflow)).encode('utf-8')
+            temp_path = f"{self.file_path}.tmp"
+
+            with open(temp_path, 'wb') as f:
+                f.write(self._HEADER.pack(self.MAGIC, self.FORMAT_VERSION, self.hash_count,
+                                          self.bit_count, self.capacity, self.bloom_count,
+                                          len(overflow_blob)))
+                f.write(self.bits)
+                f.write(overflow_blob)
+
+            os.replace(temp_path, self.file_path)
+            return True
+        except OSError as e:
+            print(f"⚠️ 거부 단어 필터 저장 실패: {e}")
+            return False
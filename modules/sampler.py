@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+가중치 샘플러 모듈
+단어 ID별 가중치에 비례하는 무작위 선택을 제공합니다.
+"""
+
+import random
+from array import array
+from typing import Iterable, Optional
+
+
+class WeightedSampler:
+    """
+    펜윅 트리(Binary Indexed Tree) 기반 가중치 샘플러
+    인덱스(단어 ID)별 가중치를 유지하며 샘플링, 가중치 갱신, 제거를 모두 O(log n)에 처리합니다.
+
+    제거는 가중치를 0으로 만드는 것이므로 시도한 단어를 빼기 위해 목록을 다시 만들 필요가 없습니다.
+    """
+
+    def __init__(self, weights: Iterable[float] = ()):
+        """
+        샘플러를 O(n)에 구축합니다.
+
+        Args:
+            weights (Iterable[float]): 인덱스별 가중치 (음수 불가)
+        """
+        self._weights = array('d', weights)
+        if any(weight < 0 for weight in self._weights):
+            raise ValueError("가중치는 음수일 수 없습니다.")
+
+        self._size = len(self._weights)
+        self._top_bit = 1 << (self._size.bit_length() - 1) if self._size else 0
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        """현재 가중치로 트리와 합계를 다시 계산합니다 (부동소수점 누적 오차 제거)."""
+        tree = array('d', bytes(8 * (self._size + 1)))
+        for index, weight in enumerate(self._weights, 1):
+            tree[index] += weight
+            parent = index + (index & -index)
+            if parent <= self._size:
+                tree[parent] += tree[index]
+
+        self._tree = tree
+        self._total = sum(self._weights)
+        self._count = sum(1 for weight in self._weights if weight > 0)
+
+    def set_weight(self, index: int, weight: float) -> None:
+        """
+        인덱스의 가중치를 변경합니다.
+
+        Args:
+            index (int): 인덱스 (단어 ID)
+            weight (float): 새 가중치 (0이면 샘플링 대상에서 제외)
+        """
+        if weight < 0:
+            raise ValueError("가중치는 음수일 수 없습니다.")
+
+        old_weight = self._weights[index]
+        delta = weight - old_weight
+        if delta == 0:
+            return
+
+        self._weights[index] = weight
+        self._total += delta
+        self._count += (weight > 0) - (old_weight > 0)
+
+        position = index + 1
+        while position <= self._size:
+            self._tree[position] += delta
+            position += position & -position
+
+    def remove(self, index: int) -> None:
+        """
+        인덱스를 샘플링 대상에서 제거합니다 (가중치를 0으로 설정).
+
+        Args:
+            index (int): 인덱스 (단어 ID)
+        """
+        if 0 <= index < self._size:
+            self.set_weight(index, 0.0)
+
+    def get_weight(self, index: int) -> float:
+        """인덱스의 현재 가중치를 반환합니다."""
+        return self._weights[index]
+
+    @property
+    def total(self) -> float:
+        """전체 가중치 합"""
+        return self._total
+
+    def sample(self, rng: random.Random = None) -> Optional[int]:
+        """
+        가중치에 비례하여 인덱스 하나를 선택합니다.
+
+        Args:
+            rng (random.Random): 난수 생성기 (None이면 전역 random 사용)
+
+        Returns:
+            Optional[int]: 선택된 인덱스 (가중치가 양수인 원소가 없으면 None)
+        """
+        if self._count == 0:
+            return None
+
+        for _ in range(2):
+            target = (rng or random).random() * self._total
+
+            # 누적합이 target을 넘지 않는 가장 긴 접두사를 트리 하강으로 찾음
+            position = 0
+            step = self._top_bit
+            while step:
+                next_position = position + step
+                if next_position <= self._size and self._tree[next_position] <= target:
+                    target -= self._tree[next_position]
+                    position = next_position
+                step >>= 1
+
+            if position < self._size and self._weights[position] > 0:
+                return position
+
+            # 누적 오차로 가중치 0인 원소에 떨어지면 트리를 다시 계산 후 재시도
+            self._rebuild()
+
+        return None
+
+    def copy(self) -> 'WeightedSampler':
+        """
+        독립적으로 수정할 수 있는 복사본을 만듭니다.
+
+        Returns:
+            WeightedSampler: 복사본
+        """
+        clone = WeightedSampler.__new__(WeightedSampler)
+        clone._weights = array('d', self._weights)
+        clone._size = self._size
+        clone._top_bit = self._top_bit
+        clone._tree = array('d', self._tree)
+        clone._total = self._total
+        clone._count = self._count
+        return clone
+
+    def __len__(self) -> int:
+        """가중치가 양수인 원소 수"""
+        return self._count
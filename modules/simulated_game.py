@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+시뮬레이션 게임 모듈
+로컬 임베딩으로 꼬맨틀 게임을 흉내 내어 브라우저/네트워크 없이 솔버를 실행합니다.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .embeddings import EmbeddingStore
+from .models import RANKED_LIMIT, GuessResult, SubmitOutcome
+from .vocabulary import Vocabulary
+
+
+@dataclass
+class SimulatedGameConfig:
+    """시뮬레이션 게임 설정을 저장하는 클래스"""
+    embedding_file: str = ''       # 게임 모델 임베딩 파일 (word2vec/fastText)
+    target_word: Optional[str] = None  # 정답 단어 (None이면 벡터가 있는 단어 중 무작위)
+    seed: Optional[int] = None     # 무작위 정답 선택 시드
+    cache_directory: str = '.cache'
+
+
+class SimulatedGame:
+    """
+    오프라인 꼬맨틀 게임 백엔드
+
+    WebAutomation과 같은 setup_driver/navigate_to_game/submit_word/parse_result/
+    check_game_completion 인터페이스를 제공하므로 SemanticSolver(game_backend=...)로
+    바꿔 끼우면 solve_game()이 그대로 동작합니다.
+
+    유사도는 게임 어휘 임베딩의 코사인 × 100 (소수 둘째 자리 반올림, 음수는 0),
+    순위는 정답과 가까운 순서의 상위 1000위(정답 자신 제외 999개)를 준비 시 한 번의
+    행렬-벡터 곱으로 계산해 둡니다. 게임 어휘에 없거나 벡터가 없는 단어는 실제 사이트처럼
+    제출이 거부됩니다.
+    """
+
+    def __init__(self, words: Union[Sequence[str], Vocabulary],
+                 config: Optional[SimulatedGameConfig] = None,
+                 embeddings: Optional[EmbeddingStore] = None):
+        """
+        시뮬레이션 게임을 초기화합니다.
+
+        Args:
+            words (Union[Sequence[str], Vocabulary]): 게임 어휘 (순위를 매길 단어들)
+            config (Optional[SimulatedGameConfig]): 게임 설정
+            embeddings (Optional[EmbeddingStore]): 이미 로드한 게임 어휘 임베딩
+                (주면 config.embedding_file 대신 사용, 예: 솔버의 vocabulary.embeddings)
+        """
+        self.config = config or SimulatedGameConfig()
+        if embeddings is None and not self.config.embedding_file:
+            raise ValueError("시뮬레이션 게임에는 임베딩 파일 또는 임베딩 저장소가 필요합니다.")
+
+        self.vocabulary = words if isinstance(words, Vocabulary) else Vocabulary(list(words))
+        self.embeddings = embeddings
+        self.driver = None
+        self.is_connected = False
+
+        self.target_id: Optional[int] = None
+        self.ranks: Dict[int, int] = {}
+        self.results: List[GuessResult] = []
+        self._submitted: Dict[str, GuessResult] = {}
+
+    @property
+    def target_word(self) -> Optional[str]:
+        """현재 게임의 정답 단어"""
+        return self.vocabulary.get_word(self.target_id) if self.target_id is not None else None
+
+    def setup_driver(self) -> bool:
+        """
+        게임 모델 임베딩을 로드합니다 (브라우저 설정에 해당).
+
+        Returns:
+            bool: 설정 성공 여부
+        """
+        if self.embeddings is not None:
+            return True
+
+        try:
+            self.embeddings = EmbeddingStore.load(self.config.embedding_file, self.vocabulary,
+                                                  self.config.cache_directory)
+        except (OSError, ValueError) as e:
+            print(f"❌ 시뮬레이션 게임 임베딩 로드 실패: {e}")
+            return False
+
+        print(f"✅ 시뮬레이션 게임 준비: 단어 {self.embeddings.coverage}개")
+        return True
+
+    def navigate_to_game(self) -> bool:
+        """
+        새 게임을 시작합니다 (정답 선택과 순위표 계산, 게임 사이트 접속에 해당).
+
+        Returns:
+            bool: 시작 성공 여부
+        """
+        if self.embeddings is None:
+            print("❌ 시뮬레이션 게임이 준비되지 않았습니다. setup_driver()를 먼저 호출하세요.")
+            return False
+
+        target_id = self._choose_target()
+        if target_id is None:
+            print(f"❌ 정답 단어를 게임 어휘에서 찾을 수 없습니다: {self.config.target_word}")
+            self.is_connected = False
+            return False
+
+        self.target_id = target_id
+        self.ranks = self._rank_table(target_id)
+        self.results = []
+        self._submitted = {}
+        self.is_connected = True
+        print(f"✅ 시뮬레이션 게임 시작 (게임 어휘 {self.embeddings.coverage}개)")
+        return True
+
+    def _choose_target(self) -> Optional[int]:
+        """설정된 정답 또는 벡터가 있는 단어 중 무작위 정답의 ID를 고릅니다."""
+        if self.config.target_word is not None:
+            target_id = self.vocabulary.get_id(self.config.target_word)
+            return target_id if target_id is not None and self.embeddings.has_vector(target_id) else None
+
+        present_ids = np.flatnonzero(self.embeddings.present)
+        if not len(present_ids):
+            return None
+        return int(random.Random(self.config.seed).choice(present_ids))
+
+    def _rank_table(self, target_id: int) -> Dict[int, int]:
+        """정답과 가까운 순서의 상위 999개 단어 순위표 {단어 ID: 순위}를 만듭니다."""
+        neighbors = self.embeddings.top_k(target_id, RANKED_LIMIT - 1, exact=True)
+        return {word_id: rank for rank, (word_id, _) in enumerate(neighbors, 1)}
+
+    def score_word(self, word: str) -> Optional[Tuple[float, Optional[int]]]:
+        """
+        현재 정답에 대한 단어의 코사인 유사도와 순위를 계산합니다 (게임 상태는 바꾸지 않음).
+
+        Args:
+            word (str): 채점할 단어
+
+        Returns:
+            Optional[Tuple[float, Optional[int]]]: (코사인 유사도, 순위) — 순위는 정답이면 0,
+                상위 1000위 밖이면 None (게임 어휘에 없거나 벡터가 없는 단어, 게임 시작 전이면 None)
+        """
+        if self.target_id is None:
+            return None
+
+        word_id = self.vocabulary.get_id(word)
+        if word_id is None or not self.embeddings.has_vector(word_id):
+            return None
+        if word_id == self.target_id:
+            return 1.0, 0
+        return self.embeddings.similarity(word_id, self.target_id), self.ranks.get(word_id)
+
+    def submit_word(self, word: str) -> SubmitOutcome:
+        """
+        단어를 제출합니다.
+
+        Args:
+            word (str): 제출할 단어
+
+        Returns:
+            SubmitOutcome: 제출 결과 (게임 어휘에 없는 단어면 UNKNOWN_WORD)
+        """
+        if not self.is_connected:
+            return SubmitOutcome.FAILED
+
+        score = self.score_word(word)
+        if score is None:
+            return SubmitOutcome.UNKNOWN_WORD
+
+        if word not in self._submitted:
+            cosine, rank_value = score
+            if rank_value == 0:
+                similarity, rank = 100.0, "정답!"
+            else:
+                similarity = min(max(round(cosine * 100.0, 2), 0.0), 100.0)
+                rank = f"{rank_value}위" if rank_value else f"{RANKED_LIMIT}위 이상"
+
+            result = GuessResult(word, similarity, rank, len(self.results) + 1)
+            self._submitted[word] = result
+            self.results.append(result)
+        return SubmitOutcome.ACCEPTED
+
+    def parse_result(self, word: str, attempt: int) -> Optional[GuessResult]:
+        """
+        제출한 단어의 결과를 반환합니다.
+
+        Args:
+            word (str): 제출한 단어
+            attempt (int): 시도 번호
+
+        Returns:
+            Optional[GuessResult]: 결과 (제출하지 않은 단어면 None)
+        """
+        submitted = self._submitted.get(word)
+        if submitted is None:
+            return None
+        return GuessResult(submitted.word, submitted.similarity, submitted.rank, attempt)
+
+    def check_game_completion(self) -> Optional[str]:
+        """
+        게임 완료 여부를 확인합니다 (정답 찾기 성공).
+
+        Returns:
+            Optional[str]: 성공시 정답 단어, 실패시 None
+        """
+        if self.target_word is not None and self.target_word in self._submitted:
+            return self.target_word
+        return None
+
+    def get_current_results(self) -> List[GuessResult]:
+        """
+        현재까지의 모든 결과를 제출 순서대로 가져옵니다.
+
+        Returns:
+            List[GuessResult]: 현재까지의 모든 추측 결과
+        """
+        return list(self.results)
+
+    def cleanup(self) -> None:
+        """게임 연결 상태를 정리합니다."""
+        self.is_connected = False
+
+    def get_driver_info(self) -> dict:
+        """
+        현재 게임 상태 정보를 반환합니다.
+
+        Returns:
+            dict: 게임 상태 정보
+        """
+        return {
+            'connected': self.is_connected,
+            'backend': 'simulated',
+            'words': len(self.vocabulary),
+            'guesses': len(self.results)
+        }
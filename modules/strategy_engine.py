@@ -4,14 +4,17 @@
 4단계 적응형 탐색 전략을 구현하는 모듈입니다.
 """
 
+import heapq
 import random
 import math
-from typing import List, Dict, Set, Optional, Tuple
+from typing import List, Dict, Set, Optional, Tuple, Union
 from abc import ABC, abstractmethod
-from collections import defaultdict
 
 from .models import GuessResult, GameSession
+from .sampler import WeightedSampler
 from .strategy_logger import StrategyLogger
+from .vocabulary import AvailableVocabulary, pack_pair
+from .word_index import decompose_jamo
 
 
 class SearchStrategy(ABC):
@@ -21,14 +24,14 @@ class SearchStrategy(ABC):
     """
     
     @abstractmethod
-    def select_word(self, session: GameSession, vocab: List[str], 
+    def select_word(self, session: GameSession, vocab: AvailableVocabulary, 
                    learned_data: Dict) -> Optional[str]:
         """
         전략에 따라 다음 단어를 선택합니다.
         
         Args:
             session (GameSession): 현재 게임 세션
-            vocab (List[str]): 사용 가능한 어휘 목록
+            vocab (AvailableVocabulary): 사용 가능한 어휘 뷰
             learned_data (Dict): 학습된 데이터
             
         Returns:
@@ -36,6 +39,46 @@ class SearchStrategy(ABC):
         """
         pass
     
+    def select_word_id(self, session: GameSession, vocab: AvailableVocabulary, 
+                       learned_data: Dict) -> Optional[int]:
+        """
+        전략에 따라 다음 단어를 선택하고 세션 어휘의 단어 ID로 반환합니다.
+        
+        Args:
+            session (GameSession): 현재 게임 세션
+            vocab (AvailableVocabulary): 사용 가능한 어휘 뷰
+            learned_data (Dict): 학습된 데이터
+            
+        Returns:
+            Optional[int]: 선택된 단어 ID (없으면 None)
+        """
+        word = self.select_word(session, vocab, learned_data)
+        return session.vocabulary.intern(word) if word is not None else None
+    
+    def _get_embedding_neighbors(self, session: GameSession, vocab: AvailableVocabulary,
+                                 word_ids: List[int], k: int = 10) -> List[str]:
+        """
+        어휘에 임베딩이 연결되어 있으면 기준 단어들의 사용 가능한 근접어를 찾습니다.
+        
+        Args:
+            session (GameSession): 현재 게임 세션
+            vocab (AvailableVocabulary): 사용 가능한 어휘 뷰
+            word_ids (List[int]): 기준 단어 ID들
+            k (int): 기준 단어당 근접어 수
+            
+        Returns:
+            List[str]: 근접어 목록 (기준 단어별로 가까운 순, 임베딩이 없으면 빈 목록)
+        """
+        embeddings = session.vocabulary.embeddings
+        if embeddings is None or not word_ids:
+            return []
+        
+        get_word = session.vocabulary.get_word
+        neighbors = []
+        for row in embeddings.top_k_batch(word_ids, k, vocab):
+            neighbors.extend(get_word(word_id) for word_id, _ in row)
+        return neighbors
+    
     @abstractmethod
     def get_strategy_name(self) -> str:
         """전략 이름을 반환합니다."""
@@ -62,14 +105,14 @@ class WideSemanticExploration(SearchStrategy):
             "상태조건": ["상태", "조건", "상황", "환경", "분위기", "기분"]
         }
     
-    def select_word(self, session: GameSession, vocab: List[str], 
+    def select_word(self, session: GameSession, vocab: AvailableVocabulary, 
                    learned_data: Dict) -> Optional[str]:
         """
         다양한 의미 영역에서 아직 시도하지 않은 단어를 선택합니다.
         
         Args:
             session (GameSession): 현재 게임 세션
-            vocab (List[str]): 사용 가능한 어휘 목록
+            vocab (AvailableVocabulary): 사용 가능한 어휘 뷰
             learned_data (Dict): 학습된 데이터
             
         Returns:
@@ -77,13 +120,13 @@ class WideSemanticExploration(SearchStrategy):
         """
         # 첫 번째 시도인 경우 학습 데이터 기반 초기 단어 선택
         if not session.guesses:
-            return self._select_initial_word(vocab, learned_data, session.tried_words)
+            return self._select_initial_word(vocab, learned_data, session)
         
         # 이미 시도한 의미 범주들 식별
         tried_categories = self._identify_tried_categories(session.guesses)
         
         # 먼저 학습 데이터 기반 후보 확인
-        learning_candidates = self._get_learning_based_candidates(vocab, learned_data, session.tried_words, 5)
+        learning_candidates = self._get_learning_based_candidates(vocab, learned_data, session, 5)
         if learning_candidates:
             selected_word = learning_candidates[0]
             print(f"   🎯 학습 기반 선택: '{selected_word}'")
@@ -97,7 +140,7 @@ class WideSemanticExploration(SearchStrategy):
             # 새로운 범주에서 랜덤 선택
             selected_category = random.choice(untried_categories)
             category_words = [w for w in self.semantic_categories[selected_category]
-                            if w in vocab and w not in session.tried_words]
+                            if w in vocab and not session.is_tried(w)]
             
             if category_words:
                 selected_word = random.choice(category_words)
@@ -126,15 +169,15 @@ class WideSemanticExploration(SearchStrategy):
         
         return tried_categories
     
-    def _select_initial_word(self, vocab: List[str], learned_data: Dict, 
-                           tried_words: Set[str]) -> Optional[str]:
+    def _select_initial_word(self, vocab: AvailableVocabulary, learned_data: Dict, 
+                           session: GameSession) -> Optional[str]:
         """
         학습 데이터를 기반으로 효과적인 초기 단어를 선택합니다.
         
         Args:
-            vocab (List[str]): 사용 가능한 어휘 목록
-            learned_data (Dict): 학습된 데이터
-            tried_words (Set[str]): 이미 시도한 단어들
+            vocab (AvailableVocabulary): 사용 가능한 어휘 뷰
+            learned_data (Dict): 학습된 데이터 (단어 ID 기준)
+            session (GameSession): 현재 게임 세션
             
         Returns:
             Optional[str]: 선택된 초기 단어
@@ -155,12 +198,12 @@ class WideSemanticExploration(SearchStrategy):
         initial_words = high_impact_words + effective_words + general_words
         
         for word in initial_words:
-            if word in vocab and word not in tried_words:
+            if word in vocab and not session.is_tried(word):
                 score = 0
                 
                 # 1. 학습된 평균 유사도
-                if word in word_frequency:
-                    freq_data = word_frequency[word]
+                freq_data = word_frequency.get(session.vocabulary.get_id(word))
+                if freq_data is not None:
                     avg_sim = freq_data.get('avg_similarity', 0)
                     count = freq_data.get('count', 0)
                     
@@ -179,35 +222,31 @@ class WideSemanticExploration(SearchStrategy):
                 initial_candidates.append((word, score))
         
         if initial_candidates:
-            # 점수순 정렬하되 상위 3개 중 확률적 선택 (다양성 유지)
-            initial_candidates.sort(key=lambda x: x[1], reverse=True)
-            top_candidates = initial_candidates[:3]
+            # 상위 3개 중 확률적 선택 (다양성 유지, 전체 정렬 없이 상위만 추출)
+            top_candidates = heapq.nlargest(3, initial_candidates, key=lambda x: x[1])
             
             # 가중치 기반 확률적 선택
-            total_score = sum(c[1] for c in top_candidates)
-            if total_score > 0:
-                probabilities = [c[1] / total_score for c in top_candidates]
-                selected_idx = random.choices(range(len(top_candidates)), weights=probabilities)[0]
+            selected_idx = WeightedSampler(c[1] for c in top_candidates).sample()
+            if selected_idx is not None:
                 return top_candidates[selected_idx][0]
-            else:
-                return top_candidates[0][0]
+            return top_candidates[0][0]
         
         # 후보가 없으면 어휘에서 랜덤 선택
-        available = [w for w in vocab if w not in tried_words]
-        return random.choice(available) if available else None
+        return vocab.random_word()
     
-    def _explore_derivatives(self, session: GameSession, vocab: List[str]) -> Optional[str]:
+    def _explore_derivatives(self, session: GameSession, vocab: AvailableVocabulary) -> Optional[str]:
         """
         기존 단어들의 파생어를 탐색합니다.
         
         Args:
             session (GameSession): 현재 게임 세션
-            vocab (List[str]): 사용 가능한 어휘 목록
+            vocab (AvailableVocabulary): 사용 가능한 어휘 뷰
             
         Returns:
             Optional[str]: 선택된 파생어
         """
         derivatives = []
+        prefix_index = session.vocabulary.prefix_index
         
         # 기존 추측에서 어근 기반 파생어 생성
         for guess in session.guesses:
@@ -215,16 +254,12 @@ class WideSemanticExploration(SearchStrategy):
             if len(word) > 1:
                 root = word[:-1]  # 마지막 글자 제거
                 
-                # 같은 어근을 가진 단어들 찾기
-                for vocab_word in vocab:
-                    if (vocab_word.startswith(root) and 
-                        vocab_word != word and 
-                        vocab_word not in session.tried_words and 
-                        len(vocab_word) <= len(word) + 2):
-                        
-                        # 예상 유사도 차이 계산 (작을수록 좋음)
-                        expected_diff = abs(guess.similarity - 0.1)
-                        derivatives.append((vocab_word, expected_diff))
+                # 같은 어근을 가진 단어들 찾기 (접두사 색인)
+                expected_diff = abs(guess.similarity - 0.1)
+                for vocab_word in prefix_index.find(root, vocab, max_length=len(word) + 2,
+                                                    exclude=word):
+                    # 예상 유사도 차이 (작을수록 좋음)
+                    derivatives.append((vocab_word, expected_diff))
         
         if derivatives:
             # 유사도가 높을 것으로 예상되는 순으로 정렬
@@ -234,35 +269,35 @@ class WideSemanticExploration(SearchStrategy):
             return selected_word
         
         # 파생어도 없으면 랜덤 선택
-        available_words = [w for w in vocab if w not in session.tried_words]
-        if available_words:
-            return random.choice(available_words)
-        
-        return None
+        return vocab.random_word()
     
     def get_strategy_name(self) -> str:
         return "넓은의미탐색"
     
-    def _get_learning_based_candidates(self, vocab: List[str], learned_data: Dict, 
-                                     tried_words: Set[str], limit: int = 10) -> List[str]:
+    def _get_learning_based_candidates(self, vocab: AvailableVocabulary, learned_data: Dict, 
+                                     session: GameSession, limit: int = 10) -> List[str]:
         """
         학습 데이터 기반으로 효과적인 후보 단어들을 추출합니다.
         
         Args:
-            vocab (List[str]): 사용 가능한 어휘
-            learned_data (Dict): 학습된 데이터
-            tried_words (Set[str]): 이미 시도한 단어들
+            vocab (AvailableVocabulary): 사용 가능한 어휘 뷰
+            learned_data (Dict): 학습된 데이터 (단어 ID 기준)
+            session (GameSession): 현재 게임 세션
             limit (int): 반환할 최대 단어 수
             
         Returns:
             List[str]: 추천 단어 목록
         """
         word_frequency = learned_data.get('word_frequency', {})
+        get_word = session.vocabulary.get_word
         candidates = []
         
         # 학습된 단어들 중에서 효과적인 것들 선택
-        for word, freq_data in word_frequency.items():
-            if word in vocab and word not in tried_words:
+        for word_id, freq_data in word_frequency.items():
+            if session.is_tried_id(word_id):
+                continue
+            word = get_word(word_id)
+            if word in vocab:
                 # 평균 유사도가 높고 성공 경험이 있는 단어
                 if freq_data['avg_similarity'] > 30 and freq_data['count'] >= 2:
                     effectiveness = freq_data['avg_similarity'] * math.log(freq_data['count'] + 1)
@@ -305,14 +340,14 @@ class SemanticGradientSearch(SearchStrategy):
             "행복": ["기쁨", "만족", "즐거움", "웃음", "평화", "사랑"]
         }
     
-    def select_word(self, session: GameSession, vocab: List[str], 
+    def select_word(self, session: GameSession, vocab: AvailableVocabulary, 
                    learned_data: Dict) -> Optional[str]:
         """
         상위 유사도 단어들을 기반으로 의미적 경사를 따라 탐색합니다.
         
         Args:
             session (GameSession): 현재 게임 세션
-            vocab (List[str]): 사용 가능한 어휘 목록
+            vocab (AvailableVocabulary): 사용 가능한 어휘 뷰
             learned_data (Dict): 학습된 데이터
             
         Returns:
@@ -326,17 +361,21 @@ class SemanticGradientSearch(SearchStrategy):
         
         for guess in top_guesses:
             # 1. 의미적 확장
-            expansions = self._get_semantic_expansions(guess.word, vocab, session.tried_words)
+            expansions = self._get_semantic_expansions(guess.word, vocab, session)
             all_candidates.extend(expansions)
             
             # 2. 연관어 탐색
-            associations = self._get_semantic_associations(guess.word, vocab, session.tried_words)
+            associations = self._get_semantic_associations(guess.word, vocab, session)
             all_candidates.extend(associations)
             
             # 3. 문맥적 관련어
-            contextual = self._get_contextual_relations(guess.word, vocab, session.tried_words)
+            contextual = self._get_contextual_relations(guess.word, vocab, session)
             all_candidates.extend(contextual)
         
+        # 4. 임베딩 근접어 (상위 추측들을 한 번의 행렬 곱으로 조회)
+        all_candidates.extend(self._get_embedding_neighbors(
+            session, vocab, [guess.word_id for guess in top_guesses]))
+        
         # 중복 제거 및 동적 점수 기반 선택
         unique_candidates = list(set(all_candidates))
         if unique_candidates:
@@ -352,29 +391,25 @@ class SemanticGradientSearch(SearchStrategy):
         wide_strategy = WideSemanticExploration()
         return wide_strategy.select_word(session, vocab, learned_data)
     
-    def _get_semantic_expansions(self, word: str, vocab: List[str], 
-                               tried_words: Set[str]) -> List[str]:
+    def _get_semantic_expansions(self, word: str, vocab: AvailableVocabulary, 
+                               session: GameSession) -> List[str]:
         """
         단어의 의미적 확장어들을 생성합니다.
         
         Args:
             word (str): 기준 단어
-            vocab (List[str]): 사용 가능한 어휘
-            tried_words (Set[str]): 이미 시도한 단어들
+            vocab (AvailableVocabulary): 사용 가능한 어휘 뷰
+            session (GameSession): 현재 게임 세션
             
         Returns:
             List[str]: 확장어 목록
         """
         expansions = []
         
-        # 어근 기반 확장 (앞 2글자 어근)
+        # 어근 기반 확장 (앞 2글자 어근, 접두사 색인)
         if len(word) > 2:
             root = word[:2]
-            for vocab_word in vocab:
-                if (vocab_word.startswith(root) and 
-                    vocab_word != word and 
-                    vocab_word not in tried_words):
-                    expansions.append(vocab_word)
+            expansions.extend(session.vocabulary.prefix_index.find(root, vocab, exclude=word))
         
         # 의미 영역별 확장
         semantic_expansions = {
@@ -392,20 +427,20 @@ class SemanticGradientSearch(SearchStrategy):
                 for expansion_word in words:
                     if (expansion_word != word and 
                         expansion_word in vocab and 
-                        expansion_word not in tried_words):
+                        not session.is_tried(expansion_word)):
                         expansions.append(expansion_word)
         
         return expansions[:10]  # 최대 10개로 제한
     
-    def _get_semantic_associations(self, word: str, vocab: List[str], 
-                                 tried_words: Set[str]) -> List[str]:
+    def _get_semantic_associations(self, word: str, vocab: AvailableVocabulary, 
+                                 session: GameSession) -> List[str]:
         """
         단어의 의미적 연관어들을 생성합니다.
         
         Args:
             word (str): 기준 단어
-            vocab (List[str]): 사용 가능한 어휘
-            tried_words (Set[str]): 이미 시도한 단어들
+            vocab (AvailableVocabulary): 사용 가능한 어휘 뷰
+            session (GameSession): 현재 게임 세션
             
         Returns:
             List[str]: 연관어 목록
@@ -418,20 +453,20 @@ class SemanticGradientSearch(SearchStrategy):
                 for assoc_word in words:
                     if (assoc_word != word and 
                         assoc_word in vocab and 
-                        assoc_word not in tried_words):
+                        not session.is_tried(assoc_word)):
                         associations.append(assoc_word)
         
         return associations[:8]  # 최대 8개로 제한
     
-    def _get_contextual_relations(self, word: str, vocab: List[str], 
-                                tried_words: Set[str]) -> List[str]:
+    def _get_contextual_relations(self, word: str, vocab: AvailableVocabulary, 
+                                session: GameSession) -> List[str]:
         """
         단어의 문맥적 관련어들을 생성합니다.
         
         Args:
             word (str): 기준 단어
-            vocab (List[str]): 사용 가능한 어휘
-            tried_words (Set[str]): 이미 시도한 단어들
+            vocab (AvailableVocabulary): 사용 가능한 어휘 뷰
+            session (GameSession): 현재 게임 세션
             
         Returns:
             List[str]: 문맥적 관련어 목록
@@ -444,26 +479,27 @@ class SemanticGradientSearch(SearchStrategy):
                 for rel_word in words:
                     if (rel_word != word and 
                         rel_word in vocab and 
-                        rel_word not in tried_words):
+                        not session.is_tried(rel_word)):
                         relations.append(rel_word)
         
         return relations[:6]  # 최대 6개로 제한
     
     def _sort_by_effectiveness(self, candidates: List[str], 
-                             word_frequency: Dict) -> List[str]:
+                             word_frequency: Dict, session: GameSession) -> List[str]:
         """
         학습된 효과성에 따라 후보들을 정렬합니다.
         
         Args:
             candidates (List[str]): 후보 단어들
-            word_frequency (Dict): 단어 빈도 데이터
+            word_frequency (Dict): 단어 빈도 데이터 (단어 ID 기준)
+            session (GameSession): 현재 게임 세션
             
         Returns:
             List[str]: 효과성 순으로 정렬된 후보들
         """
         def get_effectiveness_score(word: str) -> float:
-            if word in word_frequency:
-                freq_data = word_frequency[word]
+            freq_data = word_frequency.get(session.vocabulary.get_id(word))
+            if freq_data is not None:
                 return freq_data.get('avg_similarity', 0) * freq_data.get('count', 1)
             return 0
         
@@ -471,79 +507,28 @@ class SemanticGradientSearch(SearchStrategy):
         return candidates
     
     def _score_candidates(self, candidates: List[str], session: GameSession, 
-                         learned_data: Dict) -> List[Tuple[str, float]]:
+                         learned_data: Dict, top_k: int = 10) -> List[Tuple[str, float]]:
         """
         여러 요소를 고려하여 후보 단어들에 점수를 부여합니다.
         
+        후보 묶음 전체의 점수 요소(빈도 사전 점수, 상위 추측과의 학습된 관계, 어근 공유,
+        다양성 보너스, 임베딩 유사도)를 CandidateScorer가 배열 연산으로 한 번에 계산합니다.
+        
         Args:
             candidates (List[str]): 후보 단어들
             session (GameSession): 현재 게임 세션
             learned_data (Dict): 학습된 데이터
+            top_k (int): 반환할 상위 후보 수
             
         Returns:
-            List[Tuple[str, float]]: (단어, 점수) 튜플의 정렬된 리스트
+            List[Tuple[str, float]]: 점수 상위 (단어, 점수) 튜플의 정렬된 리스트
         """
-        word_frequency = learned_data.get('word_frequency', {})
-        word_pairs = learned_data.get('word_pairs', {})
-        
-        scored = []
-        for word in candidates:
-            score = 0
-            
-            # 1. 기본 효과성 점수
-            if word in word_frequency:
-                freq_data = word_frequency[word]
-                avg_sim = freq_data.get('avg_similarity', 0)
-                count = freq_data.get('count', 0)
-                score += avg_sim * math.log(count + 1) * 5
-            
-            # 2. 최근 고득점 단어와의 관계
-            top_guesses = session.get_top_guesses(3)
-            for guess in top_guesses:
-                pair_key1 = f"{guess.word}|{word}"
-                pair_key2 = f"{word}|{guess.word}"
-                
-                if pair_key1 in word_pairs or pair_key2 in word_pairs:
-                    pair_data = word_pairs.get(pair_key1, word_pairs.get(pair_key2, {}))
-                    similarity_diffs = pair_data.get('similarity_diffs', [])
-                    if similarity_diffs:
-                        avg_diff = sum(similarity_diffs) / len(similarity_diffs)
-                        # 유사도 차이가 작을수록 높은 점수
-                        score += (1 - avg_diff/100) * guess.similarity * 3
-            
-            # 3. 의미적 거리 점수 (어근 공유 등)
-            for guess in session.guesses[-5:]:  # 최근 5개
-                if len(word) > 2 and len(guess.word) > 2:
-                    # 공통 어근 길이
-                    common_prefix_len = 0
-                    for i in range(min(len(word), len(guess.word))):
-                        if word[i] == guess.word[i]:
-                            common_prefix_len += 1
-                        else:
-                            break
-                    
-                    if common_prefix_len >= 2:
-                        score += guess.similarity * common_prefix_len
-            
-            # 4. 다양성 보너스 (너무 비슷한 단어 연속 시도 방지)
-            recent_words = [g.word for g in session.guesses[-3:]]
-            if recent_words:
-                avg_similarity_to_recent = 0
-                for recent in recent_words:
-                    if len(word) > 2 and len(recent) > 2:
-                        common_chars = set(word) & set(recent)
-                        avg_similarity_to_recent += len(common_chars) / max(len(word), len(recent))
-                
-                avg_similarity_to_recent /= len(recent_words)
-                # 적당한 차이가 있으면 보너스
-                if 0.2 < avg_similarity_to_recent < 0.7:
-                    score += 1
-            
-            scored.append((word, score))
-        
-        # 점수순 정렬
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return scored
+        vocabulary = session.vocabulary
+        candidate_ids = [vocabulary.intern(word) for word in candidates]
+        scorer = vocabulary.candidate_scorer
+        scores = scorer.score_gradient(candidate_ids, session, learned_data)
+        return [(vocabulary.get_word(word_id), score)
+                for word_id, score in scorer.top_k(candidate_ids, scores, top_k)]
     
     def get_strategy_name(self) -> str:
         return "의미적경사탐색"
@@ -565,14 +550,14 @@ class FocusedSemanticSearch(SearchStrategy):
             "행동활동": ["행동", "활동", "움직임", "작업", "실행", "진행", "과정", "방법"]
         }
     
-    def select_word(self, session: GameSession, vocab: List[str], 
+    def select_word(self, session: GameSession, vocab: AvailableVocabulary, 
                    learned_data: Dict) -> Optional[str]:
         """
         고유사도 단어들의 공통 의미 영역에서 집중적으로 탐색합니다.
         
         Args:
             session (GameSession): 현재 게임 세션
-            vocab (List[str]): 사용 가능한 어휘 목록
+            vocab (AvailableVocabulary): 사용 가능한 어휘 뷰
             learned_data (Dict): 학습된 데이터
             
         Returns:
@@ -586,7 +571,7 @@ class FocusedSemanticSearch(SearchStrategy):
         
         if common_field:
             candidates = [w for w in common_field 
-                         if w in vocab and w not in session.tried_words]
+                         if w in vocab and not session.is_tried(w)]
             if candidates:
                 selected_word = candidates[0]
                 print(f"   🎯 공통 의미 영역: '{selected_word}'")
@@ -599,19 +584,20 @@ class FocusedSemanticSearch(SearchStrategy):
             # 1층: 직접 연관어
             gradient_strategy = SemanticGradientSearch()
             layer1 = gradient_strategy._get_semantic_associations(
-                best_guess.word, vocab, session.tried_words)
+                best_guess.word, vocab, session)
+            layer1.extend(self._get_embedding_neighbors(session, vocab, [best_guess.word_id]))
             
             # 2층: 1층 단어들의 연관어
             layer2 = []
             for word in layer1[:3]:  # 상위 3개만
-                if word not in session.tried_words:
+                if not session.is_tried(word):
                     layer2.extend(gradient_strategy._get_semantic_associations(
-                        word, vocab, session.tried_words))
+                        word, vocab, session))
             
             # 모든 후보 결합
             all_candidates = layer1 + layer2
             unique_candidates = [w for w in set(all_candidates) 
-                               if w in vocab and w not in session.tried_words]
+                               if w in vocab and not session.is_tried(w)]
             
             if unique_candidates:
                 # 동적 점수 기반 선택
@@ -651,60 +637,27 @@ class FocusedSemanticSearch(SearchStrategy):
         return []
     
     def _score_focused_candidates(self, candidates: List[str], best_guess: GuessResult,
-                                session: GameSession, learned_data: Dict) -> List[Tuple[str, float]]:
+                                session: GameSession, learned_data: Dict,
+                                top_k: int = 10) -> List[Tuple[str, float]]:
         """
-        집중 탐색을 위한 후보 점수 계산
+        집중 탐색을 위한 후보 점수 계산 (CandidateScorer로 후보 묶음 전체를 한 번에 계산)
         
         Args:
             candidates (List[str]): 후보 단어들
             best_guess (GuessResult): 현재 최고 유사도 단어
             session (GameSession): 현재 게임 세션  
             learned_data (Dict): 학습된 데이터
+            top_k (int): 반환할 상위 후보 수
             
         Returns:
-            List[Tuple[str, float]]: (단어, 점수) 튜플의 정렬된 리스트
+            List[Tuple[str, float]]: 점수 상위 (단어, 점수) 튜플의 정렬된 리스트
         """
-        word_pairs = learned_data.get('word_pairs', {})
-        scored = []
-        
-        for word in candidates:
-            score = 0
-            
-            # 1. 최고 단어와의 학습된 관계
-            pair_key1 = f"{best_guess.word}|{word}"
-            pair_key2 = f"{word}|{best_guess.word}"
-            
-            if pair_key1 in word_pairs or pair_key2 in word_pairs:
-                pair_data = word_pairs.get(pair_key1, word_pairs.get(pair_key2, {}))
-                similarity_diffs = pair_data.get('similarity_diffs', [])
-                if similarity_diffs:
-                    avg_diff = sum(similarity_diffs) / len(similarity_diffs)
-                    # 매우 유사한 관계면 높은 점수 (0-100 scale)
-                    if avg_diff < 5:
-                        score += 10 * (1 - avg_diff/100)
-            
-            # 2. 유사도 기울기 예측
-            recent_guesses = session.guesses[-5:]
-            if len(recent_guesses) >= 2:
-                # 최근 유사도 변화율 계산
-                similarities = [g.similarity for g in recent_guesses]
-                gradient = (similarities[-1] - similarities[0]) / len(similarities)
-                
-                # 양의 기울기면 더 높은 점수
-                if gradient > 0:
-                    score += gradient * 5
-            
-            # 3. 의미적 근접성
-            if len(word) > 2 and len(best_guess.word) > 2:
-                # 공통 문자 비율
-                common_chars = set(word) & set(best_guess.word)
-                char_similarity = len(common_chars) / max(len(word), len(best_guess.word))
-                score += char_similarity * best_guess.similarity * 3
-            
-            scored.append((word, score))
-        
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return scored
+        vocabulary = session.vocabulary
+        candidate_ids = [vocabulary.intern(word) for word in candidates]
+        scorer = vocabulary.candidate_scorer
+        scores = scorer.score_focused(candidate_ids, best_guess, session, learned_data)
+        return [(vocabulary.get_word(word_id), score)
+                for word_id, score in scorer.top_k(candidate_ids, scores, top_k)]
     
     def get_strategy_name(self) -> str:
         return "집중의미탐색"
@@ -714,16 +667,17 @@ class PrecisionSemanticSearch(SearchStrategy):
     """
     4단계: 정밀 의미 탐색 전략
     형태론적 분석을 사용하여 고유사도 상황에서 정밀하게 탐색합니다.
+    관측 제약이 연결되어 있으면 관측 유사도들과 일관된 후보만 고릅니다.
     """
     
-    def select_word(self, session: GameSession, vocab: List[str], 
+    def select_word(self, session: GameSession, vocab: AvailableVocabulary, 
                    learned_data: Dict) -> Optional[str]:
         """
-        형태론적 변형과 학습된 초근접 단어를 사용하여 정밀 탐색합니다.
+        관측 일관 후보, 형태론적 변형, 학습된 초근접 단어를 사용하여 정밀 탐색합니다.
         
         Args:
             session (GameSession): 현재 게임 세션
-            vocab (List[str]): 사용 가능한 어휘 목록
+            vocab (AvailableVocabulary): 사용 가능한 어휘 뷰
             learned_data (Dict): 학습된 데이터
             
         Returns:
@@ -732,18 +686,30 @@ class PrecisionSemanticSearch(SearchStrategy):
         if not session.guesses:
             return None
         
+        # 관측 제약이 있으면 모든 관측과 가장 잘 맞는 후보를 선택
+        constraints = session.constraints
+        if constraints is not None and constraints.is_active:
+            consistent = constraints.best_candidates(1, vocab)
+            if consistent:
+                selected_word = session.vocabulary.get_word(consistent[0][0])
+                print(f"   🔎 관측 일관 후보 {constraints.count}개 중: '{selected_word}'")
+                return selected_word
+        
         best_guess = max(session.guesses, key=lambda g: g.similarity)
         precision_candidates = []
         
+        # 0. 임베딩 근접어 (임베딩이 연결된 경우 형태 변형보다 우선)
+        precision_candidates.extend(self._get_embedding_neighbors(
+            session, vocab, [best_guess.word_id], k=3))
+        
         # 1. 형태론적 변형 생성
         morphological_variants = self._generate_morphological_variants(
-            best_guess.word, vocab, session.tried_words)
+            best_guess.word, vocab, session)
         precision_candidates.extend(morphological_variants[:3])
         
         # 2. 학습된 초근접 단어들
-        word_pairs = learned_data.get('word_pairs', {})
         ultra_close_words = self._find_ultra_close_words(
-            best_guess.word, word_pairs, vocab, session.tried_words)
+            best_guess.word_id, learned_data, vocab, session)
         precision_candidates.extend([w[0] for w in ultra_close_words[:2]])
         
         if precision_candidates:
@@ -755,68 +721,74 @@ class PrecisionSemanticSearch(SearchStrategy):
         focused_strategy = FocusedSemanticSearch()
         return focused_strategy.select_word(session, vocab, learned_data)
     
-    def _generate_morphological_variants(self, word: str, vocab: List[str], 
-                                       tried_words: Set[str]) -> List[str]:
+    def _generate_morphological_variants(self, word: str, vocab: AvailableVocabulary, 
+                                       session: GameSession) -> List[str]:
         """
-        단어의 형태론적 변형들을 생성합니다.
+        단어의 형태론적 변형들을 자모 편집 거리로 찾습니다.
+        
+        접미사 목록 없이 자모 BK-트리에서 기준 단어와 자모 몇 개만 다른 단어
+        (예: "경제학" -> "경제적", "경제력")를 거리 순으로 반환합니다.
         
         Args:
             word (str): 기준 단어
-            vocab (List[str]): 사용 가능한 어휘
-            tried_words (Set[str]): 이미 시도한 단어들
+            vocab (AvailableVocabulary): 사용 가능한 어휘 뷰
+            session (GameSession): 현재 게임 세션
             
         Returns:
-            List[str]: 형태론적 변형들
+            List[str]: 형태론적 변형들 (가까운 순)
         """
-        variants = []
+        max_distance = self._get_variant_distance(word)
+        neighbors = session.vocabulary.jamo_tree.find(word, max_distance, vocab)
+        return [variant for variant, _ in neighbors]
+    
+    def _get_variant_distance(self, word: str) -> int:
+        """
+        변형으로 인정할 최대 자모 거리를 단어 길이에 맞춰 계산합니다.
         
-        if len(word) > 2:
-            root = word[:-1]  # 마지막 글자 제거
-            
-            # 한국어 일반적인 접미사들
-            suffixes = ['다', '하다', '되다', '이다', '적', '의', '로', '을', '를']
+        Args:
+            word (str): 기준 단어
             
-            for suffix in suffixes:
-                variant = root + suffix
-                if (variant in vocab and 
-                    variant not in tried_words and 
-                    variant != word):
-                    variants.append(variant)
-        
-        return variants
+        Returns:
+            int: 최대 자모 편집 거리 (1 ~ 3)
+        """
+        jamo_length = len(decompose_jamo(word))
+        return max(1, min(3, jamo_length // 3))
     
-    def _find_ultra_close_words(self, word: str, word_pairs: Dict, 
-                              vocab: List[str], tried_words: Set[str]) -> List[Tuple[str, float]]:
+    def _find_ultra_close_words(self, word_id: int, learned_data: Dict, 
+                              vocab: AvailableVocabulary, session: GameSession) -> List[Tuple[str, float]]:
         """
         학습된 데이터에서 초근접 단어들을 찾습니다.
         
         Args:
-            word (str): 기준 단어
-            word_pairs (Dict): 단어 쌍 데이터
-            vocab (List[str]): 사용 가능한 어휘
-            tried_words (Set[str]): 이미 시도한 단어들
+            word_id (int): 기준 단어 ID
+            learned_data (Dict): 학습된 데이터 (단어 쌍, 단어 쌍 상대 인덱스)
+            vocab (AvailableVocabulary): 사용 가능한 어휘 뷰
+            session (GameSession): 현재 게임 세션
             
         Returns:
             List[Tuple[str, float]]: (단어, 평균차이) 튜플의 리스트
         """
+        word_pairs = learned_data.get('word_pairs', {})
+        pair_partners = learned_data.get('pair_partners', {})
+        get_word = session.vocabulary.get_word
         ultra_close = []
         
-        for pair_key, pair_data in word_pairs.items():
-            word1, word2 = pair_key.split('|')
+        # 기준 단어와 쌍을 이루는 단어들만 조회
+        for other_id in pair_partners.get(word_id, ()):
+            if session.is_tried_id(other_id):
+                continue
             
-            if word1 == word or word2 == word:
-                other_word = word2 if word1 == word else word1
-                
-                if (other_word in vocab and 
-                    other_word not in tried_words):
-                    
-                    # 평균 유사도 차이 계산
-                    similarity_diffs = pair_data.get('similarity_diffs', [])
-                    if similarity_diffs:
-                        avg_diff = sum(similarity_diffs) / len(similarity_diffs)
-                        # 매우 유사한 단어들만 (차이 < 3, 0-100 scale)
-                        if avg_diff < 3:
-                            ultra_close.append((other_word, avg_diff))
+            other_word = get_word(other_id)
+            if other_word not in vocab:
+                continue
+            
+            # 평균 유사도 차이 계산
+            similarity_diffs = word_pairs[pack_pair(word_id, other_id)].get('similarity_diffs', [])
+            if similarity_diffs:
+                avg_diff = sum(similarity_diffs) / len(similarity_diffs)
+                # 매우 유사한 단어들만 (차이 < 3, 0-100 scale)
+                if avg_diff < 3:
+                    ultra_close.append((other_word, avg_diff))
         
         # 유사도 차이 순으로 정렬 (작은 순)
         ultra_close.sort(key=lambda x: x[1])
@@ -826,33 +798,307 @@ class PrecisionSemanticSearch(SearchStrategy):
         return "정밀의미탐색"
 
 
+class TargetEstimateSearch(SearchStrategy):
+    """
+    정답 벡터 추정 탐색 전략
+    관측 유사도로 점진 추정한 정답 벡터에 가장 가까운 미시도 단어를 제안합니다.
+    """
+    
+    def select_word(self, session: GameSession, vocab: AvailableVocabulary, 
+                   learned_data: Dict) -> Optional[str]:
+        """
+        추정된 정답 방향의 근접어 중 관측 제약과 일관된 단어를 우선 선택합니다.
+        
+        Args:
+            session (GameSession): 현재 게임 세션
+            vocab (AvailableVocabulary): 사용 가능한 어휘 뷰
+            learned_data (Dict): 학습된 데이터
+            
+        Returns:
+            Optional[str]: 선택된 단어
+        """
+        estimator = session.target_estimator
+        if estimator is not None:
+            neighbors = estimator.nearest(10, vocab)
+            
+            constraints = session.constraints
+            if constraints is not None and constraints.is_active:
+                consistent = [(word_id, cosine) for word_id, cosine in neighbors
+                              if constraints.mask[word_id]]
+                neighbors = consistent or neighbors
+            
+            if neighbors:
+                word_id, cosine = neighbors[0]
+                selected_word = session.vocabulary.get_word(word_id)
+                print(f"   🧮 추정 정답 벡터 근접어: '{selected_word}' (코사인 {cosine:.3f})")
+                return selected_word
+        
+        # 추정치가 없으면 경사 탐색으로 복귀
+        gradient_strategy = SemanticGradientSearch()
+        return gradient_strategy.select_word(session, vocab, learned_data)
+    
+    def get_strategy_name(self) -> str:
+        return "정답추정탐색"
+
+
+class RankBoundedSearch(SearchStrategy):
+    """
+    순위 경계 탐색 전략
+    상위 1000위 안에 든 추측들의 순위로 정답 주변을 좁힌 뒤 후보를 점수화합니다.
+    
+    순위 r인 추측은 정답의 r번째 근접어이므로 정답도 대체로 그 추측의 근접어 상위
+    몇 배 r 안에 있습니다. 순위권 추측마다 순위에 비례하는 근접어 범위를 잡고
+    가장 많은 범위에 함께 속하는 후보만 남긴 뒤 점수를 계산합니다.
+    
+    임베딩이 없으면 학습된 단어 쌍 상대(유사도 차이 작은 순)와 같은 어근의 단어(접두사 색인)를
+    근접어 범위로 대신 사용하고, 그마저 없으면 선택되지 않습니다 (선택 후 후보가 비면 집중 탐색으로 복귀).
+    """
+    
+    # 순위 r 추측의 근접어 범위: clamp(r × 배율, 최소, 최대)
+    NEIGHBORHOOD_SCALE = 3
+    MIN_NEIGHBORHOOD = 20
+    MAX_NEIGHBORHOOD = 3000
+    
+    def select_word(self, session: GameSession, vocab: AvailableVocabulary, 
+                   learned_data: Dict) -> Optional[str]:
+        """
+        순위권 추측들의 근접어 범위 교집합에서 후보를 골라 점수가 가장 높은 단어를 선택합니다.
+        
+        Args:
+            session (GameSession): 현재 게임 세션
+            vocab (AvailableVocabulary): 사용 가능한 어휘 뷰
+            learned_data (Dict): 학습된 데이터
+            
+        Returns:
+            Optional[str]: 선택된 단어
+        """
+        ranked_guesses = session.get_ranked_guesses(3)
+        if ranked_guesses:
+            candidate_ids = self._get_rank_bounded_candidates(
+                session, vocab, ranked_guesses, learned_data)
+            
+            # 관측 제약이 있으면 일관된 후보로 한 번 더 좁힘 (교집합이 비면 유지)
+            constraints = session.constraints
+            if constraints is not None and constraints.is_active and candidate_ids:
+                consistent = [word_id for word_id in candidate_ids
+                              if word_id < len(constraints.mask) and constraints.mask[word_id]]
+                candidate_ids = consistent or candidate_ids
+            
+            if candidate_ids:
+                best_ranked = ranked_guesses[0]
+                scorer = session.vocabulary.candidate_scorer
+                scores = scorer.score_focused(candidate_ids, best_ranked, session, learned_data)
+                scores = scores + scorer.embedding_scores(
+                    ranked_guesses, scorer.as_ids(candidate_ids))
+                selected_id = scorer.top_k(candidate_ids, scores, 1)[0][0]
+                selected_word = session.vocabulary.get_word(selected_id)
+                print(f"   🏅 '{best_ranked.word}'({best_ranked.rank_value}위) "
+                      f"순위 경계 후보 {len(candidate_ids)}개: '{selected_word}'")
+                return selected_word
+        
+        # 순위 경계 후보가 없으면 집중 탐색으로 복귀
+        focused_strategy = FocusedSemanticSearch()
+        return focused_strategy.select_word(session, vocab, learned_data)
+    
+    def _get_neighborhood_size(self, rank: int) -> int:
+        """
+        순위에 비례하는 근접어 범위 크기를 계산합니다.
+        
+        Args:
+            rank (int): 추측의 순위
+            
+        Returns:
+            int: 근접어 범위 크기
+        """
+        return max(self.MIN_NEIGHBORHOOD,
+                   min(self.MAX_NEIGHBORHOOD, rank * self.NEIGHBORHOOD_SCALE))
+    
+    def has_neighborhood(self, session: GameSession, learned_data: Optional[Dict] = None) -> bool:
+        """
+        순위권 추측의 근접어 범위를 만들 수 있는지 확인합니다.
+        
+        Args:
+            session (GameSession): 현재 게임 세션
+            learned_data (Optional[Dict]): 학습된 데이터 (None이면 학습 데이터 없이 판단)
+            
+        Returns:
+            bool: 임베딩이 있거나 학습 데이터/접두사 색인으로 후보를 찾을 수 있으면 True
+        """
+        if session.vocabulary.embeddings is not None:
+            return True
+        return bool(self._get_rank_bounded_candidates(
+            session, session.available, session.get_ranked_guesses(3), learned_data or {}))
+    
+    def _get_rank_bounded_candidates(self, session: GameSession, vocab: AvailableVocabulary,
+                                     ranked_guesses: List[GuessResult],
+                                     learned_data: Dict) -> List[int]:
+        """
+        순위권 추측들의 근접어 범위에 가장 많이 함께 속하는 사용 가능한 단어 ID들을 찾습니다.
+        
+        순위에 비례하는 임베딩 상위 근접어를 범위로 사용합니다
+        (임베딩이 없으면 학습 데이터와 접두사 색인의 근접어를 같은 크기로 자른 범위).
+        
+        Args:
+            session (GameSession): 현재 게임 세션
+            vocab (AvailableVocabulary): 사용 가능한 어휘 뷰
+            ranked_guesses (List[GuessResult]): 순위권 추측들 (순위 오름차순)
+            learned_data (Dict): 학습된 데이터
+            
+        Returns:
+            List[int]: 후보 단어 ID들 (단어 ID 순)
+        """
+        embeddings = session.vocabulary.embeddings
+        bounds = [self._get_neighborhood_size(g.rank_value) for g in ranked_guesses]
+        if embeddings is not None:
+            rows = embeddings.top_k_batch([g.word_id for g in ranked_guesses], max(bounds), vocab)
+            neighborhoods = [[word_id for word_id, _ in row] for row in rows]
+        else:
+            neighborhoods = [self._get_learned_neighbors(session, vocab, guess, learned_data)
+                             for guess in ranked_guesses]
+        
+        overlap_counts: Dict[int, int] = {}
+        for neighborhood, bound in zip(neighborhoods, bounds):
+            for word_id in neighborhood[:bound]:
+                overlap_counts[word_id] = overlap_counts.get(word_id, 0) + 1
+        
+        if not overlap_counts:
+            return []
+        best_overlap = max(overlap_counts.values())
+        return sorted(word_id for word_id, count in overlap_counts.items()
+                      if count == best_overlap)
+    
+    def _get_learned_neighbors(self, session: GameSession, vocab: AvailableVocabulary,
+                               guess: GuessResult, learned_data: Dict) -> List[int]:
+        """
+        임베딩 없이 순위권 추측의 근접어 후보를 찾습니다.
+        
+        학습된 단어 쌍 상대를 평균 유사도 차이 작은 순으로 먼저, 그다음 같은 어근
+        (앞 2글자, 두 글자 단어는 앞 1글자)으로 시작하는 단어를 짧은 순으로 나열합니다.
+        
+        Args:
+            session (GameSession): 현재 게임 세션
+            vocab (AvailableVocabulary): 사용 가능한 어휘 뷰
+            guess (GuessResult): 순위권 추측
+            learned_data (Dict): 학습된 데이터 (단어 쌍, 단어 쌍 상대 인덱스)
+            
+        Returns:
+            List[int]: 사용 가능한 근접어 후보 ID들 (가까운 순, 중복 없음)
+        """
+        word_pairs = learned_data.get('word_pairs', {})
+        partners = []
+        for other_id in learned_data.get('pair_partners', {}).get(guess.word_id, ()):
+            if not vocab.contains_id(other_id) or session.is_tried_id(other_id):
+                continue
+            similarity_diffs = word_pairs.get(pack_pair(guess.word_id, other_id), {}).get(
+                'similarity_diffs', [])
+            if similarity_diffs:
+                partners.append((sum(similarity_diffs) / len(similarity_diffs), other_id))
+        neighbors = [word_id for _, word_id in sorted(partners)]
+        
+        word = guess.word
+        if len(word) > 1:
+            root = word[:2] if len(word) > 2 else word[:1]
+            neighbors.extend(
+                word_id for word_id in session.vocabulary.prefix_index.iter_prefix_ids(
+                    root, max_length=len(word) + 2)
+                if word_id != guess.word_id and vocab.contains_id(word_id))
+        return list(dict.fromkeys(neighbors))
+    
+    def get_strategy_name(self) -> str:
+        return "순위경계탐색"
+
+
+class InformationGainSearch(SearchStrategy):
+    """
+    기대 정보 이득 탐색 전략
+    관측 일관 후보 집합을 기대값으로 가장 많이 줄이는 추측을 표본 정답들로 골라
+    전체 제출 횟수(네트워크 왕복)를 줄입니다.
+    """
+    
+    def __init__(self, budget: int = 65536):
+        """
+        정보 이득 선택기를 초기화합니다 (numpy는 이 전략을 켤 때만 로드).
+        
+        Args:
+            budget (int): 결정당 유사도 표 칸 수 (추측 후보 수 × 표본 정답 수)
+        """
+        from .information_gain import InformationGainSelector
+        self.selector = InformationGainSelector(budget)
+    
+    def select_word(self, session: GameSession, vocab: AvailableVocabulary, 
+                   learned_data: Dict) -> Optional[str]:
+        """
+        기대 잔여 후보 비율이 가장 작은 단어를 선택합니다.
+        
+        Args:
+            session (GameSession): 현재 게임 세션
+            vocab (AvailableVocabulary): 사용 가능한 어휘 뷰
+            learned_data (Dict): 학습된 데이터
+            
+        Returns:
+            Optional[str]: 선택된 단어
+        """
+        constraints = session.constraints
+        if constraints is not None and constraints.is_active:
+            selected = self.selector.select(constraints, vocab)
+            if selected is not None:
+                word_id, remaining = selected
+                selected_word = session.vocabulary.get_word(word_id)
+                print(f"   📐 정보 이득 선택: '{selected_word}' "
+                      f"(일관 후보 {constraints.count}개, 기대 잔여 {remaining * 100:.1f}%)")
+                return selected_word
+        
+        # 관측 제약이 없으면 경사 탐색으로 복귀
+        gradient_strategy = SemanticGradientSearch()
+        return gradient_strategy.select_word(session, vocab, learned_data)
+    
+    def get_strategy_name(self) -> str:
+        return "정보이득탐색"
+
+
 class StrategyEngine:
     """
     전략 엔진: 상황에 따라 적절한 탐색 전략을 선택하고 실행합니다.
     """
     
-    def __init__(self, enable_logging: bool = True):
+    # 관측 일관 후보가 이 수 이하로 줄면 유사도와 관계없이 정밀 탐색
+    CONSTRAINT_PRECISION_THRESHOLD = 200
+    # 정답 벡터 추정기가 이만큼의 관측을 모으면 추정 탐색 사용
+    ESTIMATOR_MIN_OBSERVATIONS = 10
+    # 최근 이만큼의 추측이 최고 유사도를 갱신하지 못하면 추정 탐색을 쉬고 다른 전략으로 전환
+    ESTIMATOR_STALL_WINDOW = 10
+    
+    def __init__(self, enable_logging: bool = True,
+                 information_gain_budget: Optional[int] = None):
         """
         모든 전략들을 초기화합니다.
         
         Args:
             enable_logging (bool): 로깅 활성화 여부
+            information_gain_budget (Optional[int]): 지정하면 관측 제약이 있을 때 기대 정보 이득
+                선택 모드를 사용하며, 결정당 유사도 표 칸 수 예산으로 사용 (None이면 사용 안 함)
         """
         self.strategies = {
             "wide": WideSemanticExploration(),
             "gradient": SemanticGradientSearch(),
             "focused": FocusedSemanticSearch(),
-            "precision": PrecisionSemanticSearch()
+            "precision": PrecisionSemanticSearch(),
+            "rank": RankBoundedSearch(),
+            "estimate": TargetEstimateSearch()
         }
+        if information_gain_budget is not None:
+            self.strategies["information"] = InformationGainSearch(information_gain_budget)
         self.logger = StrategyLogger() if enable_logging else None
         self.previous_strategy = None
     
-    def select_strategy(self, session: GameSession) -> SearchStrategy:
+    def select_strategy(self, session: GameSession,
+                        learned_data: Optional[Dict] = None) -> SearchStrategy:
         """
         현재 상황에 따라 최적의 전략을 선택합니다.
         
         Args:
             session (GameSession): 현재 게임 세션
+            learned_data (Optional[Dict]): 학습된 데이터 (임베딩이 없을 때 순위 경계 후보 확인용)
             
         Returns:
             SearchStrategy: 선택된 전략 객체
@@ -876,9 +1122,23 @@ class StrategyEngine:
         if attempts_with_current > 20 and is_stuck:  # 20회 이상 같은 전략으로 정체
             force_switch = True
         
-        if not session.guesses or best_similarity < 10:
+        constraints = session.constraints
+        if (constraints is not None and constraints.is_active
+                and constraints.count <= self.CONSTRAINT_PRECISION_THRESHOLD):
+            # 관측과 일관된 후보가 충분히 좁혀짐
+            strategy = self.strategies["precision"]
+        elif (constraints is not None and constraints.is_active
+                and "information" in self.strategies):
+            # 정보 이득 선택 모드: 일관 후보 집합을 가장 많이 줄이는 추측
+            strategy = self.strategies["information"]
+        elif not session.guesses or best_similarity < 10:
             # 초기 탐색
             strategy = self.strategies["wide"]
+        elif (session.get_best_rank() is not None and best_similarity < 50
+              and self.strategies["rank"].has_neighborhood(session, learned_data)):
+            # 상위 1000위 안에 든 추측이 있으면 순위로 근접어 범위를 좁혀 탐색
+            # (임베딩이 없으면 학습 데이터/접두사 색인의 근접어가 있을 때만)
+            strategy = self.strategies["rank"]
         elif force_switch or (is_stuck and attempts_with_current > 10):
             # 강제 전환 또는 정체 상태
             if current_strategy_name:
@@ -893,6 +1153,11 @@ class StrategyEngine:
                 strategy = self.strategies[strategy_order[next_idx]]
             else:
                 strategy = self.strategies["gradient"]
+        elif (session.target_estimator is not None
+              and session.target_estimator.observations >= self.ESTIMATOR_MIN_OBSERVATIONS
+              and not self._is_estimator_stalled(session, best_similarity)):
+            # 관측이 충분하면 추정한 정답 벡터의 근접어 탐색 (순위권 추측과 정체 전환이 우선)
+            strategy = self.strategies["estimate"]
         else:
             # 유사도 기반 전략 선택 with 더 동적인 전환
             if best_similarity < 15:
@@ -938,20 +1203,67 @@ class StrategyEngine:
         self.previous_strategy = strategy
         return strategy
     
-    def select_next_word(self, session: GameSession, vocab: List[str], 
+    def _is_estimator_stalled(self, session: GameSession, best_similarity: float) -> bool:
+        """
+        최근 추측들이 최고 유사도를 갱신하지 못했는지 확인합니다.
+        
+        Args:
+            session (GameSession): 현재 게임 세션
+            best_similarity (float): 현재 최고 유사도
+            
+        Returns:
+            bool: 최근 ESTIMATOR_STALL_WINDOW개 추측 모두 최고 유사도보다 낮으면 True
+        """
+        if len(session.guesses) <= self.ESTIMATOR_STALL_WINDOW:
+            return False
+        # session.guesses는 유사도 순이므로 시도 번호로 최근 추측을 고름
+        recent = heapq.nlargest(self.ESTIMATOR_STALL_WINDOW, session.guesses,
+                                key=lambda g: g.attempt)
+        return max(g.similarity for g in recent) < best_similarity
+    
+    def select_next_word(self, session: GameSession, 
+                        vocab: Union[AvailableVocabulary, List[str]], 
                         learned_data: Dict) -> Optional[str]:
         """
         상황에 맞는 전략을 선택하고 다음 단어를 선택합니다.
         
         Args:
             session (GameSession): 현재 게임 세션
-            vocab (List[str]): 사용 가능한 어휘 목록
+            vocab (Union[AvailableVocabulary, List[str]]): 사용 가능한 어휘 뷰 (또는 단어 목록)
             learned_data (Dict): 학습된 데이터
             
         Returns:
             Optional[str]: 선택된 단어
         """
-        strategy = self.select_strategy(session)
+        word_id = self.select_next_word_id(session, vocab, learned_data)
+        return session.vocabulary.get_word(word_id) if word_id is not None else None
+    
+    def select_next_word_id(self, session: GameSession, 
+                            vocab: Union[AvailableVocabulary, List[str]], 
+                            learned_data: Dict) -> Optional[int]:
+        """
+        상황에 맞는 전략을 선택하고 다음 단어를 단어 ID로 선택합니다.
+        
+        단어 목록이 주어지면 시도하지 않은 단어들로 어휘 뷰를 만들어 사용합니다.
+        솔버는 세션이 유지하는 session.available을 그대로 넘겨 매 시도마다의 재구성을 피합니다.
+        
+        Args:
+            session (GameSession): 현재 게임 세션
+            vocab (Union[AvailableVocabulary, List[str]]): 사용 가능한 어휘 뷰 (또는 단어 목록)
+            learned_data (Dict): 학습된 데이터 (단어 ID 기준)
+            
+        Returns:
+            Optional[int]: 선택된 단어 ID
+        """
+        learned_vocabulary = learned_data.get('vocabulary')
+        if learned_vocabulary is not None and learned_vocabulary is not session.vocabulary:
+            raise ValueError("세션과 학습 데이터가 서로 다른 어휘(단어 ID 체계)를 사용합니다.")
+        
+        if not isinstance(vocab, AvailableVocabulary):
+            vocab = AvailableVocabulary.from_words(
+                session.vocabulary, (w for w in vocab if not session.is_tried(w)))
+        
+        strategy = self.select_strategy(session, learned_data)
         session.update_strategy(strategy.get_strategy_name())
         
-        return strategy.select_word(session, vocab, learned_data)
\ No newline at end of file
+        return strategy.select_word_id(session, vocab, learned_data)
\ No newline at end of file
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+정답 벡터 추정 모듈
+관측 유사도로부터 정답 임베딩 벡터를 점진적 최소제곱으로 추정합니다.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .embeddings import EmbeddingStore
+from .vocabulary import AvailableVocabulary
+
+
+class TargetEstimator:
+    """
+    점진적 최소제곱 정답 벡터 추정기
+
+    추측 단어 벡터 e_i와 관측 유사도 s_i(코사인 = s_i / 100)에 대해
+    min_t Σ(e_i·t - s_i)² + λ|t|² 의 해를 유지합니다.
+
+    P = (EᵀE + λI)⁻¹를 보관하고 관측마다 셔먼-모리슨 랭크-1 갱신(재귀 최소제곱)으로
+    P와 t를 O(차원²)에 고치므로, 갱신 비용이 관측 수와 무관합니다.
+    """
+
+    def __init__(self, embeddings: EmbeddingStore, regularization: float = 0.1,
+                 scale: float = 100.0):
+        """
+        추정기를 초기화합니다.
+
+        Args:
+            embeddings (EmbeddingStore): 어휘 ID 순서의 임베딩 저장소
+            regularization (float): 릿지 정규화 계수 λ (관측이 차원보다 적을 때 해를 안정화)
+            scale (float): 게임 유사도 점수 배율 (코사인 × scale)
+        """
+        if regularization <= 0:
+            raise ValueError("정규화 계수는 0보다 커야 합니다.")
+
+        self.embeddings = embeddings
+        self.regularization = regularization
+        self.scale = scale
+
+        self.inverse_gram = np.eye(embeddings.dim) / regularization
+        self.estimate = np.zeros(embeddings.dim)
+        self.observations = 0
+
+    def observe(self, word_id: int, similarity: float) -> bool:
+        """
+        관측 하나로 추정치를 랭크-1 갱신합니다.
+
+        Args:
+            word_id (int): 추측한 단어 ID
+            similarity (float): 게임이 알려준 유사도 (0.0 ~ 100.0)
+
+        Returns:
+            bool: 갱신 여부 (단어에 벡터가 없으면 False)
+        """
+        vector = self.embeddings.get_vector(word_id)
+        if vector is None:
+            return False
+
+        vector = vector.astype(np.float64)
+        projected = self.inverse_gram @ vector
+        gain = projected / (1.0 + vector @ projected)
+
+        residual = similarity / self.scale - vector @ self.estimate
+        self.estimate += gain * residual
+        self.inverse_gram -= np.outer(gain, projected)
+        self.observations += 1
+        return True
+
+    def get_direction(self) -> Optional[np.ndarray]:
+        """
+        추정된 정답 방향(단위 벡터)을 반환합니다.
+
+        Returns:
+            Optional[np.ndarray]: float32 단위 벡터 (관측이 없으면 None)
+        """
+        norm = float(np.linalg.norm(self.estimate))
+        if not self.observations or norm == 0.0:
+            return None
+        return (self.estimate / norm).astype(np.float32)
+
+    def predict(self, word_id: int) -> float:
+        """
+        현재 추정치로 단어의 유사도 점수를 예측합니다.
+
+        Args:
+            word_id (int): 단어 ID
+
+        Returns:
+            float: 예측 유사도 점수 (벡터가 없으면 0.0)
+        """
+        vector = self.embeddings.get_vector(word_id)
+        if vector is None:
+            return 0.0
+        return float(vector @ self.estimate) * self.scale
+
+    def nearest(self, k: int = 10,
+                available: Optional[AvailableVocabulary] = None) -> List[Tuple[int, float]]:
+        """
+        추정된 정답 방향과 가장 가까운 단어들을 찾습니다.
+
+        Args:
+            k (int): 반환할 단어 수
+            available (Optional[AvailableVocabulary]): 사용 가능한 어휘 뷰 (None이면 전체)
+
+        Returns:
+            List[Tuple[int, float]]: (단어 ID, 코사인 유사도) 목록 (가까운 순)
+        """
+        direction = self.get_direction()
+        if direction is None:
+            return []
+        return self.embeddings.top_k(direction, k, available)
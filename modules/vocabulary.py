@@ -0,0 +1,565 @@
+#!/usr/bin/env python3
+"""
+어휘 모듈
+어휘 정규화 규칙, 컴파일된 어휘 캐시, 단어 ID 인터닝, 사용 가능 어휘 뷰를 담당하는 모듈입니다.
+"""
+
+import hashlib
+import mmap
+import os
+import random
+import re
+import struct
+from array import array
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .sampler import WeightedSampler
+
+if TYPE_CHECKING:
+    from .candidate_scoring import CandidateScorer
+    from .embeddings import EmbeddingStore
+    from .word_index import JamoBKTree, PrefixIndex
+
+
+# 정규화 규칙 버전 (규칙이 바뀌면 올려서 기존 캐시를 무효화)
+NORMALIZATION_VERSION = 1
+
+# 캐시 키에 포함되는 정규화 규칙 설명
+NORMALIZATION_RULES = (
+    f"v{NORMALIZATION_VERSION};"
+    "excel:strip,re.sub(r'\\d+$'),strip,skip'[',skip-digits,len>1;"
+    "text:strip,skip-empty,skip'[';"
+    "dedupe,sort"
+)
+
+_HOMONYM_DIGITS = re.compile(r'\d+$')
+
+# 단어 쌍 키 패킹 (작은 ID를 상위 32비트에 배치)
+_PAIR_SHIFT = 32
+_PAIR_MASK = (1 << _PAIR_SHIFT) - 1
+
+
+def pack_pair(word_id1: int, word_id2: int) -> int:
+    """
+    두 단어 ID를 순서와 무관한 하나의 정수 키로 묶습니다.
+
+    Args:
+        word_id1 (int): 첫 번째 단어 ID
+        word_id2 (int): 두 번째 단어 ID
+
+    Returns:
+        int: 패킹된 단어 쌍 키
+    """
+    if word_id1 > word_id2:
+        word_id1, word_id2 = word_id2, word_id1
+    return (word_id1 << _PAIR_SHIFT) | word_id2
+
+
+def unpack_pair(pair_key: int) -> Tuple[int, int]:
+    """
+    패킹된 단어 쌍 키를 두 단어 ID로 풉니다.
+
+    Args:
+        pair_key (int): 패킹된 단어 쌍 키
+
+    Returns:
+        Tuple[int, int]: (작은 ID, 큰 ID)
+    """
+    return pair_key >> _PAIR_SHIFT, pair_key & _PAIR_MASK
+
+
+def normalize_excel_word(value: str) -> Optional[str]:
+    """
+    Excel 셀 값을 어휘 단어로 정규화합니다.
+
+    Args:
+        value (str): 원본 셀 값
+
+    Returns:
+        Optional[str]: 정규화된 단어 (제외 대상이면 None)
+    """
+    word = str(value).strip()
+
+    # 단어 뒤의 숫자 제거 (동음이의어 구분용)
+    # 예: "사위01" -> "사위", "사이99" -> "사이"
+    word = _HOMONYM_DIGITS.sub('', word).strip()
+
+    # 빈 문자열, 주석, 순수 숫자, 1글자 제외
+    if (word and not word.startswith('[') and
+        not word.replace('.', '').isdigit() and
+        len(word) > 1):
+        return word
+    return None
+
+
+def normalize_text_word(line: str) -> Optional[str]:
+    """
+    텍스트 어휘 파일의 한 줄을 어휘 단어로 정규화합니다.
+
+    Args:
+        line (str): 원본 줄
+
+    Returns:
+        Optional[str]: 정규화된 단어 (제외 대상이면 None)
+    """
+    word = line.strip()
+    if word and not word.startswith('['):
+        return word
+    return None
+
+
+class VocabularyCache:
+    """
+    컴파일된 어휘 캐시
+    원본 어휘 파일과 정규화 규칙의 해시를 키로 하는 바이너리 파일을 관리합니다.
+
+    파일 구조 (리틀 엔디언):
+        magic(4) | version(u16) | reserved(u16) | key(32) | count(u32) | blob_size(u32)
+        | UTF-8 단어 블롭 ('\\n' 구분)
+
+    로드는 블롭 전체를 한 번에 디코딩해 나누므로 단어별 오프셋 표는 두지 않습니다.
+    """
+
+    MAGIC = b'KVOC'
+    FORMAT_VERSION = 2
+    _HEADER = struct.Struct('<4sHH32sII')
+
+    def __init__(self, cache_directory: str = ".cache"):
+        """
+        어휘 캐시를 초기화합니다.
+
+        Args:
+            cache_directory (str): 캐시 파일을 저장할 디렉토리
+        """
+        self.cache_directory = cache_directory
+
+    def get_cache_path(self, source_file: str) -> str:
+        """
+        원본 어휘 파일에 대응하는 캐시 파일 경로를 반환합니다.
+
+        Args:
+            source_file (str): 원본 어휘 파일 경로
+
+        Returns:
+            str: 캐시 파일 경로
+        """
+        base_name = os.path.basename(source_file)
+        path_hash = hashlib.md5(os.path.abspath(source_file).encode('utf-8')).hexdigest()[:8]
+        return os.path.join(self.cache_directory, f"{base_name}.{path_hash}.vocab")
+
+    def get_jamo_tree_path(self, source_file: str) -> str:
+        """
+        원본 어휘 파일에 대응하는 자모 BK-트리 캐시 파일 경로를 반환합니다.
+
+        Args:
+            source_file (str): 원본 어휘 파일 경로
+
+        Returns:
+            str: 자모 BK-트리 캐시 파일 경로 (어휘 캐시 옆)
+        """
+        return self.get_cache_path(source_file)[:-len('.vocab')] + '.jamo.bktree'
+
+    def compute_key(self, source_file: str) -> bytes:
+        """
+        원본 파일 내용과 정규화 규칙으로 캐시 키를 계산합니다.
+
+        Args:
+            source_file (str): 원본 어휘 파일 경로
+
+        Returns:
+            bytes: SHA-256 캐시 키 (32바이트)
+        """
+        digest = hashlib.sha256()
+        digest.update(NORMALIZATION_RULES.encode('utf-8'))
+        with open(source_file, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.digest()
+
+    def load(self, source_file: str) -> Optional[List[str]]:
+        """
+        유효한 캐시가 있으면 단어 목록을 로드합니다.
+
+        Args:
+            source_file (str): 원본 어휘 파일 경로
+
+        Returns:
+            Optional[List[str]]: 캐시된 단어 목록 (없거나 오래되었으면 None)
+        """
+        key = self.compute_key(source_file)
+        cache_path = self.get_cache_path(source_file)
+
+        if not os.path.exists(cache_path):
+            return None
+
+        try:
+            with open(cache_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    magic, version, _, cached_key, count, blob_size = \
+                        self._HEADER.unpack_from(mm, 0)
+
+                    if (magic != self.MAGIC or version != self.FORMAT_VERSION or
+                        cached_key != key):
+                        return None
+
+                    blob_start = self._HEADER.size
+                    if blob_start + blob_size != len(mm):
+                        return None
+
+                    if count == 0:
+                        return []
+
+                    blob = mm[blob_start:blob_start + blob_size]
+                    words = blob.decode('utf-8').split('\n')
+                    return words if len(words) == count else None
+        except (OSError, ValueError, struct.error) as e:
+            print(f"⚠️ 어휘 캐시 로드 실패: {e}")
+            return None
+
+    def save(self, source_file: str, words: List[str]) -> bool:
+        """
+        단어 목록을 컴파일하여 캐시 파일로 저장합니다.
+
+        Args:
+            source_file (str): 원본 어휘 파일 경로
+            words (List[str]): 정규화된 단어 목록
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        try:
+            key = self.compute_key(source_file)
+            blob = '\n'.join(words).encode('utf-8')
+
+            os.makedirs(self.cache_directory, exist_ok=True)
+            cache_path = self.get_cache_path(source_file)
+            temp_path = f"{cache_path}.tmp"
+
+            with open(temp_path, 'wb') as f:
+                f.write(self._HEADER.pack(self.MAGIC, self.FORMAT_VERSION, 0,
+                                          key, len(words), len(blob)))
+                f.write(blob)
+
+            # 원자적 교체로 동시 실행 중인 다른 솔버가 깨진 파일을 읽지 않도록 함
+            os.replace(temp_path, cache_path)
+            return True
+        except OSError as e:
+            print(f"⚠️ 어휘 캐시 저장 실패: {e}")
+            return False
+
+
+class Vocabulary:
+    """
+    단어 ID 인터닝 테이블
+    모든 단어에 0부터 시작하는 연속 정수 ID를 부여하고, 문자열 변환은 경계에서만 수행합니다.
+
+    로드 시점의 어휘(정렬된 후보 단어)가 ID 0 ~ base_size-1을 차지하며,
+    이후 학습 데이터 등에서 등장한 어휘 밖의 단어는 그 뒤에 추가됩니다.
+    """
+
+    def __init__(self, words: Iterable[str] = ()):
+        """
+        어휘를 초기화합니다.
+
+        Args:
+            words (Iterable[str]): 후보 어휘 단어들 (로드 순서대로 ID 부여)
+        """
+        self.words: List[str] = []
+        self.word_to_id: Dict[str, int] = {}
+
+        for word in words:
+            self.intern(word)
+
+        # 추측 후보가 되는 로드 시점 어휘 크기
+        self.base_size = len(self.words)
+        
+        # 처음 사용할 때 구축되는 단어 색인들
+        self._prefix_index = None
+        self._jamo_tree = None
+        self._candidate_scorer = None
+
+        # 어휘 ID 순서에 맞춘 단어 임베딩 (솔버가 임베딩 파일을 지정한 경우에만 연결)
+        self.embeddings: Optional['EmbeddingStore'] = None
+
+    @property
+    def prefix_index(self) -> 'PrefixIndex':
+        """
+        접두사 색인 (처음 접근할 때 한 번 구축되고 이후 인터닝된 단어는 자동 반영)
+
+        Returns:
+            PrefixIndex: 접두사 색인
+        """
+        if self._prefix_index is None:
+            from .word_index import PrefixIndex
+            self._prefix_index = PrefixIndex(self)
+        return self._prefix_index
+
+    @property
+    def jamo_tree(self) -> 'JamoBKTree':
+        """
+        자모 편집 거리 BK-트리 (build_indexes()에서 미리 만들지 않았으면 처음 사용할 때 구축)
+
+        Returns:
+            JamoBKTree: 자모 BK-트리
+        """
+        if self._jamo_tree is None:
+            from .word_index import JamoBKTree
+            self._jamo_tree = JamoBKTree(self)
+        return self._jamo_tree
+
+    @property
+    def candidate_scorer(self) -> 'CandidateScorer':
+        """
+        묶음 후보 점수 계산기 (처음 점수를 계산할 때 numpy와 함께 로드)
+
+        Returns:
+            CandidateScorer: 후보 점수 계산기
+        """
+        if self._candidate_scorer is None:
+            from .candidate_scoring import CandidateScorer
+            self._candidate_scorer = CandidateScorer(self)
+        return self._candidate_scorer
+
+    def build_indexes(self, jamo_tree_path: Optional[str] = None) -> None:
+        """
+        어휘 로드 직후 단어 색인들을 미리 구축합니다.
+
+        자모 BK-트리는 구축이 비싸므로(3만 단어 약 1.7초) 게임 중 첫 정밀 탐색에서
+        만들지 않도록 여기서 구축하고, 경로가 주어지면 저장된 트리를 재사용합니다.
+
+        Args:
+            jamo_tree_path (Optional[str]): 자모 BK-트리 캐시 파일 경로
+                (없거나 어휘가 바뀌었으면 새로 구축하여 저장)
+        """
+        _ = self.prefix_index
+
+        if self._jamo_tree is None and jamo_tree_path:
+            from .word_index import JamoBKTree
+            self._jamo_tree = JamoBKTree.load(self, jamo_tree_path)
+            if self._jamo_tree is None:
+                self._jamo_tree = JamoBKTree(self)
+                self._jamo_tree.save(jamo_tree_path)
+        _ = self.jamo_tree
+
+    def intern(self, word: str) -> int:
+        """
+        단어의 ID를 반환하고, 처음 보는 단어면 새 ID를 부여합니다.
+
+        Args:
+            word (str): 단어
+
+        Returns:
+            int: 단어 ID
+        """
+        word_id = self.word_to_id.get(word)
+        if word_id is None:
+            word_id = len(self.words)
+            self.word_to_id[word] = word_id
+            self.words.append(word)
+        return word_id
+
+    def get_id(self, word: str) -> Optional[int]:
+        """
+        단어의 ID를 반환합니다.
+
+        Args:
+            word (str): 단어
+
+        Returns:
+            Optional[int]: 단어 ID (등록되지 않은 단어면 None)
+        """
+        return self.word_to_id.get(word)
+
+    def get_word(self, word_id: int) -> str:
+        """
+        ID에 해당하는 단어를 반환합니다.
+
+        Args:
+            word_id (int): 단어 ID
+
+        Returns:
+            str: 단어
+        """
+        return self.words[word_id]
+
+    def is_candidate(self, word_id: int) -> bool:
+        """ID가 로드 시점 후보 어휘에 속하는지 확인합니다."""
+        return 0 <= word_id < self.base_size
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.word_to_id
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.words)
+
+
+class AvailableVocabulary:
+    """
+    사용 가능한(아직 시도하지 않은) 후보 단어 뷰
+    단어 ID별 플래그 배열(비트셋)과 스왑 삭제 방식의 밀집 ID 배열을 함께 유지하여
+    멤버십 확인, 제거, 무작위 선택을 모두 O(1)에 처리합니다.
+
+    세션이 추측을 추가할 때마다 갱신되므로 매 시도마다 어휘 목록을 다시 만들 필요가 없습니다.
+    밀집 배열은 제거 시 순서가 바뀌므로 순회 순서는 보장되지 않습니다.
+    탐색 가중치를 지정하면 무작위 선택이 가중치 샘플러(O(log n))를 사용합니다.
+    """
+
+    def __init__(self, vocabulary: Vocabulary, word_ids: Optional[Iterable[int]] = None):
+        """
+        사용 가능 어휘 뷰를 초기화합니다.
+
+        Args:
+            vocabulary (Vocabulary): 단어 ID 인터닝 테이블
+            word_ids (Optional[Iterable[int]]): 사용 가능한 단어 ID들
+                (None이면 로드 시점 후보 어휘 전체)
+        """
+        self.vocabulary = vocabulary
+        self._sampler: Optional[WeightedSampler] = None
+
+        if word_ids is None:
+            size = vocabulary.base_size
+            self._ids = array('I', range(size))
+            self._positions = array('I', range(size))
+            self._flags = bytearray(b'\x01') * size
+            return
+
+        self._ids = array('I', dict.fromkeys(word_ids))
+        capacity = max(self._ids) + 1 if self._ids else 0
+        self._positions = array('I', bytes(4 * capacity))
+        self._flags = bytearray(capacity)
+        for position, word_id in enumerate(self._ids):
+            self._positions[word_id] = position
+            self._flags[word_id] = 1
+
+    @classmethod
+    def from_words(cls, vocabulary: Vocabulary, words: Iterable[str]) -> 'AvailableVocabulary':
+        """
+        단어 목록으로 사용 가능 어휘 뷰를 생성합니다 (처음 보는 단어는 인터닝).
+
+        Args:
+            vocabulary (Vocabulary): 단어 ID 인터닝 테이블
+            words (Iterable[str]): 사용 가능한 단어들
+
+        Returns:
+            AvailableVocabulary: 생성된 뷰
+        """
+        return cls(vocabulary, (vocabulary.intern(word) for word in words))
+
+    def discard(self, word_id: int) -> bool:
+        """
+        단어를 사용 가능 목록에서 제거합니다 (마지막 원소와 자리 교체 후 삭제).
+
+        Args:
+            word_id (int): 단어 ID
+
+        Returns:
+            bool: 실제로 제거되었는지 여부
+        """
+        if not self.contains_id(word_id):
+            return False
+
+        self._flags[word_id] = 0
+        if self._sampler is not None:
+            self._sampler.remove(word_id)
+
+        position = self._positions[word_id]
+        last_id = self._ids.pop()
+        if last_id != word_id:
+            self._ids[position] = last_id
+            self._positions[last_id] = position
+        return True
+
+    def discard_word(self, word: str) -> bool:
+        """
+        단어를 문자열로 받아 사용 가능 목록에서 제거합니다.
+
+        Args:
+            word (str): 단어
+
+        Returns:
+            bool: 실제로 제거되었는지 여부
+        """
+        word_id = self.vocabulary.get_id(word)
+        return word_id is not None and self.discard(word_id)
+
+    def contains_id(self, word_id: int) -> bool:
+        """ID로 사용 가능한 단어인지 확인합니다."""
+        return 0 <= word_id < len(self._flags) and self._flags[word_id] == 1
+
+    def iter_ids(self) -> Iterator[int]:
+        """사용 가능한 단어 ID들을 순회합니다."""
+        return iter(self._ids)
+
+    def flag_view(self) -> memoryview:
+        """
+        단어 ID별 사용 가능 플래그(0/1) 버퍼를 복사 없이 반환합니다 (numpy 마스크 변환용).
+        버퍼 길이는 가장 큰 사용 가능 ID + 1 이하일 수 있으므로 범위 밖 ID는 사용 불가로 취급합니다.
+
+        Returns:
+            memoryview: 읽기 전용 플래그 버퍼
+        """
+        return memoryview(self._flags).toreadonly()
+
+    def set_weights(self, weights: Sequence[float]) -> None:
+        """
+        무작위 선택에 사용할 단어 ID별 탐색 가중치를 지정합니다.
+
+        Args:
+            weights (Sequence[float]): 단어 ID별 가중치 (범위 밖 ID와 사용 불가 단어는 0)
+        """
+        self._sampler = WeightedSampler(
+            weights[word_id] if flag and word_id < len(weights) else 0.0
+            for word_id, flag in enumerate(self._flags))
+
+    def random_id(self) -> Optional[int]:
+        """
+        사용 가능한 단어 중 하나의 ID를 무작위로 선택합니다.
+        탐색 가중치가 있으면 가중치에 비례하여, 없으면 균등하게 선택합니다.
+
+        Returns:
+            Optional[int]: 선택된 단어 ID (남은 단어가 없으면 None)
+        """
+        if not self._ids:
+            return None
+        if self._sampler is not None and len(self._sampler):
+            return self._sampler.sample()
+        return self._ids[random.randrange(len(self._ids))]
+
+    def random_word(self) -> Optional[str]:
+        """
+        사용 가능한 단어 중 하나를 무작위로 선택합니다.
+
+        Returns:
+            Optional[str]: 선택된 단어 (남은 단어가 없으면 None)
+        """
+        word_id = self.random_id()
+        return self.vocabulary.get_word(word_id) if word_id is not None else None
+
+    def copy(self) -> 'AvailableVocabulary':
+        """
+        독립적으로 수정할 수 있는 복사본을 만듭니다.
+
+        Returns:
+            AvailableVocabulary: 복사본
+        """
+        clone = AvailableVocabulary.__new__(AvailableVocabulary)
+        clone.vocabulary = self.vocabulary
+        clone._ids = array('I', self._ids)
+        clone._positions = array('I', self._positions)
+        clone._flags = bytearray(self._flags)
+        clone._sampler = self._sampler.copy() if self._sampler is not None else None
+        return clone
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, word: str) -> bool:
+        word_id = self.vocabulary.get_id(word)
+        return word_id is not None and self.contains_id(word_id)
+
+    def __iter__(self) -> Iterator[str]:
+        words = self.vocabulary.words
+        return (words[word_id] for word_id in self._ids)
@@ -5,21 +5,45 @@
 """
 
 import time
+from types import SimpleNamespace
 from typing import Optional, List
 from dataclasses import dataclass
 
-from .models import GuessResult
+from .models import GuessResult, SubmitOutcome
 
-try:
-    from selenium import webdriver
-    from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-except ImportError as e:
-    print(f"[오류] 필수 라이브러리가 설치되지 않았습니다: {e}")
-    print("웹 자동화를 위해 `pip install selenium` 명령어를 실행해주세요.")
-    exit()
+
+# 게임이 사전에 없는 단어를 제출했을 때 오류 요소에 표시하는 문구
+# (semantle-ko: "<단어>은(는) 알 수 없는 단어입니다.", 로컬 게임 서버: "<단어>: 모르는 단어입니다.")
+_UNKNOWN_WORD_MARKERS = ('알 수 없는 단어', '모르는 단어')
+
+# 셀레니움은 임포트 비용이 커서 브라우저를 실제로 띄울 때 처음 로드
+_selenium = None
+
+
+def _load_selenium() -> Optional[SimpleNamespace]:
+    """
+    셀레니움 모듈들을 처음 필요할 때 로드합니다.
+    
+    Returns:
+        Optional[SimpleNamespace]: webdriver, Options, By, WebDriverWait, EC
+            (셀레니움이 설치되지 않았으면 None)
+    """
+    global _selenium
+    if _selenium is None:
+        try:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            from selenium.webdriver.common.by import By
+            from selenium.webdriver.support.ui import WebDriverWait
+            from selenium.webdriver.support import expected_conditions as EC
+        except ImportError as e:
+            print(f"[오류] 필수 라이브러리가 설치되지 않았습니다: {e}")
+            print("웹 자동화를 위해 `pip install selenium` 명령어를 실행해주세요.")
+            return None
+        
+        _selenium = SimpleNamespace(webdriver=webdriver, Options=Options, By=By,
+                                    WebDriverWait=WebDriverWait, EC=EC)
+    return _selenium
 
 
 @dataclass
@@ -65,9 +89,13 @@ class WebAutomation:
         Returns:
             bool: 설정 성공 여부
         """
+        selenium = _load_selenium()
+        if selenium is None:
+            return False
+        
         try:
             # Chrome 옵션 설정
-            chrome_options = Options()
+            chrome_options = selenium.Options()
             
             # 헤드리스 모드 설정 (필요시)
             if self.config.headless:
@@ -86,7 +114,7 @@ class WebAutomation:
             chrome_options.add_experimental_option('useAutomationExtension', False)
             
             # 드라이버 생성
-            self.driver = webdriver.Chrome(options=chrome_options)
+            self.driver = selenium.webdriver.Chrome(options=chrome_options)
             self.driver.set_page_load_timeout(self.config.page_load_timeout)
             
             print("✅ 브라우저 설정 완료")
@@ -112,8 +140,10 @@ class WebAutomation:
             time.sleep(2)
             
             # 게임 요소들이 로드되었는지 확인
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, self.selectors['input_field']))
+            selenium = _load_selenium()
+            selenium.WebDriverWait(self.driver, 10).until(
+                selenium.EC.presence_of_element_located(
+                    (selenium.By.CSS_SELECTOR, self.selectors['input_field']))
             )
             
             self.is_connected = True
@@ -125,7 +155,7 @@ class WebAutomation:
             self.is_connected = False
             return False
     
-    def submit_word(self, word: str) -> bool:
+    def submit_word(self, word: str) -> SubmitOutcome:
         """
         단어를 입력하고 제출합니다.
         
@@ -133,12 +163,13 @@ class WebAutomation:
             word (str): 제출할 단어
             
         Returns:
-            bool: 제출 성공 여부
+            SubmitOutcome: 제출 결과 (게임이 모르는 단어 오류를 표시하면 UNKNOWN_WORD,
+                그 밖의 오류는 FAILED)
         """
         try:
             if not self.is_connected:
                 print("❌ 게임 사이트에 연결되지 않았습니다.")
-                return False
+                return SubmitOutcome.FAILED
             
             # JavaScript를 사용하여 빠른 입력 및 제출
             script = f"""
@@ -171,17 +202,20 @@ class WebAutomation:
                 
                 error_msg = self.driver.execute_script(error_check_script)
                 if error_msg:
+                    if any(marker in error_msg for marker in _UNKNOWN_WORD_MARKERS):
+                        print(f"🚫 게임이 모르는 단어: {error_msg}")
+                        return SubmitOutcome.UNKNOWN_WORD
                     print(f"⚠️ 서버 오류: {error_msg}")
-                    return False
+                    return SubmitOutcome.FAILED
                 
-                return True
+                return SubmitOutcome.ACCEPTED
             else:
                 print(f"❌ 입력 요소를 찾을 수 없습니다: {word}")
-                return False
+                return SubmitOutcome.FAILED
                 
         except Exception as e:
             print(f"❌ 단어 제출 실패 ({word}): {e}")
-            return False
+            return SubmitOutcome.FAILED
     
     def parse_result(self, word: str, attempt: int) -> Optional[GuessResult]:
         """
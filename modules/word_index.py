@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+단어 색인 모듈
+어근(접두사) 기반 파생어 탐색과 자모 편집 거리 근접 단어 탐색을 위한 색인을 제공합니다.
+"""
+
+import hashlib
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .vocabulary import AvailableVocabulary, Vocabulary
+
+
+# 한글 음절 분해 상수 (유니코드 완성형 '가' ~ '힣')
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_JUNGSEONG_COUNT = 21
+_JONGSEONG_COUNT = 28
+_SYLLABLE_BLOCK = _JUNGSEONG_COUNT * _JONGSEONG_COUNT
+
+
+def decompose_jamo(word: str) -> str:
+    """
+    한글 음절을 초성/중성/종성 자모(조합형)로 분해합니다.
+
+    Args:
+        word (str): 단어 (한글 외 문자는 그대로 유지)
+
+    Returns:
+        str: 자모 문자열 (예: "사랑" -> "사랑")
+    """
+    jamo = []
+    for char in word:
+        code = ord(char)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            index = code - _HANGUL_BASE
+            jamo.append(chr(0x1100 + index // _SYLLABLE_BLOCK))
+            jamo.append(chr(0x1161 + (index % _SYLLABLE_BLOCK) // _JONGSEONG_COUNT))
+            final = index % _JONGSEONG_COUNT
+            if final:
+                jamo.append(chr(0x11A7 + final))
+        else:
+            jamo.append(char)
+    return ''.join(jamo)
+
+
+def _pattern_masks(pattern: str) -> Dict[str, int]:
+    """비트 병렬 편집 거리 계산용 문자별 위치 비트마스크를 만듭니다."""
+    masks: Dict[str, int] = {}
+    for position, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << position)
+    return masks
+
+
+def _bit_parallel_distance(masks: Dict[str, int], pattern_length: int, text: str) -> int:
+    """
+    Myers(Hyyrö) 비트 병렬 알고리즘으로 레벤슈타인 거리를 계산합니다.
+
+    Args:
+        masks (Dict[str, int]): 패턴의 문자별 위치 비트마스크
+        pattern_length (int): 패턴 길이
+        text (str): 비교할 문자열
+
+    Returns:
+        int: 편집 거리
+    """
+    if pattern_length == 0:
+        return len(text)
+
+    all_ones = (1 << pattern_length) - 1
+    high_bit = 1 << (pattern_length - 1)
+    positive, negative = all_ones, 0
+    distance = pattern_length
+
+    for char in text:
+        equal = masks.get(char, 0)
+        vertical = equal | negative
+        horizontal = (((equal & positive) + positive) ^ positive) | equal
+        horizontal_positive = negative | ~(horizontal | positive)
+        horizontal_negative = positive & horizontal
+
+        if horizontal_positive & high_bit:
+            distance += 1
+        elif horizontal_negative & high_bit:
+            distance -= 1
+
+        horizontal_positive = (horizontal_positive << 1) | 1
+        horizontal_negative <<= 1
+        positive = (horizontal_negative | ~(vertical | horizontal_positive)) & all_ones
+        negative = horizontal_positive & vertical
+
+    return distance
+
+
+def jamo_distance(word1: str, word2: str) -> int:
+    """
+    두 단어의 자모 단위 편집 거리를 계산합니다.
+
+    Args:
+        word1 (str): 첫 번째 단어
+        word2 (str): 두 번째 단어
+
+    Returns:
+        int: 자모 편집 거리 (예: "사랑" / "사람" -> 1)
+    """
+    jamo1, jamo2 = decompose_jamo(word1), decompose_jamo(word2)
+    return _bit_parallel_distance(_pattern_masks(jamo1), len(jamo1), jamo2)
+
+
+class PrefixIndex:
+    """
+    접두사 색인 (길이별 정렬 배열 + 이분 탐색)
+    단어를 길이별 버킷으로 나누어 정렬해 두고, 접두사 범위를 이분 탐색으로 찾습니다.
+
+    "X로 시작하고 길이가 N 이하인 단어" 질의는 길이 버킷마다 이분 탐색 한 번씩만 하고
+    일치하는 단어만 순회하므로, 전체 어휘 크기가 아니라 결과 크기에 비례해 동작합니다.
+    """
+
+    def __init__(self, vocabulary: Vocabulary):
+        """
+        접두사 색인을 구축합니다.
+
+        Args:
+            vocabulary (Vocabulary): 단어 ID 인터닝 테이블
+        """
+        self.vocabulary = vocabulary
+
+        # 길이 -> (정렬된 단어 목록, 같은 순서의 단어 ID 배열)
+        self._buckets: Dict[int, Tuple[List[str], array]] = {}
+        self._indexed_count = 0
+
+        self._build()
+
+    def _build(self) -> None:
+        """현재 어휘 전체로 길이별 버킷을 구축합니다."""
+        grouped: Dict[int, List[Tuple[str, int]]] = {}
+        for word_id, word in enumerate(self.vocabulary.words):
+            grouped.setdefault(len(word), []).append((word, word_id))
+
+        for length, entries in grouped.items():
+            entries.sort()
+            self._buckets[length] = ([word for word, _ in entries],
+                                     array('I', [word_id for _, word_id in entries]))
+
+        self._indexed_count = len(self.vocabulary)
+
+    def _refresh(self) -> None:
+        """색인 구축 이후 인터닝된 단어들을 버킷에 추가합니다."""
+        words = self.vocabulary.words
+        for word_id in range(self._indexed_count, len(words)):
+            word = words[word_id]
+            bucket_words, bucket_ids = self._buckets.setdefault(len(word), ([], array('I')))
+            position = bisect_left(bucket_words, word)
+            bucket_words.insert(position, word)
+            bucket_ids.insert(position, word_id)
+
+        self._indexed_count = len(words)
+
+    def iter_prefix_ids(self, prefix: str, max_length: Optional[int] = None,
+                        min_length: Optional[int] = None) -> Iterator[int]:
+        """
+        접두사로 시작하는 단어 ID들을 순회합니다 (길이 오름차순, 같은 길이는 사전순).
+
+        Args:
+            prefix (str): 접두사
+            max_length (Optional[int]): 최대 단어 길이 (None이면 제한 없음)
+            min_length (Optional[int]): 최소 단어 길이 (None이면 접두사 길이)
+
+        Returns:
+            Iterator[int]: 단어 ID 이터레이터
+        """
+        if self._indexed_count != len(self.vocabulary):
+            self._refresh()
+
+        lower = max(len(prefix), min_length or 0)
+        for length in sorted(self._buckets):
+            if length < lower:
+                continue
+            if max_length is not None and length > max_length:
+                break
+
+            bucket_words, bucket_ids = self._buckets[length]
+            position = bisect_left(bucket_words, prefix)
+            while position < len(bucket_words) and bucket_words[position].startswith(prefix):
+                yield bucket_ids[position]
+                position += 1
+
+    def find(self, prefix: str, available: AvailableVocabulary,
+             max_length: Optional[int] = None, exclude: Optional[str] = None) -> List[str]:
+        """
+        접두사로 시작하는 사용 가능한(시도하지 않은) 단어들을 찾습니다.
+
+        Args:
+            prefix (str): 접두사 (어근)
+            available (AvailableVocabulary): 사용 가능한 어휘 뷰
+            max_length (Optional[int]): 최대 단어 길이 (None이면 제한 없음)
+            exclude (Optional[str]): 결과에서 제외할 단어 (보통 기준 단어)
+
+        Returns:
+            List[str]: 일치하는 단어 목록
+        """
+        words = self.vocabulary.words
+        return [words[word_id] for word_id in self.iter_prefix_ids(prefix, max_length)
+                if available.contains_id(word_id) and words[word_id] != exclude]
+
+    def __len__(self) -> int:
+        return self._indexed_count
+
+
+class JamoBKTree:
+    """
+    자모 편집 거리 BK-트리
+    모든 단어를 자모로 분해하여 편집 거리(거리 공리를 만족) 기준 BK-트리에 색인합니다.
+
+    "기준 단어와 자모 거리 d 이내의 단어" 질의는 삼각 부등식으로 자식 가지를 잘라내므로
+    전체 어휘를 훑지 않고 일부 노드만 방문합니다. 거리 계산은 비트 병렬 알고리즘을 사용합니다.
+
+    가지치기 효과는 거리에 따라 크게 다릅니다. 3만 단어 기준 d=1은 노드의 약 3%,
+    d=2는 약 21%, d=3은 약 46%를 방문하므로, 정밀 탐색이 쓰는 거리(단어 길이에 따라 1 ~ 3,
+    대부분 2 ~ 3)에서는 전체 스캔보다 2 ~ 3배 빠른 선형에 가까운 탐색입니다.
+    반면 구축은 삽입마다 경로를 따라 거리를 계산하므로 비싸서(3만 단어 약 1.7초),
+    게임 중이 아니라 어휘 로드 직후에 만들고 save()/load()로 캐시에 저장해 재사용합니다.
+    """
+
+    MAGIC = b'KBKT'
+    FORMAT_VERSION = 1
+    _HEADER = struct.Struct('<4sHH32sII')
+    _NO_PARENT = 0xFFFFFFFF
+
+    def __init__(self, vocabulary: Vocabulary, build: bool = True):
+        """
+        BK-트리를 구축합니다.
+
+        Args:
+            vocabulary (Vocabulary): 단어 ID 인터닝 테이블
+            build (bool): False면 빈 트리로 시작 (load()에서 사용)
+        """
+        self.vocabulary = vocabulary
+
+        # 노드: [단어 ID, 자모 문자열, {거리: 자식 노드}]
+        self._root: Optional[list] = None
+        self._indexed_count = 0
+
+        if build:
+            self._refresh()
+
+    @staticmethod
+    def _fingerprint(words: List[str]) -> bytes:
+        """색인한 단어 목록의 SHA-256 지문 (저장된 트리가 같은 어휘인지 확인)"""
+        return hashlib.sha256('\n'.join(words).encode('utf-8')).digest()
+
+    def save(self, path: str) -> bool:
+        """
+        트리 구조를 파일로 저장합니다.
+
+        파일 구조 (리틀 엔디언):
+            magic(4) | version(u16) | reserved(u16) | 어휘 지문(32) | 색인 단어 수(u32)
+            | 노드 수(u32) | 노드(u32 * 3 * 노드 수: 단어 ID, 부모 노드 번호, 부모와의 거리)
+
+        노드는 부모가 먼저 오는 순서로 기록되며 자모 문자열은 로드 시 다시 분해합니다.
+
+        Args:
+            path (str): 저장할 파일 경로
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        records = array('I')
+        if self._root is not None:
+            stack = [(self._root, self._NO_PARENT, 0)]
+            while stack:
+                node, parent, edge = stack.pop()
+                position = len(records) // 3
+                records.extend((node[0], parent, edge))
+                for child_edge, child in node[2].items():
+                    stack.append((child, position, child_edge))
+        if sys.byteorder == "big":
+            records.byteswap()
+
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(self._HEADER.pack(
+                    self.MAGIC, self.FORMAT_VERSION, 0,
+                    self._fingerprint(self.vocabulary.words[:self._indexed_count]),
+                    self._indexed_count, len(records) // 3))
+                f.write(records.tobytes())
+            os.replace(temp_path, path)
+            return True
+        except OSError as e:
+            print(f"⚠️ 자모 BK-트리 저장 실패: {e}")
+            return False
+
+    @classmethod
+    def load(cls, vocabulary: Vocabulary, path: str) -> Optional['JamoBKTree']:
+        """
+        저장된 트리를 로드합니다 (거리 계산 없이 노드만 다시 연결).
+
+        Args:
+            vocabulary (Vocabulary): 단어 ID 인터닝 테이블
+            path (str): 저장된 파일 경로
+
+        Returns:
+            Optional[JamoBKTree]: 로드된 트리 (없거나 어휘가 다르면 None)
+        """
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                header = f.read(cls._HEADER.size)
+                magic, version, _, fingerprint, indexed_count, node_count = \
+                    cls._HEADER.unpack(header)
+                records = array('I')
+                records.frombytes(f.read())
+        except (OSError, ValueError, struct.error) as e:
+            print(f"⚠️ 자모 BK-트리 로드 실패: {e}")
+            return None
+
+        words = vocabulary.words
+        if (magic != cls.MAGIC or version != cls.FORMAT_VERSION or
+                len(records) != 3 * node_count or indexed_count > len(words) or
+                fingerprint != cls._fingerprint(words[:indexed_count])):
+            return None
+        if sys.byteorder == "big":
+            records.byteswap()
+
+        tree = cls(vocabulary, build=False)
+        nodes: List[list] = []
+        for index in range(0, len(records), 3):
+            word_id, parent, edge = records[index], records[index + 1], records[index + 2]
+            node = [word_id, decompose_jamo(words[word_id]), {}]
+            if parent == cls._NO_PARENT:
+                tree._root = node
+            else:
+                nodes[parent][2][edge] = node
+            nodes.append(node)
+        tree._indexed_count = indexed_count
+
+        # 저장 뒤에 인터닝된 단어 반영
+        tree._refresh()
+        return tree
+
+    def _refresh(self) -> None:
+        """아직 색인되지 않은 단어들을 트리에 삽입합니다."""
+        words = self.vocabulary.words
+        for word_id in range(self._indexed_count, len(words)):
+            self._insert(word_id, decompose_jamo(words[word_id]))
+        self._indexed_count = len(words)
+
+    def _insert(self, word_id: int, jamo: str) -> None:
+        """
+        단어 하나를 트리에 삽입합니다.
+
+        Args:
+            word_id (int): 단어 ID
+            jamo (str): 자모 문자열
+        """
+        new_node = [word_id, jamo, {}]
+        if self._root is None:
+            self._root = new_node
+            return
+
+        masks = _pattern_masks(jamo)
+        node = self._root
+        while True:
+            distance = _bit_parallel_distance(masks, len(jamo), node[1])
+            if distance == 0:
+                return  # 자모가 같은 단어 (중복 없이 첫 단어만 유지)
+
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = new_node
+                return
+            node = child
+
+    def iter_within(self, word: str, max_distance: int) -> Iterator[Tuple[int, int]]:
+        """
+        기준 단어와 자모 거리 max_distance 이내의 단어들을 순회합니다.
+
+        Args:
+            word (str): 기준 단어
+            max_distance (int): 최대 자모 편집 거리
+
+        Returns:
+            Iterator[Tuple[int, int]]: (단어 ID, 거리) 이터레이터 (순서 무관)
+        """
+        if self._indexed_count != len(self.vocabulary):
+            self._refresh()
+        if self._root is None:
+            return
+
+        jamo = decompose_jamo(word)
+        masks = _pattern_masks(jamo)
+        stack = [self._root]
+
+        while stack:
+            node = stack.pop()
+            distance = _bit_parallel_distance(masks, len(jamo), node[1])
+            if distance <= max_distance:
+                yield node[0], distance
+
+            # 삼각 부등식: |d(q, node) - d(node, child)| <= d(q, child)
+            for edge, child in node[2].items():
+                if distance - max_distance <= edge <= distance + max_distance:
+                    stack.append(child)
+
+    def find(self, word: str, max_distance: int,
+             available: Optional[AvailableVocabulary] = None) -> List[Tuple[str, int]]:
+        """
+        기준 단어와 자모 거리 max_distance 이내의 사용 가능한 단어들을 찾습니다.
+
+        Args:
+            word (str): 기준 단어 (결과에서 제외)
+            max_distance (int): 최대 자모 편집 거리
+            available (Optional[AvailableVocabulary]): 사용 가능한 어휘 뷰 (None이면 전체)
+
+        Returns:
+            List[Tuple[str, int]]: (단어, 거리) 목록 (거리 오름차순, 같은 거리는 사전순)
+        """
+        words = self.vocabulary.words
+        neighbors = [(words[word_id], distance)
+                     for word_id, distance in self.iter_within(word, max_distance)
+                     if (available is None or available.contains_id(word_id))
+                     and words[word_id] != word]
+        neighbors.sort(key=lambda item: (item[1], item[0]))
+        return neighbors
+
+    def __len__(self) -> int:
+        return self._indexed_count
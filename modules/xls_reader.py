@@ -0,0 +1,675 @@
+#!/usr/bin/env python3
+"""
+XLS 스트리밍 리더 모듈
+pandas/xlrd 없이 OLE2 복합 문서(BIFF5/BIFF8) 형식의 .xls 파일에서
+단어 열을 레코드 단위로 읽어오는 모듈입니다.
+"""
+
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .vocabulary import normalize_excel_word
+
+
+# OLE2 섹터 체인 특수 값
+_FREE_SECTOR = 0xFFFFFFFF
+_END_OF_CHAIN = 0xFFFFFFFE
+
+# BIFF 레코드 ID
+_RECORD_BOF = 0x0809
+_RECORD_EOF = 0x000A
+_RECORD_CODEPAGE = 0x0042
+_RECORD_SST = 0x00FC
+_RECORD_CONTINUE = 0x003C
+_RECORD_LABELSST = 0x00FD
+_RECORD_LABEL = 0x0204
+_RECORD_RSTRING = 0x00D6
+
+# BOF 서브스트림 종류
+_SUBSTREAM_WORKSHEET = 0x0010
+
+# 단어 열 판별에 사용할 데이터 행 수 (헤더 제외)
+_COLUMN_PROBE_ROWS = 10
+
+
+def _codec_for_codepage(codepage: int) -> str:
+    """
+    BIFF CODEPAGE 값을 파이썬 코덱 이름으로 변환합니다.
+
+    Args:
+        codepage (int): CODEPAGE 레코드 값
+
+    Returns:
+        str: 코덱 이름
+    """
+    if codepage == 1200:
+        return 'utf-16-le'
+    if codepage == 367:
+        return 'ascii'
+    if codepage in (32768, 10000):
+        return 'mac_roman'
+    return f"cp{codepage}"
+
+
+class CompoundFileReader:
+    """
+    OLE2 복합 문서 리더
+    파일 전체를 메모리에 올리지 않고 섹터 체인을 따라 스트림을 읽습니다.
+    """
+
+    _HEADER = struct.Struct('<8s16sHHHHHH4xIIIIIIIII')
+    _SIGNATURE = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+    def __init__(self, file: BinaryIO):
+        """
+        복합 문서 헤더와 할당 테이블을 읽습니다.
+
+        Args:
+            file (BinaryIO): 바이너리 모드로 연 파일 객체
+        """
+        self.file = file
+
+        header = file.read(512)
+        if len(header) < 512 or header[:8] != self._SIGNATURE:
+            raise ValueError("OLE2 복합 문서 형식이 아닙니다.")
+
+        (_, _, _, _, _, sector_shift, mini_sector_shift, _, _,
+         fat_sector_count, self.directory_start, _, self.mini_stream_cutoff,
+         self.mini_fat_start, mini_fat_sector_count, difat_start,
+         difat_sector_count) = self._HEADER.unpack_from(header, 0)
+
+        self.sector_size = 1 << sector_shift
+        self.mini_sector_size = 1 << mini_sector_shift
+
+        # 헤더의 DIFAT(최대 109개) + DIFAT 체인에서 FAT 섹터 목록 수집
+        fat_sectors = list(struct.unpack_from('<109I', header, 76))
+        sector = difat_start
+        entries_per_sector = self.sector_size // 4
+        for _ in range(difat_sector_count):
+            if sector in (_FREE_SECTOR, _END_OF_CHAIN):
+                break
+            entries = struct.unpack('<%dI' % entries_per_sector, self._read_sector(sector))
+            fat_sectors.extend(entries[:-1])
+            sector = entries[-1]
+
+        self.fat = array('I')
+        for fat_sector in fat_sectors[:fat_sector_count]:
+            self.fat.frombytes(self._read_sector(fat_sector))
+        if sys.byteorder == "big":
+            self.fat.byteswap()
+
+        self._mini_fat_sector_count = mini_fat_sector_count
+        self._directory: Optional[List[Tuple[str, int, int, int]]] = None
+        self._stream_sectors: Optional[Tuple[str, int, Union[bytes, array]]] = None
+
+    def _read_sector(self, sector: int) -> bytes:
+        """섹터 하나를 읽습니다."""
+        self.file.seek((sector + 1) * self.sector_size)
+        return self.file.read(self.sector_size)
+
+    def _iter_chain(self, start_sector: int) -> Iterator[int]:
+        """FAT 체인을 따라 섹터 번호를 순회합니다."""
+        sector = start_sector
+        visited = 0
+        while sector not in (_END_OF_CHAIN, _FREE_SECTOR):
+            if sector >= len(self.fat) or visited > len(self.fat):
+                raise ValueError("손상된 섹터 체인입니다.")
+            yield sector
+            visited += 1
+            sector = self.fat[sector]
+
+    def _read_chain(self, start_sector: int) -> bytes:
+        """작은 체인(디렉토리, 미니 FAT 등)을 한 번에 읽습니다."""
+        return b''.join(self._read_sector(s) for s in self._iter_chain(start_sector))
+
+    def list_streams(self) -> List[Tuple[str, int, int, int]]:
+        """
+        디렉토리 엔트리 목록을 반환합니다.
+
+        Returns:
+            List[Tuple[str, int, int, int]]: (이름, 종류, 시작 섹터, 크기) 목록
+        """
+        if self._directory is None:
+            directory = self._read_chain(self.directory_start)
+            entries = []
+            for offset in range(0, len(directory), 128):
+                entry = directory[offset:offset + 128]
+                name_size = struct.unpack_from('<H', entry, 64)[0]
+                name = entry[:max(0, name_size - 2)].decode('utf-16-le', errors='replace')
+                entry_type = entry[66]
+                start_sector, size = struct.unpack_from('<II', entry, 116)
+                entries.append((name, entry_type, start_sector, size))
+            self._directory = entries
+        return self._directory
+
+    def _find_stream(self, name: str) -> Tuple[int, int]:
+        """이름으로 스트림 엔트리를 찾아 (시작 섹터, 크기)를 반환합니다."""
+        for entry_name, entry_type, start_sector, size in self.list_streams():
+            if entry_type == 2 and entry_name == name:
+                return start_sector, size
+        raise KeyError(name)
+
+    def iter_stream(self, name: str) -> Iterator[bytes]:
+        """
+        이름으로 스트림을 찾아 섹터 크기 단위의 조각으로 순회합니다.
+
+        Args:
+            name (str): 스트림 이름
+
+        Returns:
+            Iterator[bytes]: 스트림 데이터 조각들
+        """
+        start_sector, size = self._find_stream(name)
+
+        if size < self.mini_stream_cutoff:
+            yield self._read_mini_stream(start_sector, size)
+            return
+
+        remaining = size
+        for sector in self._iter_chain(start_sector):
+            if remaining <= 0:
+                break
+            data = self._read_sector(sector)
+            if len(data) > remaining:
+                data = data[:remaining]
+            remaining -= len(data)
+            yield data
+
+    def read_stream_at(self, name: str, offset: int, size: int) -> bytes:
+        """
+        스트림의 임의 위치에서 size 바이트를 읽습니다.
+        스트림별 섹터 체인 목록(섹터당 4바이트)만 처음 호출 때 만들어 보관합니다.
+
+        Args:
+            name (str): 스트림 이름
+            offset (int): 스트림 안의 시작 위치
+            size (int): 읽을 바이트 수
+
+        Returns:
+            bytes: 읽은 데이터 (스트림 끝을 넘으면 잘림)
+        """
+        if self._stream_sectors is None or self._stream_sectors[0] != name:
+            start_sector, stream_size = self._find_stream(name)
+            if stream_size < self.mini_stream_cutoff:
+                layout = self._read_mini_stream(start_sector, stream_size)
+            else:
+                layout = array('I', self._iter_chain(start_sector))
+            self._stream_sectors = (name, stream_size, layout)
+
+        _, stream_size, layout = self._stream_sectors
+        size = max(0, min(size, stream_size - offset))
+        if isinstance(layout, bytes):
+            return layout[offset:offset + size]
+
+        parts = []
+        while size > 0:
+            index, skip = divmod(offset, self.sector_size)
+            part = self._read_sector(layout[index])[skip:skip + size]
+            parts.append(part)
+            offset += len(part)
+            size -= len(part)
+        return b''.join(parts)
+
+    def _read_mini_stream(self, start_sector: int, size: int) -> bytes:
+        """미니 스트림에 저장된 작은 스트림을 읽습니다."""
+        root_start = self.list_streams()[0][2]
+        mini_stream = self._read_chain(root_start)
+        mini_fat = array('I', self._read_chain(self.mini_fat_start)) \
+            if self._mini_fat_sector_count else array('I')
+
+        chunks = []
+        sector = start_sector
+        while sector not in (_END_OF_CHAIN, _FREE_SECTOR) and sector < len(mini_fat):
+            offset = sector * self.mini_sector_size
+            chunks.append(mini_stream[offset:offset + self.mini_sector_size])
+            sector = mini_fat[sector]
+        return b''.join(chunks)[:size]
+
+
+class _RecordStream:
+    """
+    BIFF 레코드 순회기
+    섹터 조각 경계를 넘는 레코드를 이어 붙이고, 한 레코드 되돌리기를 지원합니다.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._buffer = b''
+        self._position = 0
+        self._buffer_offset = 0
+        self._pushed: Optional[Tuple[Tuple[int, bytes], int]] = None
+        # 마지막으로 반환한 레코드 데이터의 스트림 내 위치
+        self.data_offset = 0
+
+    def _fill(self, size: int) -> bool:
+        """버퍼에 최소 size 바이트가 남도록 채웁니다."""
+        while len(self._buffer) - self._position < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return False
+            self._buffer_offset += self._position
+            self._buffer = self._buffer[self._position:] + chunk
+            self._position = 0
+        return True
+
+    def next_record(self) -> Optional[Tuple[int, bytes]]:
+        """
+        다음 레코드를 반환합니다.
+
+        Returns:
+            Optional[Tuple[int, bytes]]: (레코드 ID, 데이터), 스트림 끝이면 None
+        """
+        if self._pushed is not None:
+            (record, self.data_offset), self._pushed = self._pushed, None
+            return record
+
+        if not self._fill(4):
+            return None
+        record_id, length = struct.unpack_from('<HH', self._buffer, self._position)
+        self._position += 4
+
+        if not self._fill(length):
+            return None
+        data = self._buffer[self._position:self._position + length]
+        self.data_offset = self._buffer_offset + self._position
+        self._position += length
+        return record_id, data
+
+    def push_back(self, record: Tuple[int, bytes]) -> None:
+        """읽은 레코드 하나를 되돌립니다."""
+        self._pushed = (record, self.data_offset)
+
+
+class _ContinuedReader:
+    """
+    SST/CONTINUE 레코드 체인을 하나의 연속된 입력처럼 읽는 커서
+    문자 데이터가 CONTINUE 경계를 넘으면 새 옵션 바이트를 읽어 인코딩을 다시 결정합니다.
+    """
+
+    def __init__(self, first: bytes, next_segment: Callable[[], Optional[bytes]],
+                 position: int = 0):
+        """
+        Args:
+            first (bytes): 첫 구간 (SST 레코드 데이터 또는 CONTINUE 레코드 데이터)
+            next_segment (Callable[[], Optional[bytes]]): 다음 CONTINUE 데이터를 반환하는 함수
+                (체인이 끝나면 None)
+            position (int): 첫 구간 안의 시작 위치
+        """
+        self._segment = first
+        self._position = position
+        self._next = next_segment
+        self.segment_index = 0
+
+    def _next_segment(self) -> bool:
+        """다음 CONTINUE 레코드로 넘어갑니다."""
+        segment = self._next()
+        if segment is None:
+            return False
+        self._segment = segment
+        self._position = 0
+        self.segment_index += 1
+        return True
+
+    def tell(self) -> Tuple[int, int]:
+        """
+        다음 문자열이 시작하는 (구간 번호, 구간 안 위치)를 반환합니다.
+        현재 구간이 끝났으면 다음 CONTINUE 레코드의 처음을 가리킵니다.
+        """
+        if self._position >= len(self._segment) and not self._next_segment():
+            raise ValueError("SST 레코드가 예상보다 일찍 끝났습니다.")
+        return self.segment_index, self._position
+
+    def read(self, size: int) -> bytes:
+        """경계를 넘어 size 바이트를 읽습니다."""
+        parts = []
+        while size > 0:
+            if self._position >= len(self._segment) and not self._next_segment():
+                raise ValueError("SST 레코드가 예상보다 일찍 끝났습니다.")
+            part = self._segment[self._position:self._position + size]
+            self._position += len(part)
+            size -= len(part)
+            parts.append(part)
+        return b''.join(parts)
+
+    def skip(self, size: int) -> None:
+        """경계를 넘어 size 바이트를 건너뜁니다."""
+        while size > 0:
+            if self._position >= len(self._segment) and not self._next_segment():
+                raise ValueError("SST 레코드가 예상보다 일찍 끝났습니다.")
+            step = min(size, len(self._segment) - self._position)
+            self._position += step
+            size -= step
+
+    def read_characters(self, count: int, high_byte: bool, decode: bool = True) -> str:
+        """
+        경계를 넘어 count개의 문자를 읽습니다.
+
+        Args:
+            count (int): 문자 수
+            high_byte (bool): UTF-16 여부 (False면 압축된 8비트 문자)
+            decode (bool): False면 디코딩 없이 건너뛰고 빈 문자열 반환
+
+        Returns:
+            str: 디코딩된 문자열
+        """
+        parts = []
+        while count > 0:
+            if self._position >= len(self._segment):
+                if not self._next_segment():
+                    raise ValueError("SST 문자열이 예상보다 일찍 끝났습니다.")
+                high_byte = bool(self._segment[0] & 0x01)
+                self._position = 1
+
+            width = 2 if high_byte else 1
+            available = (len(self._segment) - self._position) // width
+            take = min(count, available)
+            if decode:
+                raw = self._segment[self._position:self._position + take * width]
+                parts.append(raw.decode('utf-16-le' if high_byte else 'latin-1'))
+            self._position += take * width
+            count -= take
+        return ''.join(parts)
+
+    def read_string(self, decode: bool = True) -> str:
+        """
+        SST 문자열 하나(헤더, 문자, 서식/확장 데이터)를 읽습니다.
+
+        Args:
+            decode (bool): False면 문자를 디코딩하지 않고 건너뜀
+
+        Returns:
+            str: 디코딩된 문자열 (decode=False면 빈 문자열)
+        """
+        char_count, flags = struct.unpack('<HB', self.read(3))
+        rich_runs = struct.unpack('<H', self.read(2))[0] if flags & 0x08 else 0
+        ext_size = struct.unpack('<I', self.read(4))[0] if flags & 0x04 else 0
+
+        text = self.read_characters(char_count, bool(flags & 0x01), decode)
+        self.skip(rich_runs * 4 + ext_size)
+        return text
+
+
+class _SharedStringTable:
+    """
+    지연 디코딩 공유 문자열 테이블 (SST)
+    문자열마다 (CONTINUE 구간 번호, 구간 안 위치)만 보관하고, 셀이 참조할 때
+    워크북 스트림에서 해당 구간을 다시 읽어 디코딩합니다. 풀이/예문 같은 다른 열의
+    문자열은 메모리에 올리지 않으므로 사전 전체 덤프에서도 문자열당 6바이트만 차지합니다.
+    """
+
+    def __init__(self, compound: CompoundFileReader, stream_name: str):
+        self._compound = compound
+        self._stream_name = stream_name
+        # 구간(SST 레코드 데이터와 뒤따르는 CONTINUE 데이터)의 스트림 내 위치와 길이
+        self.segment_offsets = array('I')
+        self.segment_lengths = array('H')
+        # 문자열별 시작 구간과 구간 안 위치
+        self.string_segments = array('I')
+        self.string_positions = array('H')
+        self._cached: Tuple[int, bytes] = (-1, b'')
+
+    def __len__(self) -> int:
+        return len(self.string_segments)
+
+    def _segment(self, index: int) -> bytes:
+        """구간 하나를 읽습니다 (직전 구간 재사용: 단어 열 참조는 대체로 SST 순서를 따름)."""
+        if self._cached[0] != index:
+            data = self._compound.read_stream_at(
+                self._stream_name, self.segment_offsets[index], self.segment_lengths[index])
+            self._cached = (index, data)
+        return self._cached[1]
+
+    def __getitem__(self, index: int) -> str:
+        segment_index = self.string_segments[index]
+        next_index = [segment_index]
+
+        def next_segment() -> Optional[bytes]:
+            next_index[0] += 1
+            if next_index[0] >= len(self.segment_offsets):
+                return None
+            return self._segment(next_index[0])
+
+        reader = _ContinuedReader(self._segment(segment_index), next_segment,
+                                  self.string_positions[index])
+        return reader.read_string()
+
+
+class XLSWordReader:
+    """
+    .xls 어휘 파일 스트리밍 리더
+    첫 번째 워크시트의 단어 열을 레코드 단위로 읽어 정규화된 단어를 하나씩 반환합니다.
+    """
+
+    def __init__(self, file_path: str, default_codepage: int = 949):
+        """
+        리더를 초기화합니다.
+
+        Args:
+            file_path (str): .xls 파일 경로
+            default_codepage (int): CODEPAGE 레코드가 없을 때 사용할 코드 페이지
+        """
+        self.file_path = file_path
+        self.codepage = default_codepage
+        self.biff_version: Optional[int] = None
+        self.word_column: Optional[int] = None
+        self.header: Dict[int, str] = {}
+
+    def iter_words(self) -> Iterator[str]:
+        """
+        단어 열의 값을 정규화하여 순회합니다 (동음이의어 숫자 제거 포함).
+
+        Returns:
+            Iterator[str]: 정규화된 단어들
+        """
+        for value in self.iter_column_values():
+            word = normalize_excel_word(value)
+            if word:
+                yield word
+
+    def iter_column_values(self) -> Iterator[str]:
+        """
+        첫 번째 워크시트에서 단어 열의 원본 문자열 값을 순회합니다.
+        헤더 다음 10개 행에서 2글자 이상 텍스트가 가장 많은 열을 단어 열로 선택합니다.
+
+        Returns:
+            Iterator[str]: 단어 열의 문자열 값들
+        """
+        probe: List[Tuple[int, int, str]] = []
+        header_row: Optional[int] = None
+        self.word_column = None
+
+        cells = self._iter_text_cells()
+        for row, col, text in cells:
+            if header_row is None:
+                header_row = row
+            if row == header_row:
+                self.header[col] = text
+                continue
+            if row > header_row + _COLUMN_PROBE_ROWS:
+                self.word_column = self._choose_word_column(probe)
+                yield from (value for _, c, value in probe if c == self.word_column)
+                if col == self.word_column:
+                    yield text
+                break
+            probe.append((row, col, text))
+        else:
+            # 행 수가 적어 판별 구간을 다 채우지 못한 경우
+            self.word_column = self._choose_word_column(probe)
+            yield from (value for _, c, value in probe if c == self.word_column)
+            return
+
+        probe.clear()
+        word_column = self.word_column
+        for _, col, text in cells:
+            if col == word_column:
+                yield text
+
+    def _choose_word_column(self, probe: List[Tuple[int, int, str]]) -> int:
+        """판별 구간의 셀들로 단어 열을 선택합니다."""
+        text_counts: Dict[int, int] = {}
+        for _, col, text in probe:
+            text_counts.setdefault(col, 0)
+            if len(text.strip()) > 1:
+                text_counts[col] += 1
+
+        word_column = 0
+        max_text_count = 0
+        for col in sorted(text_counts):
+            if text_counts[col] > max_text_count:
+                max_text_count = text_counts[col]
+                word_column = col
+        return word_column
+
+    def _iter_text_cells(self) -> Iterator[Tuple[int, int, str]]:
+        """
+        첫 번째 워크시트의 텍스트 셀을 (행, 열, 문자열) 형태로 순회합니다.
+
+        단어 열이 정해진 뒤(self.word_column)에는 다른 열의 셀을 디코딩하지 않고 건너뜁니다.
+
+        Returns:
+            Iterator[Tuple[int, int, str]]: 텍스트 셀들
+        """
+        with open(self.file_path, 'rb') as f:
+            compound = CompoundFileReader(f)
+            stream_names = {entry[0] for entry in compound.list_streams()}
+            stream_name = 'Workbook' if 'Workbook' in stream_names else 'Book'
+            records = _RecordStream(compound.iter_stream(stream_name))
+
+            sst = self._read_workbook_globals(records, compound, stream_name)
+
+            # 첫 번째 워크시트 서브스트림 찾기
+            depth = 0
+            in_worksheet = False
+            while True:
+                record = records.next_record()
+                if record is None:
+                    return
+                record_id, data = record
+
+                if record_id == _RECORD_BOF:
+                    depth += 1
+                    if depth == 1:
+                        substream_type = struct.unpack_from('<H', data, 2)[0]
+                        in_worksheet = substream_type == _SUBSTREAM_WORKSHEET
+                    continue
+                if record_id == _RECORD_EOF:
+                    depth -= 1
+                    if depth == 0 and in_worksheet:
+                        return
+                    continue
+                if not in_worksheet or depth != 1:
+                    continue
+
+                if record_id == _RECORD_LABELSST:
+                    row, col, _, index = struct.unpack_from('<HHHI', data, 0)
+                    if index < len(sst) and self.word_column in (None, col):
+                        yield row, col, sst[index]
+                elif record_id in (_RECORD_LABEL, _RECORD_RSTRING):
+                    row, col = struct.unpack_from('<HH', data, 0)
+                    if self.word_column in (None, col):
+                        yield row, col, self._decode_label(data, 6)
+
+    def _read_workbook_globals(self, records: _RecordStream,
+                               compound: CompoundFileReader, stream_name: str) -> Sequence[str]:
+        """
+        워크북 전역 서브스트림에서 BIFF 버전, 코드 페이지, 공유 문자열 테이블을 읽습니다.
+
+        Args:
+            records (_RecordStream): 레코드 순회기
+            compound (CompoundFileReader): 공유 문자열을 나중에 다시 읽을 복합 문서
+            stream_name (str): 워크북 스트림 이름
+
+        Returns:
+            Sequence[str]: 지연 디코딩 공유 문자열 테이블 (BIFF5 이하는 빈 목록)
+        """
+        record = records.next_record()
+        if record is None or record[0] != _RECORD_BOF:
+            raise ValueError("BIFF 워크북 스트림이 아닙니다.")
+        self.biff_version = 8 if struct.unpack_from('<H', record[1], 0)[0] == 0x0600 else 5
+
+        sst: Sequence[str] = []
+        while True:
+            record = records.next_record()
+            if record is None:
+                raise ValueError("워크북 전역 영역이 손상되었습니다.")
+            record_id, data = record
+
+            if record_id == _RECORD_EOF:
+                return sst
+            if record_id == _RECORD_CODEPAGE:
+                self.codepage = struct.unpack_from('<H', data, 0)[0]
+            elif record_id == _RECORD_SST:
+                sst = self._read_sst(data, records, _SharedStringTable(compound, stream_name))
+
+    def _read_sst(self, data: bytes, records: _RecordStream,
+                  table: _SharedStringTable) -> _SharedStringTable:
+        """
+        SST 레코드와 뒤따르는 CONTINUE 레코드들을 순서대로 훑어 문자열 위치만 기록합니다.
+        문자는 디코딩하지 않고 건너뛰므로 메모리는 문자열 수에만 비례합니다.
+
+        Args:
+            data (bytes): SST 레코드 데이터
+            records (_RecordStream): 레코드 순회기
+            table (_SharedStringTable): 위치를 기록할 공유 문자열 테이블
+
+        Returns:
+            _SharedStringTable: 공유 문자열 테이블
+        """
+        unique_count = struct.unpack_from('<I', data, 4)[0]
+        table.segment_offsets.append(records.data_offset + 8)
+        table.segment_lengths.append(len(data) - 8)
+
+        def next_segment() -> Optional[bytes]:
+            record = records.next_record()
+            if record is None:
+                return None
+            if record[0] != _RECORD_CONTINUE:
+                records.push_back(record)
+                return None
+            table.segment_offsets.append(records.data_offset)
+            table.segment_lengths.append(len(record[1]))
+            return record[1]
+
+        reader = _ContinuedReader(data[8:], next_segment)
+        for _ in range(unique_count):
+            segment_index, position = reader.tell()
+            table.string_segments.append(segment_index)
+            table.string_positions.append(position)
+            reader.read_string(decode=False)
+
+        # 남은 CONTINUE 레코드 건너뛰기
+        while next_segment() is not None:
+            pass
+
+        return table
+
+    def _decode_label(self, data: bytes, offset: int) -> str:
+        """LABEL/RSTRING 레코드의 문자열을 디코딩합니다."""
+        char_count = struct.unpack_from('<H', data, offset)[0]
+        offset += 2
+
+        if self.biff_version == 8:
+            flags = data[offset]
+            offset += 1
+            if flags & 0x01:
+                return data[offset:offset + char_count * 2].decode('utf-16-le', errors='replace')
+            return data[offset:offset + char_count].decode('latin-1')
+
+        # BIFF5/7: 코드 페이지 바이트 문자열 (한국어 파일은 보통 CP949)
+        return data[offset:offset + char_count].decode(
+            _codec_for_codepage(self.codepage), errors='replace')
+
+
+def iter_xls_words(file_path: str) -> Iterator[str]:
+    """
+    .xls 어휘 파일에서 정규화된 단어를 하나씩 읽어옵니다.
+
+    Args:
+        file_path (str): .xls 파일 경로
+
+    Returns:
+        Iterator[str]: 정규화된 단어들
+    """
+    return XLSWordReader(file_path).iter_words()
@@ -6,13 +6,16 @@
 
 import time
 import os
-import re
 from typing import List, Optional
 
-from modules.models import GuessResult, GameSession
+from modules.models import GuessResult, GameSession, SubmitOutcome
 from modules.strategy_engine import StrategyEngine
 from modules.learning_engine import LearningEngine
 from modules.web_automation import WebAutomation, WebAutomationConfig
+from modules.vocabulary import (Vocabulary, VocabularyCache,
+                                normalize_excel_word, normalize_text_word)
+from modules.xls_reader import XLSWordReader
+from modules.rejected_words import RejectedWordFilter
 
 
 class SemanticSolver:
@@ -26,7 +29,13 @@ class SemanticSolver:
     def __init__(self, vocab_file: str = 'words.xls', 
                  learning_file: str = 'kkomantle_learning.json',
                  word_pairs_file: str = 'word_pairs.json',
-                 web_config: WebAutomationConfig = None):
+                 web_config: WebAutomationConfig = None,
+                 rejected_words_file: str = 'rejected_words.bloom',
+                 embedding_file: Optional[str] = None,
+                 embedding_quantization: str = 'float32',
+                 constraint_tolerance: float = 1.0,
+                 information_gain_budget: Optional[int] = None,
+                 game_backend=None):
         """
         솔버를 초기화합니다.
         
@@ -35,103 +44,118 @@ class SemanticSolver:
             learning_file (str): 학습 데이터 파일 경로
             word_pairs_file (str): 단어 쌍 데이터 파일 경로
             web_config (WebAutomationConfig): 웹 자동화 설정
+            rejected_words_file (str): 서버 거부 단어 필터 파일 경로
+            embedding_file (Optional[str]): 로컬 word2vec/fastText 임베딩 파일 경로 (None이면 사용 안 함)
+            embedding_quantization (str): 임베딩 저장 형식 ('float32', 'int8', 'pq')
+            constraint_tolerance (float): 관측 제약의 유사도 허용 오차 (임베딩이 있을 때만 사용)
+            information_gain_budget (Optional[int]): 기대 정보 이득 선택 모드의 결정당 계산 예산
+                (유사도 표 칸 수, None이면 사용 안 함, 임베딩이 있을 때만 사용)
+            game_backend: WebAutomation과 같은 인터페이스의 게임 백엔드
+                (예: 오프라인 SimulatedGame, 'http'이면 web_config.game_url의 추측 엔드포인트를
+                직접 호출하는 HTTPGameClient, None이면 셀레니움 웹 자동화)
         """
         print("🚀 의미 기반 지능형 꼬맨틀 솔버 초기화 중...")
         
         # 어휘 로드
+        self.vocab_load_stats = {'mode': 'default', 'seconds': 0.0}
         self.vocab = self._load_vocabulary(vocab_file)
         print(f"📚 어휘 로드 완료: {len(self.vocab)}개 단어")
         
+        self.constraint_tolerance = constraint_tolerance
+        
+        # 단어 ID 인터닝 테이블 (세션과 학습 데이터가 공유)
+        self.vocabulary = Vocabulary(self.vocab)
+        self.vocabulary.build_indexes(
+            jamo_tree_path=VocabularyCache().get_jamo_tree_path(vocab_file))
+        
+        # 단어 임베딩 (지정된 경우에만 numpy를 로드하고 어휘 ID 순서 행렬을 메모리 매핑)
+        if embedding_file:
+            self._load_embeddings(embedding_file, embedding_quantization)
+        
+        # 서버가 거부한 단어들 (게임 간 유지, 세션 시작 시 후보에서 제외)
+        self.rejected_words = RejectedWordFilter(rejected_words_file)
+        self.rejected_ids = self.rejected_words.find_rejected_ids(self.vocabulary)
+        if self.rejected_ids:
+            rejected_stats = self.rejected_words.get_stats()
+            print(f"🚫 거부 단어 필터: 후보 {len(self.rejected_ids)}개 제외 "
+                  f"(기록 {rejected_stats['entries']}개, "
+                  f"예상 오탐률 {rejected_stats['false_positive_rate'] * 100:.3f}%)")
+        
         # 핵심 구성 요소들 초기화
-        self.learning_engine = LearningEngine(learning_file, word_pairs_file)
-        self.strategy_engine = StrategyEngine(enable_logging=True)
-        self.web_automation = WebAutomation(web_config or WebAutomationConfig())
+        self.learning_engine = LearningEngine(learning_file, word_pairs_file,
+                                              vocabulary=self.vocabulary)
+        self.strategy_engine = StrategyEngine(
+            enable_logging=True,
+            information_gain_budget=(information_gain_budget
+                                     if self.vocabulary.embeddings is not None else None))
+        self.web_automation = self._create_game_backend(game_backend, web_config)
         
         # 현재 게임 세션
         self.current_session = None
         
         print("✅ 솔버 초기화 완료")
     
+    def _create_game_backend(self, game_backend, web_config: Optional[WebAutomationConfig]):
+        """
+        게임 백엔드를 만듭니다.
+        
+        Args:
+            game_backend: 게임 백엔드 객체, 'http', 'web' 또는 None
+            web_config (Optional[WebAutomationConfig]): 웹 자동화 설정 (게임 주소 포함)
+            
+        Returns:
+            WebAutomation과 같은 인터페이스의 게임 백엔드
+        """
+        web_config = web_config or WebAutomationConfig()
+        if game_backend is None or game_backend == 'web':
+            return WebAutomation(web_config)
+        if game_backend == 'http':
+            from modules.http_client import HTTPGameClient, HTTPGameClientConfig
+            return HTTPGameClient(HTTPGameClientConfig(game_url=web_config.game_url))
+        if isinstance(game_backend, str):
+            raise ValueError(f"지원하지 않는 게임 백엔드입니다: {game_backend}")
+        return game_backend
+    
     def _load_vocabulary(self, vocab_file: str) -> List[str]:
         """
         어휘 파일에서 단어 목록을 로드합니다.
         
+        컴파일된 어휘 캐시가 유효하면 원본 파싱 없이 캐시에서 바로 로드하고(웜 스타트),
+        원본 파일이나 정규화 규칙이 바뀌었으면 원본을 다시 읽어 캐시를 재생성합니다(콜드 스타트).
+        
         Args:
             vocab_file (str): 어휘 파일 경로 (.txt 또는 .xls/.xlsx)
             
         Returns:
             List[str]: 단어 목록
         """
+        start_time = time.perf_counter()
+        vocab_cache = VocabularyCache()
+        
         try:
-            if vocab_file.endswith(('.xls', '.xlsx')):
-                # Excel 파일 처리
-                import pandas as pd
-                
-                print(f"📊 Excel 파일에서 어휘 로드 중: {vocab_file}")
-                
-                # Excel 파일 읽기
-                df = pd.read_excel(vocab_file, engine='openpyxl' if vocab_file.endswith('.xlsx') else None)
-                
-                print(f"📋 Excel 파일 구조: {df.shape[0]}행 x {df.shape[1]}열")
-                print(f"📋 컬럼명: {list(df.columns)}")
-                
-                # 단어가 있는 열 찾기 (문자열이 많은 열)
-                word_column_idx = 0
-                max_text_count = 0
-                
-                for col_idx in range(df.shape[1]):
-                    column = df.iloc[:, col_idx]
-                    text_count = 0
-                    
-                    for value in column.head(10):  # 처음 10개만 확인
-                        if pd.notna(value) and isinstance(value, str) and len(value.strip()) > 1:
-                            text_count += 1
-                    
-                    print(f"📊 {col_idx}번 열: 텍스트 {text_count}개 (샘플: {column.dropna().head(3).tolist()})")
-                    
-                    if text_count > max_text_count:
-                        max_text_count = text_count
-                        word_column_idx = col_idx
-                
-                print(f"🎯 단어 열로 선택: {word_column_idx}번째 열")
-                
-                # 선택된 열에서 단어 추출
-                words = []
-                word_column = df.iloc[:, word_column_idx]
-                
-                for value in word_column:
-                    if pd.notna(value):  # NaN 값 제외
-                        word = str(value).strip()
-                        
-                        # 단어 뒤의 숫자 제거 (동음이의어 구분용)
-                        # 예: "사위01" -> "사위", "사이99" -> "사이"
-                        word = re.sub(r'\d+$', '', word).strip()
-                        
-                        # 빈 문자열, 주석, 순수 숫자 제외
-                        if (word and not word.startswith('[') and 
-                            not word.replace('.', '').isdigit() and
-                            len(word) > 1):  # 1글자 제외
-                            words.append(word)
-                
-                print(f"📈 Excel에서 {len(words)}개 단어 추출")
-                
-            else:
-                # 텍스트 파일 처리 (기존 로직)
-                print(f"📄 텍스트 파일에서 어휘 로드 중: {vocab_file}")
-                
-                with open(vocab_file, 'r', encoding='utf-8') as f:
-                    words = []
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('['):
-                            words.append(line)
+            cached_words = vocab_cache.load(vocab_file)
+            
+            if cached_words is not None:
+                elapsed = time.perf_counter() - start_time
+                self.vocab_load_stats = {'mode': 'warm', 'seconds': elapsed}
+                print(f"⚡ 컴파일된 어휘 캐시 사용 (웜 스타트): {elapsed * 1000:.1f}ms")
+                if not cached_words:
+                    raise ValueError("어휘 파일이 비어있습니다.")
+                return cached_words
+            
+            unique_words = self._read_vocabulary_source(vocab_file)
             
-            # 중복 제거 및 정렬
-            unique_words = sorted(list(set(words)))
+            # 빈 결과도 캐시에 기록하여 다음 실행에서 원본을 다시 파싱하지 않음
+            vocab_cache.save(vocab_file, unique_words)
             
             if not unique_words:
                 raise ValueError("어휘 파일이 비어있습니다.")
             
+            elapsed = time.perf_counter() - start_time
+            self.vocab_load_stats = {'mode': 'cold', 'seconds': elapsed}
+            print(f"🐢 원본 파일에서 어휘 로드 (콜드 스타트): {elapsed * 1000:.1f}ms "
+                  f"→ 캐시 컴파일: {vocab_cache.get_cache_path(vocab_file)}")
+            
             return unique_words
                 
         except FileNotFoundError:
@@ -145,6 +169,121 @@ class SemanticSolver:
             print("기본 어휘를 사용합니다.")
             return ["사랑", "시간", "사람", "생각", "마음", "세상", "문제", "사회"]
     
+    def _load_embeddings(self, embedding_file: str, quantization: str = 'float32') -> bool:
+        """
+        임베딩 파일을 로드하여 어휘에 연결합니다 (첫 실행 시 .npy로 변환, 이후 메모리 매핑).
+        
+        Args:
+            embedding_file (str): 임베딩 파일 경로
+            quantization (str): 저장 형식 ('float32', 'int8', 'pq')
+            
+        Returns:
+            bool: 로드 성공 여부
+        """
+        from modules.embeddings import EmbeddingStore
+        
+        start_time = time.perf_counter()
+        try:
+            embeddings = EmbeddingStore.load(embedding_file, self.vocabulary,
+                                             quantization=quantization)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ 임베딩 로드 실패: {e}")
+            return False
+        
+        self.vocabulary.embeddings = embeddings
+        elapsed = time.perf_counter() - start_time
+        print(f"🧭 임베딩 연결: {embeddings.coverage}/{len(embeddings)}개 단어, "
+              f"{embeddings.dim}차원, {quantization} ({elapsed * 1000:.1f}ms)")
+        
+        # 오프라인에서 구축한 ANN 색인이 있으면 근접어 검색에 사용 (build_embedding_index.py ivf)
+        if embeddings.load_ann_index():
+            print(f"🧭 ANN 색인 연결: 군집 {embeddings.ann_index.n_lists}개, "
+                  f"탐색 {embeddings.ann_index.n_probe}개")
+        
+        # 미리 계산한 근접어 표가 있으면 단어 근접어를 표에서 읽음 (build_embedding_index.py neighbors)
+        if embeddings.load_neighbor_table():
+            print(f"🧭 근접어 표 연결: 단어당 {embeddings.neighbor_table.k}개")
+        return True
+    
+    def _read_vocabulary_source(self, vocab_file: str) -> List[str]:
+        """
+        원본 어휘 파일을 파싱하여 정규화된 단어 목록을 만듭니다.
+        
+        Args:
+            vocab_file (str): 어휘 파일 경로 (.txt 또는 .xls/.xlsx)
+            
+        Returns:
+            List[str]: 중복 제거 및 정렬된 단어 목록
+        """
+        if vocab_file.endswith('.xls'):
+            # 레거시 BIFF .xls 파일은 pandas 없이 레코드 단위로 스트리밍
+            print(f"📊 Excel(.xls) 파일에서 어휘 스트리밍 로드 중: {vocab_file}")
+            
+            reader = XLSWordReader(vocab_file)
+            words = list(reader.iter_words())
+            
+            print(f"📋 BIFF{reader.biff_version} 형식, 컬럼명: {list(reader.header.values())}")
+            print(f"🎯 단어 열로 선택: {reader.word_column}번째 열")
+            print(f"📈 Excel에서 {len(words)}개 단어 추출")
+            
+        elif vocab_file.endswith('.xlsx'):
+            # Excel 파일 처리
+            import pandas as pd
+            
+            print(f"📊 Excel 파일에서 어휘 로드 중: {vocab_file}")
+            
+            # Excel 파일 읽기
+            df = pd.read_excel(vocab_file, engine='openpyxl')
+            
+            print(f"📋 Excel 파일 구조: {df.shape[0]}행 x {df.shape[1]}열")
+            print(f"📋 컬럼명: {list(df.columns)}")
+            
+            # 단어가 있는 열 찾기 (문자열이 많은 열)
+            word_column_idx = 0
+            max_text_count = 0
+            
+            for col_idx in range(df.shape[1]):
+                column = df.iloc[:, col_idx]
+                text_count = 0
+                
+                for value in column.head(10):  # 처음 10개만 확인
+                    if pd.notna(value) and isinstance(value, str) and len(value.strip()) > 1:
+                        text_count += 1
+                
+                print(f"📊 {col_idx}번 열: 텍스트 {text_count}개 (샘플: {column.dropna().head(3).tolist()})")
+                
+                if text_count > max_text_count:
+                    max_text_count = text_count
+                    word_column_idx = col_idx
+            
+            print(f"🎯 단어 열로 선택: {word_column_idx}번째 열")
+            
+            # 선택된 열에서 단어 추출
+            words = []
+            word_column = df.iloc[:, word_column_idx]
+            
+            for value in word_column:
+                if pd.notna(value):  # NaN 값 제외
+                    word = normalize_excel_word(value)
+                    if word:
+                        words.append(word)
+            
+            print(f"📈 Excel에서 {len(words)}개 단어 추출")
+            
+        else:
+            # 텍스트 파일 처리 (기존 로직)
+            print(f"📄 텍스트 파일에서 어휘 로드 중: {vocab_file}")
+            
+            with open(vocab_file, 'r', encoding='utf-8') as f:
+                words = []
+                for line in f:
+                    word = normalize_text_word(line)
+                    if word:
+                        words.append(word)
+        
+        # 중복 제거 및 정렬
+        return sorted(list(set(words)))
+    
     # def _remove_word_from_vocab(self, word: str) -> None:
     #     """
     #     어휘에서 실패한 단어를 제거합니다. (현재 비활성화됨)
@@ -162,7 +301,24 @@ class SemanticSolver:
         Returns:
             GameSession: 새로운 게임 세션 객체
         """
-        self.current_session = GameSession()
+        self.current_session = GameSession(self.vocabulary)
+        
+        # 무작위 탐색은 학습된 효과성에 비례하는 가중치 샘플러 사용
+        self.current_session.available.set_weights(
+            self.learning_engine.get_exploration_weights(self.vocabulary.base_size))
+        
+        # 이전 게임에서 서버가 거부한 단어는 제안하지 않음
+        for word_id in self.rejected_ids:
+            self.current_session.available.discard(word_id)
+        
+        # 임베딩이 있으면 관측 유사도마다 정답 후보를 좁히는 제약과 정답 벡터 추정기 연결
+        if self.vocabulary.embeddings is not None:
+            from modules.constraints import CandidateConstraints
+            from modules.target_estimator import TargetEstimator
+            self.current_session.constraints = CandidateConstraints(
+                self.vocabulary.embeddings, self.constraint_tolerance)
+            self.current_session.target_estimator = TargetEstimator(self.vocabulary.embeddings)
+        
         print(f"🎮 새로운 게임 세션 시작 (세션 ID: {id(self.current_session)})")
         return self.current_session
     
@@ -209,10 +365,16 @@ class SemanticSolver:
                 print(f"🎯 시도 {attempt}: '{next_word}'")
             
             # 단어 제출
-            if not self.web_automation.submit_word(next_word):
-                print("❌ 단어 제출 실패. 다음 단어로 계속...")
-                # 제출 실패한 단어도 tried_words에 추가하여 재시도 방지
-                session.tried_words.add(next_word)
+            outcome = self.web_automation.submit_word(next_word)
+            if not outcome:
+                if outcome is SubmitOutcome.UNKNOWN_WORD:
+                    # 게임이 모르는 단어라고 응답한 경우만 거부 목록에 기록하여 이후 게임에서도 재시도 방지
+                    print("🚫 게임이 모르는 단어입니다. 다음 단어로 계속...")
+                    self._reject_word(session, next_word)
+                else:
+                    # 네트워크나 일시적 문제일 수 있으므로 이번 세션에서만 건너뜀
+                    print("❌ 단어 제출 실패. 다음 단어로 계속...")
+                    session.mark_tried(next_word)
                 continue
             
             # 결과 파싱
@@ -220,8 +382,8 @@ class SemanticSolver:
             
             if not result:
                 print(f"❌ 단어 '{next_word}' 결과 파싱 실패 - 다음 단어로 계속")
-                # 파싱 실패한 단어도 tried_words에 추가하여 재시도 방지
-                session.tried_words.add(next_word)
+                # 파싱 실패는 대기 시간 초과나 느린 페이지 때문일 수 있으므로 이번 세션에서만 건너뜀
+                session.mark_tried(next_word)
                 continue
             
             # 세션에 결과 추가
@@ -292,6 +454,20 @@ class SemanticSolver:
         
         return None
     
+    def _reject_word(self, session: GameSession, word: str) -> None:
+        """
+        게임이 모르는 단어를 세션과 영구 거부 목록에 기록합니다.
+        
+        Args:
+            session (GameSession): 현재 게임 세션
+            word (str): 거부된 단어
+        """
+        word_id = session.mark_tried(word)
+        
+        if self.rejected_words.add(word):
+            self.rejected_ids.append(word_id)
+            self.rejected_words.save()
+    
     def _setup_and_connect(self) -> bool:
         """
         웹 브라우저를 설정하고 게임 사이트에 접속합니다.
@@ -319,24 +495,20 @@ class SemanticSolver:
         Returns:
             Optional[str]: 선택된 단어
         """
-        # 사용 가능한 어휘 확인
-        available_vocab = [word for word in self.vocab 
-                          if word not in session.tried_words]
+        # 사용 가능한 어휘 확인 (세션이 추측마다 O(1)로 갱신하는 뷰)
+        available_vocab = session.available
         
         if not available_vocab:
             return None
         
-        # 학습 데이터 준비
-        learned_data = {
-            'word_frequency': self.learning_engine.learning_data.get('word_frequency', {}),
-            'word_pairs': self.learning_engine.word_pairs
-        }
+        # 학습 데이터 준비 (단어 ID 기준)
+        learned_data = self.learning_engine.get_learned_data()
         
-        # 전략 엔진을 통한 단어 선택
-        selected_word = self.strategy_engine.select_next_word(
+        # 전략 엔진을 통한 단어 선택 (문자열 변환은 웹 제출 직전에만)
+        selected_id = self.strategy_engine.select_next_word_id(
             session, available_vocab, learned_data)
         
-        return selected_word
+        return self.vocabulary.get_word(selected_id) if selected_id is not None else None
     
     def _show_progress(self, session: GameSession, current_attempt: int) -> None:
         """
@@ -359,6 +531,10 @@ class SemanticSolver:
         for i, guess in enumerate(top_guesses, 1):
             print(f"   {i}. {guess.word}: {guess.similarity:.4f} ({guess.rank})")
         
+        # 관측 일관 후보 수
+        if session.surviving_counts:
+            print(f"🔎 관측 일관 후보: {session.surviving_counts[-1]}개")
+        
         # 전략 사용 현황
         if session.strategy_history:
             recent_strategies = session.strategy_history[-3:]
@@ -461,14 +637,11 @@ class SemanticSolver:
             return available[:count]
         
         recommendations = []
-        available_vocab = [word for word in self.vocab 
-                          if word not in self.current_session.tried_words]
+        # 추천 중복 방지를 위해 세션 뷰의 복사본 사용
+        available_vocab = self.current_session.available.copy()
         
-        # 학습 데이터 준비
-        learned_data = {
-            'word_frequency': self.learning_engine.learning_data.get('word_frequency', {}),
-            'word_pairs': self.learning_engine.word_pairs
-        }
+        # 학습 데이터 준비 (단어 ID 기준)
+        learned_data = self.learning_engine.get_learned_data()
         
         # 여러 전략으로 추천 단어 수집
         try:
@@ -478,7 +651,7 @@ class SemanticSolver:
                 
                 if word and word not in recommendations:
                     recommendations.append(word)
-                    available_vocab.remove(word)  # 중복 방지
+                    available_vocab.discard_word(word)  # 중복 방지
                 
                 if len(recommendations) >= count:
                     break
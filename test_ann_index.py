@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+근사 최근접 이웃 색인 테스트
+IVF 색인 검색의 재현율이 전수 비교 대비 충분한지, 저장 후 다시 열어도 같은지 검증합니다.
+"""
+
+import numpy as np
+
+from modules.ann_index import IVFIndex, evaluate_recall
+from modules.embeddings import EmbeddingStore
+from modules.vocabulary import AvailableVocabulary, Vocabulary
+
+WORDS = 3000
+DIM = 24
+
+
+def _embeddings(seed: int = 6) -> EmbeddingStore:
+    rng = np.random.default_rng(seed)
+    # 군집 구조가 있는 단위 벡터 (일부 단어는 벡터 없음)
+    centers = rng.standard_normal((40, DIM))
+    vectors = centers[rng.integers(0, 40, WORDS)] + 0.5 * rng.standard_normal((WORDS, DIM))
+    vectors = (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+    present = np.ones(WORDS, dtype=bool)
+    present[rng.choice(WORDS, 50, replace=False)] = False
+    vectors[~present] = 0.0
+    return EmbeddingStore(vectors, present, Vocabulary([f"단어{i}" for i in range(WORDS)]))
+
+
+def test_ivf_recall_against_exact_top_k():
+    """탐색 군집을 늘리면 재현율이 오르고, 전체 군집을 탐색하면 전수 비교와 같은지 확인합니다."""
+    embeddings = _embeddings()
+    index = IVFIndex.build(embeddings, n_lists=32, n_probe=4)
+    query_ids = np.flatnonzero(embeddings.present)[::37]
+
+    report = evaluate_recall(index, embeddings, query_ids, k=10, n_probes=(1, 4, 32))
+    recall = {row['n_probe']: row['recall'] for row in report}
+    assert recall[1] <= recall[4] <= recall[32]
+    assert recall[4] >= 0.85
+    assert recall[32] == 1.0
+
+    # 전체 벡터가 역리스트에 한 번씩만 들어 있음
+    assert sorted(index.list_ids.tolist()) == np.flatnonzero(embeddings.present).tolist()
+
+
+def test_store_top_k_uses_index_with_mask(tmp_path):
+    """저장소에 연결된 색인이 허용 마스크와 질의 단어 제외를 지키고, 저장 후 다시 열어도 같은 결과를 내는지 확인합니다."""
+    embeddings = _embeddings()
+    index = IVFIndex.build(embeddings, n_lists=32, n_probe=32)
+    path = str(tmp_path / "vectors.ivf.npz")
+    assert index.save(path)
+    embeddings.ann_index = IVFIndex.load(path)
+    assert embeddings.ann_index.n_lists == 32
+
+    query = 11
+    available = AvailableVocabulary(embeddings.vocabulary, range(1, WORDS, 2))
+    found = embeddings.top_k(query, 10, available)
+    exact = embeddings.top_k(query, 10, available, exact=True)
+    assert len(found) == 10
+    assert [word_id for word_id, _ in found] == [word_id for word_id, _ in exact]
+    assert all(word_id % 2 == 1 and word_id != query and embeddings.present[word_id]
+               for word_id, _ in found)
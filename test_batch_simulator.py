@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+묶음 시뮬레이터 테스트
+유사도/순위가 단일 시뮬레이션 게임과 같은지, 게임 모델에 없는 단어의 거부와
+묶음 허용 오차 넓히기, 추측마다의 학습 기록을 검증합니다.
+"""
+
+import contextlib
+import os
+
+import numpy as np
+import pytest
+
+from modules.batch_simulator import BatchSimulator
+from modules.constraints import CandidateConstraints
+from modules.embeddings import EmbeddingStore
+from modules.learning_engine import LearningEngine
+from modules.simulated_game import SimulatedGame, SimulatedGameConfig
+from modules.vocabulary import Vocabulary
+
+WORDS = 400
+
+
+def _vocabulary(seed: int = 5, words: int = WORDS) -> Vocabulary:
+    vocabulary = Vocabulary([f"단어{i}" for i in range(words)])
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((words, 16)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    vocabulary.embeddings = EmbeddingStore(vectors, np.ones(words, dtype=bool), vocabulary)
+    return vocabulary
+
+
+class _ScriptedSimulator(BatchSimulator):
+    """전략 엔진 대신 정해 둔 단어 ID를 단계마다 제안하는 시뮬레이터"""
+
+    def __init__(self, vocabulary: Vocabulary, script, **kwargs):
+        super().__init__(vocabulary, **kwargs)
+        self.script = list(script)
+
+    def _select_guesses(self, sessions, active, learned_data):
+        return np.array([self.script.pop(0)] * len(active), dtype=np.int64)
+
+
+def test_similarity_and_rank_match_simulated_game():
+    """묶음 유사도/순위가 같은 정답의 SimulatedGame.score_word()와 같은지 확인합니다."""
+    vocabulary = _vocabulary(words=1500)
+    embeddings = vocabulary.embeddings
+    simulator = BatchSimulator(vocabulary)
+    targets = np.array([123, 7, 1499])
+    rank_ids = simulator._rank_table(targets)
+
+    for row, target in enumerate(targets):
+        game = SimulatedGame(vocabulary, SimulatedGameConfig(target_word=f"단어{target}"),
+                             embeddings=embeddings)
+        assert game.navigate_to_game()
+
+        # 1위는 정답 자신을 제외한 가장 가까운 단어
+        nearest = embeddings.top_k(int(target), 1, exact=True)[0][0]
+        assert rank_ids[row, 0] == nearest and target not in rank_ids[row]
+
+        guesses = np.arange(0, 1500, 3)
+        similarities = simulator._similarities(guesses, np.full(len(guesses), target))
+        ranks = simulator._ranks(np.repeat(rank_ids[row:row + 1], len(guesses), axis=0), guesses)
+        for word_id, similarity, rank in zip(guesses, similarities, ranks):
+            if word_id == target:
+                continue
+            cosine, expected_rank = game.score_word(f"단어{word_id}")
+            assert similarity == pytest.approx(max(round(cosine * 100.0, 2), 0.0), abs=0.011)
+            assert rank == (expected_rank or 0)
+        assert (ranks == 0).any() and (ranks > 0).any()
+
+
+def test_unknown_guesses_are_rejected_without_an_attempt():
+    """게임 모델에 벡터가 없는 단어는 시도로 세지 않고 거부한 뒤 다음 단어로 진행하는지 확인합니다."""
+    vocabulary = _vocabulary()
+    game_vectors = np.array(vocabulary.embeddings.vectors)
+    game_vectors[9] = 0.0
+    simulator = _ScriptedSimulator(vocabulary, [9, 9, 5, 42], game_vectors=game_vectors)
+
+    result, = simulator.run([42], max_attempts=10)
+    assert (result.rejected, result.attempts, result.solved) == (2, 2, True)
+    assert result.best_similarity == 100.0
+
+
+def test_grouped_widening_matches_immediate_widening():
+    """여러 게임의 허용 오차 넓히기를 묶어 계산해도 게임마다 바로 넓힌 결과와 같은지 확인합니다."""
+    vocabulary = _vocabulary()
+    embeddings = vocabulary.embeddings
+    simulator = BatchSimulator(vocabulary)
+    rng = np.random.default_rng(12)
+    games = []
+    for target in (3, 77, 150, 300, 399):
+        guesses = rng.choice(WORDS, 30, replace=False)
+        truth = embeddings.similarities(guesses.tolist(), [target])[:, 0] * 100.0
+        observed = np.maximum(truth + rng.normal(0.0, 1.5, len(truth)), 0.0)
+        observed[rng.choice(30, 3, replace=False)] = 99.0  # 모순 관측
+        deferred = CandidateConstraints(embeddings, max_tolerance=16.0)
+        deferred.defer_widening = True
+        games.append((deferred, CandidateConstraints(embeddings, max_tolerance=16.0),
+                      list(zip(guesses.tolist(), np.round(observed, 2).tolist()))))
+
+    widened = 0
+    for step in range(30):
+        for deferred, immediate, observations in games:
+            word_id, similarity = observations[step]
+            deferred.observe(word_id, similarity)
+            immediate.observe(word_id, similarity)
+        widened += sum(deferred.pending_widening for deferred, _, _ in games)
+        # 묶음 크기가 작아 여러 묶음과 혼자 넓히는 게임이 모두 나옴
+        simulator._widen_constraints([deferred for deferred, _, _ in games], chunk_size=24)
+
+        for deferred, immediate, _ in games:
+            assert not deferred.pending_widening
+            assert deferred.tolerance == immediate.tolerance
+            assert np.array_equal(deferred.candidate_ids, immediate.candidate_ids)
+            assert deferred.inconsistent_observations == immediate.inconsistent_observations
+    assert widened > 0
+
+
+def test_recorder_learns_from_each_new_guess():
+    """게임의 추측마다 빈도가 한 번씩, 추측 쌍마다 관계가 한 번씩 기록되는지 확인합니다."""
+    vocabulary = _vocabulary()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        recorder = LearningEngine('', '', vocabulary=vocabulary)
+        simulator = BatchSimulator(vocabulary, learning_recorder=recorder)
+        result, = simulator.run([123], max_attempts=8)
+
+    attempts = result.attempts
+    assert attempts >= 2
+    assert len(recorder.word_frequency) == attempts
+    assert all(data['count'] == 1 for data in recorder.word_frequency.values())
+    assert len(recorder.word_pairs) == attempts * (attempts - 1) // 2
+    assert (max(data['best_similarity'] for data in recorder.word_frequency.values())
+            == result.best_similarity)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+후보 점수 계산 테스트
+묶음 점수가 단어별 중첩 루프로 계산하던 점수와 같은지,
+음절 역색인으로 센 공통 음절 수가 음절 코드 행렬 비교와 같은지 검증합니다.
+"""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from modules.candidate_scoring import CandidateScorer
+from modules.models import GameSession, GuessResult
+from modules.vocabulary import Vocabulary, pack_pair
+
+SYLLABLES = "가나다라마바사아자차카"
+
+
+def _random_words(count: int, seed: int = 8):
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        # 같은 음절이 반복되는 단어도 섞이도록 좁은 음절 집합에서 뽑음
+        words.add(''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 6))))
+    return sorted(words)
+
+
+def test_indexed_counts_match_matrix_counts():
+    """역색인과 행렬 비교가 반복 음절, 중복 후보, 구축 후 인터닝된 단어에서 같은 값을 내는지 확인합니다."""
+    vocabulary = Vocabulary(_random_words(3000))
+    scorer = CandidateScorer(vocabulary)
+    rng = np.random.default_rng(1)
+    ids = scorer.as_ids(rng.integers(0, len(vocabulary), 1200))
+
+    for word in ("가가나", "다라마바", "차", "하하"):
+        codes, first_occurrence = scorer.gather(ids)
+        expected = np.array([len(set(vocabulary.get_word(int(word_id))) & set(word))
+                             for word_id in ids])
+        assert np.array_equal(scorer.shared_syllable_counts(word, codes, first_occurrence),
+                              expected)
+        assert np.array_equal(scorer.indexed_syllable_counts(word, ids), expected)
+        assert np.array_equal(scorer.overlap_counts(word, ids, codes, first_occurrence), expected)
+
+    # 역색인 구축 이후 인터닝된 긴 단어도 다음 조회에 반영
+    new_id = vocabulary.intern("가나다라마바사아자차카")
+    ids = scorer.as_ids([new_id, 0, new_id])
+    assert scorer.indexed_syllable_counts("카가", ids)[0] == 2
+    assert new_id in scorer.syllable_postings("카")
+
+
+def _reference_gradient(word_id, session, learned_data):
+    """예전 SemanticGradientSearch._score_candidates의 단어별 점수 (임베딩 제외)"""
+    word = session.vocabulary.get_word(word_id)
+    score = 0.0
+    freq_data = learned_data['word_frequency'].get(word_id)
+    if freq_data is not None:
+        score += freq_data['avg_similarity'] * math.log(freq_data['count'] + 1) * 5
+
+    for guess in session.get_top_guesses(3):
+        pair_data = learned_data['word_pairs'].get(pack_pair(guess.word_id, word_id))
+        if pair_data is not None and pair_data['similarity_diffs']:
+            avg_diff = sum(pair_data['similarity_diffs']) / len(pair_data['similarity_diffs'])
+            score += (1 - avg_diff / 100) * guess.similarity * 3
+
+    for guess in session.guesses[-5:]:
+        if len(word) > 2 and len(guess.word) > 2:
+            common_prefix_len = 0
+            for i in range(min(len(word), len(guess.word))):
+                if word[i] != guess.word[i]:
+                    break
+                common_prefix_len += 1
+            if common_prefix_len >= 2:
+                score += guess.similarity * common_prefix_len
+
+    recent_words = [g.word for g in session.guesses[-3:]]
+    if recent_words:
+        overlap = 0.0
+        for recent in recent_words:
+            if len(word) > 2 and len(recent) > 2:
+                overlap += len(set(word) & set(recent)) / max(len(word), len(recent))
+        if 0.2 < overlap / len(recent_words) < 0.7:
+            score += 1
+    return score
+
+
+def _reference_focused(word_id, best_guess, session, learned_data):
+    """예전 FocusedSemanticSearch._score_focused_candidates의 단어별 점수"""
+    word = session.vocabulary.get_word(word_id)
+    score = 0.0
+    pair_data = learned_data['word_pairs'].get(pack_pair(best_guess.word_id, word_id))
+    if pair_data is not None and pair_data['similarity_diffs']:
+        avg_diff = sum(pair_data['similarity_diffs']) / len(pair_data['similarity_diffs'])
+        if avg_diff < 5:
+            score += 10 * (1 - avg_diff / 100)
+
+    recent_guesses = session.guesses[-5:]
+    if len(recent_guesses) >= 2:
+        gradient = (recent_guesses[-1].similarity - recent_guesses[0].similarity) / len(recent_guesses)
+        if gradient > 0:
+            score += gradient * 5
+
+    if len(word) > 2 and len(best_guess.word) > 2:
+        shared = len(set(word) & set(best_guess.word))
+        score += shared / max(len(word), len(best_guess.word)) * best_guess.similarity * 3
+    return score
+
+
+def _scoring_fixture():
+    vocabulary = Vocabulary(_random_words(3000, seed=21))
+    session = GameSession(vocabulary)
+    rng = random.Random(4)
+    guess_words = rng.sample([w for w in vocabulary.words if len(w) > 2], 7)
+    for attempt, word in enumerate(guess_words, 1):
+        session.add_guess(GuessResult(word, rng.uniform(5.0, 45.0), "1000위 이상", attempt))
+
+    # 학습 데이터: 상위 추측과 쌍을 이루는 단어들, 빈도 기록
+    word_frequency, word_pairs, pair_partners = {}, {}, {}
+    for word_id in rng.sample(range(len(vocabulary)), 300):
+        word_frequency[word_id] = {'avg_similarity': rng.uniform(0, 40), 'count': rng.randint(1, 9)}
+    for guess in session.guesses:
+        for word_id in rng.sample(range(len(vocabulary)), 80):
+            if word_id == guess.word_id:
+                continue
+            diffs = [rng.uniform(0, 12) for _ in range(rng.randint(1, 3))]
+            word_pairs[pack_pair(guess.word_id, word_id)] = {'similarity_diffs': diffs}
+            pair_partners.setdefault(guess.word_id, set()).add(word_id)
+            pair_partners.setdefault(word_id, set()).add(guess.word_id)
+    learned_data = {'word_frequency': word_frequency, 'word_pairs': word_pairs,
+                    'pair_partners': pair_partners}
+    candidates = sorted(set(range(len(vocabulary))) - session.tried_ids)
+    return vocabulary, session, learned_data, candidates
+
+
+@pytest.mark.parametrize("count", [40, 1200])
+def test_batch_scores_match_nested_loops(count):
+    """경사/집중 탐색 묶음 점수가 단어별 중첩 루프 점수와 같은지 확인합니다 (역색인 경로 포함)."""
+    vocabulary, session, learned_data, candidates = _scoring_fixture()
+    candidates = random.Random(count).sample(candidates, count)
+    scorer = CandidateScorer(vocabulary)
+
+    gradient = scorer.score_gradient(candidates, session, learned_data)
+    expected = [_reference_gradient(word_id, session, learned_data) for word_id in candidates]
+    assert gradient == pytest.approx(expected)
+    assert np.count_nonzero(gradient) > count // 10
+
+    best_guess = session.guesses[0]
+    focused = scorer.score_focused(candidates, best_guess, session, learned_data)
+    expected = [_reference_focused(word_id, best_guess, session, learned_data)
+                for word_id in candidates]
+    assert focused == pytest.approx(expected)
+
+    ranked = CandidateScorer.top_k(candidates, focused, 5)
+    assert [score for _, score in ranked] == pytest.approx(sorted(expected, reverse=True)[:5])
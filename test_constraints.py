@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+관측 제약 테스트
+묶음 훑기로 허용 오차를 넓히는 결과가 관측을 다시 적용하던 방식과 같은지 검증합니다.
+"""
+
+import numpy as np
+import pytest
+
+from modules.constraints import CandidateConstraints
+from modules.embeddings import EmbeddingStore
+from modules.vocabulary import Vocabulary
+
+WORDS = 3000
+TARGET = 17
+
+
+class _ReplayConstraints(CandidateConstraints):
+    """허용 오차를 넓힐 때마다 모든 관측을 처음부터 다시 적용하는 기준 구현"""
+
+    def _widen(self, chunk_size: int = 64, scores=None) -> None:
+        while self.tolerance < self.max_tolerance:
+            self.tolerance = min(self.tolerance * 2, self.max_tolerance)
+            self._reset()
+            if all(self._apply(word_id, similarity) for word_id, similarity in self.observations):
+                self.inconsistent_observations = 0
+                return
+
+        self._reset()
+        self.inconsistent_observations = sum(
+            not self._apply(word_id, similarity) for word_id, similarity in self.observations)
+
+
+def _embeddings(seed: int = 3) -> EmbeddingStore:
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((WORDS, 32)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    present = np.ones(WORDS, dtype=bool)
+    present[rng.choice(WORDS, 20, replace=False)] = False
+    present[TARGET] = True
+    vectors[~present] = 0.0
+    return EmbeddingStore(vectors, present, Vocabulary([f"단어{i}" for i in range(WORDS)]))
+
+
+def _recorded_observations(embeddings: EmbeddingStore, seed: int = 11):
+    """잡음 섞인 관측과 서로 모순되는 관측이 섞인 추측 기록을 만듭니다."""
+    rng = np.random.default_rng(seed)
+    guesses = rng.choice(WORDS, 40, replace=False)
+    truth = embeddings.similarities(guesses.tolist(), [TARGET])[:, 0] * 100.0
+    observed = np.maximum(truth + rng.normal(0.0, 2.5, len(truth)), 0.0)
+    observed[[9, 23, 31]] = [99.0, 98.5, 97.0]  # 어떤 후보와도 맞지 않는 관측
+    return [(int(word_id), round(float(similarity), 2))
+            for word_id, similarity in zip(guesses, observed)]
+
+
+@pytest.mark.parametrize("max_tolerance", [16.0, 4.0])
+def test_batched_widen_matches_replay(max_tolerance):
+    """관측마다 후보 수, 허용 오차, 후보 ID, 모순 관측 수가 다시 적용한 결과와 같은지 확인합니다."""
+    embeddings = _embeddings()
+    batched = CandidateConstraints(embeddings, max_tolerance=max_tolerance)
+    replay = _ReplayConstraints(embeddings, max_tolerance=max_tolerance)
+    widened = 0
+
+    for word_id, similarity in _recorded_observations(embeddings):
+        tolerance = batched.tolerance
+        assert batched.observe(word_id, similarity) == replay.observe(word_id, similarity)
+        widened += batched.tolerance != tolerance
+
+        assert batched.tolerance == replay.tolerance
+        assert np.array_equal(batched.candidate_ids, replay.candidate_ids)
+        assert batched.inconsistent_observations == replay.inconsistent_observations
+        assert batched.applied_observations == replay.applied_observations
+        assert batched.skipped_observations == replay.skipped_observations
+        assert batched.fit_errors == pytest.approx(replay.fit_errors, rel=1e-4, abs=1e-3)
+
+    assert widened > 0
+    assert batched.surviving_counts == replay.surviving_counts
+    if max_tolerance == 4.0:
+        # 최대 허용 오차로도 모순되는 관측을 건너뛴 경로까지 비교되어야 함
+        assert batched.inconsistent_observations > 0
+
+
+def test_deferred_widen_with_precomputed_rows():
+    """넓히기를 미루고 묶음으로 계산한 관측 행을 넘겨도 바로 넓힌 결과와 같은지 확인합니다."""
+    embeddings = _embeddings()
+    immediate = CandidateConstraints(embeddings)
+    deferred = CandidateConstraints(embeddings)
+    deferred.defer_widening = True
+
+    for word_id, similarity in _recorded_observations(embeddings):
+        immediate.observe(word_id, similarity)
+        deferred.observe(word_id, similarity)
+        if deferred.pending_widening:
+            rows = embeddings.similarities([w for w, _ in deferred.observations])
+            with pytest.raises(ValueError):
+                deferred.widen(rows[1:])
+            assert deferred.widen(rows) == immediate.count
+        assert not deferred.pending_widening
+
+        assert deferred.tolerance == immediate.tolerance
+        assert np.array_equal(deferred.candidate_ids, immediate.candidate_ids)
+        assert deferred.inconsistent_observations == immediate.inconsistent_observations
+
+    assert deferred.surviving_counts == immediate.surviving_counts
+
+
+def test_successful_widen_resets_inconsistent_count():
+    """넓힌 허용 오차로 모든 관측이 일관되면 모순 관측 수를 0으로 되돌리는지 확인합니다."""
+    embeddings = _embeddings()
+    constraints = CandidateConstraints(embeddings, tolerance=0.5, max_tolerance=128.0)
+    constraints.inconsistent_observations = 3
+    word_id = next(i for i in range(WORDS) if i != TARGET and embeddings.has_vector(i))
+
+    # 추측 단어 자신 외에는 어떤 후보도 0.5 안에 들지 않는 관측
+    constraints.observe(word_id, 100.0)
+
+    assert constraints.tolerance > 0.5
+    assert constraints.inconsistent_observations == 0
+    assert constraints.count > 0 and word_id not in constraints.candidate_ids
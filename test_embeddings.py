@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+임베딩 저장소 테스트
+word2vec 바이너리/텍스트 읽기, 캐시 키별 변환 결과 정리, 근접어 표 이어 구축을 검증합니다.
+"""
+
+import os
+import struct
+
+import numpy as np
+
+from modules.embeddings import EmbeddingStore, _iter_source_vectors
+from modules.neighbor_table import NeighborTable, _build_block
+from modules.vocabulary import Vocabulary
+
+DIM = 4
+SOURCE_WORDS = ["사과", "바나나", "없는단어", "포도", "배"]
+
+
+def _source_vectors() -> np.ndarray:
+    rng = np.random.default_rng(2)
+    return rng.standard_normal((len(SOURCE_WORDS), DIM)).astype(np.float32)
+
+
+def _write_text(path) -> str:
+    lines = [f"{len(SOURCE_WORDS)} {DIM}"]
+    for word, vector in zip(SOURCE_WORDS, _source_vectors()):
+        lines.append(word + " " + " ".join(repr(float(value)) for value in vector))
+    path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    return str(path)
+
+
+def _write_binary(path) -> str:
+    data = bytearray(f"{len(SOURCE_WORDS)} {DIM}\n".encode('utf-8'))
+    for word, vector in zip(SOURCE_WORDS, _source_vectors()):
+        # word2vec 형식: 단어, 공백, 리틀 엔디언 float32 벡터, 줄바꿈
+        data += word.encode('utf-8') + b' ' + struct.pack(f'<{DIM}f', *vector) + b'\n'
+    path.write_bytes(bytes(data))
+    return str(path)
+
+
+def _read(source_file: str, vocabulary: Vocabulary, **kwargs):
+    vectors = _iter_source_vectors(source_file, vocabulary, **kwargs)
+    dim = next(vectors)
+    return dim, [(word_id, vector.tolist()) for word_id, vector in vectors]
+
+
+def test_binary_reader_matches_text_across_chunks(tmp_path):
+    """바이너리 읽기가 읽기 단위 경계와 관계없이 텍스트 형식과 같은 벡터를 내는지 확인합니다."""
+    vocabulary = Vocabulary(["배", "사과", "포도", "바나나"])
+    expected = _read(_write_text(tmp_path / "vectors.vec"), vocabulary)
+    binary = _write_binary(tmp_path / "vectors.bin")
+
+    assert expected[0] == DIM and len(expected[1]) == 4
+    for chunk_size in (1, 5, 7, 64, 1 << 20):
+        assert _read(binary, vocabulary, chunk_size=chunk_size) == expected
+
+
+def test_binary_reader_stops_at_truncated_record(tmp_path):
+    """마지막 벡터가 잘린 파일은 온전한 단어까지만 읽는지 확인합니다."""
+    binary = tmp_path / "vectors.bin"
+    _write_binary(binary)
+    binary.write_bytes(binary.read_bytes()[:-6])
+
+    dim, vectors = _read(str(binary), Vocabulary(SOURCE_WORDS), chunk_size=3)
+    assert dim == DIM
+    assert [word_id for word_id, _ in vectors] == [0, 1, 2, 3]
+
+
+def test_conversion_keeps_caches_of_other_vocabularies(tmp_path):
+    """같은 원본을 다른 어휘로 변환해도 서로의 캐시와 파생 색인을 지우지 않는지 확인합니다."""
+    source = _write_text(tmp_path / "vectors.vec")
+    cache_directory = str(tmp_path / "cache")
+    first = EmbeddingStore.load(source, Vocabulary(["사과", "포도"]), cache_directory)
+    derived = f"{first.cache_prefix}.ivf.npz"
+    np.savez(derived, centroids=np.zeros(1))
+
+    second = EmbeddingStore.load(source, Vocabulary(["배", "바나나", "사과"]), cache_directory)
+    assert second.cache_key != first.cache_key
+    for path in (f"{first.cache_prefix}.emb.npy", f"{first.cache_prefix}.present.npy", derived):
+        assert os.path.exists(path)
+
+    # 같은 캐시 키를 다시 변환하면 그 키의 이전 파생 색인만 정리
+    os.remove(f"{first.cache_prefix}.present.npy")
+    again = EmbeddingStore.load(source, Vocabulary(["사과", "포도"]), cache_directory)
+    assert again.cache_key == first.cache_key and again.coverage == 2
+    assert not os.path.exists(derived)
+    assert os.path.exists(f"{second.cache_prefix}.emb.npy")
+
+
+def test_neighbor_table_resumes_with_different_block_size(tmp_path):
+    """블록 크기를 바꿔 이어 구축해도 계산하지 않은 행을 완료로 취급하지 않는지 확인합니다."""
+    source = _write_text(tmp_path / "vectors.vec")
+    vocabulary = Vocabulary(["사과", "바나나", "포도", "배"])
+    store = EmbeddingStore.load(source, vocabulary, str(tmp_path / "cache"))
+    prefix = store.cache_prefix
+    expected = NeighborTable.build(store, k=2, workers=1, block_size=3)
+    expected_ids = np.array(expected.ids)
+    for path in NeighborTable.get_paths(prefix):
+        if os.path.exists(path):
+            os.remove(path)
+
+    # 블록 크기 2로 첫 블록(행 0~1)만 구축한 뒤 중단
+    ids_path, scores_path, progress_path = NeighborTable.get_paths(prefix, partial=True)
+    done = NeighborTable._open_partial(ids_path, scores_path, progress_path, len(store), 2)
+    task = (f"{prefix}.emb.npy", f"{prefix}.present.npy", ids_path, scores_path, 0, 2, 2)
+    NeighborTable._mark_done(done, progress_path, _build_block(task), 1, 2, 0.0)
+
+    # 블록 수가 같은(2개) 블록 크기 3으로 이어 구축해도 행 2가 계산되어야 함
+    resumed = NeighborTable.build(store, k=2, workers=1, block_size=3)
+    assert np.array_equal(np.array(resumed.ids), expected_ids)
+    assert (np.array(resumed.ids) >= 0).all()
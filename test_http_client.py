@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+HTTP 게임 클라이언트 테스트
+로컬 게임 서버를 상대로 응답 상태별 제출 결과(정답, 모르는 단어, 일시적 실패)를 검증합니다.
+"""
+
+import socket
+
+import numpy as np
+import pytest
+
+from modules.embeddings import EmbeddingStore
+from modules.game_server import GameServerConfig, LocalGameServer
+from modules.http_client import HTTPGameClient, HTTPGameClientConfig
+from modules.models import SubmitOutcome
+from modules.simulated_game import SimulatedGame, SimulatedGameConfig
+from modules.vocabulary import Vocabulary
+
+WORDS = ["사과", "배", "포도", "과일", "자동차", "바다"]
+
+
+def _game() -> SimulatedGame:
+    vocabulary = Vocabulary(WORDS)
+    rng = np.random.default_rng(5)
+    vectors = rng.standard_normal((len(WORDS), 16)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    embeddings = EmbeddingStore(vectors, np.ones(len(WORDS), dtype=bool), vocabulary)
+    return SimulatedGame(vocabulary, SimulatedGameConfig(target_word="사과"), embeddings=embeddings)
+
+
+def _client(server: LocalGameServer, retries: int = 2) -> HTTPGameClient:
+    client = HTTPGameClient(HTTPGameClientConfig(game_url=server.url, timeout=5.0,
+                                                 retries=retries, retry_delay=0.0))
+    assert client.navigate_to_game()
+    return client
+
+
+def test_accepted_and_unknown_words():
+    """순위가 있는 단어와 정답은 ACCEPTED, 404(모르는 단어)는 UNKNOWN_WORD인지 확인합니다."""
+    with LocalGameServer(_game(), GameServerConfig(port=0)) as server:
+        client = _client(server)
+
+        assert client.submit_word("포도") is SubmitOutcome.ACCEPTED
+        assert client.submit_word("없는단어") is SubmitOutcome.UNKNOWN_WORD
+        assert client.check_game_completion() is None
+
+        assert client.submit_word("사과") is SubmitOutcome.ACCEPTED
+        result = client.parse_result("사과", 3)
+        assert (result.similarity, result.rank, result.rank_value) == (100.0, "정답!", 0)
+        assert client.check_game_completion() == "사과"
+        assert client.parse_result("없는단어", 4) is None
+        client.cleanup()
+
+    assert server.get_stats()['unknown_words'] == 1
+
+
+def test_server_errors_are_transient_after_retries():
+    """재시도 후에도 5xx로 응답한 제출은 FAILED이고 재시도 횟수가 기록되는지 확인합니다."""
+    with LocalGameServer(_game(), GameServerConfig(port=0, error_rate=1.0, seed=1)) as server:
+        client = _client(server, retries=2)
+
+        outcome = client.submit_word("포도")
+        assert outcome is SubmitOutcome.FAILED and not outcome
+        assert client.get_driver_info()['retries'] == 2
+        assert server.get_stats()['injected_errors'] == 3
+        client.cleanup()
+
+
+def test_unparseable_response_is_transient(monkeypatch):
+    """200 응답이지만 유사도가 없는 JSON은 모르는 단어가 아니라 FAILED로 보고하는지 확인합니다."""
+    with LocalGameServer(_game(), GameServerConfig(port=0)) as server:
+        monkeypatch.setattr(server, 'handle_guess', lambda word: (200, {'guess': word}))
+        client = _client(server)
+
+        assert client.submit_word("포도") is SubmitOutcome.FAILED
+        assert client.parse_result("포도", 1) is None
+        client.cleanup()
+
+
+def test_connection_refused_is_transient():
+    """게임 서버에 연결할 수 없으면 재시도 후 FAILED로 보고하는지 확인합니다."""
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]  # 닫은 뒤에는 아무도 듣지 않는 포트
+
+    client = HTTPGameClient(HTTPGameClientConfig(game_url=f"http://127.0.0.1:{port}/", day=1,
+                                                 timeout=5.0, retries=1, retry_delay=0.0))
+    assert not client.navigate_to_game()
+    client.is_connected = True  # 접속 확인 없이 제출 경로만 시험
+
+    assert client.submit_word("포도") is SubmitOutcome.FAILED
+    assert client.get_driver_info()['retries'] == 2  # 접속 시도 1회 + 제출 1회
+    client.cleanup()
+
+
+def test_submit_before_navigation_fails():
+    """게임에 접속하기 전 제출은 FAILED로 보고하는지 확인합니다."""
+    client = HTTPGameClient(HTTPGameClientConfig(game_url="http://127.0.0.1:9/"))
+    assert client.submit_word("포도") is SubmitOutcome.FAILED
+
+    with pytest.raises(ValueError):
+        HTTPGameClient(HTTPGameClientConfig(game_url="ftp://example.com/"))
@@ -24,13 +24,10 @@ def test_improved_algorithm():
     strategy_engine = StrategyEngine()
     
     # 테스트 세션 생성
-    session = GameSession()
+    session = GameSession(learning_engine.vocabulary)
     
     # 학습 데이터 준비
-    learned_data = {
-        'word_frequency': learning_engine.learning_data.get('word_frequency', {}),
-        'word_pairs': learning_engine.word_pairs
-    }
+    learned_data = learning_engine.get_learned_data()
     
     print("🧪 개선된 알고리즘 테스트")
     print("=" * 50)
@@ -68,7 +65,7 @@ def test_improved_algorithm():
     
     # 4. 학습 데이터 활용도 확인
     print("\n4. 학습 데이터 활용도:")
-    word_freq = learning_engine.learning_data.get('word_frequency', {})
+    word_freq = learning_engine.word_frequency
     word_pairs = learning_engine.word_pairs
     
     print(f"   - 학습된 단어 수: {len(word_freq)}")
@@ -77,7 +74,8 @@ def test_improved_algorithm():
     # 상위 효과적인 단어들
     if word_freq:
         effective_words = sorted(
-            [(w, d['avg_similarity']) for w, d in word_freq.items() if d['count'] > 2],
+            [(learning_engine.vocabulary.get_word(w), d['avg_similarity'])
+             for w, d in word_freq.items() if d['count'] > 2],
             key=lambda x: x[1],
             reverse=True
         )[:5]
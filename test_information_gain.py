@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+정보 이득 선택 테스트
+표본 정답들을 서로 다른 유사도로 가르는 추측이 모두 같은 유사도를 보여주는 추측보다
+기대 잔여 후보가 적어 선택되는지 검증합니다.
+"""
+
+import random
+
+import numpy as np
+
+from modules.constraints import CandidateConstraints
+from modules.embeddings import EmbeddingStore
+from modules.information_gain import InformationGainSelector
+from modules.vocabulary import AvailableVocabulary, Vocabulary
+
+TARGETS = 16
+ANCHOR, SPLITTER, FLAT = TARGETS, TARGETS + 1, TARGETS + 2
+
+
+def _constraints() -> CandidateConstraints:
+    # 정답 후보: 기준 단어와 모두 0.8, (e0, e1) 평면에서는 서로 다른 각도
+    vectors = np.zeros((TARGETS + 3, 4), dtype=np.float32)
+    for word_id, angle in enumerate(np.linspace(0.3, np.pi - 0.3, TARGETS)):
+        vectors[word_id] = [0.6 * np.cos(angle), 0.6 * np.sin(angle), 0.0, 0.8]
+    vectors[ANCHOR, 3] = 1.0    # 관측에 쓰는 기준 단어
+    vectors[SPLITTER, 0] = 1.0  # 정답마다 다른 유사도
+    vectors[FLAT, 2] = 1.0      # 모든 정답과 유사도 0
+    vocabulary = Vocabulary([f"단어{i}" for i in range(len(vectors))])
+    embeddings = EmbeddingStore(vectors, np.ones(len(vectors), dtype=bool), vocabulary)
+
+    constraints = CandidateConstraints(embeddings)
+    constraints.observe(ANCHOR, 80.0)
+    assert constraints.candidate_ids.tolist() == list(range(TARGETS))
+    return constraints
+
+
+def test_splitting_guess_leaves_fewer_candidates():
+    """정답들을 가르는 추측의 기대 잔여 비율이 가르지 못하는 추측보다 작은지 확인합니다."""
+    constraints = _constraints()
+    selector = InformationGainSelector()
+    remaining = selector.expected_remaining(constraints, np.array([SPLITTER, FLAT]),
+                                            constraints.candidate_ids)
+
+    assert remaining[1] == 1.0
+    assert remaining[0] < 0.25
+
+
+def test_select_prefers_splitting_guess():
+    """select()가 모든 정답에 같은 유사도를 보여주는 추측을 고르지 않는지 확인합니다."""
+    random.seed(3)
+    constraints = _constraints()
+    vocabulary = constraints.embeddings.vocabulary
+    selector = InformationGainSelector(seed=3)
+
+    available = AvailableVocabulary(vocabulary, [SPLITTER, FLAT])
+    word_id, remaining = selector.select(constraints, available)
+    assert (word_id, remaining) == (SPLITTER, selector.expected_remaining(
+        constraints, np.array([SPLITTER]), constraints.candidate_ids)[0])
+
+    # 일관 후보도 사용 가능하면 그중 하나 또는 가르는 추측을 고름
+    available = AvailableVocabulary(vocabulary, [*range(TARGETS), SPLITTER, FLAT])
+    word_id, remaining = selector.select(constraints, available)
+    assert word_id != FLAT and remaining < 0.25
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+데이터 구조 테스트
+게임이 표시한 순위 문자열 파싱과 세션의 순위권 추측 정렬을 검증합니다.
+"""
+
+import pytest
+
+from modules.models import GameSession, GuessResult, parse_rank
+
+
+@pytest.mark.parametrize("rank_text, expected", [
+    ("정답!", 0),
+    ("정답", 0),
+    ("123위", 123),
+    (" 7위 ", 7),
+    ("1위", 1),
+    ("999위", 999),
+    ("1000위", 1000),
+    ("1,000위", 1000),
+    ("1001위", None),         # 공개 범위(1000위 이내) 밖
+    ("1000위 이상", None),
+    ("순위 밖", None),
+    ("1000위 밖", None),
+    ("???", None),
+    ("", None),
+    (None, None),
+    (42, 42),
+    (0, 0),
+    (1500, None),
+])
+def test_parse_rank(rank_text, expected):
+    """정답은 0, 순위권은 정수, 순위 밖이거나 알 수 없는 표시는 None으로 변환되는지 확인합니다."""
+    assert parse_rank(rank_text) == expected
+
+
+def test_session_keeps_ranked_guesses_sorted():
+    """순위권 추측만 순위 오름차순으로 유지되고 최고 순위가 갱신되는지 확인합니다."""
+    session = GameSession()
+    assert session.get_best_rank() is None
+
+    for attempt, (word, similarity, rank) in enumerate([
+            ("사과", 12.5, "1000위 이상"),
+            ("과일", 45.1, "310위"),
+            ("배", 52.3, "42위"),
+            ("채소", 40.0, "310위"),
+            ("포도", 60.7, "7위")], start=1):
+        session.add_guess(GuessResult(word, similarity, rank, attempt))
+
+    assert session.get_best_rank() == 7
+    assert [g.word for g in session.get_ranked_guesses(10)] == ["포도", "배", "과일", "채소"]
+    assert [g.rank_value for g in session.get_ranked_guesses(2)] == [7, 42]
+    assert session.guesses[-1].rank_value is None
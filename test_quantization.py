@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+임베딩 양자화 테스트
+int8/PQ 코드의 근사 유사도 순위가 float32 전수 비교와 맞는지,
+캐시된 코드는 float32 행렬 없이 로드되는지 검증합니다.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from modules.embeddings import EmbeddingStore
+from modules.quantization import (ProductQuantizedCodes, QuantizedEmbeddingStore,
+                                  ScalarQuantizedCodes, evaluate_quantization)
+from modules.vocabulary import Vocabulary
+
+WORDS = 600
+DIM = 16
+
+
+def _write_source(path) -> str:
+    rng = np.random.default_rng(9)
+    # 군집 구조가 있어야 상위 근접어 순위가 의미 있음
+    centers = rng.standard_normal((20, DIM))
+    vectors = centers[rng.integers(0, 20, WORDS)] + 0.4 * rng.standard_normal((WORDS, DIM))
+    lines = [f"{WORDS} {DIM}"]
+    for i, vector in enumerate(vectors):
+        lines.append(f"단어{i} " + " ".join(f"{value:.6f}" for value in vector))
+    path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    return str(path)
+
+
+def _vocabulary() -> Vocabulary:
+    return Vocabulary([f"단어{i}" for i in range(WORDS)])
+
+
+@pytest.mark.parametrize("quantization, min_recall", [("int8", 0.95), ("pq", 0.5)])
+def test_quantized_top_k_recall(tmp_path, quantization, min_recall):
+    """양자화 저장소의 상위 근접어가 float32 전수 비교 결과를 충분히 재현하는지 확인합니다."""
+    source = _write_source(tmp_path / "vectors.vec")
+    cache = str(tmp_path / "cache")
+    exact = EmbeddingStore.load(source, _vocabulary(), cache)
+    quantized = EmbeddingStore.load(source, exact.vocabulary, cache, quantization=quantization)
+    assert isinstance(quantized, QuantizedEmbeddingStore)
+    assert quantized.quantization == quantization
+
+    report = evaluate_quantization(exact, [quantized], range(0, WORDS, 7), k=10)
+    assert report[1]['recall'] >= min_recall
+    assert report[1]['bytes'] < report[0]['bytes']
+
+
+@pytest.mark.parametrize("codes_class", [ScalarQuantizedCodes, ProductQuantizedCodes])
+def test_adc_scores_match_decoded_vectors(codes_class):
+    """코드와 직접 비교한 내적(ADC)이 복원한 벡터와의 내적과 같은지 확인합니다."""
+    rng = np.random.default_rng(3)
+    vectors = rng.standard_normal((300, DIM)).astype(np.float32)
+    codes = (codes_class.encode(vectors) if codes_class is ScalarQuantizedCodes
+             else codes_class.encode(vectors, np.ones(300, dtype=bool), subspaces=4))
+    queries = rng.standard_normal((3, DIM)).astype(np.float32)
+    ids = np.array([5, 0, 299, 5])
+
+    assert codes.decode(ids).shape == (4, DIM)
+    assert np.allclose(codes.scores(queries), queries @ codes.decode(slice(None)).T, atol=1e-4)
+    assert np.allclose(codes.scores(queries, ids), queries @ codes.decode(ids).T, atol=1e-4)
+
+
+@pytest.mark.parametrize("quantization", ["int8", "pq"])
+def test_cached_codes_load_without_float32_matrix(tmp_path, quantization):
+    """코드가 캐시에 있으면 float32 행렬을 지운 뒤에도 재변환 없이 같은 저장소를 여는지 확인합니다."""
+    source = _write_source(tmp_path / "vectors.vec")
+    cache = str(tmp_path / "cache")
+    built = EmbeddingStore.load(source, _vocabulary(), cache, quantization=quantization)
+    expected = built.similarities([1, 2], [3, 4, 5])
+    vectors_path = f"{built.cache_prefix}.emb.npy"
+    os.remove(vectors_path)
+
+    reopened = EmbeddingStore.load(source, _vocabulary(), cache, quantization=quantization)
+    assert isinstance(reopened, QuantizedEmbeddingStore)
+    assert not os.path.exists(vectors_path)
+    assert reopened.dim == DIM and reopened.coverage == WORDS
+    assert np.allclose(reopened.similarities([1, 2], [3, 4, 5]), expected)
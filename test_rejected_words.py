@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+거부 단어 필터 테스트
+블룸 필터 저장/로드와 오버플로 목록, 솔버가 영구 거부 목록에 기록하는 조건을 검증합니다.
+"""
+
+from typing import Optional
+
+from modules.models import GuessResult, SubmitOutcome
+from modules.rejected_words import RejectedWordFilter
+
+
+def test_bloom_filter_round_trip_with_overflow(tmp_path):
+    """설계 용량을 넘는 단어는 오버플로 목록에 저장되고 저장/로드 후에도 모두 유지되는지 확인합니다."""
+    path = str(tmp_path / "rejected.bloom")
+    rejected = RejectedWordFilter(path, capacity=3, false_positive_rate=0.01)
+    words = ["가나", "다라", "마바", "사아", "자차"]
+
+    for word in words:
+        assert rejected.add(word)
+    assert not rejected.add("가나")  # 이미 기록된 단어
+
+    assert rejected.bloom_count == 3
+    assert rejected.overflow == {"사아", "자차"}
+    assert rejected.save()
+
+    loaded = RejectedWordFilter(path, capacity=1000, false_positive_rate=0.2)
+    # 파일에 저장된 설계 값이 생성자 인자보다 우선
+    assert (loaded.capacity, loaded.bit_count, loaded.hash_count) == \
+        (rejected.capacity, rejected.bit_count, rejected.hash_count)
+    assert loaded.overflow == rejected.overflow
+    assert len(loaded) == 5
+    assert all(word in loaded for word in words)
+    assert loaded.get_stats()['overflow_entries'] == 2
+
+
+def test_bloom_filter_rejects_corrupt_file(tmp_path):
+    """손상된 파일은 로드하지 않고 빈 필터로 시작하는지 확인합니다."""
+    path = tmp_path / "rejected.bloom"
+    path.write_bytes(b"KBLM" + b"\x00" * 3)
+
+    rejected = RejectedWordFilter(str(path))
+    assert len(rejected) == 0
+    assert "가나" not in rejected
+
+
+class _ScriptedBackend:
+    """단어 끝 글자로 제출 결과를 정하는 가짜 게임 백엔드"""
+
+    def __init__(self):
+        self.is_connected = False
+
+    def setup_driver(self) -> bool:
+        return True
+
+    def navigate_to_game(self) -> bool:
+        self.is_connected = True
+        return True
+
+    def submit_word(self, word: str) -> SubmitOutcome:
+        if word.endswith("모름"):
+            return SubmitOutcome.UNKNOWN_WORD
+        if word.endswith("오류"):
+            return SubmitOutcome.FAILED
+        return SubmitOutcome.ACCEPTED
+
+    def parse_result(self, word: str, attempt: int) -> Optional[GuessResult]:
+        if word.endswith("지연"):
+            return None  # 결과 표 대기 시간 초과
+        return GuessResult(word, 5.0, "1000위 이상", attempt)
+
+    def check_game_completion(self) -> Optional[str]:
+        return None
+
+    def cleanup(self) -> None:
+        pass
+
+
+def test_solver_persists_only_unknown_words(tmp_path, monkeypatch):
+    """게임이 모르는 단어만 영구 거부 목록에 기록되고 일시적 실패는 기록되지 않는지 확인합니다."""
+    from semantic_solver import SemanticSolver
+
+    monkeypatch.chdir(tmp_path)
+    words = [f"{prefix}{suffix}" for prefix in ("가", "나", "다")
+             for suffix in ("모름", "오류", "지연", "정상")]
+    (tmp_path / "words.txt").write_text("\n".join(words), encoding='utf-8')
+    bloom_path = str(tmp_path / "rejected.bloom")
+
+    solver = SemanticSolver(vocab_file=str(tmp_path / "words.txt"),
+                            learning_file=str(tmp_path / "learning.json"),
+                            word_pairs_file=str(tmp_path / "pairs.json"),
+                            rejected_words_file=bloom_path,
+                            game_backend=_ScriptedBackend())
+    solver.solve_game(max_attempts=len(words))
+
+    rejected = RejectedWordFilter(bloom_path)
+    assert len(rejected) == 3
+    for word in words:
+        assert (word in rejected) == word.endswith("모름")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+가중치 샘플러 테스트
+펜윅 트리 샘플러의 비례 선택, 가중치 갱신, 0 가중치 처리를 검증합니다.
+"""
+
+import random
+from collections import Counter
+
+import pytest
+
+from modules.sampler import WeightedSampler
+
+SAMPLES = 20000
+
+
+def _frequencies(sampler: WeightedSampler, seed: int = 7) -> Counter:
+    rng = random.Random(seed)
+    return Counter(sampler.sample(rng) for _ in range(SAMPLES))
+
+
+def test_sample_is_proportional_to_weights():
+    """선택 빈도가 가중치에 비례하고 가중치 0인 인덱스는 선택되지 않는지 확인합니다."""
+    weights = [1.0, 0.0, 2.0, 3.0, 0.0, 4.0]
+    counts = _frequencies(WeightedSampler(weights))
+
+    assert counts[1] == 0 and counts[4] == 0
+    total = sum(weights)
+    for index, weight in enumerate(weights):
+        assert counts[index] / SAMPLES == pytest.approx(weight / total, abs=0.015)
+
+
+def test_update_and_remove_follow_new_weights():
+    """가중치 갱신과 제거 후 합계, 원소 수, 선택 빈도가 새 가중치를 따르는지 확인합니다."""
+    sampler = WeightedSampler([1.0] * 8)
+    sampler.set_weight(2, 5.0)
+    sampler.remove(0)
+    sampler.remove(7)
+    sampler.remove(100)  # 범위 밖 인덱스는 무시
+
+    assert sampler.total == pytest.approx(10.0)
+    assert len(sampler) == 6
+    counts = _frequencies(sampler)
+    assert counts[0] == 0 and counts[7] == 0
+    assert counts[2] / SAMPLES == pytest.approx(0.5, abs=0.015)
+    assert counts[3] / SAMPLES == pytest.approx(0.1, abs=0.015)
+
+
+def test_all_zero_weights_and_validation():
+    """가중치가 모두 0이면 None을 반환하고 음수 가중치는 거부하는지 확인합니다."""
+    assert WeightedSampler().sample() is None
+    assert WeightedSampler([0.0, 0.0]).sample() is None
+
+    sampler = WeightedSampler([0.5, 0.5])
+    sampler.remove(0)
+    sampler.remove(1)
+    assert len(sampler) == 0 and sampler.sample() is None
+
+    with pytest.raises(ValueError):
+        WeightedSampler([1.0, -1.0])
+    with pytest.raises(ValueError):
+        sampler.set_weight(0, -0.1)
+
+
+def test_copy_is_independent():
+    """복사본의 가중치를 바꿔도 원본 샘플러가 바뀌지 않는지 확인합니다."""
+    sampler = WeightedSampler([1.0, 1.0, 1.0])
+    clone = sampler.copy()
+    clone.remove(1)
+
+    assert len(sampler) == 3 and len(clone) == 2
+    assert sampler.get_weight(1) == 1.0
+    assert 1 not in _frequencies(clone)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+전략 엔진 테스트
+순위 경계 탐색이 순위에 따라 후보 범위를 정하고 임베딩이 없으면 학습 데이터와 어근으로 범위를 잡는지,
+정답 추정 탐색보다 우선하는지 검증합니다.
+"""
+
+import numpy as np
+
+from modules.embeddings import EmbeddingStore
+from modules.models import GameSession, GuessResult
+from modules.strategy_engine import RankBoundedSearch, StrategyEngine, TargetEstimateSearch
+from modules.target_estimator import TargetEstimator
+from modules.vocabulary import Vocabulary, pack_pair
+
+WORDS = 2000
+
+
+def _vocabulary(with_embeddings: bool) -> Vocabulary:
+    vocabulary = Vocabulary([f"단어{i}" for i in range(WORDS)])
+    if with_embeddings:
+        rng = np.random.default_rng(4)
+        vectors = rng.standard_normal((WORDS, 16)).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        vocabulary.embeddings = EmbeddingStore(vectors, np.ones(WORDS, dtype=bool), vocabulary)
+    return vocabulary
+
+
+def _session_with_rank(vocabulary: Vocabulary, rank: str) -> GameSession:
+    session = GameSession(vocabulary)
+    session.add_guess(GuessResult("단어7", 35.0, rank, 1))
+    return session
+
+
+def _session_with_estimator(ranked: bool) -> GameSession:
+    vocabulary = _vocabulary(with_embeddings=True)
+    session = GameSession(vocabulary)
+    session.target_estimator = TargetEstimator(vocabulary.embeddings)
+    for i in range(StrategyEngine.ESTIMATOR_MIN_OBSERVATIONS):
+        session.add_guess(GuessResult(f"단어{i}", 20.0 + i, "1000위 이상", i + 1))
+    if ranked:
+        session.add_guess(GuessResult("단어100", 30.0, "120위", 11))
+    return session
+
+
+def test_rank_bounds_candidate_neighborhood():
+    """같은 추측이라도 순위가 다르면 근접어 범위 크기와 후보 집합이 달라지는지 확인합니다."""
+    vocabulary = _vocabulary(with_embeddings=True)
+    strategy = RankBoundedSearch()
+    candidates = {}
+    for rank in ("5위", "300위"):
+        session = _session_with_rank(vocabulary, rank)
+        candidates[rank] = strategy._get_rank_bounded_candidates(
+            session, session.available, session.get_ranked_guesses(3), {})
+
+    assert len(candidates["5위"]) == strategy.MIN_NEIGHBORHOOD
+    assert len(candidates["300위"]) == 300 * strategy.NEIGHBORHOOD_SCALE
+    assert set(candidates["5위"]) < set(candidates["300위"])
+    assert 7 not in candidates["300위"]
+
+
+def test_rank_strategy_without_embeddings_uses_learned_neighbors():
+    """임베딩이 없으면 학습된 단어 쌍 상대와 같은 어근 단어로 범위를 잡고, 둘 다 없으면 고르지 않는지 확인합니다."""
+    engine = StrategyEngine(enable_logging=False)
+    with_embeddings = _session_with_rank(_vocabulary(with_embeddings=True), "42위")
+    assert isinstance(engine.select_strategy(with_embeddings), RankBoundedSearch)
+
+    # 어근을 공유하는 단어가 없는 어휘: 학습 데이터가 있어야만 순위 경계 탐색
+    vocabulary = Vocabulary(["바다", "하늘", "구름", "태양", "강물", "산맥"])
+    session = GameSession(vocabulary)
+    session.add_guess(GuessResult("바다", 35.0, "42위", 1))
+    assert not isinstance(engine.select_strategy(session, {}), RankBoundedSearch)
+
+    get_id = vocabulary.get_id
+    learned_data = {
+        'word_pairs': {pack_pair(get_id("바다"), get_id("강물")): {'similarity_diffs': [2.0]},
+                       pack_pair(get_id("바다"), get_id("하늘")): {'similarity_diffs': [9.0, 7.0]}},
+        'pair_partners': {get_id("바다"): {get_id("강물"), get_id("하늘")}},
+    }
+    assert isinstance(engine.select_strategy(session, learned_data), RankBoundedSearch)
+    assert RankBoundedSearch()._get_learned_neighbors(
+        session, session.available, session.guesses[0], learned_data) == [
+            get_id("강물"), get_id("하늘")]
+    assert engine.select_next_word(session, session.available, learned_data) == "강물"
+
+    # 같은 어근(두 글자 단어는 첫 글자)의 단어는 학습 데이터 없이도 범위가 됨
+    vocabulary = Vocabulary(["바다", "하늘", "바다새", "바닷물"])
+    session = GameSession(vocabulary)
+    session.add_guess(GuessResult("바다", 35.0, "42위", 1))
+    assert isinstance(engine.select_strategy(session), RankBoundedSearch)
+    assert RankBoundedSearch()._get_rank_bounded_candidates(
+        session, session.available, session.get_ranked_guesses(3), {}) == [
+            vocabulary.get_id("바다새"), vocabulary.get_id("바닷물")]
+
+
+def test_rank_strategy_precedes_estimator():
+    """추정기 관측이 충분해도 순위권 추측이 있으면 순위 경계 탐색을 고르는지 확인합니다."""
+    engine = StrategyEngine(enable_logging=False)
+
+    ranked = _session_with_estimator(ranked=True)
+    assert ranked.target_estimator.observations > StrategyEngine.ESTIMATOR_MIN_OBSERVATIONS
+    assert isinstance(engine.select_strategy(ranked), RankBoundedSearch)
+
+    unranked = _session_with_estimator(ranked=False)
+    assert isinstance(engine.select_strategy(unranked), TargetEstimateSearch)
+
+
+def test_stalled_estimator_yields_to_other_strategies():
+    """정답 추정 탐색이 최근 추측에서 최고 유사도를 갱신하지 못하면 다른 전략으로 전환하는지 확인합니다."""
+    engine = StrategyEngine(enable_logging=False)
+    session = _session_with_estimator(ranked=False)
+    assert isinstance(engine.select_strategy(session), TargetEstimateSearch)
+
+    for i in range(StrategyEngine.ESTIMATOR_STALL_WINDOW):
+        session.add_guess(GuessResult(f"단어{200 + i}", 15.0, "1000위 이상", 20 + i))
+    assert not isinstance(engine.select_strategy(session), TargetEstimateSearch)
+
+
+def test_estimator_not_stalled_when_newest_guess_is_best():
+    """최근 추측이 최고 유사도를 갱신하면 추측이 창보다 많아도 정답 추정 탐색을 계속하는지 확인합니다."""
+    engine = StrategyEngine(enable_logging=False)
+    session = _session_with_estimator(ranked=False)
+    session.add_guess(GuessResult("단어300", 40.0, "1000위 이상", 11))
+
+    assert len(session.guesses) > StrategyEngine.ESTIMATOR_STALL_WINDOW
+    assert not engine._is_estimator_stalled(session, session.get_best_similarity())
+    assert isinstance(engine.select_strategy(session), TargetEstimateSearch)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+어휘 모듈 테스트
+컴파일된 어휘 캐시와 단어 ID/사용 가능 어휘 뷰의 동작을 검증합니다.
+"""
+
+from modules.vocabulary import (AvailableVocabulary, Vocabulary, VocabularyCache,
+                                pack_pair, unpack_pair)
+
+
+def _write_source(tmp_path, text: str) -> str:
+    source = tmp_path / "words.txt"
+    source.write_text(text, encoding='utf-8')
+    return str(source)
+
+
+def test_vocabulary_cache_round_trip(tmp_path):
+    """저장한 단어 목록이 순서 그대로 다시 로드되는지 확인합니다."""
+    source = _write_source(tmp_path, "사과\n바나나\n")
+    cache = VocabularyCache(str(tmp_path / "cache"))
+    words = ["바나나", "사과", "가나다라마바사"]
+
+    assert cache.load(source) is None
+    assert cache.save(source, words)
+    assert cache.load(source) == words
+
+
+def test_vocabulary_cache_empty_list_is_a_hit(tmp_path):
+    """빈 어휘 캐시는 캐시 없음(None)이 아니라 빈 목록으로 로드되어야 합니다."""
+    source = _write_source(tmp_path, "")
+    cache = VocabularyCache(str(tmp_path / "cache"))
+
+    assert cache.save(source, [])
+    assert cache.load(source) == []
+
+
+def test_vocabulary_cache_invalidated_by_source_change(tmp_path):
+    """원본 파일 내용이 바뀌면 캐시를 쓰지 않는지 확인합니다."""
+    source = _write_source(tmp_path, "사과\n")
+    cache = VocabularyCache(str(tmp_path / "cache"))
+    assert cache.save(source, ["사과"])
+
+    _write_source(tmp_path, "사과\n배\n")
+    assert cache.load(source) is None
+
+
+def test_pack_pair_is_order_independent():
+    """단어 쌍 키가 순서와 무관하고 원래 ID로 풀리는지 확인합니다."""
+    assert pack_pair(3, 70000) == pack_pair(70000, 3)
+    assert unpack_pair(pack_pair(70000, 3)) == (3, 70000)
+    assert unpack_pair(pack_pair(5, 5)) == (5, 5)
+    assert pack_pair(0, 1) != pack_pair(1, 2)
+
+
+def test_available_vocabulary_swap_delete():
+    """스왑 삭제 후에도 멤버십, 위치 표, 크기가 일관되게 유지되는지 확인합니다."""
+    vocabulary = Vocabulary(["가", "나", "다", "라", "마"])
+    available = AvailableVocabulary(vocabulary)
+
+    assert available.discard(1)            # 가운데 원소: 마지막 원소가 자리를 채움
+    assert not available.discard(1)        # 이미 제거된 ID
+    assert available.discard(4)            # 마지막 원소
+    assert not available.discard(99)       # 범위 밖 ID
+    assert available.discard_word("가")
+    assert not available.discard_word("없는단어")
+
+    assert len(available) == 2
+    assert sorted(available.iter_ids()) == [2, 3]
+    assert set(available) == {"다", "라"}
+    assert "나" not in available and "다" in available
+
+    # 남은 원소도 위치 표를 통해 올바르게 제거되어야 함
+    assert available.discard(3) and available.discard(2)
+    assert len(available) == 0 and available.random_id() is None
+
+
+def test_available_vocabulary_copy_and_random_choice():
+    """복사본이 독립적이고 무작위 선택이 제거된 단어를 고르지 않는지 확인합니다."""
+    vocabulary = Vocabulary([f"단어{i}" for i in range(20)])
+    available = AvailableVocabulary(vocabulary, range(0, 20, 2))
+    clone = available.copy()
+
+    for word_id in range(0, 20, 4):
+        available.discard(word_id)
+
+    assert len(clone) == 10 and len(available) == 5
+    for _ in range(200):
+        assert available.random_id() in {2, 6, 10, 14, 18}
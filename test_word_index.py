@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+단어 색인 모듈 테스트
+자모 BK-트리 질의와 저장/로드 결과가 전체 스캔과 일치하는지 검증합니다.
+"""
+
+from modules.vocabulary import AvailableVocabulary, Vocabulary
+from modules.word_index import JamoBKTree, jamo_distance
+
+WORDS = ["경제", "경제학", "경제적", "경제력", "경영", "경영학", "사과", "사각", "사람", "사랑",
+         "사랑니", "자연", "자원", "자유", "정치", "정책", "정치학", "과학", "과학자", "문학"]
+
+
+def _scan(word, max_distance):
+    return sorted((other, distance) for other in WORDS
+                  for distance in [jamo_distance(word, other)]
+                  if distance <= max_distance and other != word)
+
+
+def test_jamo_tree_matches_full_scan():
+    """BK-트리 질의 결과가 모든 단어와의 거리를 계산한 결과와 같은지 확인합니다."""
+    vocabulary = Vocabulary(WORDS)
+    tree = vocabulary.jamo_tree
+
+    for word in WORDS + ["경제성", "사랑해"]:
+        for max_distance in (1, 2, 3):
+            assert sorted(tree.find(word, max_distance)) == _scan(word, max_distance)
+
+
+def test_jamo_tree_save_load_round_trip(tmp_path):
+    """저장한 트리를 같은 어휘로 로드하면 같은 결과를 주고, 어휘가 다르면 로드하지 않는지 확인합니다."""
+    path = str(tmp_path / "words.jamo.bktree")
+    vocabulary = Vocabulary(WORDS)
+    vocabulary.build_indexes(jamo_tree_path=path)
+
+    loaded_vocabulary = Vocabulary(WORDS)
+    loaded = JamoBKTree.load(loaded_vocabulary, path)
+    assert loaded is not None and len(loaded) == len(WORDS)
+
+    available = AvailableVocabulary(loaded_vocabulary)
+    available.discard_word("경제적")
+    for word in WORDS:
+        assert loaded.find(word, 3, available) == vocabulary.jamo_tree.find(word, 3, available)
+
+    # 로드 후 인터닝된 단어도 질의에 반영
+    loaded_vocabulary.intern("경제인")
+    assert ("경제인", 0) in [(loaded_vocabulary.get_word(word_id), distance)
+                             for word_id, distance in loaded.iter_within("경제인", 0)]
+
+    assert JamoBKTree.load(Vocabulary(WORDS[::-1]), path) is None
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+XLS 스트리밍 리더 테스트
+내장 BIFF 리더가 pandas(xlrd)로 읽은 words.xls와 같은 단어 목록을 만드는지 검증합니다.
+"""
+
+import struct
+
+import pytest
+
+from modules.vocabulary import normalize_excel_word
+from modules.xls_reader import XLSWordReader, _ContinuedReader, _SharedStringTable
+
+
+def test_xls_reader_matches_pandas():
+    """words.xls의 단어 열과 정규화 결과가 pandas 경로와 일치하는지 확인합니다."""
+    pd = pytest.importorskip('pandas')
+    pytest.importorskip('xlrd')
+
+    df = pd.read_excel('words.xls')
+    reader = XLSWordReader('words.xls')
+    words = list(reader.iter_words())
+
+    expected = []
+    for value in df.iloc[:, reader.word_column]:
+        if pd.notna(value):
+            word = normalize_excel_word(str(value))
+            if word:
+                expected.append(word)
+
+    assert [str(column) for column in df.columns] == [reader.header[col]
+                                                      for col in sorted(reader.header)]
+    assert words == expected
+
+
+def test_text_cells_match_xlrd():
+    """모든 열의 텍스트 셀(CONTINUE 경계를 넘는 공유 문자열 포함)이 xlrd와 일치하는지 확인합니다."""
+    xlrd = pytest.importorskip('xlrd')
+
+    sheet = xlrd.open_workbook('words.xls').sheet_by_index(0)
+    expected = {(row, col): sheet.cell_value(row, col)
+                for row in range(sheet.nrows) for col in range(sheet.ncols)
+                if sheet.cell_type(row, col) == xlrd.XL_CELL_TEXT}
+
+    # 단어 열을 정하기 전에는 모든 열의 셀을 디코딩
+    cells = {(row, col): text for row, col, text in XLSWordReader('words.xls')._iter_text_cells()}
+
+    assert cells == expected
+
+
+class _FakeCompound:
+    """구간들을 이어 붙인 바이트를 워크북 스트림처럼 제공하는 가짜 복합 문서"""
+
+    def __init__(self, stream: bytes):
+        self.stream = stream
+
+    def read_stream_at(self, name: str, offset: int, size: int) -> bytes:
+        return self.stream[offset:offset + size]
+
+
+def test_shared_string_crossing_continue_boundary():
+    """CONTINUE 경계에서 인코딩이 바뀌는 문자열을 위치 기록과 지연 디코딩 모두 처리하는지 확인합니다."""
+    # 세 글자 문자열이 UTF-16 '가' 뒤에서 끊기고, 다음 구간은 압축 8비트 옵션 바이트로 이어짐
+    first = struct.pack('<HB', 3, 0x01) + '가'.encode('utf-16-le')
+    second = b'\x00' + b'AB' + struct.pack('<HB', 2, 0x00) + b'xy'
+    segments = [first, second]
+
+    records = iter(segments[1:])
+    reader = _ContinuedReader(first, lambda: next(records, None))
+    positions = []
+    for _ in range(2):
+        positions.append(reader.tell())
+        reader.read_string(decode=False)
+    assert positions == [(0, 0), (1, 3)]
+
+    table = _SharedStringTable(_FakeCompound(first + second), 'Workbook')
+    table.segment_offsets.extend([0, len(first)])
+    table.segment_lengths.extend([len(first), len(second)])
+    for segment_index, position in positions:
+        table.string_segments.append(segment_index)
+        table.string_positions.append(position)
+
+    assert len(table) == 2
+    assert table[0] == '가AB'
+    assert table[1] == 'xy'